@@ -32,11 +32,20 @@ Main Classes
 - AstrologicalSubjectFactory: Create astrological subjects (recommended)
 - AstrologicalSubject: Legacy wrapper for backward compatibility
 - ChartDrawer: Generate SVG chart visualizations
+- ChartBatchRenderer: Render many charts in parallel with shared options
+- TransitTimelineRenderer: Animate transits to a natal chart over a time range
 - AspectsFactory: Calculate planetary aspects
 - RelationshipScoreFactory: Calculate compatibility scores
+- CompatibilitySearch: Rank a pool of candidates by relationship score
+- GroupSynastryMatrix: Synastry aspects of every pair in a group of subjects
 - CompositeSubjectFactory: Create composite charts
 - PlanetaryReturnFactory: Calculate solar/lunar returns
 - TransitsTimeRangeFactory: Track transits over time
+- MultiSubjectTransitEngine: Find the transits of many subjects at once
+- RelocationEngine: Relocate a chart over many places and draw Astro*Carto*Graphy lines
+- ChartVariants: One chart under many house systems and sidereal modes
+- EphemerisEventFinder: Exact ingresses, stations and retrograde shadows over a date range
+- AlmanacGenerator: Daily Sun and Moon rise, set, transit and phases for one location
 
 .. include:: ../README.md
 
@@ -52,6 +61,11 @@ from .planetary_return_factory import PlanetaryReturnFactory
 from .chart_data_factory import ChartDataFactory
 from .ephemeris_data_factory import EphemerisDataFactory
 from .transits_time_range_factory import TransitsTimeRangeFactory
+from .multi_subject_transits import MultiSubjectTransitEngine
+from .relocation import RelocationEngine
+from .chart_variants import ChartVariants
+from .ephemeris_events import EphemerisEventFinder
+from .almanac import AlmanacGenerator
 from .moon_phase_details import MoonPhaseDetailsFactory
 
 # =============================================================================
@@ -59,12 +73,16 @@ from .moon_phase_details import MoonPhaseDetailsFactory
 # =============================================================================
 from .aspects import AspectsFactory
 from .relationship_score_factory import RelationshipScoreFactory
+from .compatibility_search import CompatibilitySearch
+from .group_synastry import GroupSynastryMatrix
 from .house_comparison.house_comparison_factory import HouseComparisonFactory
 
 # =============================================================================
 # VISUALIZATION
 # =============================================================================
 from .charts.chart_drawer import ChartDrawer
+from .charts.chart_batch_renderer import ChartBatchRenderer
+from .charts.transit_timeline_renderer import TransitTimelineRenderer
 from .report import ReportGenerator
 
 # =============================================================================
@@ -86,7 +104,8 @@ from .schemas.kr_models import (
 # SETTINGS AND UTILITIES
 # =============================================================================
 from .settings import KerykeionSettingsModel
-from .context_serializer import to_context
+from .context_serializer import iter_context, to_context, write_context
+from .wire_format import from_wire, to_wire
 
 # =============================================================================
 # LEGACY API (v4 backward compatibility)
@@ -107,13 +126,22 @@ __all__ = [
     "ChartDataFactory",
     "EphemerisDataFactory",
     "TransitsTimeRangeFactory",
+    "MultiSubjectTransitEngine",
+    "RelocationEngine",
+    "ChartVariants",
+    "EphemerisEventFinder",
+    "AlmanacGenerator",
     "MoonPhaseDetailsFactory",
     # Analysis Factories
     "AspectsFactory",
     "RelationshipScoreFactory",
+    "CompatibilitySearch",
+    "GroupSynastryMatrix",
     "HouseComparisonFactory",
     # Visualization
     "ChartDrawer",
+    "ChartBatchRenderer",
+    "TransitTimelineRenderer",
     "ReportGenerator",
     # Data Models
     "KerykeionException",
@@ -128,6 +156,10 @@ __all__ = [
     # Settings and Utilities
     "KerykeionSettingsModel",
     "to_context",
+    "iter_context",
+    "write_context",
+    "to_wire",
+    "from_wire",
     # Legacy API (v4 backward compatibility)
     "AstrologicalSubject",
     "KerykeionChartSVG",
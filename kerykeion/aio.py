@@ -0,0 +1,432 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio Module
+
+This module provides AsyncKerykeion, an asyncio facade over the subject, chart
+data, chart drawing and planetary return factories.
+
+Every factory call is CPU-bound and blocks for milliseconds (tens of
+milliseconds for a rendered chart), so the facade runs it in an executor and
+awaits the result:
+
+- ``"thread"`` (default) runs the calls one at a time in a single worker thread.
+  The Swiss Ephemeris keeps process-global state (ephemeris path, sidereal mode,
+  topocentric position) that a calculation sets and reads back, so two
+  calculations must never overlap in one process; the GIL would prevent a
+  speed-up from more threads anyway. Context variables (an active position
+  cache or profiler) are propagated to the worker.
+- ``"process"`` runs the calls in a pool of worker processes, each with its own
+  Swiss Ephemeris state, for real parallelism. Arguments and results are pickled.
+
+A semaphore bounds the number of calls submitted at once (``max_concurrency``),
+so a burst of requests waits in the event loop instead of piling up in the
+executor queue.
+
+GeoNames lookups go through the same ``FetchGeonames`` path as the synchronous
+factory, run in the executor like any other call, so they share its on-disk
+requests-cache (kept for ``cache_expire_after_days``), redirect handling and
+error reporting. Concurrent lookups of the same place share one call. The
+coordinates and timezone they return are then passed to the offline factories.
+
+Classes:
+    AsyncKerykeion: Awaitable counterparts of the Kerykeion factories
+
+Example:
+    >>> import asyncio
+    >>> from kerykeion.aio import AsyncKerykeion
+    >>> async def main():
+    ...     async with AsyncKerykeion() as kerykeion:
+    ...         subject = await kerykeion.create_subject(
+    ...             "John", 1990, 1, 1, 12, 0, lng=-0.1276, lat=51.5072, tz_str="Europe/London", online=False
+    ...         )
+    ...         chart_data = await kerykeion.natal_chart_data(subject)
+    ...         return await kerykeion.render_svg(chart_data, theme="dark")
+    >>> svg = asyncio.run(main())
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Literal, Optional, Tuple, TypeVar, Union
+
+from kerykeion.astrological_subject_factory import (
+    DEFAULT_GEONAMES_CACHE_EXPIRE_AFTER_DAYS,
+    AstrologicalSubjectFactory,
+    LocationData,
+    _get_geonames_username,
+)
+from kerykeion.chart_data_factory import ChartDataFactory
+from kerykeion.charts.chart_drawer import ChartDrawer
+from kerykeion.planetary_return_factory import PlanetaryReturnFactory
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import ReturnType
+from kerykeion.schemas.kr_models import (
+    AstrologicalSubjectModel,
+    ChartDataModel,
+    CompositeSubjectModel,
+    PlanetReturnModel,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# WORKER FUNCTIONS
+# =============================================================================
+# Module-level so that they can be pickled for the process executor.
+
+
+def _render_svg(
+    chart_data: ChartDataModel,
+    drawer_options: Dict[str, Any],
+    minify: bool,
+    remove_css_variables: bool,
+) -> str:
+    return ChartDrawer(chart_data, **drawer_options).generate_svg_string(
+        minify=minify, remove_css_variables=remove_css_variables
+    )
+
+
+def _geocode(city: str, nation: str, username: str, cache_expire_after_days: int) -> Dict[str, str]:
+    location = LocationData(city=city, nation=nation)
+    location.fetch_from_geonames(username, cache_expire_after_days)
+    return location.city_data
+
+
+def _planetary_return(
+    subject: AstrologicalSubjectModel,
+    location: Dict[str, Any],
+    year: int,
+    month: int,
+    day: int,
+    return_type: ReturnType,
+) -> PlanetReturnModel:
+    factory = PlanetaryReturnFactory(subject, online=False, **location)
+    return factory.next_return_from_date(year, month, day, return_type=return_type)
+
+
+# =============================================================================
+# FACADE
+# =============================================================================
+
+
+class AsyncKerykeion:
+    """
+    Awaitable counterparts of the Kerykeion factories.
+
+    Use it as an async context manager, or call ``close()`` when done, to shut
+    the executor down. An instance can be shared by all the tasks of an event loop.
+
+    Args:
+        executor: ``"thread"`` (one worker thread) or ``"process"`` (a process pool).
+        max_workers: Number of worker processes for the process executor.
+            Defaults to the number of CPUs. Ignored by the thread executor.
+        max_concurrency: Maximum number of calls submitted to the executor at once.
+            Defaults to twice the number of workers.
+        geonames_username: GeoNames username. Defaults to the
+            ``KERYKEION_GEONAMES_USERNAME`` environment variable or the shared demo account.
+        cache_expire_after_days: How long GeoNames results are kept in the requests-cache.
+
+    Raises:
+        KerykeionException: If the executor kind or a limit is invalid.
+    """
+
+    def __init__(
+        self,
+        *,
+        executor: Literal["thread", "process"] = "thread",
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        geonames_username: Optional[str] = None,
+        cache_expire_after_days: int = DEFAULT_GEONAMES_CACHE_EXPIRE_AFTER_DAYS,
+    ):
+        if executor == "thread":
+            workers = 1
+        elif executor == "process":
+            workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        else:
+            raise KerykeionException(f"Unknown executor {executor!r}. Use 'thread' or 'process'.")
+        if workers < 1:
+            raise KerykeionException("max_workers must be at least 1.")
+        concurrency = max_concurrency if max_concurrency is not None else 2 * workers
+        if concurrency < 1:
+            raise KerykeionException("max_concurrency must be at least 1.")
+
+        self.executor_kind = executor
+        self.max_workers = workers
+        self.max_concurrency = concurrency
+        self.geonames_username = geonames_username
+        self.cache_expire_after_days = cache_expire_after_days
+
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._geonames_pending: Dict[Tuple[str, str], "asyncio.Future[Dict[str, str]]"] = {}
+
+    async def __aenter__(self) -> "AsyncKerykeion":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Shut the executor down, waiting for running calls to finish."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, functools.partial(executor.shutdown, wait=True))
+
+    # =========================================================================
+    # EXECUTION
+    # =========================================================================
+
+    async def run(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking Kerykeion call in the executor.
+
+        Args:
+            function: Callable to run. It must be picklable (a module-level
+                function or a class method) for the process executor.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            The result of the call.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            call = functools.partial(function, *args, **kwargs)
+            if self.executor_kind == "thread":
+                call = functools.partial(contextvars.copy_context().run, call)
+            return await loop.run_in_executor(self._get_executor(), call)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kerykeion")
+        return self._executor
+
+    # =========================================================================
+    # SUBJECTS
+    # =========================================================================
+
+    async def create_subject(
+        self,
+        name: str,
+        year: int,
+        month: int,
+        day: int,
+        hour: int = 0,
+        minute: int = 0,
+        *,
+        city: Optional[str] = None,
+        nation: Optional[str] = None,
+        lng: Optional[float] = None,
+        lat: Optional[float] = None,
+        tz_str: Optional[str] = None,
+        online: bool = True,
+        **kwargs: Any,
+    ) -> AstrologicalSubjectModel:
+        """
+        Awaitable ``AstrologicalSubjectFactory.from_birth_data``.
+
+        When ``online`` is True and coordinates or timezone are missing, they are
+        looked up asynchronously with ``geocode()`` before the subject is computed.
+
+        Args:
+            name: Subject name.
+            year: Birth year.
+            month: Birth month.
+            day: Birth day.
+            hour: Birth hour (local time).
+            minute: Birth minute.
+            city: City name, used for the GeoNames lookup.
+            nation: Two-letter country code, used for the GeoNames lookup.
+            lng: Longitude.
+            lat: Latitude.
+            tz_str: IANA timezone name.
+            online: Whether missing location data may be fetched from GeoNames.
+            **kwargs: Other ``from_birth_data`` arguments (zodiac, houses, points...).
+
+        Returns:
+            AstrologicalSubjectModel: The computed subject.
+
+        Raises:
+            KerykeionException: If the location cannot be resolved or the data is invalid.
+        """
+        city, nation, lng, lat, tz_str = await self._resolve_location(city, nation, lng, lat, tz_str, online)
+        return await self.run(
+            AstrologicalSubjectFactory.from_birth_data,
+            name,
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            city=city,
+            nation=nation,
+            lng=lng,
+            lat=lat,
+            tz_str=tz_str,
+            online=False,
+            suppress_geonames_warning=True,
+            **kwargs,
+        )
+
+    async def planetary_return(
+        self,
+        subject: AstrologicalSubjectModel,
+        year: int,
+        month: int,
+        day: int = 1,
+        *,
+        return_type: ReturnType,
+        city: Optional[str] = None,
+        nation: Optional[str] = None,
+        lng: Optional[float] = None,
+        lat: Optional[float] = None,
+        tz_str: Optional[str] = None,
+        online: bool = True,
+    ) -> PlanetReturnModel:
+        """
+        Awaitable ``PlanetaryReturnFactory.next_return_from_date``.
+
+        The return is cast for the given place, looked up asynchronously when
+        ``online`` is True and coordinates or timezone are missing.
+
+        Args:
+            subject: Natal subject.
+            year: Year to search from.
+            month: Month to search from.
+            day: Day to search from.
+            return_type: "Solar" or "Lunar".
+            city: City name of the return location.
+            nation: Two-letter country code of the return location.
+            lng: Longitude of the return location.
+            lat: Latitude of the return location.
+            tz_str: Timezone of the return location.
+            online: Whether missing location data may be fetched from GeoNames.
+
+        Returns:
+            PlanetReturnModel: The first return on or after the date.
+        """
+        city, nation, lng, lat, tz_str = await self._resolve_location(city, nation, lng, lat, tz_str, online)
+        location = dict(city=city, nation=nation, lng=lng, lat=lat, tz_str=tz_str)
+        return await self.run(_planetary_return, subject, location, year, month, day, return_type)
+
+    # =========================================================================
+    # CHART DATA AND RENDERING
+    # =========================================================================
+
+    async def natal_chart_data(
+        self, subject: Union[AstrologicalSubjectModel, PlanetReturnModel], **kwargs: Any
+    ) -> ChartDataModel:
+        """Awaitable ``ChartDataFactory.create_natal_chart_data``."""
+        return await self.run(ChartDataFactory.create_natal_chart_data, subject, **kwargs)
+
+    async def synastry_chart_data(
+        self, first_subject: AstrologicalSubjectModel, second_subject: AstrologicalSubjectModel, **kwargs: Any
+    ) -> ChartDataModel:
+        """Awaitable ``ChartDataFactory.create_synastry_chart_data``."""
+        return await self.run(ChartDataFactory.create_synastry_chart_data, first_subject, second_subject, **kwargs)
+
+    async def transit_chart_data(
+        self, natal_subject: AstrologicalSubjectModel, transit_subject: AstrologicalSubjectModel, **kwargs: Any
+    ) -> ChartDataModel:
+        """Awaitable ``ChartDataFactory.create_transit_chart_data``."""
+        return await self.run(ChartDataFactory.create_transit_chart_data, natal_subject, transit_subject, **kwargs)
+
+    async def composite_chart_data(self, composite_subject: CompositeSubjectModel, **kwargs: Any) -> ChartDataModel:
+        """Awaitable ``ChartDataFactory.create_composite_chart_data``."""
+        return await self.run(ChartDataFactory.create_composite_chart_data, composite_subject, **kwargs)
+
+    async def return_chart_data(
+        self, natal_subject: AstrologicalSubjectModel, return_subject: PlanetReturnModel, **kwargs: Any
+    ) -> ChartDataModel:
+        """Awaitable ``ChartDataFactory.create_return_chart_data``."""
+        return await self.run(ChartDataFactory.create_return_chart_data, natal_subject, return_subject, **kwargs)
+
+    async def render_svg(
+        self,
+        chart_data: ChartDataModel,
+        *,
+        minify: bool = False,
+        remove_css_variables: bool = False,
+        **drawer_options: Any,
+    ) -> str:
+        """
+        Awaitable ``ChartDrawer(chart_data, ...).generate_svg_string()``.
+
+        Args:
+            chart_data: Chart data to draw.
+            minify: Minify the SVG.
+            remove_css_variables: Inline the CSS variables.
+            **drawer_options: ``ChartDrawer`` arguments (theme, language, style...).
+
+        Returns:
+            str: The SVG markup.
+        """
+        return await self.run(_render_svg, chart_data, drawer_options, minify, remove_css_variables)
+
+    # =========================================================================
+    # GEOCODING
+    # =========================================================================
+
+    async def geocode(self, city: str, nation: str) -> Dict[str, str]:
+        """
+        Look a city up on GeoNames without blocking the event loop.
+
+        The lookup is ``FetchGeonames.get_serialized_data()`` run in the
+        executor, so results are cached on disk like the synchronous factory's.
+        Concurrent lookups of the same place share one call.
+
+        Args:
+            city: City name.
+            nation: Two-letter country code.
+
+        Returns:
+            Dict[str, str]: ``name``, ``lat``, ``lng``, ``countryCode`` and
+            ``timezonestr``, as returned by ``FetchGeonames.get_serialized_data()``.
+
+        Raises:
+            KerykeionException: If GeoNames cannot be reached or does not know the place.
+        """
+        key = (city.casefold(), nation.casefold())
+        pending = self._geonames_pending.get(key)
+        if pending is None:
+            username = self.geonames_username or _get_geonames_username()
+            pending = asyncio.ensure_future(self.run(_geocode, city, nation, username, self.cache_expire_after_days))
+            self._geonames_pending[key] = pending
+            pending.add_done_callback(lambda _: self._geonames_pending.pop(key, None))
+        return dict(await asyncio.shield(pending))
+
+    async def _resolve_location(
+        self,
+        city: Optional[str],
+        nation: Optional[str],
+        lng: Optional[float],
+        lat: Optional[float],
+        tz_str: Optional[str],
+        online: bool,
+    ) -> Tuple[Optional[str], Optional[str], Optional[float], Optional[float], Optional[str]]:
+        if not online or (lng is not None and lat is not None and tz_str):
+            return city, nation, lng, lat, tz_str
+        city, nation = city or "Greenwich", nation or "GB"
+        data = await self.geocode(city, nation)
+        return city, data["countryCode"], float(data["lng"]), float(data["lat"]), data["timezonestr"]
+
+
+__all__ = [
+    "AsyncKerykeion",
+]
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Almanac Module
+
+This module provides AlmanacGenerator, which streams day-by-day Sun and Moon
+rise, set and transit times, Moon illumination and the exact times of the major
+lunar phases for one location over a date range.
+
+MoonPhaseDetailsFactory answers the same questions for a single instant but
+needs a full subject, a full overview and several phase and eclipse searches per
+call, so a yearly calendar costs hundreds of subjects. The generator talks to
+Swiss Ephemeris directly instead. Every event search starts from the first local
+midnight it has not covered yet and its result is kept: a moonrise found after
+today's midnight that falls tomorrow is tomorrow's moonrise, so each rise, set
+and transit is searched for once. The Sun-Moon elongation at each midnight is
+likewise carried over to the next day, and a major phase is only refined by root
+finding on the days where the elongation crosses a multiple of 90 degrees.
+
+Classes:
+    AlmanacPhaseEvent: One New Moon, First Quarter, Full Moon or Last Quarter
+    AlmanacDay: Sun and Moon data for one local civil day
+    AlmanacGenerator: Almanac over a date range for one location
+
+Example:
+    >>> from datetime import date
+    >>> from kerykeion.almanac import AlmanacGenerator
+    >>> almanac = AlmanacGenerator(lng=12.4964, lat=41.9028, tz_str="Europe/Rome")
+    >>> for day in almanac.iter_days(date(2025, 1, 1), date(2025, 1, 31)):
+    ...     print(day.date, day.sunrise, day.moonrise, day.moon_illumination)
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import math
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+import pytz
+
+from kerykeion.ephemeris_events import _find_root
+from kerykeion.instrumentation import swe
+from kerykeion.moon_phase_details.utils import (
+    STANDARD_ATMOSPHERIC_PRESSURE_HPA,
+    STANDARD_TEMPERATURE_CELSIUS,
+    configure_ephemeris_path,
+)
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import LunarPhaseEmoji, LunarPhaseName
+from kerykeion.utilities import (
+    datetime_to_julian,
+    get_moon_emoji_from_phase_int,
+    get_moon_phase_name_from_phase_int,
+    julian_to_datetime,
+)
+
+_CALC_RISE = getattr(swe, "CALC_RISE", getattr(swe, "SE_CALC_RISE", 1))
+_CALC_SET = getattr(swe, "CALC_SET", getattr(swe, "SE_CALC_SET", 2))
+_CALC_MTRANSIT = getattr(swe, "CALC_MTRANSIT", getattr(swe, "SE_CALC_MTRANSIT", 4))
+
+# (field of AlmanacDay, Swiss Ephemeris body, rise_trans event flag)
+_DAILY_EVENTS: Tuple[Tuple[str, int, int], ...] = (
+    ("sunrise", swe.SUN, _CALC_RISE),
+    ("sunset", swe.SUN, _CALC_SET),
+    ("solar_noon", swe.SUN, _CALC_MTRANSIT),
+    ("moonrise", swe.MOON, _CALC_RISE),
+    ("moonset", swe.MOON, _CALC_SET),
+    ("moon_transit", swe.MOON, _CALC_MTRANSIT),
+)
+
+#: Major phases by Sun-Moon elongation quarter (0, 90, 180 and 270 degrees).
+MAJOR_PHASES: Tuple[LunarPhaseName, ...] = ("New Moon", "First Quarter", "Full Moon", "Last Quarter")
+
+_PHASE_STEP_DEGREES = 360.0 / 28.0
+
+
+class AlmanacPhaseEvent(NamedTuple):
+    """
+    One major lunar phase.
+
+    Attributes:
+        phase: "New Moon", "First Quarter", "Full Moon" or "Last Quarter".
+        julian_day: Julian Day (UT) of the exact phase.
+        moment: Local datetime of the exact phase.
+    """
+
+    phase: LunarPhaseName
+    julian_day: float
+    moment: datetime
+
+
+class AlmanacDay(NamedTuple):
+    """
+    Sun and Moon data for one local civil day.
+
+    Event times are timezone-aware local datetimes, or None when the event does
+    not happen that day (the Moon skips one rise and one set per month, and
+    neither body rises or sets near the poles during polar day and night).
+
+    Attributes:
+        date: Local calendar date.
+        sunrise: Sunrise (upper limb, standard refraction).
+        sunset: Sunset.
+        solar_noon: Upper transit of the Sun over the meridian.
+        moonrise: Moonrise (upper limb, standard refraction).
+        moonset: Moonset.
+        moon_transit: Upper transit of the Moon over the meridian.
+        moon_phase_angle: Sun-Moon elongation at local noon, in degrees [0, 360).
+        moon_illumination: Illuminated fraction of the Moon at local noon, from 0 to 1.
+        moon_phase_name: Phase name at local noon.
+        moon_emoji: Phase emoji at local noon.
+        phase_events: Major phases reached during the day, in time order.
+    """
+
+    date: date
+    sunrise: Optional[datetime]
+    sunset: Optional[datetime]
+    solar_noon: Optional[datetime]
+    moonrise: Optional[datetime]
+    moonset: Optional[datetime]
+    moon_transit: Optional[datetime]
+    moon_phase_angle: float
+    moon_illumination: float
+    moon_phase_name: LunarPhaseName
+    moon_emoji: LunarPhaseEmoji
+    phase_events: Tuple[AlmanacPhaseEvent, ...]
+
+    @property
+    def day_length(self) -> Optional[timedelta]:
+        """Time from sunrise to sunset, when both happen and sunrise comes first."""
+        if self.sunrise is None or self.sunset is None or self.sunset < self.sunrise:
+            return None
+        return self.sunset - self.sunrise
+
+
+class AlmanacGenerator:
+    """
+    Stream daily Sun and Moon almanac data for one location.
+
+    Args:
+        lng: Observer longitude in degrees.
+        lat: Observer latitude in degrees.
+        tz_str: IANA timezone used for the local days and the reported times.
+        altitude: Observer altitude in meters above sea level.
+
+    Raises:
+        KerykeionException: If the timezone is unknown or the coordinates are out of range.
+    """
+
+    def __init__(self, lng: float, lat: float, tz_str: str, *, altitude: float = 0.0):
+        if not -180.0 <= lng <= 180.0 or not -90.0 <= lat <= 90.0:
+            raise KerykeionException(f"Invalid coordinates: longitude {lng}, latitude {lat}.")
+        try:
+            self.timezone = pytz.timezone(tz_str)
+        except pytz.exceptions.UnknownTimeZoneError as exc:
+            raise KerykeionException(f"Unknown timezone: {tz_str}.") from exc
+        self.lng = float(lng)
+        self.lat = float(lat)
+        self.tz_str = tz_str
+        self.altitude = float(altitude)
+        self._geopos = (self.lng, self.lat, self.altitude)
+        self._iflag = configure_ephemeris_path()
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def iter_days(self, start: Union[date, datetime], end: Union[date, datetime]) -> Iterator[AlmanacDay]:
+        """
+        Stream the almanac for every local day from ``start`` to ``end``, both included.
+
+        Args:
+            start: First local date (the date part of a datetime is used).
+            end: Last local date.
+
+        Yields:
+            AlmanacDay: One entry per day, in order.
+
+        Raises:
+            KerykeionException: If ``end`` is before ``start`` or Swiss Ephemeris fails.
+        """
+        first, last = _as_date(start), _as_date(end)
+        if last < first:
+            raise KerykeionException("The end of the range must not be before its start.")
+        return self._iter_days(first, last)
+
+    def iter_phase_events(
+        self, start: Union[date, datetime], end: Union[date, datetime]
+    ) -> Iterator[AlmanacPhaseEvent]:
+        """
+        Stream the major lunar phases reached from ``start`` to ``end``, both days included.
+
+        Yields:
+            AlmanacPhaseEvent: Phases in time order.
+        """
+        for day in self.iter_days(start, end):
+            yield from day.phase_events
+
+    # =========================================================================
+    # SEARCH
+    # =========================================================================
+
+    def _iter_days(self, first: date, last: date) -> Iterator[AlmanacDay]:
+        # Next event of each kind found so far; reused while it lies ahead of the current day.
+        next_events: Dict[str, Optional[float]] = {name: None for name, _, _ in _DAILY_EVENTS}
+        day_start = self._local_midnight(first)
+        start_elongation = self._elongation(day_start)
+
+        current = first
+        while current <= last:
+            following = current + timedelta(days=1)
+            day_end = self._local_midnight(following)
+
+            times: Dict[str, Optional[datetime]] = {}
+            for name, body, event in _DAILY_EVENTS:
+                event_jd = next_events[name]
+                if event_jd is None or event_jd < day_start:
+                    event_jd = next_events[name] = self._next_event(day_start, body, event)
+                times[name] = self._local(event_jd) if event_jd is not None and event_jd < day_end else None
+
+            end_elongation = self._elongation(day_end)
+            noon_elongation = self._elongation(self._local_jd(datetime(current.year, current.month, current.day, 12)))
+            phase = int(noon_elongation // _PHASE_STEP_DEGREES) + 1
+
+            yield AlmanacDay(
+                date=current,
+                moon_phase_angle=noon_elongation,
+                moon_illumination=0.5 * (1.0 - math.cos(math.radians(noon_elongation))),
+                moon_phase_name=get_moon_phase_name_from_phase_int(phase),
+                moon_emoji=get_moon_emoji_from_phase_int(phase),
+                phase_events=self._phase_events(day_start, day_end, start_elongation, end_elongation),
+                **times,
+            )
+
+            current, day_start, start_elongation = following, day_end, end_elongation
+
+    def _next_event(self, julian_day: float, body: int, event: int) -> Optional[float]:
+        """First rise, set or transit of ``body`` after ``julian_day``, or None if it does not happen."""
+        try:
+            status, times = swe.rise_trans(
+                julian_day,
+                body,
+                event,
+                self._geopos,
+                atpress=STANDARD_ATMOSPHERIC_PRESSURE_HPA,
+                attemp=STANDARD_TEMPERATURE_CELSIUS,
+                flags=self._iflag,
+            )
+        except swe.Error as exc:
+            raise KerykeionException(f"Swiss Ephemeris rise/set search failed: {exc}") from exc
+        return float(times[0]) if status == 0 else None
+
+    def _phase_events(
+        self, day_start: float, day_end: float, start_elongation: float, end_elongation: float
+    ) -> Tuple[AlmanacPhaseEvent, ...]:
+        """Major phase reached between two instants, the elongation growing by less than 90 degrees."""
+        start_quarter = int(start_elongation // 90.0)
+        end_quarter = int(end_elongation // 90.0)
+        if start_quarter == end_quarter:
+            return ()
+        quarter = (start_quarter + 1) % 4
+        target = quarter * 90.0
+
+        def offset(julian_day: float) -> float:
+            return swe.difdeg2n(self._elongation(julian_day), target)
+
+        exact_jd = _find_root(
+            offset,
+            day_start,
+            day_end,
+            swe.difdeg2n(start_elongation, target),
+            swe.difdeg2n(end_elongation, target),
+        )
+        return (AlmanacPhaseEvent(MAJOR_PHASES[quarter], exact_jd, self._local(exact_jd)),)
+
+    def _elongation(self, julian_day: float) -> float:
+        """Sun-Moon elongation measured eastward along the ecliptic, in degrees [0, 360)."""
+        try:
+            sun = swe.calc_ut(julian_day, swe.SUN, self._iflag)[0][0]
+            moon = swe.calc_ut(julian_day, swe.MOON, self._iflag)[0][0]
+        except swe.Error as exc:
+            raise KerykeionException(f"Swiss Ephemeris calculation failed: {exc}") from exc
+        return (moon - sun) % 360.0
+
+    # =========================================================================
+    # TIME CONVERSION
+    # =========================================================================
+
+    def _local_midnight(self, day: date) -> float:
+        return self._local_jd(datetime(day.year, day.month, day.day))
+
+    def _local_jd(self, moment: datetime) -> float:
+        """Julian Day (UT) of a naive local datetime."""
+        return datetime_to_julian(self.timezone.localize(moment).astimezone(timezone.utc))
+
+    def _local(self, julian_day: float) -> datetime:
+        return julian_to_datetime(julian_day).replace(tzinfo=timezone.utc).astimezone(self.timezone)
+
+
+def _as_date(value: Union[date, datetime]) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+__all__ = [
+    "MAJOR_PHASES",
+    "AlmanacDay",
+    "AlmanacGenerator",
+    "AlmanacPhaseEvent",
+]
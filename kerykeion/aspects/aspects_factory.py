@@ -40,6 +40,11 @@ AXES_LIST = [
     "Imum_Coeli",
 ]
 
+# Points whose position itself depends on the location (the axes, Vertex and Arabic parts)
+LOCATION_DEPENDENT_POINTS = frozenset(
+    [*AXES_LIST, "Vertex", "Anti_Vertex", "Pars_Fortunae", "Pars_Spiritus", "Pars_Amoris", "Pars_Fidei"]
+)
+
 
 class AspectsFactory:
     """
@@ -306,7 +311,7 @@ class AspectsFactory:
         active_points_list = get_active_points_list(subject, active_points)
 
         # Update aspects settings with active aspects orbs
-        filtered_settings = AspectsFactory._update_aspect_settings(aspects_settings, active_aspects)
+        filtered_settings = AspectsFactory.resolve_aspect_settings(aspects_settings, active_aspects)
 
         # Create a lookup dictionary for planet IDs to optimize performance
         planet_id_lookup = {planet["name"]: planet["id"] for planet in celestial_points}
@@ -424,7 +429,7 @@ class AspectsFactory:
         planet_id_lookup = {planet["name"]: planet["id"] for planet in celestial_points}
 
         # Update aspects settings with active aspects orbs
-        filtered_settings = AspectsFactory._update_aspect_settings(aspects_settings, active_aspects)
+        filtered_settings = AspectsFactory.resolve_aspect_settings(aspects_settings, active_aspects)
 
         all_aspects_list = []
         for first in range(len(first_active_points_list)):
@@ -492,20 +497,29 @@ class AspectsFactory:
         return all_aspects_list
 
     @staticmethod
-    def _update_aspect_settings(
+    def resolve_aspect_settings(
         aspects_settings: Sequence[Mapping[str, Any]], active_aspects: List[ActiveAspect]
     ) -> List[dict]:
         """
-        Update aspects settings with active aspects orbs.
+        Resolve the aspect settings used for a calculation.
 
-        This is a common utility method used by both single chart and dual chart calculations.
+        Keeps only the settings of the active aspects, in ``aspects_settings``
+        order, and replaces each orb with the one of the matching active aspect.
+        Single and dual chart calculations use it, and so can callers that
+        match aspects themselves (e.g. against ``DEFAULT_CHART_ASPECTS_SETTINGS``).
+        The input settings are not modified.
 
         Args:
-            aspects_settings: Base aspect settings
+            aspects_settings: Base aspect settings (``name``, ``degree``, ``orb``...)
             active_aspects: Active aspects with their orb configurations
 
         Returns:
             List of filtered and updated aspect settings
+
+        Example:
+            >>> settings = AspectsFactory.resolve_aspect_settings(
+            ...     DEFAULT_CHART_ASPECTS_SETTINGS, [{"name": "conjunction", "orb": 8}]
+            ... )
         """
         filtered_settings = []
         for aspect_setting in aspects_settings:
@@ -4,8 +4,8 @@ This is part of Kerykeion (C) 2025 Giacomo Battaglia
 """
 # TODO: Better documentation and unit tests
 
-from swisseph import difdeg2n
 from typing import Optional, Union
+from kerykeion.instrumentation import swe
 from kerykeion.schemas.kr_models import AstrologicalSubjectModel, CompositeSubjectModel, PlanetReturnModel
 from kerykeion.schemas.kr_literals import AspectMovementType
 from kerykeion.schemas.settings_models import KerykeionSettingsCelestialPointModel
@@ -28,7 +28,7 @@ def get_aspect_from_two_points(
     Returns:
         dict: Dictionary containing the aspect details.
     """
-    distance = abs(difdeg2n(point_one, point_two))
+    distance = abs(swe.difdeg2n(point_one, point_two))
     diff = abs(point_one - point_two)
 
     for aid, aspect in enumerate(aspects_settings):
@@ -145,7 +145,7 @@ def calculate_aspect_movement(
             Absolute orb in degrees
         """
         # Calculate shortest distance between points on the circle
-        diff = abs(difdeg2n(p1, p2))
+        diff = abs(swe.difdeg2n(p1, p2))
         # The orb is the absolute difference between the actual separation and the aspect angle
         return abs(diff - aspect)
 
@@ -31,18 +31,19 @@ License: AGPL-3.0
 """
 
 import pytz
-import swisseph as swe
 import logging
 import math
 from datetime import datetime
 from os import getenv
 from pathlib import Path
-from typing import Optional, List, Dict, Any, get_args
+from typing import Optional, List, Dict, Any, Iterator, NamedTuple, Protocol, Tuple, Union, get_args
 from dataclasses import dataclass, field
 from contextlib import contextmanager
+from contextvars import ContextVar
 
 
 from kerykeion.fetch_geonames import FetchGeonames
+from kerykeion.instrumentation import stage, swe
 from kerykeion.schemas import (
     KerykeionException,
     ZodiacType,
@@ -211,6 +212,181 @@ def _get_geonames_username() -> str:
     return getenv(GEONAMES_USERNAME_ENV_VAR) or DEFAULT_GEONAMES_USERNAME
 
 
+class PositionSource(Protocol):
+    """
+    Precomputed body positions, supplied through ``AstrologicalSubjectFactory.precomputed_positions()``.
+
+    Implemented by ChebyshevPositionCache (see kerykeion.position_cache) and used
+    by ChartVariants (see kerykeion.chart_variants).
+    """
+
+    def lookup(self, julian_day: float, planet_id: int, iflag: int) -> Optional[Tuple[float, float, float]]:
+        """
+        Position of a Swiss Ephemeris body, or None when the source does not cover the request.
+
+        Args:
+            julian_day: Julian Day (UT).
+            planet_id: Swiss Ephemeris body identifier.
+            iflag: Swiss Ephemeris calculation flags.
+
+        Returns:
+            Optional[Tuple[float, float, float]]: (longitude, speed, declination), or None.
+        """
+        ...
+
+
+# Position sources consulted before Swiss Ephemeris, innermost last, installed by
+# AstrologicalSubjectFactory.precomputed_positions().
+_ACTIVE_POSITION_SOURCES: ContextVar[Tuple[PositionSource, ...]] = ContextVar("kerykeion_position_sources", default=())
+
+
+def _calc_body_position(julian_day: float, planet_id: int, iflag: int) -> Tuple[float, float, float]:
+    """
+    Return the ecliptic longitude, longitude speed and declination of a body.
+
+    Uses the innermost active position source that covers the body, instant and
+    flags, otherwise calls Swiss Ephemeris.
+
+    Args:
+        julian_day: Julian Day (UT).
+        planet_id: Swiss Ephemeris body identifier.
+        iflag: Swiss Ephemeris calculation flags.
+
+    Returns:
+        Tuple[float, float, float]: (longitude, speed, declination) in degrees and degrees/day.
+    """
+    for source in reversed(_ACTIVE_POSITION_SOURCES.get()):
+        cached = source.lookup(julian_day, planet_id, iflag)
+        if cached is not None:
+            return cached
+
+    planet_calc = swe.calc_ut(julian_day, planet_id, iflag)[0]
+    # Declination from equatorial coordinates
+    planet_eq = swe.calc_ut(julian_day, planet_id, iflag | swe.FLG_EQUATORIAL)[0]
+    return planet_calc[0], planet_calc[3], planet_eq[1]
+
+
+# =============================================================================
+# SKY AT INSTANT (location-independent stage)
+# =============================================================================
+# Planet, node, asteroid and fixed-star positions depend on the instant and the
+# zodiac settings only (topocentric charts excepted). They are computed as one
+# snapshot, which a SkyCache (see kerykeion.sky_cache) installed through
+# _ACTIVE_SKY_CACHE shares between subjects; houses, angles, Vertex, sect and
+# Arabic parts are then computed per location on top of it.
+_ACTIVE_SKY_CACHE: ContextVar[Optional[Any]] = ContextVar("kerykeion_sky_cache", default=None)
+
+
+class _SkyPosition(NamedTuple):
+    """Location-independent position of one body."""
+
+    longitude: float
+    speed: float
+    declination: Optional[float]
+    magnitude: Optional[float] = None
+
+
+# Position of every requested body, or the error raised while calculating it
+SkySnapshot = Dict[AstrologicalPoint, Union[_SkyPosition, Exception]]
+
+
+def _calculate_sky(julian_day: float, iflag: int, points: Tuple[AstrologicalPoint, ...]) -> SkySnapshot:
+    """
+    Calculate the location-independent positions of the requested bodies.
+
+    Must run inside ``ephemeris_context``. Standard planets, TNOs and fixed stars
+    are timed as the ``subject.planets``, ``subject.tnos`` and
+    ``subject.fixed_stars`` stages.
+
+    Args:
+        julian_day: Julian Day (UT).
+        iflag: Swiss Ephemeris calculation flags.
+        points: Bodies to calculate; any other point is ignored.
+
+    Returns:
+        SkySnapshot: Position of each body, or the exception raised for it.
+    """
+    requested = set(points)
+    sky: SkySnapshot = {}
+
+    with stage("subject.planets"):
+        for planet_name, planet_id in STANDARD_PLANETS.items():
+            if planet_name in requested:
+                try:
+                    sky[planet_name] = _SkyPosition(*_calc_body_position(julian_day, planet_id, iflag))
+                except Exception as e:
+                    sky[planet_name] = e
+
+    # TNOs require AST_OFFSET and may fail for dates outside ephemeris range
+    with stage("subject.tnos"):
+        for tno_name, asteroid_num in TNO_PLANETS.items():
+            if tno_name in requested:
+                try:
+                    sky[tno_name] = _SkyPosition(*_calc_body_position(julian_day, swe.AST_OFFSET + asteroid_num, iflag))
+                except Exception as e:
+                    sky[tno_name] = e
+
+    # Fixed stars use a different calculation method (swe.fixstar_ut)
+    with stage("subject.fixed_stars"):
+        for star_name in FIXED_STARS:
+            if star_name in requested:
+                try:
+                    # Use Swiss Ephemeris name if different from AstrologicalPoint name
+                    swe_name = FIXED_STAR_SWE_NAMES.get(star_name, star_name)
+                    # Ecliptic longitude for zodiac placement
+                    pos_ecl = swe.fixstar_ut(swe_name, julian_day, iflag)[0]
+                    star_speed = pos_ecl[3] if len(pos_ecl) > 3 else 0.0
+                    # Equatorial coordinates for true declination
+                    pos_eq = swe.fixstar_ut(swe_name, julian_day, iflag | swe.FLG_EQUATORIAL)[0]
+                    star_dec = pos_eq[1] if len(pos_eq) > 1 else None
+
+                    # Apparent visual magnitude via fixstar2_mag
+                    try:
+                        star_mag = swe.fixstar2_mag(swe_name)[0]
+                    except Exception as e:
+                        logging.warning(f"Could not load fixed-star magnitude for {star_name} ({swe_name}): {e}")
+                        star_mag = None
+
+                    sky[star_name] = _SkyPosition(pos_ecl[0], star_speed, star_dec, star_mag)
+                except Exception as e:
+                    sky[star_name] = e
+
+    return sky
+
+
+def _sky_at_instant(
+    julian_day: float,
+    iflag: int,
+    sidereal_settings: Optional[Tuple[Any, ...]],
+    points: Tuple[AstrologicalPoint, ...],
+) -> SkySnapshot:
+    """
+    Return the sky snapshot, from the active SkyCache when one is installed.
+
+    Topocentric positions depend on the observer and positions taken from an
+    active position source may be approximations, so neither is shared.
+
+    Args:
+        julian_day: Julian Day (UT).
+        iflag: Swiss Ephemeris calculation flags (zodiac and perspective).
+        sidereal_settings: Sidereal mode and custom ayanamsa, None for tropical charts.
+        points: Bodies to calculate.
+
+    Returns:
+        SkySnapshot: Position of each body, or the exception raised for it.
+    """
+    sky_cache = _ACTIVE_SKY_CACHE.get()
+    if sky_cache is None or iflag & swe.FLG_TOPOCTR or _ACTIVE_POSITION_SOURCES.get():
+        return _calculate_sky(julian_day, iflag, points)
+
+    key = (julian_day, iflag, sidereal_settings, points)
+    sky = sky_cache.lookup(key)
+    if sky is None:
+        sky = _calculate_sky(julian_day, iflag, points)
+        sky_cache.store(key, sky)
+    return sky
+
+
 @contextmanager
 def ephemeris_context(
     ephe_path: str,
@@ -579,6 +755,35 @@ class AstrologicalSubjectFactory:
         or implement appropriate locking mechanisms.
     """
 
+    @staticmethod
+    @contextmanager
+    def precomputed_positions(source: PositionSource) -> Iterator[PositionSource]:
+        """
+        Take body positions from ``source`` for the subjects created inside the ``with`` block.
+
+        Before calling Swiss Ephemeris for a planet, lunar node, asteroid or TNO, the
+        factory asks the active sources for its position, innermost first, and uses
+        the first answer that is not None. Sources nest: a source only shadows the
+        outer ones for the requests it covers. Houses, angles, fixed stars and the
+        derived points are always calculated, and sky snapshots are not shared
+        through a SkyCache while a source is active.
+
+        The source is installed for the current context only (thread or task).
+
+        Args:
+            source: Any object implementing ``PositionSource.lookup()``, such as a
+                ChebyshevPositionCache.
+
+        Example:
+            >>> with AstrologicalSubjectFactory.precomputed_positions(cache):
+            ...     subject = AstrologicalSubjectFactory.from_birth_data(...)
+        """
+        token = _ACTIVE_POSITION_SOURCES.set(_ACTIVE_POSITION_SOURCES.get() + (source,))
+        try:
+            yield source
+        finally:
+            _ACTIVE_POSITION_SOURCES.reset(token)
+
     @classmethod
     def from_birth_data(
         cls,
@@ -785,28 +990,32 @@ class AstrologicalSubjectFactory:
             if geonames_username == DEFAULT_GEONAMES_USERNAME and not suppress_geonames_warning:
                 logging.warning(GEONAMES_DEFAULT_USERNAME_WARNING)
 
-        # Initialize location data
-        location = LocationData(
-            city=city or "Greenwich",
-            nation=nation or "GB",
-            lat=lat if lat is not None else 51.5074,
-            lng=lng if lng is not None else 0.0,
-            tz_str=tz_str or "Etc/GMT",
-            altitude=altitude,
-        )
+        with stage("subject.location"):
+            # Initialize location data
+            location = LocationData(
+                city=city or "Greenwich",
+                nation=nation or "GB",
+                lat=lat if lat is not None else 51.5074,
+                lng=lng if lng is not None else 0.0,
+                tz_str=tz_str or "Etc/GMT",
+                altitude=altitude,
+            )
 
-        # If offline mode is requested but required data is missing, raise error
-        if not online and (not tz_str or lat is None or lng is None):
-            raise KerykeionException("For offline mode, you must provide timezone (tz_str) and coordinates (lat, lng)")
+            # If offline mode is requested but required data is missing, raise error
+            if not online and (not tz_str or lat is None or lng is None):
+                raise KerykeionException(
+                    "For offline mode, you must provide timezone (tz_str) and coordinates (lat, lng)"
+                )
 
-        # Fetch location data if needed
-        if online and (not tz_str or lat is None or lng is None):
-            location.fetch_from_geonames(
-                username=geonames_username or _get_geonames_username(), cache_expire_after_days=cache_expire_after_days
-            )
+            # Fetch location data if needed
+            if online and (not tz_str or lat is None or lng is None):
+                location.fetch_from_geonames(
+                    username=geonames_username or _get_geonames_username(),
+                    cache_expire_after_days=cache_expire_after_days,
+                )
 
-        # Prepare location for calculations
-        location.prepare_for_calculation()
+            # Prepare location for calculations
+            location.prepare_for_calculation()
 
         # Add location data to calculation data
         calc_data["city"] = location.city
@@ -826,7 +1035,8 @@ class AstrologicalSubjectFactory:
         calc_data["is_dst"] = is_dst
 
         # Calculate time conversions
-        AstrologicalSubjectFactory._calculate_time_conversions(calc_data, location)
+        with stage("subject.time_conversion"):
+            AstrologicalSubjectFactory._calculate_time_conversions(calc_data, location)
         # Initialize Swiss Ephemeris and calculate houses and planets with context manager
         ephe_path = str(Path(__file__).parent.absolute() / "sweph")
         with ephemeris_context(
@@ -837,9 +1047,16 @@ class AstrologicalSubjectFactory:
             alt=calc_data["altitude"],
         ) as iflag:
             calc_data["_iflag"] = iflag
+            # Sidereal settings not encoded in iflag, part of the sky cache key
+            calc_data["_sidereal_settings"] = (
+                (config.sidereal_mode, config.custom_ayanamsa_t0, config.custom_ayanamsa_ayan_t0)
+                if config.zodiac_type == "Sidereal"
+                else None
+            )
             # House system name (previously set in _setup_ephemeris)
             calc_data["houses_system_name"] = swe.house_name(config.houses_system_identifier.encode("ascii"))
-            calculated_axial_cusps = AstrologicalSubjectFactory._calculate_houses(calc_data, active_points_list)
+            with stage("subject.houses"):
+                calculated_axial_cusps = AstrologicalSubjectFactory._calculate_houses(calc_data, active_points_list)
 
             # Compute sect (diurnal/nocturnal) BEFORE calculating planets
             # This is needed for Arabic Parts day/night formula selection
@@ -875,7 +1092,8 @@ class AstrologicalSubjectFactory:
             calc_data["lunar_phase"] = None
 
         # Create and return the AstrologicalSubjectModel
-        return AstrologicalSubjectModel(**calc_data)
+        with stage("subject.validation"):
+            return AstrologicalSubjectModel(**calc_data)
 
     @classmethod
     def from_iso_utc_time(
@@ -1370,84 +1588,47 @@ class AstrologicalSubjectFactory:
         return calculated_axial_cusps
 
     @staticmethod
-    def _calculate_single_planet(
+    def _place_sky_point(
         data: Dict[str, Any],
-        planet_name: AstrologicalPoint,
-        planet_id: int,
-        julian_day: float,
-        iflag: int,
+        point_name: AstrologicalPoint,
+        position: _SkyPosition,
         houses_degree_ut: List[float],
         point_type: PointType,
         calculated_planets: List[AstrologicalPoint],
-        active_points: List[AstrologicalPoint],
+        retrograde: Optional[bool] = None,
     ) -> None:
         """
-        Calculate a single celestial body's position with comprehensive error handling.
+        Place a body of the sky snapshot in the chart.
 
-        Computes the position of a single planet, asteroid, or other celestial object
-        using Swiss Ephemeris, creates a Kerykeion point object, determines house
-        position, and assesses retrograde status. Handles calculation errors gracefully
-        by logging and removing failed points from the active list.
+        Creates the Kerykeion point from the location-independent position and
+        adds the location-dependent house.
 
         Args:
             data (Dict[str, Any]): Main calculation data dictionary to store results.
-            planet_name (AstrologicalPoint): Name identifier for the celestial body.
-            planet_id (int): Swiss Ephemeris numerical identifier for the object.
-            julian_day (float): Julian Day Number for the calculation moment.
-            iflag (int): Swiss Ephemeris calculation flags (perspective, zodiac, etc.).
+            point_name (AstrologicalPoint): Name identifier for the celestial body.
+            position (_SkyPosition): Position of the body from the sky snapshot.
             houses_degree_ut (List[float]): House cusp degrees for house determination.
             point_type (PointType): Classification of the point type for the object.
             calculated_planets (List[str]): Running list of successfully calculated objects.
-            active_points (List[AstrologicalPoint]): Active points list (modified on error).
+            retrograde (Optional[bool]): Retrograde status; derived from the speed
+                (negative = retrograde) when None.
 
         Side Effects:
-            - Adds calculated object to data dictionary using lowercase planet_name as key
-            - Appends planet_name to calculated_planets list on success
-            - Removes planet_name from active_points list on calculation failure
-            - Logs error messages for calculation failures
-
-        Calculated Properties:
-            - Zodiacal position (longitude) in degrees
-            - House position based on house cusp positions
-            - Retrograde status based on velocity (negative = retrograde)
-            - Sign, degree, and minute components
-
-        Error Handling:
-            If Swiss Ephemeris calculation fails (e.g., for distant asteroids outside
-            ephemeris range), the method logs the error and removes the object from
-            active_points to prevent cascade failures.
-
-        Note:
-            The method uses the Swiss Ephemeris calc_ut function which returns position
-            and velocity data. Retrograde determination is based on the velocity
-            component being negative (element index 3).
+            - Adds the point to data dictionary using lowercase point_name as key
+            - Appends point_name to calculated_planets list
         """
-        try:
-            # Calculate planet position using Swiss Ephemeris (ecliptic coordinates)
-            planet_calc = swe.calc_ut(julian_day, planet_id, iflag)[0]
-
-            # Get declination from equatorial coordinates
-            planet_eq = swe.calc_ut(julian_day, planet_id, iflag | swe.FLG_EQUATORIAL)[0]
-            declination = planet_eq[1]  # Declination from equatorial coordinates
-
-            # Create Kerykeion point from degree
-            data[planet_name.lower()] = get_kerykeion_point_from_degree(
-                planet_calc[0], planet_name, point_type=point_type, speed=planet_calc[3], declination=declination
-            )
-
-            # Calculate house position
-            data[planet_name.lower()].house = get_planet_house(planet_calc[0], houses_degree_ut)
-
-            # Determine if planet is retrograde
-            data[planet_name.lower()].retrograde = planet_calc[3] < 0
-
-            # Track calculated planet
-            calculated_planets.append(planet_name)
-
-        except Exception as e:
-            logging.error(f"Error calculating {planet_name}: {e}")
-            if planet_name in active_points:
-                active_points.remove(planet_name)
+        point_key = point_name.lower()
+        data[point_key] = get_kerykeion_point_from_degree(
+            position.longitude,
+            point_name,
+            point_type=point_type,
+            speed=position.speed,
+            declination=position.declination,
+            magnitude=position.magnitude,
+        )
+        data[point_key].house = get_planet_house(position.longitude, houses_degree_ut)
+        data[point_key].retrograde = position.speed < 0 if retrograde is None else retrograde
+        calculated_planets.append(point_name)
 
     @staticmethod
     def _ensure_point_calculated(
@@ -1497,15 +1678,12 @@ class AstrologicalSubjectFactory:
         # For planets, use STANDARD_PLANETS mapping
         if point in STANDARD_PLANETS:
             planet_id = STANDARD_PLANETS[point]
-            planet_calc = swe.calc_ut(julian_day, planet_id, iflag)[0]
-            # Get declination from equatorial coordinates (matching _calculate_single_planet)
-            planet_eq = swe.calc_ut(julian_day, planet_id, iflag | swe.FLG_EQUATORIAL)[0]
-            declination = planet_eq[1]
+            longitude, speed, declination = _calc_body_position(julian_day, planet_id, iflag)
             data[point_key] = get_kerykeion_point_from_degree(
-                planet_calc[0], point, point_type=point_type, speed=planet_calc[3], declination=declination
+                longitude, point, point_type=point_type, speed=speed, declination=declination
             )
-            data[point_key].house = get_planet_house(planet_calc[0], houses_degree_ut)
-            data[point_key].retrograde = planet_calc[3] < 0
+            data[point_key].house = get_planet_house(longitude, houses_degree_ut)
+            data[point_key].retrograde = speed < 0
 
     @staticmethod
     def _compute_is_diurnal(
@@ -1735,191 +1913,143 @@ class AstrologicalSubjectFactory:
         calculated_planets: List[AstrologicalPoint] = []
 
         # =============================================================================
-        # STANDARD PLANETS (using centralized mapping)
+        # SKY AT INSTANT (location-independent, shared through an active SkyCache)
         # =============================================================================
-        # This loop replaces ~150 lines of repetitive individual planet calculations.
-        # All standard planets (Sun through Vesta) use the same calculation pattern.
-        # South lunar nodes are calculated after True_North_Lunar_Node to preserve
-        # the original calculation order (Mean_North, True_North, Mean_South, True_South).
-        for planet_name, planet_id in STANDARD_PLANETS.items():
-            if should_calculate(planet_name):
-                AstrologicalSubjectFactory._calculate_single_planet(
-                    data,
-                    planet_name,
-                    planet_id,
-                    julian_day,
-                    iflag,
-                    houses_degree_ut,
-                    point_type,
-                    calculated_planets,
-                    active_points,
-                )
-
-                # Special handling for lunar nodes: calculate declination
-                if planet_name in ("Mean_North_Lunar_Node", "True_North_Lunar_Node"):
-                    node_key = planet_name.lower()
-                    if node_key in data:
-                        # Calculate declination using equatorial coordinates
-                        node_eq = swe.calc_ut(julian_day, planet_id, iflag | swe.FLG_EQUATORIAL)[0]
-                        data[node_key].declination = node_eq[1]
-
-                # Calculate corresponding south node immediately after each north node
-                if planet_name == "Mean_North_Lunar_Node":
-                    south_node: AstrologicalPoint = "Mean_South_Lunar_Node"
-                    north_key = planet_name.lower()
-                    if should_calculate(south_node) and north_key in data:
-                        north_data = data[north_key]
-                        south_deg = math.fmod(north_data.abs_pos + 180, 360)
-                        data[south_node.lower()] = get_kerykeion_point_from_degree(
-                            south_deg,
-                            south_node,
-                            point_type=point_type,
-                            speed=-north_data.speed if north_data.speed is not None else None,
-                            declination=-north_data.declination if north_data.declination is not None else None,
-                        )
-                        data[south_node.lower()].house = get_planet_house(south_deg, houses_degree_ut)
-                        data[south_node.lower()].retrograde = north_data.retrograde
-                        calculated_planets.append(south_node)
-
-                if planet_name == "True_North_Lunar_Node":
-                    south_node_true: AstrologicalPoint = "True_South_Lunar_Node"
-                    north_key = planet_name.lower()
-                    if should_calculate(south_node_true) and north_key in data:
-                        north_data = data[north_key]
-                        south_deg = math.fmod(north_data.abs_pos + 180, 360)
-                        data[south_node_true.lower()] = get_kerykeion_point_from_degree(
-                            south_deg,
-                            south_node_true,
-                            point_type=point_type,
-                            speed=-north_data.speed if north_data.speed is not None else None,
-                            declination=-north_data.declination if north_data.declination is not None else None,
-                        )
-                        data[south_node_true.lower()].house = get_planet_house(south_deg, houses_degree_ut)
-                        data[south_node_true.lower()].retrograde = north_data.retrograde
-                        calculated_planets.append(south_node_true)
+        sky_points = tuple(
+            point for point in (*STANDARD_PLANETS, *TNO_PLANETS, *FIXED_STARS) if should_calculate(point)
+        )
+        sky = _sky_at_instant(julian_day, iflag, data.get("_sidereal_settings"), sky_points)
 
         # =============================================================================
-        # TRANS-NEPTUNIAN OBJECTS (using centralized mapping)
+        # STANDARD PLANETS AND TNOs (using centralized mapping)
         # =============================================================================
-        # TNOs require AST_OFFSET and may fail for dates outside ephemeris range
-        for tno_name, asteroid_num in TNO_PLANETS.items():
-            if should_calculate(tno_name):
-                try:
-                    AstrologicalSubjectFactory._calculate_single_planet(
-                        data,
-                        tno_name,
-                        swe.AST_OFFSET + asteroid_num,
-                        julian_day,
-                        iflag,
-                        houses_degree_ut,
-                        point_type,
-                        calculated_planets,
-                        active_points,
+        # South lunar nodes are placed after True_North_Lunar_Node to preserve
+        # the original calculation order (Mean_North, True_North, Mean_South, True_South).
+        for planet_name in (*STANDARD_PLANETS, *TNO_PLANETS):
+            position = sky.get(planet_name)
+            if position is None:
+                continue
+            if isinstance(position, Exception):
+                logging.error(f"Error calculating {planet_name}: {position}")
+                if planet_name in active_points:
+                    active_points.remove(planet_name)
+            else:
+                AstrologicalSubjectFactory._place_sky_point(
+                    data, planet_name, position, houses_degree_ut, point_type, calculated_planets
+                )
+
+            # Calculate corresponding south node immediately after each north node
+            if planet_name == "Mean_North_Lunar_Node":
+                south_node: AstrologicalPoint = "Mean_South_Lunar_Node"
+                north_key = planet_name.lower()
+                if should_calculate(south_node) and north_key in data:
+                    north_data = data[north_key]
+                    south_deg = math.fmod(north_data.abs_pos + 180, 360)
+                    data[south_node.lower()] = get_kerykeion_point_from_degree(
+                        south_deg,
+                        south_node,
+                        point_type=point_type,
+                        speed=-north_data.speed if north_data.speed is not None else None,
+                        declination=-north_data.declination if north_data.declination is not None else None,
                     )
-                except Exception as e:
-                    logging.warning(f"Could not calculate {tno_name} position: {e}")
-                    if tno_name in active_points:
-                        active_points.remove(tno_name)
+                    data[south_node.lower()].house = get_planet_house(south_deg, houses_degree_ut)
+                    data[south_node.lower()].retrograde = north_data.retrograde
+                    calculated_planets.append(south_node)
+
+            if planet_name == "True_North_Lunar_Node":
+                south_node_true: AstrologicalPoint = "True_South_Lunar_Node"
+                north_key = planet_name.lower()
+                if should_calculate(south_node_true) and north_key in data:
+                    north_data = data[north_key]
+                    south_deg = math.fmod(north_data.abs_pos + 180, 360)
+                    data[south_node_true.lower()] = get_kerykeion_point_from_degree(
+                        south_deg,
+                        south_node_true,
+                        point_type=point_type,
+                        speed=-north_data.speed if north_data.speed is not None else None,
+                        declination=-north_data.declination if north_data.declination is not None else None,
+                    )
+                    data[south_node_true.lower()].house = get_planet_house(south_deg, houses_degree_ut)
+                    data[south_node_true.lower()].retrograde = north_data.retrograde
+                    calculated_planets.append(south_node_true)
 
         # =============================================================================
         # FIXED STARS (using centralized list)
         # =============================================================================
-        # Fixed stars use different calculation method (swe.fixstar_ut)
         for star_name in FIXED_STARS:
-            if should_calculate(star_name):
-                try:
-                    # Use Swiss Ephemeris name if different from AstrologicalPoint name
-                    swe_name = FIXED_STAR_SWE_NAMES.get(star_name, star_name)
-                    # Ecliptic longitude for zodiac placement
-                    pos_ecl = swe.fixstar_ut(swe_name, julian_day, iflag)[0]
-                    star_deg = pos_ecl[0]
-                    star_speed = pos_ecl[3] if len(pos_ecl) > 3 else 0.0
-                    # Equatorial coordinates for true declination
-                    pos_eq = swe.fixstar_ut(swe_name, julian_day, iflag | swe.FLG_EQUATORIAL)[0]
-                    star_dec = pos_eq[1] if len(pos_eq) > 1 else None
-
-                    # Apparent visual magnitude via fixstar2_mag
-                    try:
-                        star_mag = swe.fixstar2_mag(swe_name)[0]
-                    except Exception as e:
-                        logging.warning(f"Could not load fixed-star magnitude for {star_name} ({swe_name}): {e}")
-                        star_mag = None
-
-                    star_key = star_name.lower()
-                    data[star_key] = get_kerykeion_point_from_degree(
-                        star_deg,
-                        star_name,
-                        point_type=point_type,
-                        speed=star_speed,
-                        declination=star_dec,
-                        magnitude=star_mag,
-                    )
-                    data[star_key].house = get_planet_house(star_deg, houses_degree_ut)
-                    data[star_key].retrograde = False  # Fixed stars are never retrograde
-                    calculated_planets.append(star_name)
-                except Exception as e:
-                    logging.warning(f"Could not calculate {star_name} position: {e}")
-                    if star_name in active_points:
-                        active_points.remove(star_name)
+            position = sky.get(star_name)
+            if position is None:
+                continue
+            if isinstance(position, Exception):
+                logging.warning(f"Could not calculate {star_name} position: {position}")
+                if star_name in active_points:
+                    active_points.remove(star_name)
+            else:
+                # Fixed stars are never retrograde
+                AstrologicalSubjectFactory._place_sky_point(
+                    data, star_name, position, houses_degree_ut, point_type, calculated_planets, retrograde=False
+                )
 
         # =============================================================================
         # ARABIC PARTS / LOTS (using centralized configuration)
         # =============================================================================
         # This loop replaces ~260 lines of repetitive Arabic Parts calculations.
         # Each part is configured in ARABIC_PARTS_CONFIG with its formula and requirements.
-        for part_name, part_config in ARABIC_PARTS_CONFIG.items():
-            if should_calculate(part_name):
-                AstrologicalSubjectFactory._calculate_arabic_part(
-                    part_name,
-                    part_config,
-                    data,
-                    julian_day,
-                    iflag,
-                    houses_degree_ut,
-                    point_type,
-                    active_points,
-                    calculated_planets,
-                )
+        with stage("subject.arabic_parts"):
+            for part_name, part_config in ARABIC_PARTS_CONFIG.items():
+                if should_calculate(part_name):
+                    AstrologicalSubjectFactory._calculate_arabic_part(
+                        part_name,
+                        part_config,
+                        data,
+                        julian_day,
+                        iflag,
+                        houses_degree_ut,
+                        point_type,
+                        active_points,
+                        calculated_planets,
+                    )
 
         # =============================================================================
         # VERTEX AND ANTI-VERTEX
         # =============================================================================
-        if should_calculate("Vertex") or should_calculate("Anti_Vertex"):
-            try:
-                # Vertex is at ascmc[3] in Swiss Ephemeris
-                _, ascmc = swe.houses_ex(
-                    tjdut=data["julian_day"],
-                    lat=data["lat"],
-                    lon=data["lng"],
-                    hsys=str.encode("V"),  # Vertex works best with Vehlow system
-                    flags=iflag,
-                )
+        with stage("subject.vertex"):
+            if should_calculate("Vertex") or should_calculate("Anti_Vertex"):
+                try:
+                    # Vertex is at ascmc[3] in Swiss Ephemeris
+                    _, ascmc = swe.houses_ex(
+                        tjdut=data["julian_day"],
+                        lat=data["lat"],
+                        lon=data["lng"],
+                        hsys=str.encode("V"),  # Vertex works best with Vehlow system
+                        flags=iflag,
+                    )
 
-                vertex_deg = ascmc[3]
+                    vertex_deg = ascmc[3]
 
-                # Calculate Vertex if requested
-                if should_calculate("Vertex"):
-                    data["vertex"] = get_kerykeion_point_from_degree(vertex_deg, "Vertex", point_type=point_type)
-                    data["vertex"].house = get_planet_house(vertex_deg, houses_degree_ut)
-                    data["vertex"].retrograde = False
-                    calculated_planets.append("Vertex")
+                    # Calculate Vertex if requested
+                    if should_calculate("Vertex"):
+                        data["vertex"] = get_kerykeion_point_from_degree(vertex_deg, "Vertex", point_type=point_type)
+                        data["vertex"].house = get_planet_house(vertex_deg, houses_degree_ut)
+                        data["vertex"].retrograde = False
+                        calculated_planets.append("Vertex")
 
-                # Calculate Anti-Vertex if requested
-                if should_calculate("Anti_Vertex"):
-                    anti_vertex_deg = math.fmod(vertex_deg + 180, 360)
-                    data["anti_vertex"] = get_kerykeion_point_from_degree(
-                        anti_vertex_deg, "Anti_Vertex", point_type=point_type
-                    )
-                    data["anti_vertex"].house = get_planet_house(anti_vertex_deg, houses_degree_ut)
-                    data["anti_vertex"].retrograde = False
-                    calculated_planets.append("Anti_Vertex")
-
-            except Exception as e:
-                logging.warning("Could not calculate Vertex/Anti-Vertex position, error: %s", e)
-                if "Vertex" in active_points:
-                    active_points.remove("Vertex")
-                if "Anti_Vertex" in active_points:
-                    active_points.remove("Anti_Vertex")
+                    # Calculate Anti-Vertex if requested
+                    if should_calculate("Anti_Vertex"):
+                        anti_vertex_deg = math.fmod(vertex_deg + 180, 360)
+                        data["anti_vertex"] = get_kerykeion_point_from_degree(
+                            anti_vertex_deg, "Anti_Vertex", point_type=point_type
+                        )
+                        data["anti_vertex"].house = get_planet_house(anti_vertex_deg, houses_degree_ut)
+                        data["anti_vertex"].retrograde = False
+                        calculated_planets.append("Anti_Vertex")
+
+                except Exception as e:
+                    logging.warning("Could not calculate Vertex/Anti-Vertex position, error: %s", e)
+                    if "Vertex" in active_points:
+                        active_points.remove("Vertex")
+                    if "Anti_Vertex" in active_points:
+                        active_points.remove("Anti_Vertex")
 
         # Store only the planets that were actually calculated
         all_calculated_points = calculated_planets.copy()
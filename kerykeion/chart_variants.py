@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+Chart Variants Module
+
+This module provides ChartVariants, which computes one chart under many house
+systems and sidereal modes in a single pass, for comparison views.
+
+Creating every variant with AstrologicalSubjectFactory repeats the whole
+planetary calculation, although the tropical positions are the same for all of
+them and the sidereal positions only differ by the ayanamsa. ChartVariants
+takes the positions of one tropical subject, obtains the ayanamsa of each
+sidereal mode from ``swe.get_ayanamsa_ex_ut`` (the value, plus two calls for
+its rate) and shifts every position by it, then runs only the Swiss Ephemeris house step for each house
+system. The result is compact; ``variant()`` builds the summary of one variant
+on demand and ``to_subject()`` expands it into a full AstrologicalSubjectModel,
+reusing the shifted positions instead of recomputing the bodies.
+
+Accuracy:
+    Shifting by the ayanamsa reproduces the sidereal longitudes of Swiss
+    Ephemeris within 1e-6 degrees for the named modes, and speeds corrected by
+    the rate of the ayanamsa within about 2e-6 degrees/day. The modes that
+    project positions on the ecliptic of their reference epoch (J1900, J2000,
+    B1950, GALALIGN_MARDYKS) are only approximated by a shift, within about
+    3e-3 degrees: their ``variant()`` summaries carry that error, while
+    ``to_subject()`` computes their bodies with Swiss Ephemeris.
+
+Classes:
+    ChartVariant: Positions, cusps, angles and houses of one variant
+    ChartVariants: All requested variants of one chart
+
+Example:
+    >>> from kerykeion import AstrologicalSubjectFactory
+    >>> from kerykeion.chart_variants import ChartVariants
+    >>> variants = ChartVariants.from_subject(subject, sidereal_modes=["LAHIRI", "FAGAN_BRADLEY"])
+    >>> variants.variant("W", "LAHIRI").ascendant
+    >>> lahiri_koch = variants.to_subject("K", "LAHIRI")
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, get_args
+
+from kerykeion.aspects.aspects_factory import LOCATION_DEPENDENT_POINTS
+from kerykeion.astrological_subject_factory import (
+    STANDARD_PLANETS,
+    TNO_PLANETS,
+    AstrologicalSubjectFactory,
+    ChartConfiguration,
+    ephemeris_context,
+)
+from kerykeion.instrumentation import swe
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import Houses, HousesSystemIdentifier, SiderealMode, ZodiacType
+from kerykeion.schemas.kr_models import AstrologicalSubjectModel
+from kerykeion.utilities import get_planet_house
+
+_EPHE_PATH = str(Path(__file__).parent.absolute() / "sweph")
+
+#: Every house system supported by Kerykeion.
+ALL_HOUSES_SYSTEMS: Tuple[HousesSystemIdentifier, ...] = get_args(HousesSystemIdentifier)
+
+#: Every named sidereal mode (the "USER" mode needs its own parameters).
+ALL_SIDEREAL_MODES: Tuple[SiderealMode, ...] = tuple(mode for mode in get_args(SiderealMode) if mode != "USER")
+
+# Half of the interval used to differentiate the ayanamsa, in days
+_AYANAMSA_RATE_STEP = 0.5
+
+# Modes projecting positions on the ecliptic of their reference epoch; a plain shift
+# by the ayanamsa only approximates them.
+_EPOCH_ECLIPTIC_MODES = frozenset({"J1900", "J2000", "B1950", "GALALIGN_MARDYKS"})
+
+
+class ChartVariant(NamedTuple):
+    """
+    One chart variant.
+
+    Attributes:
+        zodiac_type: "Tropical" or "Sidereal".
+        sidereal_mode: Sidereal mode, or None for the tropical zodiac.
+        houses_system_identifier: House system.
+        ayanamsa: Offset subtracted from the tropical longitudes (0 for the tropical zodiac).
+        longitudes: Longitude of each point.
+        cusps: The 12 house cusps, or None where the house system is undefined.
+        ascendant: Ascendant longitude, or None where the house system is undefined.
+        medium_coeli: Midheaven longitude, or None where the house system is undefined.
+        houses: House of each point (empty where the house system is undefined).
+    """
+
+    zodiac_type: ZodiacType
+    sidereal_mode: Optional[SiderealMode]
+    houses_system_identifier: HousesSystemIdentifier
+    ayanamsa: float
+    longitudes: Dict[str, float]
+    cusps: Optional[Tuple[float, ...]]
+    ascendant: Optional[float]
+    medium_coeli: Optional[float]
+    houses: Dict[str, Houses]
+
+
+class _ShiftedPositions:
+    """Shifted positions of the tropical subject, supplied through ``AstrologicalSubjectFactory.precomputed_positions()``."""
+
+    def __init__(
+        self,
+        julian_day: float,
+        iflag: int,
+        positions: Dict[int, Tuple[float, float, float]],
+        ayanamsa: float,
+        ayanamsa_rate: float,
+    ):
+        self.julian_day = julian_day
+        self.iflag = iflag
+        self.positions = positions
+        self.ayanamsa = ayanamsa
+        self.ayanamsa_rate = ayanamsa_rate
+
+    def lookup(self, julian_day: float, planet_id: int, iflag: int) -> Optional[Tuple[float, float, float]]:
+        if julian_day != self.julian_day or iflag != self.iflag or planet_id not in self.positions:
+            return None
+        longitude, speed, declination = self.positions[planet_id]
+        return (longitude - self.ayanamsa) % 360, speed - self.ayanamsa_rate, declination
+
+
+class ChartVariants:
+    """
+    One chart under several house systems and zodiacs.
+
+    Build it with ``from_subject()``.
+
+    Attributes:
+        subject: The tropical subject the variants derive from.
+        houses_system_identifiers: House systems of the variants.
+        sidereal_modes: Sidereal modes of the variants (None stands for the tropical zodiac).
+    """
+
+    def __init__(
+        self,
+        subject: AstrologicalSubjectModel,
+        tropical_longitudes: Dict[str, float],
+        ayanamsas: Dict[Optional[SiderealMode], Tuple[float, float]],
+        houses: Dict[
+            Tuple[Optional[SiderealMode], HousesSystemIdentifier], Optional[Tuple[Tuple[float, ...], float, float]]
+        ],
+        iflag: int,
+    ):
+        self.subject = subject
+        self.houses_system_identifiers: List[HousesSystemIdentifier] = list(dict.fromkeys(key[1] for key in houses))
+        self.sidereal_modes: List[Optional[SiderealMode]] = list(ayanamsas)
+        self._tropical_longitudes = tropical_longitudes
+        self._ayanamsas = ayanamsas
+        self._houses = houses
+        self._iflag = iflag
+
+    @classmethod
+    def from_subject(
+        cls,
+        subject: AstrologicalSubjectModel,
+        houses_system_identifiers: Optional[Iterable[HousesSystemIdentifier]] = None,
+        sidereal_modes: Optional[Iterable[SiderealMode]] = None,
+        *,
+        include_tropical: bool = True,
+    ) -> "ChartVariants":
+        """
+        Compute the variants of a tropical chart.
+
+        Args:
+            subject: A tropical subject with coordinates and Julian Day.
+            houses_system_identifiers: House systems to compute. Defaults to all of them.
+            sidereal_modes: Named sidereal modes to compute. Defaults to all of them.
+            include_tropical: Also compute the tropical variants.
+
+        Returns:
+            ChartVariants: The variants, computed with one ayanamsa evaluation per
+                sidereal mode and one house calculation per mode and house system.
+
+        Raises:
+            KerykeionException: If the subject is not tropical, has no coordinates or
+                Julian Day, or a house system or sidereal mode is unknown.
+        """
+        if subject.zodiac_type != "Tropical":
+            raise KerykeionException("Chart variants are derived from a tropical subject.")
+        if subject.julian_day is None or subject.lat is None or subject.lng is None:
+            raise KerykeionException(f"{subject.name} needs coordinates and a Julian Day to compute variants.")
+
+        houses_systems = list(
+            dict.fromkeys(ALL_HOUSES_SYSTEMS if houses_system_identifiers is None else houses_system_identifiers)
+        )
+        modes: List[Optional[SiderealMode]] = [None] if include_tropical else []
+        modes.extend(dict.fromkeys(ALL_SIDEREAL_MODES if sidereal_modes is None else sidereal_modes))
+        for houses_system in houses_systems:
+            if houses_system not in ALL_HOUSES_SYSTEMS:
+                raise KerykeionException(f"Unknown house system: {houses_system}")
+        for mode in modes:
+            if mode is not None and mode not in ALL_SIDEREAL_MODES:
+                raise KerykeionException(f"Unknown or unsupported sidereal mode: {mode}")
+
+        tropical_longitudes: Dict[str, float] = {}
+        for point_name in subject.active_points:
+            point = getattr(subject, point_name.lower(), None)
+            if point is not None and point_name not in LOCATION_DEPENDENT_POINTS:
+                tropical_longitudes[point_name] = point.abs_pos
+
+        julian_day = subject.julian_day
+        ayanamsas: Dict[Optional[SiderealMode], Tuple[float, float]] = {}
+        houses: Dict[
+            Tuple[Optional[SiderealMode], HousesSystemIdentifier], Optional[Tuple[Tuple[float, ...], float, float]]
+        ] = {}
+        tropical_config = ChartConfiguration(perspective_type=subject.perspective_type)
+        with ephemeris_context(ephe_path=_EPHE_PATH, config=tropical_config, lng=subject.lng, lat=subject.lat) as iflag:
+            for mode in modes:
+                mode_flag = iflag
+                if mode is None:
+                    ayanamsas[mode] = (0.0, 0.0)
+                else:
+                    mode_flag |= swe.FLG_SIDEREAL
+                    swe.set_sid_mode(getattr(swe, f"SIDM_{mode}"))
+                    ayanamsa = swe.get_ayanamsa_ex_ut(julian_day, mode_flag)[1]
+                    rate = (
+                        swe.get_ayanamsa_ex_ut(julian_day + _AYANAMSA_RATE_STEP, mode_flag)[1]
+                        - swe.get_ayanamsa_ex_ut(julian_day - _AYANAMSA_RATE_STEP, mode_flag)[1]
+                    ) / (2 * _AYANAMSA_RATE_STEP)
+                    ayanamsas[mode] = (ayanamsa, rate)
+
+                for houses_system in houses_systems:
+                    try:
+                        cusps, ascmc = swe.houses_ex(
+                            julian_day, subject.lat, subject.lng, houses_system.encode(), mode_flag
+                        )
+                    except swe.Error:
+                        houses[(mode, houses_system)] = None
+                        continue
+                    houses[(mode, houses_system)] = (tuple(cusps), ascmc[0], ascmc[1])
+
+        return cls(subject, tropical_longitudes, ayanamsas, houses, iflag)
+
+    def __len__(self) -> int:
+        return len(self._houses)
+
+    def __iter__(self) -> Iterator[ChartVariant]:
+        for mode, houses_system in self._houses:
+            yield self.variant(houses_system, mode)
+
+    def _check_key(
+        self, houses_system_identifier: HousesSystemIdentifier, sidereal_mode: Optional[SiderealMode]
+    ) -> None:
+        if (sidereal_mode, houses_system_identifier) not in self._houses:
+            zodiac = sidereal_mode or "tropical zodiac"
+            raise KerykeionException(f"No variant for house system {houses_system_identifier} and {zodiac}.")
+
+    def ayanamsa(self, sidereal_mode: SiderealMode) -> float:
+        """Ayanamsa of a computed sidereal mode, in degrees."""
+        if sidereal_mode not in self._ayanamsas:
+            raise KerykeionException(f"Sidereal mode {sidereal_mode} was not computed.")
+        return self._ayanamsas[sidereal_mode][0]
+
+    def variant(
+        self, houses_system_identifier: HousesSystemIdentifier, sidereal_mode: Optional[SiderealMode] = None
+    ) -> ChartVariant:
+        """
+        Summary of one variant.
+
+        Args:
+            houses_system_identifier: House system of the variant.
+            sidereal_mode: Sidereal mode of the variant, or None for the tropical zodiac.
+
+        Raises:
+            KerykeionException: If the variant was not computed.
+        """
+        self._check_key(houses_system_identifier, sidereal_mode)
+        ayanamsa = self._ayanamsas[sidereal_mode][0]
+        longitudes = {name: (longitude - ayanamsa) % 360 for name, longitude in self._tropical_longitudes.items()}
+        houses = self._houses[(sidereal_mode, houses_system_identifier)]
+        if houses is None:
+            cusps, ascendant, medium_coeli, point_houses = None, None, None, {}
+        else:
+            cusps, ascendant, medium_coeli = houses
+            point_houses = {name: get_planet_house(longitude, cusps) for name, longitude in longitudes.items()}
+
+        return ChartVariant(
+            zodiac_type="Tropical" if sidereal_mode is None else "Sidereal",
+            sidereal_mode=sidereal_mode,
+            houses_system_identifier=houses_system_identifier,
+            ayanamsa=ayanamsa,
+            longitudes=longitudes,
+            cusps=cusps,
+            ascendant=ascendant,
+            medium_coeli=medium_coeli,
+            houses=point_houses,
+        )
+
+    def to_subject(
+        self, houses_system_identifier: HousesSystemIdentifier, sidereal_mode: Optional[SiderealMode] = None
+    ) -> AstrologicalSubjectModel:
+        """
+        Expand one variant into a full AstrologicalSubjectModel.
+
+        The bodies computed directly by Swiss Ephemeris take the shifted positions of
+        the tropical subject (except for the epoch-ecliptic modes, which are computed
+        in full); houses, angles and derived points are computed as usual.
+
+        Args:
+            houses_system_identifier: House system of the variant.
+            sidereal_mode: Sidereal mode of the variant, or None for the tropical zodiac.
+
+        Raises:
+            KerykeionException: If the variant was not computed or its house system is
+                undefined at the subject's latitude.
+        """
+        self._check_key(houses_system_identifier, sidereal_mode)
+        if self._houses[(sidereal_mode, houses_system_identifier)] is None:
+            raise KerykeionException(
+                f"House system {houses_system_identifier} is undefined at latitude {self.subject.lat}."
+            )
+
+        ayanamsa, rate = self._ayanamsas[sidereal_mode]
+        iflag = self._iflag if sidereal_mode is None else self._iflag | swe.FLG_SIDEREAL
+        subject = self.subject
+        shifted_positions = _ShiftedPositions(subject.julian_day, iflag, self._body_positions(), ayanamsa, rate)
+
+        positions = (
+            nullcontext()
+            if sidereal_mode in _EPOCH_ECLIPTIC_MODES
+            else AstrologicalSubjectFactory.precomputed_positions(shifted_positions)
+        )
+        with positions:
+            return AstrologicalSubjectFactory.from_iso_utc_time(
+                subject.name,
+                subject.iso_formatted_utc_datetime,
+                city=subject.city,
+                nation=subject.nation,
+                tz_str=subject.tz_str,
+                online=False,
+                lng=subject.lng,
+                lat=subject.lat,
+                zodiac_type="Tropical" if sidereal_mode is None else "Sidereal",
+                sidereal_mode=sidereal_mode,
+                houses_system_identifier=houses_system_identifier,
+                perspective_type=subject.perspective_type,
+                active_points=list(subject.active_points),
+                suppress_geonames_warning=True,
+            )
+
+    def _body_positions(self) -> Dict[int, Tuple[float, float, float]]:
+        """Tropical (longitude, speed, declination) of the subject's Swiss Ephemeris bodies by id."""
+        positions: Dict[int, Tuple[float, float, float]] = {}
+        body_ids: Sequence[Tuple[str, int]] = [
+            *STANDARD_PLANETS.items(),
+            *((name, swe.AST_OFFSET + number) for name, number in TNO_PLANETS.items()),
+        ]
+        for point_name, planet_id in body_ids:
+            point = getattr(self.subject, point_name.lower(), None)
+            if point is None or point.speed is None or point.declination is None:
+                continue
+            positions[planet_id] = (point.abs_pos, point.speed, point.declination)
+        return positions
+
+
+__all__ = ["ALL_HOUSES_SYSTEMS", "ALL_SIDEREAL_MODES", "ChartVariant", "ChartVariants"]
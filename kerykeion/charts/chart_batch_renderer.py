@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+Batch Chart Rendering
+=====================
+
+This module renders many pre-computed charts with shared render options,
+spreading the work across a pool of worker processes.
+
+Rendering a chart is CPU-bound Python, so a process pool scales with the
+available cores. Every worker is initialized once with the shared options and
+warms its per-process caches (SVG templates, CSS theme, chart language),
+so the cost of those is paid once per worker instead of once per chart.
+
+Results are produced as soon as each chart completes, not in input order, and
+a chart that fails to render is reported through its result instead of
+aborting the whole batch.
+
+Example:
+    >>> from kerykeion.charts.chart_batch_renderer import ChartBatchRenderer
+    >>> renderer = ChartBatchRenderer(theme="dark", minify=True, max_workers=4)
+    >>> for result in renderer.save_svgs(chart_data_list, "/tmp/charts"):
+    ...     if not result.ok:
+    ...         print(result.index, result.error)
+
+This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Union, get_args
+
+from kerykeion.charts.chart_drawer import ChartDrawer, _read_chart_asset
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import KerykeionChartLanguage, KerykeionChartStyle, KerykeionChartTheme
+from kerykeion.schemas.kr_models import ChartDataModel
+from kerykeion.settings.translations import load_language_settings
+
+
+logger = logging.getLogger(__name__)
+
+_TEMPLATE_FILES = ("chart.xml", "wheel_only.xml", "modern_wheel.xml", "aspect_grid_only.xml")
+
+#: Callable building the output filename (without extension) for a chart.
+FilenameFactory = Callable[[int, ChartDataModel], str]
+
+# (index, chart data, output directory or None, filename or None) of one chart to render.
+_RenderTask = tuple[int, ChartDataModel, Optional[Path], Optional[str]]
+
+
+@dataclass(frozen=True)
+class ChartRenderResult:
+    """
+    Outcome of rendering a single chart of a batch.
+
+    Attributes:
+        index: Position of the chart in the input iterable.
+        svg: Rendered SVG markup (string mode only).
+        path: Written file path (file mode only).
+        error: ``"ExceptionType: message"`` when rendering failed, otherwise None.
+    """
+
+    index: int
+    svg: Optional[str] = None
+    path: Optional[Path] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True when the chart was rendered successfully."""
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class _BatchRenderSettings:
+    """Render options shared by every chart of a batch (sent once to each worker)."""
+
+    theme: Optional[KerykeionChartTheme]
+    chart_language: KerykeionChartLanguage
+    style: KerykeionChartStyle
+    minify: bool
+    remove_css_variables: bool
+    drawer_options: dict[str, Any] = field(default_factory=dict)
+
+
+# Settings of the current worker process, set once by the pool initializer.
+_WORKER_SETTINGS: Optional[_BatchRenderSettings] = None
+
+
+def _warm_render_caches(settings: _BatchRenderSettings) -> None:
+    """Load the bundled templates, the selected theme and the chart language (with its EN fallback)."""
+    for template_file in _TEMPLATE_FILES:
+        _read_chart_asset("templates", template_file)
+    if settings.theme is not None:
+        _read_chart_asset("themes", f"{settings.theme}.css")
+    load_language_settings(languages=(settings.chart_language, "EN"))
+
+
+def _init_batch_worker(settings: _BatchRenderSettings) -> None:
+    """Process pool initializer: store the shared settings and warm the caches."""
+    global _WORKER_SETTINGS
+    _WORKER_SETTINGS = settings
+    _warm_render_caches(settings)
+
+
+def _render_chart(
+    settings: _BatchRenderSettings,
+    index: int,
+    chart_data: ChartDataModel,
+    output_path: Optional[Path],
+    filename: Optional[str],
+) -> ChartRenderResult:
+    """
+    Render one chart, returning the SVG or writing it to ``output_path``.
+
+    Any exception raised while drawing or writing is captured in the result.
+    """
+    try:
+        drawer = ChartDrawer(
+            chart_data,
+            theme=settings.theme,
+            chart_language=settings.chart_language,
+            style=settings.style,
+            **settings.drawer_options,
+        )
+        svg = drawer.generate_svg_string(settings.minify, settings.remove_css_variables)
+
+        if output_path is None:
+            return ChartRenderResult(index=index, svg=svg)
+
+        if filename is None:
+            suffix = " - Modern" if settings.style == "modern" else ""
+            filename = drawer.get_default_filename(suffix)
+
+        chart_path = output_path / f"{filename}.svg"
+        with open(chart_path, "w", encoding="utf-8", errors="ignore") as output_file:
+            output_file.write(svg)
+        return ChartRenderResult(index=index, path=chart_path)
+
+    except Exception as exc:
+        logger.debug("Chart %s of the batch failed to render", index, exc_info=True)
+        return ChartRenderResult(index=index, error=f"{type(exc).__name__}: {exc}")
+
+
+def _render_chart_in_worker(
+    index: int,
+    chart_data: ChartDataModel,
+    output_path: Optional[Path],
+    filename: Optional[str],
+) -> ChartRenderResult:
+    """Pool task: render one chart with the settings installed by the initializer."""
+    if _WORKER_SETTINGS is None:
+        raise KerykeionException("Batch worker used before initialization.")
+    return _render_chart(_WORKER_SETTINGS, index, chart_data, output_path, filename)
+
+
+class ChartBatchRenderer:
+    """
+    Render many ChartDataModel instances with shared options across a process pool.
+
+    Args:
+        theme (KerykeionChartTheme | None): CSS theme, as in ChartDrawer. Defaults to "classic".
+        chart_language (KerykeionChartLanguage): Language of the chart labels. Defaults to "EN".
+        style (KerykeionChartStyle): Wheel style, "classic" or "modern". Defaults to "classic".
+        minify (bool): Minify every SVG. Defaults to False.
+        remove_css_variables (bool): Inline CSS variables in every SVG. Defaults to False.
+        max_workers (int | None): Number of worker processes. None uses ``os.cpu_count()``;
+            1 renders in the calling process without a pool.
+        max_pending (int | None): Maximum number of charts submitted but not yet collected,
+            which bounds memory when the input is a long lazy iterable.
+            Defaults to four times the number of workers.
+        drawer_options (Mapping | None): Extra keyword arguments for every ChartDrawer
+            (e.g. ``double_chart_aspect_grid_type``, ``colors_settings``). They must be
+            picklable to reach the worker processes.
+
+    Raises:
+        KerykeionException: If the theme or style is not supported, or max_workers is not positive.
+    """
+
+    def __init__(
+        self,
+        *,
+        theme: Optional[KerykeionChartTheme] = "classic",
+        chart_language: KerykeionChartLanguage = "EN",
+        style: KerykeionChartStyle = "classic",
+        minify: bool = False,
+        remove_css_variables: bool = False,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        drawer_options: Optional[Mapping[str, Any]] = None,
+    ):
+        if theme is not None and theme not in get_args(KerykeionChartTheme):
+            raise KerykeionException(f"Theme {theme} is not available. Set None for default theme.")
+        if style not in get_args(KerykeionChartStyle):
+            raise KerykeionException(
+                f"Style {style!r} is not available. Allowed values: {', '.join(get_args(KerykeionChartStyle))}."
+            )
+
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        if self.max_workers < 1:
+            raise KerykeionException(f"max_workers must be a positive integer, got {max_workers}.")
+        self.max_pending = max_pending if max_pending is not None else self.max_workers * 4
+
+        self._settings = _BatchRenderSettings(
+            theme=theme,
+            chart_language=chart_language,
+            style=style,
+            minify=minify,
+            remove_css_variables=remove_css_variables,
+            drawer_options=dict(drawer_options or {}),
+        )
+
+    def iter_svg_strings(self, charts: Iterable[ChartDataModel]) -> Iterator[ChartRenderResult]:
+        """
+        Render the charts and yield their SVG strings as they complete.
+
+        Args:
+            charts: Pre-computed chart data, consumed lazily.
+
+        Yields:
+            ChartRenderResult: One result per chart with ``svg`` or ``error`` set,
+            in completion order (use ``index`` to match the input).
+        """
+        tasks = ((index, chart_data, None, None) for index, chart_data in enumerate(charts))
+        return self._run(tasks)
+
+    def save_svgs(
+        self,
+        charts: Iterable[ChartDataModel],
+        output_path: Union[str, Path],
+        filename_factory: Optional[FilenameFactory] = None,
+    ) -> Iterator[ChartRenderResult]:
+        """
+        Render the charts and write each one to ``output_path`` as it completes.
+
+        Args:
+            charts: Pre-computed chart data, consumed lazily.
+            output_path: Existing directory where the SVG files are written.
+            filename_factory: Optional callable ``(index, chart_data) -> filename`` (without
+                extension), evaluated in the calling process. When omitted, ChartDrawer's
+                default "{name} - {chart_type} Chart" naming is used, which can collide
+                when several charts share a subject name. If it raises, the chart is
+                skipped and the error is reported through its result.
+
+        Yields:
+            ChartRenderResult: One result per chart with ``path`` or ``error`` set,
+            in completion order.
+        """
+        output_directory = Path(output_path)
+
+        def build_tasks() -> Iterator[Union[_RenderTask, ChartRenderResult]]:
+            for index, chart_data in enumerate(charts):
+                try:
+                    filename = filename_factory(index, chart_data) if filename_factory is not None else None
+                except Exception as exc:
+                    logger.debug("Filename factory failed for chart %s of the batch", index, exc_info=True)
+                    yield ChartRenderResult(index=index, error=f"{type(exc).__name__}: {exc}")
+                    continue
+                yield index, chart_data, output_directory, filename
+
+        return self._run(build_tasks())
+
+    def _run(self, tasks: Iterator[Union[_RenderTask, ChartRenderResult]]) -> Iterator[ChartRenderResult]:
+        """Execute the render tasks serially or on the process pool, passing through ready results."""
+        if self.max_workers == 1:
+            _warm_render_caches(self._settings)
+            for task in tasks:
+                yield task if isinstance(task, ChartRenderResult) else _render_chart(self._settings, *task)
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_batch_worker,
+            initargs=(self._settings,),
+        )
+        pending: dict[Future, int] = {}
+        try:
+            for task in tasks:
+                if isinstance(task, ChartRenderResult):
+                    yield task
+                    continue
+                pending[executor.submit(_render_chart_in_worker, *task)] = task[0]
+                if len(pending) >= self.max_pending:
+                    yield from self._collect(pending, return_when=FIRST_COMPLETED)
+            while pending:
+                yield from self._collect(pending, return_when=FIRST_COMPLETED)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _collect(pending: dict[Future, int], return_when: str) -> Iterator[ChartRenderResult]:
+        """Wait for finished futures, remove them from ``pending`` and yield their results."""
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            index = pending.pop(future)
+            try:
+                yield future.result()
+            except Exception as exc:
+                # Failures outside the render itself (e.g. pickling, a crashed worker).
+                yield ChartRenderResult(index=index, error=f"{type(exc).__name__}: {exc}")
@@ -8,6 +8,7 @@ import re
 from copy import deepcopy
 from math import ceil
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 from typing import Any, Mapping, Optional, Sequence, Union, get_args
@@ -18,10 +19,10 @@ from typing import Any, Mapping, Optional, Sequence, Union, get_args
 # default set in __init__ is used instead.
 _UNSET: Any = object()
 
-import swisseph as swe
 from scour.scour import scourString
 
 from kerykeion.house_comparison.house_comparison_factory import HouseComparisonFactory
+from kerykeion.instrumentation import stage, swe
 from kerykeion.schemas import (
     KerykeionException,
     ChartType,
@@ -48,7 +49,9 @@ from kerykeion.schemas.kr_models import ChartDataModel
 from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS
 from kerykeion.settings.translations import get_translations, load_language_settings
 from kerykeion.charts.charts_utils import (
-    draw_zodiac_slice,
+    AspectPairIndex,
+    build_aspect_pair_index,
+    draw_zodiac_slices,
     convert_latitude_coordinate_to_string,
     convert_longitude_coordinate_to_string,
     draw_aspect_line,
@@ -91,6 +94,38 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+_CHARTS_DIR = Path(__file__).parent
+
+
+@lru_cache(maxsize=None)
+def _read_chart_asset(folder: str, filename: str) -> str:
+    """
+    Read a bundled SVG template or CSS theme, caching its content per process.
+
+    Args:
+        folder (str): Sub-directory of the charts package ("templates" or "themes").
+        filename (str): Name of the file inside ``folder``.
+
+    Returns:
+        str: The file content.
+    """
+    with open(_CHARTS_DIR / folder / filename, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _chart_template(filename: str) -> Template:
+    """
+    Build the ``string.Template`` of a bundled SVG template once per process.
+
+    Args:
+        filename (str): Name of the file inside the templates folder.
+
+    Returns:
+        Template: The template, ready for substitution.
+    """
+    return Template(_read_chart_asset("templates", filename))
+
 
 # =============================================================================
 # TYPE ALIASES
@@ -111,6 +146,17 @@ FirstSubjectType = Union[AstrologicalSubjectModel, CompositeSubjectModel, Planet
 # - PlanetReturnModel: For DualReturnChart (Solar/Lunar returns)
 SecondSubjectType = Union[AstrologicalSubjectModel, PlanetReturnModel, None]
 
+# Values substituted into the SVG templates, keyed by ChartTemplateModel field name.
+# Layout offsets are ints and the canvas size is float, everything else is a string.
+ChartTemplateValues = dict[str, Union[str, int, float]]
+
+# ChartTemplateModel validation coerces these slots; the unvalidated render path
+# applies the same conversions so both produce identical SVG.
+_TEMPLATE_INT_FIELDS = tuple(name for name, field in ChartTemplateModel.model_fields.items() if field.annotation is int)
+_TEMPLATE_FLOAT_FIELDS = tuple(
+    name for name, field in ChartTemplateModel.model_fields.items() if field.annotation is float
+)
+
 
 # =============================================================================
 # CONFIGURATION DATACLASSES
@@ -389,11 +435,16 @@ class BaseChartRenderer:
         Args:
             template_dict: Dictionary to populate with SVG template values.
         """
-        self.setup_circles(template_dict)
-        self.setup_aspects(template_dict)
-        self.setup_info_sections(template_dict)
-        self.setup_grids(template_dict)
-        self.setup_house_comparison(template_dict)
+        with stage("chart.circles"):
+            self.setup_circles(template_dict)
+        with stage("chart.aspects"):
+            self.setup_aspects(template_dict)
+        with stage("chart.info"):
+            self.setup_info_sections(template_dict)
+        with stage("chart.grids"):
+            self.setup_grids(template_dict)
+        with stage("chart.house_comparison"):
+            self.setup_house_comparison(template_dict)
 
     def setup_circles(self, template_dict: dict) -> None:
         """Configure circle elements. Override in subclasses."""
@@ -731,6 +782,7 @@ class TransitChartRenderer(BaseChartRenderer):
                     d.aspects_list,
                     grid_x,
                     grid_y,
+                    aspect_index=d._aspect_pair_index(symmetric=False),
                 )
             else:
                 template_dict["makeDoubleChartAspectList"] = draw_transit_aspect_grid(
@@ -739,6 +791,7 @@ class TransitChartRenderer(BaseChartRenderer):
                     d.aspects_list,
                     600,
                     520,
+                    aspect_index=d._aspect_pair_index(symmetric=False),
                 )
 
         template_dict["makeAspects"] = d._draw_all_aspects_lines(d.main_radius, d.main_radius - 160)
@@ -957,6 +1010,7 @@ class SynastryChartRenderer(BaseChartRenderer):
                     d.aspects_list,
                     grid_x,
                     grid_y,
+                    aspect_index=d._aspect_pair_index(symmetric=False),
                 )
             else:
                 template_dict["makeDoubleChartAspectList"] = draw_transit_aspect_grid(
@@ -965,6 +1019,7 @@ class SynastryChartRenderer(BaseChartRenderer):
                     d.aspects_list,
                     550,
                     450,
+                    aspect_index=d._aspect_pair_index(symmetric=False),
                 )
 
         template_dict["makeAspects"] = d._draw_all_aspects_lines(d.main_radius, d.main_radius - 160)
@@ -1254,6 +1309,7 @@ class DualReturnChartRenderer(BaseChartRenderer):
                     d.aspects_list,
                     grid_x,
                     grid_y,
+                    aspect_index=d._aspect_pair_index(symmetric=False),
                 )
             else:
                 template_dict["makeDoubleChartAspectList"] = draw_transit_aspect_grid(
@@ -1262,6 +1318,7 @@ class DualReturnChartRenderer(BaseChartRenderer):
                     d.aspects_list,
                     550,
                     450,
+                    aspect_index=d._aspect_pair_index(symmetric=False),
                 )
 
         template_dict["makeAspects"] = d._draw_all_aspects_lines(d.main_radius, d.main_radius - 160)
@@ -1777,6 +1834,7 @@ class ChartDrawer:  # type: ignore[no-redef]
         show_aspect_icons: bool = True,
         style: "KerykeionChartStyle" = "classic",
         show_zodiac_background_ring: bool = True,
+        validate_template: bool = False,
     ):
         """
         Initialize the chart visualizer with pre-computed chart data.
@@ -1839,6 +1897,10 @@ class ChartDrawer:  # type: ignore[no-redef]
             show_zodiac_background_ring (bool, optional):
                 Default for whether to draw colored zodiac wedges (modern style only).
                 Can be overridden at render time.  Defaults to True.
+            validate_template (bool, optional):
+                Validate the template values against ``ChartTemplateModel`` before
+                every render. Useful when debugging custom renderers; the output is
+                the same either way. Defaults to False.
         """
         # =====================================================================
         # STEP 1: Store basic configuration parameters
@@ -1862,6 +1924,7 @@ class ChartDrawer:  # type: ignore[no-redef]
             padding=padding,
             style=style,
             show_zodiac_background_ring=show_zodiac_background_ring,
+            validate_template=validate_template,
         )
 
         # =====================================================================
@@ -1877,48 +1940,50 @@ class ChartDrawer:  # type: ignore[no-redef]
         # =====================================================================
         # Initialize the translation system with the requested language and
         # any custom language pack overrides.
-        self._load_language_settings(language_pack)
-
-        # =====================================================================
-        # STEP 4: Configure active celestial points
-        # =====================================================================
-        # Set up the list of celestial points that will be displayed in the
-        # chart, based on what's active in the chart data.
-        self._configure_active_celestial_points()
-
-        # =====================================================================
-        # STEP 5: Configure chart dimensions and geometry
-        # =====================================================================
-        # Set up width, height, circle radii, and other geometric properties
-        # based on the chart type and display options.
-        self._configure_dimensions_and_geometry(chart_data)
-
-        # =====================================================================
-        # STEP 6: Extract element and quality distributions
-        # =====================================================================
-        # Store the pre-computed element (fire, earth, air, water) and quality
-        # (cardinal, fixed, mutable) distributions for display.
-        self._extract_element_quality_distributions(chart_data)
-
-        # =====================================================================
-        # STEP 7: Validate and set up theme
-        # =====================================================================
-        # Verify the theme is valid and load the corresponding CSS.
-        if theme not in get_args(KerykeionChartTheme) and theme is not None:
-            raise KerykeionException(f"Theme {theme} is not available. Set None for default theme.")
-        self.set_up_theme(theme)
-
-        # =====================================================================
-        # STEP 8: Apply dynamic layout adjustments
-        # =====================================================================
-        # Adjust chart dimensions based on the number of active celestial
-        # points and other dynamic factors.
-        self._apply_dynamic_height_adjustment()
-        self._adjust_height_for_extended_aspect_columns()
-
-        # Reconcile width with the updated layout once height adjustments are known
-        if self.auto_size:
-            self._update_width_to_content()
+        with stage("chart.language"):
+            self._load_language_settings(language_pack)
+
+        with stage("chart.layout"):
+            # =====================================================================
+            # STEP 4: Configure active celestial points
+            # =====================================================================
+            # Set up the list of celestial points that will be displayed in the
+            # chart, based on what's active in the chart data.
+            self._configure_active_celestial_points()
+
+            # =====================================================================
+            # STEP 5: Configure chart dimensions and geometry
+            # =====================================================================
+            # Set up width, height, circle radii, and other geometric properties
+            # based on the chart type and display options.
+            self._configure_dimensions_and_geometry(chart_data)
+
+            # =====================================================================
+            # STEP 6: Extract element and quality distributions
+            # =====================================================================
+            # Store the pre-computed element (fire, earth, air, water) and quality
+            # (cardinal, fixed, mutable) distributions for display.
+            self._extract_element_quality_distributions(chart_data)
+
+            # =====================================================================
+            # STEP 7: Validate and set up theme
+            # =====================================================================
+            # Verify the theme is valid and load the corresponding CSS.
+            if theme not in get_args(KerykeionChartTheme) and theme is not None:
+                raise KerykeionException(f"Theme {theme} is not available. Set None for default theme.")
+            self.set_up_theme(theme)
+
+            # =====================================================================
+            # STEP 8: Apply dynamic layout adjustments
+            # =====================================================================
+            # Adjust chart dimensions based on the number of active celestial
+            # points and other dynamic factors.
+            self._apply_dynamic_height_adjustment()
+            self._adjust_height_for_extended_aspect_columns()
+
+            # Reconcile width with the updated layout once height adjustments are known
+            if self.auto_size:
+                self._update_width_to_content()
 
     # =========================================================================
     # INITIALIZATION HELPER METHODS
@@ -1946,6 +2011,7 @@ class ChartDrawer:  # type: ignore[no-redef]
         padding: int,
         style: "KerykeionChartStyle",
         show_zodiac_background_ring: bool,
+        validate_template: bool,
     ) -> None:
         """
         Store basic configuration parameters as instance attributes.
@@ -1975,6 +2041,7 @@ class ChartDrawer:  # type: ignore[no-redef]
         self.show_aspect_icons = show_aspect_icons
         self.auto_size = auto_size
         self._padding = padding
+        self.validate_template = validate_template
 
         # Chart style defaults (can be overridden per-render call)
         self._validate_chart_style(style)
@@ -2076,6 +2143,7 @@ class ChartDrawer:  # type: ignore[no-redef]
         """
         # Store aspects list for rendering
         self.aspects_list = chart_data.aspects
+        self._aspect_pair_indexes: dict[bool, tuple[list, AspectPairIndex]] = {}
 
         # Set initial height (may be increased for many active points)
         self.height = self._DEFAULT_HEIGHT
@@ -2174,6 +2242,14 @@ class ChartDrawer:  # type: ignore[no-redef]
         """Return number of active celestial points in the current chart."""
         return len([p for p in self.available_planets_setting if p.get("is_active")])
 
+    def _aspect_pair_index(self, symmetric: bool) -> AspectPairIndex:
+        """Return the (p1, p2) index of the aspects list, built once per chart."""
+        cached = self._aspect_pair_indexes.get(symmetric)
+        if cached is None or cached[0] is not self.aspects_list:
+            cached = (self.aspects_list, build_aspect_pair_index(self.aspects_list, symmetric=symmetric))
+            self._aspect_pair_indexes[symmetric] = cached
+        return cached[1]
+
     def _is_right_panel_mode(self) -> bool:
         """Whether the aspect list/grid should be placed in a right-side panel.
 
@@ -3182,10 +3258,7 @@ class ChartDrawer:  # type: ignore[no-redef]
             self.color_style_tag = ""
             return
 
-        theme_dir = Path(__file__).parent / "themes"
-
-        with open(theme_dir / f"{theme}.css", "r") as f:
-            self.color_style_tag = f.read()
+        self.color_style_tag = _read_chart_asset("themes", f"{theme}.css")
 
     def _load_language_settings(
         self,
@@ -3193,7 +3266,7 @@ class ChartDrawer:  # type: ignore[no-redef]
     ) -> None:
         """Resolve language models for the requested chart language."""
         overrides = {self.chart_language: dict(language_pack)} if language_pack else None
-        languages = load_language_settings(overrides)  # type: ignore[arg-type]
+        languages = load_language_settings(overrides, languages=(self.chart_language, "EN"))  # type: ignore[arg-type]
 
         fallback_data = languages.get("EN")
         if fallback_data is None:
@@ -3345,6 +3418,7 @@ class ChartDrawer:  # type: ignore[no-redef]
             self.chart_colors_settings["paper_0"],
             self.available_planets_setting,
             self.aspects_list,
+            aspect_index=self._aspect_pair_index(symmetric=True),
         )
         template_dict["makeAspects"] = self._draw_all_aspects_lines(
             self.main_radius, self.main_radius - self.third_circle_radius
@@ -3378,6 +3452,7 @@ class ChartDrawer:  # type: ignore[no-redef]
                 self.aspects_list,
                 600,
                 520,
+                aspect_index=self._aspect_pair_index(symmetric=False),
             )
         template_dict["makeAspects"] = self._draw_all_aspects_lines(self.main_radius, self.main_radius - 160)
 
@@ -3740,11 +3815,13 @@ class ChartDrawer:  # type: ignore[no-redef]
             str: The processed SVG template.
         """
         if remove_css_variables:
-            template = inline_css_variables_in_svg(template)
+            with stage("chart.inline_css"):
+                template = inline_css_variables_in_svg(template)
 
         if minify:
             try:
-                template = scourString(template)
+                with stage("chart.minify"):
+                    template = scourString(template)
             except Exception as exc:
                 # scour may crash on complex SVG structures (e.g. NotFoundErr
                 # when moveCommonAttributesToParentGroup encounters style-based
@@ -3773,28 +3850,23 @@ class ChartDrawer:  # type: ignore[no-redef]
         Returns:
             str: Concatenated SVG elements for zodiac slices.
         """
-        sings = get_args(Sign)
-        output = ""
-        for i, sing in enumerate(sings):
-            output += draw_zodiac_slice(
-                c1=self.first_circle_radius,
-                chart_type=self.chart_type,
-                seventh_house_degree_ut=self.first_obj.seventh_house.abs_pos,
-                num=i,
-                r=r,
-                style=f"fill:{self.chart_colors_settings[f'zodiac_bg_{i}']}; fill-opacity: 0.5;",
-                type=sing,
-            )
-
-        return output
+        return draw_zodiac_slices(
+            c1=self.first_circle_radius,
+            chart_type=self.chart_type,
+            seventh_house_degree_ut=self.first_obj.seventh_house.abs_pos,
+            r=r,
+            styles=[f"fill:{self.chart_colors_settings[f'zodiac_bg_{i}']}; fill-opacity: 0.5;" for i in range(12)],
+            signs=get_args(Sign),
+        )
 
-    def _draw_all_aspects_lines(self, r, ar):
+    def _draw_all_aspects_lines(self, r, ar, aspects: Optional[list] = None):
         """
         Render SVG lines for all aspects in the chart.
 
         Args:
             r (float): Radius at which aspect lines originate.
             ar (float): Radius at which aspect lines terminate.
+            aspects (list | None): Aspects to draw instead of the chart's own aspects.
 
         Returns:
             str: SVG markup for all aspect lines.
@@ -3802,7 +3874,7 @@ class ChartDrawer:  # type: ignore[no-redef]
         out = ""
         # Track rendered icon positions (x, y, aspect_degrees) to avoid overlapping symbols of same type
         rendered_icon_positions: list[tuple[float, float, int]] = []
-        for aspect in self.aspects_list:
+        for aspect in self.aspects_list if aspects is None else aspects:
             aspect_name = aspect["aspect"]
             aspect_color = next((a["color"] for a in self.aspects_settings if a["name"] == aspect_name), None)
             if aspect_color:
@@ -3917,7 +3989,7 @@ class ChartDrawer:  # type: ignore[no-redef]
         # Fallback for unknown chart types
         return self._truncate_name(self.first_obj.name)
 
-    def _create_template_dictionary(self, *, custom_title: Union[str, None] = None) -> ChartTemplateModel:
+    def _create_template_dictionary(self, *, custom_title: Union[str, None] = None) -> ChartTemplateValues:
         """
         Assemble chart data and rendering instructions into a template dictionary.
 
@@ -3928,7 +4000,9 @@ class ChartDrawer:  # type: ignore[no-redef]
             custom_title (str | None): Optional runtime override for the chart title.
 
         Returns:
-            ChartTemplateModel: Populated structure of template variables.
+            ChartTemplateValues: Template variables keyed by ``ChartTemplateModel``
+            field name. They are validated against the model only when
+            ``validate_template`` is set.
         """
         # Initialize template dictionary
         template_dict: dict = {}
@@ -4058,7 +4132,18 @@ class ChartDrawer:  # type: ignore[no-redef]
         renderer = get_chart_renderer(self.chart_type, self)
         renderer.render(template_dict)
 
-        return ChartTemplateModel(**template_dict)
+        if self.validate_template:
+            with stage("chart.template_model"):
+                return ChartTemplateModel(**template_dict).model_dump()
+
+        for name in _TEMPLATE_INT_FIELDS:
+            value = template_dict[name]
+            if value != int(value):
+                raise KerykeionException(f"Template value {name}={value!r} is not an integer.")
+            template_dict[name] = int(value)
+        for name in _TEMPLATE_FLOAT_FIELDS:
+            template_dict[name] = float(template_dict[name])
+        return template_dict
 
     def _generate_modern_content(
         self,
@@ -4147,15 +4232,8 @@ class ChartDrawer:  # type: ignore[no-redef]
         )
 
         self._validate_chart_style(effective_style)
-        td = self._create_template_dictionary(custom_title=custom_title)
-
-        DATA_DIR = Path(__file__).parent
-        xml_svg = DATA_DIR / "templates" / "chart.xml"
-
-        with open(xml_svg, "r", encoding="utf-8", errors="ignore") as f:
-            raw_template = f.read()
-
-        template_data = td.model_dump()
+        with stage("chart.template"):
+            template_data = self._create_template_dictionary(custom_title=custom_title)
 
         if effective_style == "modern":
             modern_content = self._generate_modern_content(
@@ -4167,31 +4245,33 @@ class ChartDrawer:  # type: ignore[no-redef]
             scale = (2 * self.main_radius) / 100
             wrapped = f'<g transform="scale({scale:.4f})">\n{modern_content}\n</g>'
 
-            overrides = dict(template_data)
             # Inject modern wheel into the background circle placeholder;
             # blank out all other classic wheel sub-groups.
-            overrides["background_circle"] = wrapped
-            overrides["makeZodiac"] = ""
-            overrides["first_circle"] = ""
-            overrides["second_circle"] = ""
-            overrides["third_circle"] = ""
-            overrides["transitRing"] = ""
-            overrides["degreeRing"] = ""
-            overrides["makeHouses"] = ""
-            overrides["makePlanets"] = ""
-            overrides["makeAspects"] = ""
-            template = Template(raw_template).substitute(overrides)
-        else:
-            template = Template(raw_template).substitute(template_data)
+            template_data["background_circle"] = wrapped
+            template_data["makeZodiac"] = ""
+            template_data["first_circle"] = ""
+            template_data["second_circle"] = ""
+            template_data["third_circle"] = ""
+            template_data["transitRing"] = ""
+            template_data["degreeRing"] = ""
+            template_data["makeHouses"] = ""
+            template_data["makePlanets"] = ""
+            template_data["makeAspects"] = ""
+
+        with stage("chart.substitution"):
+            template = _chart_template("chart.xml").substitute(template_data)
 
         logger.debug("Template dictionary includes %s fields", len(template_data))
 
         return self._apply_svg_post_processing(template, minify, remove_css_variables)
 
-    def _get_default_filename_suffix(self, suffix: str = "") -> str:
+    def get_default_filename(self, suffix: str = "") -> str:
         """
         Generate the default filename for SVG output based on chart type.
 
+        This is the name the ``save_*`` methods use when no filename is given,
+        e.g. ``"John - Natal Chart"``.
+
         Args:
             suffix (str): Optional suffix to append (e.g., " - Wheel Only", " - Aspect Grid Only").
 
@@ -4238,7 +4318,7 @@ class ChartDrawer:  # type: ignore[no-redef]
         if filename is not None:
             chartname = output_directory / f"{filename}.svg"
         else:
-            default_name = self._get_default_filename_suffix(default_suffix)
+            default_name = self.get_default_filename(default_suffix)
             chartname = output_directory / f"{default_name}.svg"
 
         with open(chartname, "w", encoding="utf-8", errors="ignore") as output_file:
@@ -4326,37 +4406,16 @@ class ChartDrawer:  # type: ignore[no-redef]
         self._validate_chart_style(effective_style)
 
         if effective_style == "modern":
-            with open(
-                Path(__file__).parent / "templates" / "modern_wheel.xml",
-                "r",
-                encoding="utf-8",
-                errors="ignore",
-            ) as f:
-                raw_template = f.read()
-
             template_dict = self._create_template_dictionary()
-            modern_content = self._generate_modern_content(
+            template_dict["makeModernHoroscope"] = self._generate_modern_content(
                 show_zodiac_background_ring=effective_ring,
             )
-            template = Template(raw_template).substitute(
-                {
-                    **template_dict.model_dump(),
-                    "makeModernHoroscope": modern_content,
-                    "viewbox": "0 0 100 100",
-                }
-            )
+            template_dict["viewbox"] = "0 0 100 100"
+            template = _chart_template("modern_wheel.xml").substitute(template_dict)
         else:
-            with open(
-                Path(__file__).parent / "templates" / "wheel_only.xml",
-                "r",
-                encoding="utf-8",
-                errors="ignore",
-            ) as f:
-                raw_template = f.read()
-
             template_dict = self._create_template_dictionary()
-            wheel_viewbox = self._wheel_only_viewbox()
-            template = Template(raw_template).substitute({**template_dict.model_dump(), "viewbox": wheel_viewbox})
+            template_dict["viewbox"] = self._wheel_only_viewbox()
+            template = _chart_template("wheel_only.xml").substitute(template_dict)
 
         return self._apply_svg_post_processing(template, minify, remove_css_variables)
 
@@ -4416,14 +4475,6 @@ class ChartDrawer:  # type: ignore[no-redef]
             str: SVG markup for the aspect grid only.
         """
 
-        with open(
-            Path(__file__).parent / "templates" / "aspect_grid_only.xml",
-            "r",
-            encoding="utf-8",
-            errors="ignore",
-        ) as f:
-            template = f.read()
-
         template_dict = self._create_template_dictionary()
 
         if self.chart_type in ["Transit", "Synastry", "DualReturnChart"]:
@@ -4431,6 +4482,7 @@ class ChartDrawer:  # type: ignore[no-redef]
                 self.chart_colors_settings["paper_0"],
                 self.available_planets_setting,
                 self.aspects_list,
+                aspect_index=self._aspect_pair_index(symmetric=False),
             )
         else:
             aspects_grid = draw_aspect_grid(
@@ -4439,14 +4491,15 @@ class ChartDrawer:  # type: ignore[no-redef]
                 self.aspects_list,
                 x_start=50,
                 y_start=250,
+                aspect_index=self._aspect_pair_index(symmetric=True),
             )
 
         # Use a compact, known-good viewBox that frames the grid
         viewbox_override = self._grid_only_viewbox()
 
-        template = Template(template).substitute(
-            {**template_dict.model_dump(), "makeAspectGrid": aspects_grid, "viewbox": viewbox_override}
-        )
+        template_dict["makeAspectGrid"] = aspects_grid
+        template_dict["viewbox"] = viewbox_override
+        template = _chart_template("aspect_grid_only.xml").substitute(template_dict)
 
         return self._apply_svg_post_processing(template, minify, remove_css_variables)
 
@@ -17,6 +17,7 @@ The module is organized in the following sections:
 
 import datetime
 import math
+from functools import lru_cache
 from typing import Literal, Mapping, Optional, Sequence, Union
 
 from kerykeion.schemas import ChartType, KerykeionException
@@ -88,6 +89,22 @@ _ELEMENT_KEYS: tuple[str, ...] = ("fire", "earth", "air", "water")
 _QUALITY_KEYS: tuple[str, ...] = ("cardinal", "fixed", "mutable")
 
 
+# =============================================================================
+# STATIC LAYER CACHE
+# =============================================================================
+
+#: Maximum number of memoized rotation-free wheel layers (zodiac slices, degree
+#: rings). The static layers are drawn for a wheel with 0° Aries on the right and
+#: wrapped in a single rotate() by the 7th house degree, so their geometry depends
+#: only on radius, ring offset and colors and is shared by every chart.
+_STATIC_LAYER_CACHE_SIZE: int = 64
+
+
+def _is_dual_wheel(chart_type: ChartType) -> bool:
+    """Whether the chart type draws a transit ring around the zodiac."""
+    return chart_type == "Transit" or chart_type == "Synastry" or chart_type == "DualReturnChart"
+
+
 # =============================================================================
 # WEIGHT CONFIGURATION FOR ELEMENT/QUALITY CALCULATIONS
 # =============================================================================
@@ -515,6 +532,55 @@ def sliceToY(slice: Union[int, float], r: Union[int, float], offset: Union[int,
     return r * ((math.sin(radial) / -1) + 1)
 
 
+# =============================================================================
+# SVG ASSEMBLY
+# =============================================================================
+
+
+class SvgFragmentBuffer:
+    """
+    Collect SVG fragments and join them once.
+
+    Drawing functions append their elements here instead of growing a string
+    with ``+=``; ``getvalue`` returns the concatenated markup.
+    """
+
+    __slots__ = ("_fragments", "append")
+
+    def __init__(self) -> None:
+        self._fragments: list[str] = []
+        self.append = self._fragments.append
+
+    def getvalue(self) -> str:
+        """Return the fragments joined into one string."""
+        return "".join(self._fragments)
+
+
+AspectPairIndex = dict[tuple[int, int], list]
+"""Aspects keyed by the ``(p1, p2)`` ids of their points, in their original order."""
+
+
+def build_aspect_pair_index(aspects: Sequence, symmetric: bool = False) -> AspectPairIndex:
+    """
+    Index aspects by the ids of their two points.
+
+    Args:
+        aspects: Aspect models or dictionaries with ``p1`` and ``p2`` ids.
+        symmetric: Key every aspect by ``(min(p1, p2), max(p1, p2))``, so that
+            a lookup matches both orders of the pair. Use for aspects within one
+            chart; aspects between two charts keep their direction.
+
+    Returns:
+        Mapping from the pair of ids to the aspects between them.
+    """
+    index: AspectPairIndex = {}
+    for aspect in aspects:
+        p1, p2 = aspect["p1"], aspect["p2"]
+        key = (p2, p1) if symmetric and p2 < p1 else (p1, p2)
+        index.setdefault(key, []).append(aspect)
+    return index
+
+
 # =============================================================================
 # SVG DRAWING FUNCTIONS - ZODIAC SLICES
 # =============================================================================
@@ -568,6 +634,70 @@ def draw_zodiac_slice(
     return slice + "" + sign
 
 
+@lru_cache(maxsize=_STATIC_LAYER_CACHE_SIZE)
+def _zodiac_slices_geometry(
+    c1: Union[int, float], dual_wheel: bool, r: Union[int, float], styles: tuple[str, ...], signs: tuple[str, ...]
+) -> tuple[str, tuple[tuple[float, float, str], ...]]:
+    """
+    Rotation-free zodiac slices (0° Aries on the right) and the anchors of their glyphs.
+
+    Returns:
+        The 12 slice paths, and for each sign the glyph anchor and its ``<use>`` group.
+    """
+    slice_dropin: Union[int, float] = 0 if dual_wheel else c1
+    glyph_dropin: Union[int, float] = 54 if dual_wheel else 18 + c1
+    radius, glyph_radius = r - slice_dropin, r - glyph_dropin
+
+    paths = SvgFragmentBuffer()
+    glyphs = []
+    for num, (style, sign) in enumerate(zip(styles, signs)):
+        paths.append(
+            f'<path d="M{r},{r} L{slice_dropin + sliceToX(num, radius, 0)},{slice_dropin + sliceToY(num, radius, 0)} '
+            f"A{radius},{radius} 0 0,0 {slice_dropin + sliceToX(num + 1, radius, 0)},"
+            f'{slice_dropin + sliceToY(num + 1, radius, 0)} z" style="{style}"/>'
+        )
+        x = glyph_dropin + sliceToX(num, glyph_radius, 15)
+        y = glyph_dropin + sliceToY(num, glyph_radius, 15)
+        glyphs.append((x, y, f'<g transform="translate(-16,-16)"><use x="{x}" y="{y}" xlink:href="#{sign}" /></g>'))
+    return paths.getvalue(), tuple(glyphs)
+
+
+def draw_zodiac_slices(
+    c1: Union[int, float],
+    chart_type: ChartType,
+    seventh_house_degree_ut: Union[int, float],
+    r: Union[int, float],
+    styles: Sequence[str],
+    signs: Sequence[str],
+) -> str:
+    """
+    Draw the 12 zodiac sign slices with their symbols on the chart wheel.
+
+    The slices are drawn once per radius and style, with 0° Aries on the right,
+    inside a single group rotated by the 7th house degree. Each symbol is
+    counter-rotated around its anchor so it stays upright.
+
+    Args:
+        c1: Inner offset for single-wheel charts (ignored for double-wheel).
+        chart_type: Type of chart being rendered.
+        seventh_house_degree_ut: Degree of the 7th house cusp for alignment.
+        r: Chart radius in pixels.
+        styles: CSS inline style of each slice path, from Aries to Pisces.
+        signs: Sign symbol ID of each slice (e.g., "Ari", "Tau", etc.).
+
+    Returns:
+        SVG group containing the slice paths and symbol elements.
+    """
+    paths, glyphs = _zodiac_slices_geometry(c1, _is_dual_wheel(chart_type), r, tuple(styles), tuple(signs))
+    out = SvgFragmentBuffer()
+    out.append(f'<g transform="rotate({seventh_house_degree_ut} {r} {r})">')
+    out.append(paths)
+    for x, y, glyph in glyphs:
+        out.append(f'<g transform="rotate({-seventh_house_degree_ut} {x} {y})">{glyph}</g>')
+    out.append("</g>")
+    return out.getvalue()
+
+
 # =============================================================================
 # COORDINATE STRING FORMATTING
 # =============================================================================
@@ -752,11 +882,26 @@ def convert_decimal_to_degree_string(dec: float, format_type: Literal["1", "2",
 # =============================================================================
 
 
+@lru_cache(maxsize=_STATIC_LAYER_CACHE_SIZE)
+def _degree_ticks(inner_r: Union[int, float], c1: Union[int, float], stroke_style: str) -> str:
+    """Rotation-free tick marks every 5° between ``inner_r`` and ``inner_r + 2`` (0° on the right)."""
+    out = SvgFragmentBuffer()
+    for i in range(72):
+        offset = float(i * 5)
+        x1 = sliceToX(0, inner_r - c1, offset) + c1
+        y1 = sliceToY(0, inner_r - c1, offset) + c1
+        x2 = sliceToX(0, inner_r + 2 - c1, offset) - 2 + c1
+        y2 = sliceToY(0, inner_r + 2 - c1, offset) - 2 + c1
+        out.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="{stroke_style}"/>')
+    return out.getvalue()
+
+
 def draw_transit_ring_degree_steps(r: Union[int, float], seventh_house_degree_ut: Union[int, float]) -> str:
     """
     Draw degree tick marks around the transit ring.
 
-    Creates 72 tick marks at 5° intervals for visual reference.
+    Creates 72 tick marks at 5° intervals for visual reference. The ticks are
+    drawn once per radius and rotated by the 7th house degree.
 
     Args:
         r: Chart radius in pixels.
@@ -765,21 +910,8 @@ def draw_transit_ring_degree_steps(r: Union[int, float], seventh_house_degree_ut
     Returns:
         SVG group element containing the tick marks.
     """
-    out = '<g id="transitRingDegreeSteps">'
-    for i in range(72):
-        offset = float(i * 5) - seventh_house_degree_ut
-        if offset < 0:
-            offset = offset + 360.0
-        elif offset > 360:
-            offset = offset - 360.0
-        x1 = sliceToX(0, r, offset)
-        y1 = sliceToY(0, r, offset)
-        x2 = sliceToX(0, r + 2, offset) - 2
-        y2 = sliceToY(0, r + 2, offset) - 2
-        out += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: #F00; stroke-width: 1px; stroke-opacity:.9;"/>'
-    out += "</g>"
-
-    return out
+    ticks = _degree_ticks(r, 0, "stroke: #F00; stroke-width: 1px; stroke-opacity:.9;")
+    return f'<g id="transitRingDegreeSteps" transform="rotate({seventh_house_degree_ut} {r} {r})">{ticks}</g>'
 
 
 def draw_degree_ring(
@@ -788,7 +920,8 @@ def draw_degree_ring(
     """
     Draw degree tick marks around the main chart ring.
 
-    Creates 72 tick marks at 5° intervals for visual reference.
+    Creates 72 tick marks at 5° intervals for visual reference. The ticks are
+    drawn once per radius and color and rotated by the 7th house degree.
 
     Args:
         r: Chart radius in pixels.
@@ -799,22 +932,8 @@ def draw_degree_ring(
     Returns:
         str: The SVG path of the degree ring.
     """
-    out = '<g id="degreeRing">'
-    for i in range(72):
-        offset = float(i * 5) - seventh_house_degree_ut
-        if offset < 0:
-            offset = offset + 360.0
-        elif offset > 360:
-            offset = offset - 360.0
-        x1 = sliceToX(0, r - c1, offset) + c1
-        y1 = sliceToY(0, r - c1, offset) + c1
-        x2 = sliceToX(0, r + 2 - c1, offset) - 2 + c1
-        y2 = sliceToY(0, r + 2 - c1, offset) - 2 + c1
-
-        out += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {stroke_color}; stroke-width: 1px; stroke-opacity:.9;"/>'
-    out += "</g>"
-
-    return out
+    ticks = _degree_ticks(r, c1, f"stroke: {stroke_color}; stroke-width: 1px; stroke-opacity:.9;")
+    return f'<g id="degreeRing" transform="rotate({seventh_house_degree_ut} {r} {r})">{ticks}</g>'
 
 
 # =============================================================================
@@ -945,6 +1064,7 @@ def draw_aspect_grid(
     aspects: list,
     x_start: int = 510,
     y_start: int = 468,
+    aspect_index: Optional[AspectPairIndex] = None,
 ) -> str:
     """
     Draw the triangular aspect grid showing relationships between planets.
@@ -960,11 +1080,15 @@ def draw_aspect_grid(
         aspects: List of aspect dictionaries containing p1, p2, and aspect_degrees.
         x_start: X-coordinate for the bottom-left corner of the grid.
         y_start: Y-coordinate for the bottom-left corner of the grid.
+        aspect_index: Symmetric index of ``aspects`` from build_aspect_pair_index,
+            if already built; otherwise it is built here.
 
     Returns:
         SVG string containing the aspect grid rectangles and symbols.
     """
-    svg_output = ""
+    if aspect_index is None:
+        aspect_index = build_aspect_pair_index(aspects, symmetric=True)
+    svg_output = SvgFragmentBuffer()
     style = f"stroke:{stroke_color}; stroke-width: 1px; stroke-width: 0.5px; fill:none"
     box_size = 14
 
@@ -976,8 +1100,12 @@ def draw_aspect_grid(
 
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
-        svg_output += f'<rect kr:node="AspectsGridRect" x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
-        svg_output += f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        svg_output.append(
+            f'<rect kr:node="AspectsGridRect" x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
+        )
+        svg_output.append(
+            f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        )
 
         # Update the starting coordinates for the next box
         x_start += box_size
@@ -990,17 +1118,19 @@ def draw_aspect_grid(
         # Iterate over the remaining planets
         for planet_b in reversed_planets[index + 1 :]:
             # Draw the grid box for the aspect
-            svg_output += f'<rect kr:node="AspectsGridRect" x="{x_aspect}" y="{y_aspect}" width="{box_size}" height="{box_size}" style="{style}"/>'
+            svg_output.append(
+                f'<rect kr:node="AspectsGridRect" x="{x_aspect}" y="{y_aspect}" width="{box_size}" height="{box_size}" style="{style}"/>'
+            )
             x_aspect += box_size
 
-            # Check for aspects between the planets
-            for aspect in aspects:
-                if (aspect["p1"] == planet_a["id"] and aspect["p2"] == planet_b["id"]) or (
-                    aspect["p1"] == planet_b["id"] and aspect["p2"] == planet_a["id"]
-                ):
-                    svg_output += f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect["aspect_degrees"]}" />'
+            # Aspects between the planets, in either order
+            id_a, id_b = planet_a["id"], planet_b["id"]
+            for aspect in aspect_index.get((id_a, id_b) if id_a <= id_b else (id_b, id_a), ()):
+                svg_output.append(
+                    f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect["aspect_degrees"]}" />'
+                )
 
-    return svg_output
+    return svg_output.getvalue()
 
 
 def draw_houses_cusps_and_text_number(
@@ -1048,7 +1178,7 @@ def draw_houses_cusps_and_text_number(
             or transit_house_cusp_color but they are None.
     """
 
-    path = ""
+    path = SvgFragmentBuffer()
     xr = 12
 
     for i in range(xr):
@@ -1101,15 +1231,21 @@ def draw_houses_cusps_and_text_number(
 
             # Add the house number text for the second subject
             fill_opacity = "0" if chart_type == "Transit" else ".4"
-            path += '<g kr:node="HouseNumber">'
-            path += f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: {fill_opacity}; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
-            path += "</g>"
+            path.append('<g kr:node="HouseNumber">')
+            path.append(
+                f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: {fill_opacity}; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
+            )
+            path.append("</g>")
 
             # Add the house cusp line for the second subject
             stroke_opacity = "0" if chart_type == "Transit" else ".3"
-            path += f'<g kr:node="Cusp" kr:absoluteposition="{second_subject_houses_list[i].abs_pos}" kr:signposition="{second_subject_houses_list[i].position}" kr:sing="{second_subject_houses_list[i].sign}" kr:slug="{second_subject_houses_list[i].name}">'
-            path += f"<line x1='{t_x1}' y1='{t_y1}' x2='{t_x2}' y2='{t_y2}' style='stroke: {t_linecolor}; stroke-width: 1px; stroke-opacity:{stroke_opacity};'/>"
-            path += "</g>"
+            path.append(
+                f'<g kr:node="Cusp" kr:absoluteposition="{second_subject_houses_list[i].abs_pos}" kr:signposition="{second_subject_houses_list[i].position}" kr:sing="{second_subject_houses_list[i].sign}" kr:slug="{second_subject_houses_list[i].name}">'
+            )
+            path.append(
+                f"<line x1='{t_x1}' y1='{t_y1}' x2='{t_x2}' y2='{t_y2}' style='stroke: {t_linecolor}; stroke-width: 1px; stroke-opacity:{stroke_opacity};'/>"
+            )
+            path.append("</g>")
 
         # Adjust dropin based on chart type and external view
         dropin_map = {"Transit": 84, "Synastry": 84, "DualReturnChart": 84}
@@ -1121,16 +1257,22 @@ def draw_houses_cusps_and_text_number(
         ytext = sliceToY(0, (r - dropin), text_offset) + dropin
 
         # Add the house cusp line for the first subject
-        path += f'<g kr:node="Cusp" kr:absoluteposition="{first_subject_houses_list[i].abs_pos}" kr:signposition="{first_subject_houses_list[i].position}" kr:sing="{first_subject_houses_list[i].sign}" kr:slug="{first_subject_houses_list[i].name}">'
-        path += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {linecolor}; stroke-width: 1px; stroke-dasharray:3,2; stroke-opacity:.4;"/>'
-        path += "</g>"
+        path.append(
+            f'<g kr:node="Cusp" kr:absoluteposition="{first_subject_houses_list[i].abs_pos}" kr:signposition="{first_subject_houses_list[i].position}" kr:sing="{first_subject_houses_list[i].sign}" kr:slug="{first_subject_houses_list[i].name}">'
+        )
+        path.append(
+            f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" style="stroke: {linecolor}; stroke-width: 1px; stroke-dasharray:3,2; stroke-opacity:.4;"/>'
+        )
+        path.append("</g>")
 
         # Add the house number text for the first subject
-        path += '<g kr:node="HouseNumber">'
-        path += f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: .6; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
-        path += "</g>"
+        path.append('<g kr:node="HouseNumber">')
+        path.append(
+            f'<text style="fill: var(--kerykeion-chart-color-house-number); fill-opacity: .6; font-size: 14px"><tspan x="{xtext - 3}" y="{ytext + 3}">{i + 1}</tspan></text>'
+        )
+        path.append("</g>")
 
-    return path
+    return path.getvalue()
 
 
 def draw_transit_aspect_list(
@@ -1195,7 +1337,16 @@ def draw_transit_aspect_list(
     # rows a "tall" column may contain.
     max_capacity_by_top = baseline_index - top_limit_index + 1
 
-    inner_path = ""
+    out = SvgFragmentBuffer()
+    out.append(f'<g transform="translate({translate_x},{translate_y})">')
+    out.append(
+        f'<text y="-15" x="0" style="fill: var(--kerykeion-chart-color-paper-0); font-size: 14px;">{grid_title}:</text>'
+    )
+
+    # Degree of every aspect name, looked up once per aspect below (first setting wins)
+    aspect_degrees: dict = {}
+    for aspect_setting in aspects_settings:
+        aspect_degrees.setdefault(aspect_setting["name"], aspect_setting["degree"])  # type: ignore
 
     full_height_column_index = 10  # 0-based index → 11th column onward
     if chart_height is not None:
@@ -1239,34 +1390,35 @@ def draw_transit_aspect_list(
                 top_offset_lines = max(0, capacity - len(column))
                 vertical_position = (top_offset_lines + row_idx) * line_height
 
-            inner_path += f'<g transform="translate({horizontal_position},{vertical_position})">'
+            out.append(f'<g transform="translate({horizontal_position},{vertical_position})">')
 
             # First planet symbol
-            inner_path += f'<use transform="scale(0.4)" x="0" y="3" xlink:href="#{celestial_point_language[aspect["p1"]]["name"]}" />'
+            out.append(
+                f'<use transform="scale(0.4)" x="0" y="3" xlink:href="#{celestial_point_language[aspect["p1"]]["name"]}" />'
+            )
 
             # Aspect symbol
             aspect_name = aspect["aspect"]
-            id_value = next((a["degree"] for a in aspects_settings if a["name"] == aspect_name), None)  # type: ignore
-            inner_path += f'<use x="15" y="0" xlink:href="#orb{id_value}" />'
+            id_value = aspect_degrees.get(aspect_name)
+            out.append(f'<use x="15" y="0" xlink:href="#orb{id_value}" />')
 
             # Second planet symbol
-            inner_path += '<g transform="translate(30,0)">'
-            inner_path += f'<use transform="scale(0.4)" x="0" y="3" xlink:href="#{celestial_point_language[aspect["p2"]]["name"]}" />'
-            inner_path += "</g>"
+            out.append('<g transform="translate(30,0)">')
+            out.append(
+                f'<use transform="scale(0.4)" x="0" y="3" xlink:href="#{celestial_point_language[aspect["p2"]]["name"]}" />'
+            )
+            out.append("</g>")
 
             # Difference in degrees
-            inner_path += f'<text y="8" x="45" style="fill: var(--kerykeion-chart-color-paper-0); font-size: 10px;">{convert_decimal_to_degree_string(aspect["orbit"])}</text>'
+            out.append(
+                f'<text y="8" x="45" style="fill: var(--kerykeion-chart-color-paper-0); font-size: 10px;">{convert_decimal_to_degree_string(aspect["orbit"])}</text>'
+            )
 
-            inner_path += "</g>"
+            out.append("</g>")
 
-    out = f'<g transform="translate({translate_x},{translate_y})">'
-    out += (
-        f'<text y="-15" x="0" style="fill: var(--kerykeion-chart-color-paper-0); font-size: 14px;">{grid_title}:</text>'
-    )
-    out += inner_path
-    out += "</g>"
+    out.append("</g>")
 
-    return out
+    return out.getvalue()
 
 
 def calculate_moon_phase_chart_params(degrees_between_sun_and_moon: float) -> dict:
@@ -1335,12 +1487,13 @@ def draw_main_house_grid(
     Returns:
     - str: The SVG code for the grid of houses.
     """
-    svg_output = f'<g transform="translate({x_position},{y_position})">'
+    svg_output = SvgFragmentBuffer()
+    svg_output.append(f'<g transform="translate({x_position},{y_position})">')
 
     line_increment = 10
     for i, house in enumerate(main_subject_houses_list):
         cusp_number = f"&#160;&#160;{i + 1}" if i < 9 else str(i + 1)
-        svg_output += (
+        svg_output.append(
             f'<g transform="translate(0,{line_increment})">'
             f'<text text-anchor="end" x="40" style="fill:{text_color}; font-size: 10px;">{house_cusp_generale_name_label} {cusp_number}:</text>'
             f'<g transform="translate(40,-8)"><use transform="scale(0.3)" xlink:href="#{house["sign"]}" /></g>'
@@ -1349,8 +1502,8 @@ def draw_main_house_grid(
         )
         line_increment += 14
 
-    svg_output += "</g>"
-    return svg_output
+    svg_output.append("</g>")
+    return svg_output.getvalue()
 
 
 def draw_secondary_house_grid(
@@ -1373,12 +1526,13 @@ def draw_secondary_house_grid(
     Returns:
     - str: The SVG code for the grid of houses.
     """
-    svg_output = f'<g transform="translate({x_position},{y_position})">'
+    svg_output = SvgFragmentBuffer()
+    svg_output.append(f'<g transform="translate({x_position},{y_position})">')
 
     line_increment = 10
     for i, house in enumerate(secondary_subject_houses_list):
         cusp_number = f"&#160;&#160;{i + 1}" if i < 9 else str(i + 1)
-        svg_output += (
+        svg_output.append(
             f'<g transform="translate(0,{line_increment})">'
             f'<text text-anchor="end" x="40" style="fill:{text_color}; font-size: 10px;">{house_cusp_generale_name_label} {cusp_number}:</text>'
             f'<g transform="translate(40,-8)"><use transform="scale(0.3)" xlink:href="#{house["sign"]}" /></g>'
@@ -1387,8 +1541,8 @@ def draw_secondary_house_grid(
         )
         line_increment += 14
 
-    svg_output += "</g>"
-    return svg_output
+    svg_output.append("</g>")
+    return svg_output.getvalue()
 
 
 # =============================================================================
@@ -1433,11 +1587,12 @@ def draw_main_planet_grid(
     LINE_STEP = 14
 
     # Wrap everything inside a single group so position can be changed once
-    svg_output = f'<g transform="translate({x_position},{y_position})">'
+    svg_output = SvgFragmentBuffer()
+    svg_output.append(f'<g transform="translate({x_position},{y_position})">')
 
     # Add title only for specific chart types
     if chart_type in ("Synastry", "Transit", "DualReturnChart"):
-        svg_output += (
+        svg_output.append(
             f'<g transform="translate(0, {HEADER_Y})">'
             f'<text style="fill:{text_color}; font-size: 14px;">{planets_and_houses_grid_title} {subject_name}</text>'
             f"</g>"
@@ -1456,7 +1611,7 @@ def draw_main_planet_grid(
             celestial_point_language,
         )
 
-        svg_output += (
+        svg_output.append(
             f'<g transform="translate({offset},{BASE_Y + line_height})">'
             f'<text text-anchor="end" style="fill:{text_color}; font-size: 10px;">{decoded_name}</text>'
             f'<g transform="translate(5,-8)"><use transform="scale(0.4)" xlink:href="#{planet["name"]}" /></g>'
@@ -1465,14 +1620,16 @@ def draw_main_planet_grid(
         )
 
         if planet["retrograde"]:
-            svg_output += '<g transform="translate(74,-6)"><use transform="scale(.5)" xlink:href="#retrograde" /></g>'
+            svg_output.append(
+                '<g transform="translate(74,-6)"><use transform="scale(.5)" xlink:href="#retrograde" /></g>'
+            )
 
-        svg_output += end_of_line
+        svg_output.append(end_of_line)
 
     # Close the wrapper group
-    svg_output += "</g>"
+    svg_output.append("</g>")
 
-    return svg_output
+    return svg_output.getvalue()
 
 
 def draw_secondary_planet_grid(
@@ -1511,7 +1668,8 @@ def draw_secondary_planet_grid(
     LINE_STEP = 14
 
     # Open wrapper group
-    svg_output = f'<g transform="translate({x_position},{y_position})">'
+    svg_output = SvgFragmentBuffer()
+    svg_output.append(f'<g transform="translate({x_position},{y_position})">')
 
     # Title content and its relative x offset
     header_text = (
@@ -1519,7 +1677,7 @@ def draw_secondary_planet_grid(
     )
     header_x_offset = -50 if chart_type == "Transit" else 0
 
-    svg_output += (
+    svg_output.append(
         f'<g transform="translate({header_x_offset}, {HEADER_Y})">'
         f'<text style="fill:{text_color}; font-size: 14px;">{header_text}</text>'
         f"</g>"
@@ -1541,7 +1699,7 @@ def draw_secondary_planet_grid(
             t_planet["name"],
             celestial_point_language,
         )
-        svg_output += (
+        svg_output.append(
             f'<g transform="translate({offset},{BASE_Y + line_height})">'
             f'<text text-anchor="end" style="fill:{text_color}; font-size: 10px;">{second_decoded_name}</text>'
             f'<g transform="translate(5,-8)"><use transform="scale(0.4)" xlink:href="#{t_planet["name"]}" /></g>'
@@ -1550,14 +1708,16 @@ def draw_secondary_planet_grid(
         )
 
         if t_planet["retrograde"]:
-            svg_output += '<g transform="translate(74,-6)"><use transform="scale(.5)" xlink:href="#retrograde" /></g>'
+            svg_output.append(
+                '<g transform="translate(74,-6)"><use transform="scale(.5)" xlink:href="#retrograde" /></g>'
+            )
 
-        svg_output += end_of_line
+        svg_output.append(end_of_line)
 
     # Close wrapper group
-    svg_output += "</g>"
+    svg_output.append("</g>")
 
-    return svg_output
+    return svg_output.getvalue()
 
 
 # =============================================================================
@@ -1573,6 +1733,7 @@ def draw_transit_aspect_grid(
     x_indent: int = 50,
     y_indent: int = 250,
     box_size: int = 14,
+    aspect_index: Optional[AspectPairIndex] = None,
 ) -> str:
     """
     Draw a rectangular aspect grid for transit charts.
@@ -1589,12 +1750,16 @@ def draw_transit_aspect_grid(
         x_indent: X-coordinate for the grid's left edge.
         y_indent: Y-coordinate for the grid's top edge.
         box_size: Width and height of each grid cell in pixels.
+        aspect_index: Directional index of ``aspects`` from
+            build_aspect_pair_index, if already built; otherwise it is built here.
 
     Returns:
         SVG string containing the transit aspect grid.
         str: SVG string representing the aspect grid.
     """
-    svg_output = ""
+    if aspect_index is None:
+        aspect_index = build_aspect_pair_index(aspects)
+    svg_output = SvgFragmentBuffer()
     style = f"stroke:{stroke_color}; stroke-width: 1px; stroke-width: 0.5px; fill:none"
     x_start = x_indent
     y_start = y_indent
@@ -1606,8 +1771,10 @@ def draw_transit_aspect_grid(
     reversed_planets = active_planets[::-1]
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
-        svg_output += f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
-        svg_output += f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        svg_output.append(f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>')
+        svg_output.append(
+            f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        )
         x_start += box_size
 
     x_start = x_indent - box_size
@@ -1615,8 +1782,10 @@ def draw_transit_aspect_grid(
 
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
-        svg_output += f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
-        svg_output += f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        svg_output.append(f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>')
+        svg_output.append(
+            f'<use transform="scale(0.4)" x="{(x_start + 2) * 2.5}" y="{(y_start + 1) * 2.5}" xlink:href="#{planet_a["name"]}" />'
+        )
         y_start -= box_size
 
     x_start = x_indent
@@ -1625,7 +1794,7 @@ def draw_transit_aspect_grid(
 
     for index, planet_a in enumerate(reversed_planets):
         # Draw the grid box for the planet
-        svg_output += f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>'
+        svg_output.append(f'<rect x="{x_start}" y="{y_start}" width="{box_size}" height="{box_size}" style="{style}"/>')
 
         # Update the starting coordinates for the next box
         y_start -= box_size
@@ -1637,17 +1806,18 @@ def draw_transit_aspect_grid(
         # Iterate over the remaining planets
         for planet_b in reversed_planets:
             # Draw the grid box for the aspect
-            svg_output += (
+            svg_output.append(
                 f'<rect x="{x_aspect}" y="{y_aspect}" width="{box_size}" height="{box_size}" style="{style}"/>'
             )
             x_aspect += box_size
 
-            # Check for aspects between the planets
-            for aspect in aspects:
-                if aspect["p1"] == planet_a["id"] and aspect["p2"] == planet_b["id"]:
-                    svg_output += f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect["aspect_degrees"]}" />'
+            # Aspects from planet_a to planet_b
+            for aspect in aspect_index.get((planet_a["id"], planet_b["id"]), ()):
+                svg_output.append(
+                    f'<use  x="{x_aspect - box_size + 1}" y="{y_aspect + 1}" xlink:href="#orb{aspect["aspect_degrees"]}" />'
+                )
 
-    return svg_output
+    return svg_output.getvalue()
 
 
 # =============================================================================
@@ -1832,14 +2002,17 @@ def draw_house_comparison_grid(
     else:
         comparison_data = house_comparison.second_points_in_first_houses
 
-    svg_output = f'<g transform="translate({x_position},{y_position})">'
+    svg_output = SvgFragmentBuffer()
+    svg_output.append(f'<g transform="translate({x_position},{y_position})">')
 
     # Add title
-    svg_output += f'<text text-anchor="start" x="0" y="-15" style="fill:{text_color}; font-size: 14px;">{house_position_comparison_label}</text>'
+    svg_output.append(
+        f'<text text-anchor="start" x="0" y="-15" style="fill:{text_color}; font-size: 14px;">{house_position_comparison_label}</text>'
+    )
 
     # Add column headers
     line_increment = 10
-    svg_output += (
+    svg_output.append(
         f'<g transform="translate(0,{line_increment})">'
         f'<text text-anchor="start" x="0" style="fill:{text_color}; font-weight: bold; font-size: 10px;">{return_point_label}</text>'
         f'<text text-anchor="start" x="77" style="fill:{text_color}; font-weight: bold; font-size: 10px;">{return_label}</text>'
@@ -1865,7 +2038,7 @@ def draw_house_comparison_grid(
         native_house = point_data.get("native_house", "-")
         secondary_house = point_data.get("secondary_house", "-")
 
-        svg_output += (
+        svg_output.append(
             f'<g transform="translate(0,{line_increment})">'
             f'<g transform="translate(0,-9)"><use transform="scale(0.4)" xlink:href="#{name}" /></g>'
             f'<text text-anchor="start" x="15" style="fill:{text_color}; font-size: 10px;">{get_decoded_kerykeion_celestial_point_name(name, celestial_point_language)}</text>'
@@ -1875,9 +2048,9 @@ def draw_house_comparison_grid(
         )
         line_increment += 12
 
-    svg_output += "</g>"
+    svg_output.append("</g>")
 
-    return svg_output
+    return svg_output.getvalue()
 
 
 def draw_single_house_comparison_grid(
@@ -1917,14 +2090,17 @@ def draw_single_house_comparison_grid(
     else:
         comparison_data = house_comparison.second_points_in_first_houses
 
-    svg_output = f'<g transform="translate({x_position},{y_position})">'
+    svg_output = SvgFragmentBuffer()
+    svg_output.append(f'<g transform="translate({x_position},{y_position})">')
 
     # Add title
-    svg_output += f'<text text-anchor="start" x="0" y="-15" style="fill:{text_color}; font-size: 14px;">{house_position_comparison_label}</text>'
+    svg_output.append(
+        f'<text text-anchor="start" x="0" y="-15" style="fill:{text_color}; font-size: 14px;">{house_position_comparison_label}</text>'
+    )
 
     # Add column headers
     line_increment = 10
-    svg_output += (
+    svg_output.append(
         f'<g transform="translate(0,{line_increment})">'
         f'<text text-anchor="start" x="0" style="fill:{text_color}; font-weight: bold; font-size: 10px;">{return_point_label}</text>'
         f'<text text-anchor="start" x="77" style="fill:{text_color}; font-weight: bold; font-size: 10px;">{natal_house_label}</text>'
@@ -1944,7 +2120,7 @@ def draw_single_house_comparison_grid(
     for name, point_data in all_points_by_name.items():
         house = point_data.get("house", "-")
 
-        svg_output += (
+        svg_output.append(
             f'<g transform="translate(0,{line_increment})">'
             f'<g transform="translate(0,-9)"><use transform="scale(0.4)" xlink:href="#{name}" /></g>'
             f'<text text-anchor="start" x="15" style="fill:{text_color}; font-size: 10px;">{get_decoded_kerykeion_celestial_point_name(name, celestial_point_language)}</text>'
@@ -1953,9 +2129,9 @@ def draw_single_house_comparison_grid(
         )
         line_increment += 12
 
-    svg_output += "</g>"
+    svg_output.append("</g>")
 
-    return svg_output
+    return svg_output.getvalue()
 
 
 def draw_cusp_comparison_grid(
@@ -1996,14 +2172,15 @@ def draw_cusp_comparison_grid(
     if not cusps_data:
         return ""
 
-    svg_output = (
+    svg_output = SvgFragmentBuffer()
+    svg_output.append(
         f'<g transform="translate({x_position},{y_position})">'
         f'<text text-anchor="start" x="0" y="-15" style="fill:{text_color}; font-size: 12px; font-weight: bold;">{cusp_position_comparison_label}</text>'
     )
 
     # Add column headers with the same vertical spacing pattern as draw_house_comparison_grid
     line_increment = 10
-    svg_output += (
+    svg_output.append(
         f'<g transform="translate(0,{line_increment})">'
         f'<text text-anchor="start" x="0" style="fill:{text_color}; font-weight: bold; font-size: 10px;">{owner_cusp_label}</text>'
         f'<text text-anchor="start" x="70" style="fill:{text_color}; font-weight: bold; font-size: 10px;">{projected_house_label}</text>'
@@ -2020,7 +2197,7 @@ def draw_cusp_comparison_grid(
         owner_house_display = f"{cusp_cell_label} {owner_house_number}" if owner_house_number else "-"
         projected_house_display = str(cusp.projected_house_number)
 
-        svg_output += (
+        svg_output.append(
             f'<g transform="translate(0,{line_increment})">'
             f'<text text-anchor="start" x="0" style="fill:{text_color}; font-size: 10px;">{owner_house_display}</text>'
             f'<text text-anchor="start" x="70" style="fill:{text_color}; font-size: 10px;">{projected_house_display}</text>'
@@ -2028,9 +2205,9 @@ def draw_cusp_comparison_grid(
         )
         line_increment += 12
 
-    svg_output += "</g>"
+    svg_output.append("</g>")
 
-    return svg_output
+    return svg_output.getvalue()
 
 
 def draw_single_cusp_comparison_grid(
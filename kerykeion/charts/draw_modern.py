@@ -19,8 +19,10 @@ This is part of Kerykeion (C) 2025 Giacomo Battaglia
 """
 
 import math
+from functools import lru_cache
 from typing import Union
 
+from kerykeion.charts.charts_utils import SvgFragmentBuffer
 from kerykeion.schemas.kr_models import KerykeionPointModel
 
 
@@ -310,32 +312,29 @@ _ZODIAC_SIGN_IDS = [
 ]
 
 
-def _draw_zodiac_background_ring(seventh_house_degree_ut: float) -> str:
+# Wedges are drawn once with 0° Aries at the wheel's zero angle (colors come from
+# CSS variables) and the whole ring is rotated per chart; only the glyph
+# counter-rotations depend on the chart.
+@lru_cache(maxsize=1)
+def _zodiac_background_geometry() -> tuple[str, tuple[tuple[str, float, str], ...]]:
     """
-    Draw the fully colored zodiac background wedges in the outermost ring,
-    with zodiac sign glyphs centered in each wedge.
+    Rotation-free zodiac wedges and glyphs of the zodiac background ring.
 
-    Each wedge is an annular sector <path> (arc from R_ZODIAC_BG_INNER to
-    R_ZODIAC_BG_OUTER), geometrically confined to the ring without masks.
-    Each slice is colored using the CSS variable --kerykeion-chart-color-zodiac-bg-N.
-    Each wedge also gets a zodiac sign glyph at its center.
+    Returns:
+        The 12 wedge paths, and for each glyph the markup before and after its
+        counter-rotation angle together with the wedge middle angle.
     """
-    # No mask — each wedge is geometrically confined to the annulus
-    out = '<g kr:node="ZodiacBackgrounds">\n'
+    out = SvgFragmentBuffer()
+    glyphs = []
 
     # Midpoint radius for glyph placement
     r_mid = (R_ZODIAC_BG_INNER + R_ZODIAC_BG_OUTER) / 2.0
     glyph_scale = 0.09
 
     for sign_num in range(12):
-        start_abs = sign_num * 30.0
-        end_abs = start_abs + 30.0
-        mid_abs = start_abs + 15.0  # Center of the 30° wedge
-
-        # Angles converted to wheel coordinates
-        start_angle = _zodiac_to_wheel_angle(start_abs, seventh_house_degree_ut)
-        end_angle = _zodiac_to_wheel_angle(end_abs, seventh_house_degree_ut)
-        mid_angle = _zodiac_to_wheel_angle(mid_abs, seventh_house_degree_ut)
+        start_angle = sign_num * 30.0
+        end_angle = start_angle + 30.0
+        mid_angle = start_angle + 15.0  # Center of the 30° wedge
 
         color = f"var(--kerykeion-modern-zodiac-bg-{sign_num})"
 
@@ -360,8 +359,8 @@ def _draw_zodiac_background_ring(seventh_house_degree_ut: float) -> str:
         # L  inner_end
         # A  inner arc (r=R_ZODIAC_BG_INNER) 30deg, sweep counter-clockwise
         # Z  close
-        out += (
-            f'  <path d="'
+        out.append(
+            f'    <path d="'
             f"M {ox1:.6f},{oy1:.6f} "
             f"A {R_ZODIAC_BG_OUTER},{R_ZODIAC_BG_OUTER} 0 0,0 {ox2:.6f},{oy2:.6f} "
             f"L {ix1:.6f},{iy1:.6f} "
@@ -370,34 +369,61 @@ def _draw_zodiac_background_ring(seventh_house_degree_ut: float) -> str:
             f'fill="{color}" style="fill-opacity: {COLOR_ZODIAC_BG_OPACITY}" />\n'
         )
 
-        # Draw the zodiac glyph centered in the wedge
+        # Each glyph is placed via rotate(-mid_angle), which points it to its
+        # wedge, then translated to r_mid and counter-rotated to stay upright.
         sign_id = _ZODIAC_SIGN_IDS[sign_num]
-        # The group is already rotated by -90°. Each glyph is placed via
-        # rotate(-mid_angle) which points it to the correct angular position,
-        # then translated to r_mid, then counter-rotated to stay upright.
-        counter_rot = mid_angle + 90  # +90 to undo the parent -90° rotation
-        out += (
-            f'  <g transform="rotate({-mid_angle:.6f} {CENTER} {CENTER})">\n'
-            f'    <g transform="translate({CENTER} {CENTER - r_mid}) '
-            f"rotate({counter_rot:.6f}) "
-            f'scale({glyph_scale}) translate(-16 -16)">\n'
-            f'      <use xlink:href="#{sign_id}" />\n'
-            f"    </g>\n"
-            f"  </g>\n"
+        glyphs.append(
+            (
+                f'    <g transform="rotate({-mid_angle:.6f} {CENTER} {CENTER})">\n'
+                f'      <g transform="translate({CENTER} {CENTER - r_mid}) rotate(',
+                mid_angle,
+                f') scale({glyph_scale}) translate(-16 -16)">\n'
+                f'        <use xlink:href="#{sign_id}" />\n'
+                f"      </g>\n"
+                f"    </g>\n",
+            )
         )
 
+    return out.getvalue(), tuple(glyphs)
+
+
+def _draw_zodiac_background_ring(seventh_house_degree_ut: float) -> str:
+    """
+    Draw the fully colored zodiac background wedges in the outermost ring,
+    with zodiac sign glyphs centered in each wedge.
+
+    Each wedge is an annular sector <path> (arc from R_ZODIAC_BG_INNER to
+    R_ZODIAC_BG_OUTER), geometrically confined to the ring without masks.
+    Each slice is colored using the CSS variable --kerykeion-modern-zodiac-bg-N.
+    The wedges are shared by every chart inside one group rotated to the
+    chart's 7th house; each glyph is counter-rotated to stay upright.
+    """
+    wedges, glyphs = _zodiac_background_geometry()
+    # Wheel angle of a zodiac degree is (degree - seventh_house_degree_ut + 180)
+    rotation = seventh_house_degree_ut - 180.0
+
+    # No mask — each wedge is geometrically confined to the annulus
+    out = SvgFragmentBuffer()
+    out.append('<g kr:node="ZodiacBackgrounds">\n')
+    out.append(f'  <g transform="rotate({rotation:.6f} {CENTER} {CENTER})">\n')
+    out.append(wedges)
+    for before, mid_angle, after in glyphs:
+        # +90 undoes the parent -90° rotation, -rotation the ring rotation
+        out.append(f"{before}{mid_angle + 90 - rotation:.6f}{after}")
+    out.append("  </g>\n")
+
     # Border circles at the inner and outer edges of the zodiac ring
-    out += (
+    out.append(
         f'  <circle r="{R_ZODIAC_BG_INNER}" cx="{CENTER}" cy="{CENTER}" '
         f'fill="none" stroke="{COLOR_STROKE}" stroke-width="0.15"/>\n'
     )
-    out += (
+    out.append(
         f'  <circle r="{R_ZODIAC_BG_OUTER}" cx="{CENTER}" cy="{CENTER}" '
         f'fill="none" stroke="{COLOR_STROKE}" stroke-width="0.15"/>\n'
     )
 
-    out += "</g>\n"
-    return out
+    out.append("</g>\n")
+    return out.getvalue()
 
 
 # =============================================================================
@@ -423,9 +449,12 @@ def _draw_cusp_ring(
     Returns:
         SVG group string for the cusp ring.
     """
-    out = '<g kr:node="CuspRing">\n'
+    out = SvgFragmentBuffer()
+    out.append('<g kr:node="CuspRing">\n')
 
-    out += f'<path d="{_annulus_path(R_CUSP_OUTER, R_CUSP_INNER)}" fill="{COLOR_BACKGROUND}" fill-rule="evenodd"/>\n'
+    out.append(
+        f'<path d="{_annulus_path(R_CUSP_OUTER, R_CUSP_INNER)}" fill="{COLOR_BACKGROUND}" fill-rule="evenodd"/>\n'
+    )
 
     for house in houses:
         cusp_angle = _zodiac_to_wheel_angle(house.abs_pos, seventh_house_degree_ut)
@@ -445,7 +474,7 @@ def _draw_cusp_ring(
         # Upright angle counteracts global (-90) and group (-cusp_angle)
         angle_upright = 90 + cusp_angle
 
-        out += (
+        out.append(
             f'  <g kr:node="Cusp" kr:absoluteposition="{house.abs_pos}" '
             f'kr:signposition="{house.position}" kr:sign="{sign_abbrev}" '
             f'kr:slug="{house.name}" '
@@ -454,7 +483,7 @@ def _draw_cusp_ring(
 
         if is_upper_half:
             # Minutes text
-            out += (
+            out.append(
                 f'    <text text-anchor="middle" dominant-baseline="middle" '
                 f'x="{CENTER}" y="2.75" font-size="{CUSP_FONT_SIZE}" fill="{COLOR_TEXT}" '
                 f'font-weight="500" '
@@ -465,14 +494,14 @@ def _draw_cusp_ring(
 
             # Sign glyph
             final_scale = 0.12 * ZODIAC_OUTER_SCALE_MAP.get(sign_abbrev, 1.0)
-            out += (
+            out.append(
                 f'    <g transform="translate({CENTER} 2.75) rotate({angle_upright:.6f}) scale({final_scale}) translate(-16 -16)">\n'
                 f'      <use xlink:href="#{sign_abbrev}" fill="{COLOR_TEXT}" />\n'
                 f"    </g>\n"
             )
 
             # Degrees text
-            out += (
+            out.append(
                 f'    <text text-anchor="middle" dominant-baseline="middle" '
                 f'x="{CENTER}" y="2.75" font-size="{CUSP_FONT_SIZE}" fill="{COLOR_TEXT}" '
                 f'font-weight="500" '
@@ -483,7 +512,7 @@ def _draw_cusp_ring(
         else:
             # Alternate layout for lower half (mirrored text order)
             # Minutes text
-            out += (
+            out.append(
                 f'    <text text-anchor="middle" dominant-baseline="middle" '
                 f'x="{CENTER}" y="2.75" font-size="{CUSP_FONT_SIZE}" fill="{COLOR_TEXT}" '
                 f'font-weight="500" '
@@ -494,14 +523,14 @@ def _draw_cusp_ring(
 
             # Sign glyph
             final_scale = 0.12 * ZODIAC_OUTER_SCALE_MAP.get(sign_abbrev, 1.0)
-            out += (
+            out.append(
                 f'    <g transform="translate({CENTER} 2.75) rotate({angle_upright:.6f}) scale({final_scale}) translate(-16 -16)">\n'
                 f'      <use xlink:href="#{sign_abbrev}" fill="{COLOR_TEXT}" />\n'
                 f"    </g>\n"
             )
 
             # Degrees text
-            out += (
+            out.append(
                 f'    <text text-anchor="middle" dominant-baseline="middle" '
                 f'x="{CENTER}" y="2.75" font-size="{CUSP_FONT_SIZE}" fill="{COLOR_TEXT}" '
                 f'font-weight="500" '
@@ -510,7 +539,7 @@ def _draw_cusp_ring(
                 f"{degrees}º</text>\n"
             )
 
-        out += "  </g>\n"
+        out.append("  </g>\n")
 
     # Only draw signs that are NOT already represented by a house cusp.
     # Skip entirely when the outer zodiac background ring is active,
@@ -529,15 +558,15 @@ def _draw_cusp_ring(
                 upright_angle = 90 + sign_angle
                 final_scale = 0.12 * ZODIAC_OUTER_SCALE_MAP.get(sign_abbrev, 1.0)
 
-                out += (
+                out.append(
                     f'<g transform="rotate(-{sign_angle:.6f} {CENTER} {CENTER}) '
                     f'translate({CENTER} 2.75) rotate({upright_angle:.6f}) scale({final_scale}) translate(-16 -16)">\n'
                     f'  <use xlink:href="#{sign_abbrev}" fill="{COLOR_TEXT}"/>\n'
                     f"</g>\n"
                 )
 
-    out += "</g>\n"
-    return out
+    out.append("</g>\n")
+    return out.getvalue()
 
 
 # =============================================================================
@@ -545,6 +574,8 @@ def _draw_cusp_ring(
 # =============================================================================
 
 
+# The ruler ring is identical on every chart: build it once.
+@lru_cache(maxsize=1)
 def _draw_ruler_ring() -> str:
     """
     Draw the graduated ruler scale ring with 3 levels of tick marks.
@@ -555,9 +586,10 @@ def _draw_ruler_ring() -> str:
     Returns:
         SVG group string for the ruler ring.
     """
-    out = '<g kr:node="RulerRing">\n'
+    out = SvgFragmentBuffer()
+    out.append('<g kr:node="RulerRing">\n')
 
-    out += (
+    out.append(
         f'<path d="{_annulus_path(R_RULER_OUTER, R_RULER_INNER)}" '
         f'fill="{COLOR_WHITE}" fill-rule="evenodd" '
         f'stroke="{COLOR_STROKE}" stroke-width="0.2"/>\n'
@@ -576,7 +608,7 @@ def _draw_ruler_ring() -> str:
     circ_fine = 2 * math.pi * r_fine
     dash_len_fine = 0.0975
     gap_fine = (circ_fine / 360) - dash_len_fine
-    out += (
+    out.append(
         f'<circle r="{r_fine}" cx="{CENTER}" cy="{CENTER}" '
         f'fill="none" stroke="{COLOR_STROKE}" '
         f'stroke-dasharray="{dash_len_fine:.4f} {gap_fine:.6f}" '
@@ -587,7 +619,7 @@ def _draw_ruler_ring() -> str:
     circ_medium = 2 * math.pi * r_medium
     dash_len_med = 0.13
     gap_med = (circ_medium / 72) - dash_len_med
-    out += (
+    out.append(
         f'<circle r="{r_medium}" cx="{CENTER}" cy="{CENTER}" '
         f'fill="none" stroke="{COLOR_STROKE}" '
         f'stroke-dasharray="{dash_len_med:.4f} {gap_med:.6f}" '
@@ -598,15 +630,15 @@ def _draw_ruler_ring() -> str:
     circ_thick = 2 * math.pi * r_thick
     dash_len_thick = 0.26
     gap_thick = (circ_thick / 36) - dash_len_thick
-    out += (
+    out.append(
         f'<circle r="{r_thick}" cx="{CENTER}" cy="{CENTER}" '
         f'fill="none" stroke="{COLOR_STROKE}" '
         f'stroke-dasharray="{dash_len_thick:.4f} {gap_thick:.6f}" '
         f'stroke-width="1"/>\n'
     )
 
-    out += "</g>\n"
-    return out
+    out.append("</g>\n")
+    return out.getvalue()
 
 
 # =============================================================================
@@ -712,7 +744,8 @@ def _draw_indicator_line(
     if arc_radius is None:
         arc_radius = R_PLANET_OUTER - 1  # 42.5
 
-    out = f'<g kr:node="Indicator" transform="rotate(-{real_angle:.6f} {CENTER} {CENTER})">\n'
+    out = SvgFragmentBuffer()
+    out.append(f'<g kr:node="Indicator" transform="rotate(-{real_angle:.6f} {CENTER} {CENTER})">\n')
 
     angle_diff = _normalize_angle(display_angle - real_angle)
     if angle_diff > 180:
@@ -720,7 +753,7 @@ def _draw_indicator_line(
 
     if abs(angle_diff) < 0.5:
         # Simple straight indicator line
-        out += (
+        out.append(
             f'  <path d="M {CENTER} {start_y} l 0 {tick_length}" '
             f'fill="transparent" stroke="{COLOR_INDICATOR}" stroke-width="0.1"/>\n'
         )
@@ -739,7 +772,7 @@ def _draw_indicator_line(
         end_x_inner = CENTER - (r_arc - tick_sign * abs(tick_length)) * math.sin(end_rad)
         end_y_inner = CENTER - (r_arc - tick_sign * abs(tick_length)) * math.cos(end_rad)
 
-        out += (
+        out.append(
             f"  <path "
             f'd="M {CENTER} {start_y} l 0 {tick_length} '
             f"A {r_arc} {r_arc} 0 0 {sweep} {end_x:.10f} {end_y:.10f} "
@@ -747,8 +780,8 @@ def _draw_indicator_line(
             f'fill="transparent" stroke="{COLOR_INDICATOR}" stroke-width="0.1"/>\n'
         )
 
-    out += "</g>\n"
-    return out
+    out.append("</g>\n")
+    return out.getvalue()
 
 
 def _draw_planet_ring(
@@ -791,16 +824,17 @@ def _draw_planet_ring(
         SVG group string for the planet ring.
     """
     horoscope_attr = f' kr:horoscope="{horoscope_id}"' if horoscope_id else ""
-    out = f'<g kr:node="PlanetRing"{horoscope_attr}>\n'
+    out = SvgFragmentBuffer()
+    out.append(f'<g kr:node="PlanetRing"{horoscope_attr}>\n')
 
-    out += (
+    out.append(
         f'<path d="{_annulus_path(ring_outer_r, ring_inner_r)}" '
         f'fill="{ring_fill_color}" fill-rule="evenodd" '
         f'stroke="{COLOR_STROKE}" stroke-width="0.25"/>\n'
     )
 
     # House division lines through the planet ring
-    out += _draw_house_division_lines(houses, seventh_house_degree_ut, line_outer_y, line_inner_y)
+    out.append(_draw_house_division_lines(houses, seventh_house_degree_ut, line_outer_y, line_inner_y))
 
     # Build planet angle data
     planets_with_angles = []
@@ -872,13 +906,13 @@ def _draw_planet_ring(
             color=color,
             **planet_kwargs,
         )
-        out += planet_svg
+        out.append(planet_svg)
 
         # Draw indicator line
-        out += _draw_indicator_line(real_angle, display_angle, **ind_kwargs)
+        out.append(_draw_indicator_line(real_angle, display_angle, **ind_kwargs))
 
-    out += "</g>\n"
-    return out
+    out.append("</g>\n")
+    return out.getvalue()
 
 
 def _draw_single_planet_in_ring(
@@ -934,7 +968,8 @@ def _draw_single_planet_in_ring(
 
     retro_attr = ' kr:retrograde="true"' if is_retro else ""
 
-    out = (
+    out = SvgFragmentBuffer()
+    out.append(
         f'<g kr:node="ChartPoint" kr:house="{point.house}" '
         f'kr:sign="{sign}" kr:absoluteposition="{point.abs_pos}" '
         f'kr:signposition="{point.position}" kr:slug="{planet_id}"{retro_attr} '
@@ -943,14 +978,14 @@ def _draw_single_planet_in_ring(
 
     # Planet glyph (outermost, largest — near outer edge of planet ring)
     planet_scale = planet_scale_base * GLYPH_SCALE_MAP.get(planet_id, 1.0)
-    out += (
+    out.append(
         f'  <g transform="translate({CENTER} {glyph_y}) rotate({counter_rotation:.6f}) scale({planet_scale}) translate(-14 -14)">\n'
         f'    <use xlink:href="#{planet_id}" kr:slug="{planet_id}" kr:node="Glyph" fill="{fill_color}" />\n'
         f"  </g>\n"
     )
 
     # Degrees text
-    out += (
+    out.append(
         f'  <text text-anchor="middle" dominant-baseline="middle" '
         f'x="{CENTER}" y="{degrees_y}" font-size="{degrees_font_size}" fill="{fill_color}" '
         f'font-weight="500" '
@@ -959,14 +994,14 @@ def _draw_single_planet_in_ring(
 
     # Sign glyph
     sign_scale = sign_scale_base * ZODIAC_INNER_SCALE_MAP.get(sign, 1.0)
-    out += (
+    out.append(
         f'  <g transform="translate({CENTER} {sign_y}) rotate({counter_rotation:.6f}) scale({sign_scale}) translate(-16 -16)">\n'
         f'    <use xlink:href="#{sign}" fill="{fill_color}" />\n'
         f"  </g>\n"
     )
 
     # Minutes text
-    out += (
+    out.append(
         f'  <text text-anchor="middle" dominant-baseline="middle" '
         f'x="{CENTER}" y="{minutes_y}" font-size="{minutes_font_size}" fill="{fill_color}" '
         f'font-weight="500" '
@@ -975,15 +1010,15 @@ def _draw_single_planet_in_ring(
 
     # RX text (innermost — near inner edge of planet ring)
     if is_retro:
-        out += (
+        out.append(
             f'  <text text-anchor="middle" dominant-baseline="middle" '
             f'x="{CENTER}" y="{rx_y}" font-size="{rx_font_size}" fill="{fill_color}" '
             f'font-weight="500" '
             f'transform="rotate({counter_rotation:.6f} {CENTER} {rx_y})">RX</text>\n'
         )
 
-    out += "</g>\n"
-    return out
+    out.append("</g>\n")
+    return out.getvalue()
 
 
 # =============================================================================
@@ -1011,20 +1046,20 @@ def _draw_house_division_lines(
     Returns:
         SVG string with house division lines.
     """
-    out = ""
+    out = SvgFragmentBuffer()
     for i, house in enumerate(houses):
         house_num = i + 1
         cusp_angle = _zodiac_to_wheel_angle(house.abs_pos, seventh_house_degree_ut)
         stroke_w = ANGULAR_STROKE_WIDTH if house_num in ANGULAR_HOUSES else NORMAL_STROKE_WIDTH
 
-        out += (
+        out.append(
             f'<line x1="{CENTER}" y1="{line_outer_y}" '
             f'x2="{CENTER}" y2="{line_inner_y}" '
             f'stroke="{COLOR_STROKE}" stroke-width="{stroke_w}" '
             f'transform="rotate(-{cusp_angle:.6f} {CENTER} {CENTER})"/>\n'
         )
 
-    return out
+    return out.getvalue()
 
 
 # =============================================================================
@@ -1056,9 +1091,12 @@ def _draw_house_ring(
     Returns:
         SVG group string for the house ring.
     """
-    out = '<g kr:node="HouseRing">\n'
+    out = SvgFragmentBuffer()
+    out.append('<g kr:node="HouseRing">\n')
 
-    out += f'<path d="{_annulus_path(house_outer_r, house_inner_r)}" fill="{COLOR_HOUSE_RING}" fill-rule="evenodd"/>\n'
+    out.append(
+        f'<path d="{_annulus_path(house_outer_r, house_inner_r)}" fill="{COLOR_HOUSE_RING}" fill-rule="evenodd"/>\n'
+    )
 
     for i, house in enumerate(houses):
         house_num = i + 1
@@ -1077,7 +1115,7 @@ def _draw_house_ring(
         house_line_y2 = CENTER - line_inner_radius
 
         # Divider line at house boundary
-        out += (
+        out.append(
             f'<line x1="{CENTER}" y1="{house_line_y1}" '
             f'x2="{CENTER}" y2="{house_line_y2}" '
             f'stroke="{COLOR_STROKE}" stroke-width="{stroke_w}" '
@@ -1088,7 +1126,7 @@ def _draw_house_ring(
         if show_numbers:
             # Place at the absolute mid-angle, keep text upright
             angle_upright = 90 + mid_angle_abs
-            out += (
+            out.append(
                 f'<text text-anchor="middle" dominant-baseline="middle" '
                 f'x="{CENTER}" y="{text_y}" font-size="1.5" fill="{COLOR_TEXT}" '
                 f'font-weight="500" '
@@ -1097,8 +1135,8 @@ def _draw_house_ring(
                 f"{house_num}</text>\n"
             )
 
-    out += "</g>\n"
-    return out
+    out.append("</g>\n")
+    return out.getvalue()
 
 
 # =============================================================================
@@ -1144,9 +1182,10 @@ def _draw_aspect_core(
     Returns:
         SVG group string for the aspect core.
     """
-    out = '<g kr:node="AspectCore">\n'
+    out = SvgFragmentBuffer()
+    out.append('<g kr:node="AspectCore">\n')
 
-    out += f'<path d="{_annulus_path(core_radius, 0)}" fill="{COLOR_BACKGROUND}" fill-rule="evenodd"/>\n'
+    out.append(f'<path d="{_annulus_path(core_radius, 0)}" fill="{COLOR_BACKGROUND}" fill-rule="evenodd"/>\n')
 
     # Aspect color lookup
     color_map = {}
@@ -1202,7 +1241,7 @@ def _draw_aspect_core(
         movement = aspect.get("aspect_movement", "")
 
         # Aspect group with scale transform and metadata
-        out += (
+        out.append(
             f'<g kr:node="Aspect" kr:aspectname="{aspect_name}" '
             f'kr:to="{p1_name}" kr:tooriginaldegrees="{p1_abs}" '
             f'kr:from="{p2_name}" kr:fromoriginaldegrees="{p2_abs}" '
@@ -1213,7 +1252,7 @@ def _draw_aspect_core(
         )
 
         # Aspect line (drawn first so glyphs render on top)
-        out += (
+        out.append(
             f'  <line x1="{sx1:.6f}" y1="{sy1:.6f}" '
             f'x2="{sx2:.6f}" y2="{sy2:.6f}" '
             f'stroke="{color}" stroke-width="0.25"/>\n'
@@ -1231,17 +1270,17 @@ def _draw_aspect_core(
                         break
 
             if should_render_icon:
-                out += (
+                out.append(
                     f'  <g transform="translate({mx:.6f} {my:.6f}) rotate(90) scale(0.45) translate(-5 -5)">\n'
                     f'    <use xlink:href="#{symbol_id}" fill="{color}"/>\n'
                     f"  </g>\n"
                 )
                 rendered_icon_positions.append((mx, my, aspect_degrees))
 
-        out += "</g>\n"
+        out.append("</g>\n")
 
-    out += "</g>\n"
-    return out
+    out.append("</g>\n")
+    return out.getvalue()
 
 
 # =============================================================================
@@ -1278,37 +1317,38 @@ def draw_modern_horoscope(
     """
     # Orient the entire wheel so that 0° (Ascendant) is at 9 o'clock (LEFT)
     # The SVG initial orientation puts 0° at TOP. We rotate the whole group by -90°.
-    out = f'<g kr:node="ModernHoroscope" transform="rotate(-90 {CENTER} {CENTER})">\n'
+    out = SvgFragmentBuffer()
+    out.append(f'<g kr:node="ModernHoroscope" transform="rotate(-90 {CENTER} {CENTER})">\n')
 
     # If zodiac background ring is enabled, draw the outer colored wedges first,
     # then scale the entire chart content to fit inside the inner boundary.
     if show_zodiac_background_ring:
-        out += _draw_zodiac_background_ring(seventh_house_degree_ut)
+        out.append(_draw_zodiac_background_ring(seventh_house_degree_ut))
         # Scale existing chart to fit inside the zodiac background ring
         s = ZODIAC_BG_SCALE
         # translate to origin, scale, translate back
         tx = CENTER * (1 - s)
         ty = CENTER * (1 - s)
-        out += f'<g transform="translate({tx:.6f} {ty:.6f}) scale({s:.6f})">\n'
+        out.append(f'<g transform="translate({tx:.6f} {ty:.6f}) scale({s:.6f})">\n')
 
     # Full background circle
-    out += (
+    out.append(
         f'<circle fill="{COLOR_BACKGROUND}" r="{R_CUSP_OUTER}" cx="{CENTER}" cy="{CENTER}" '
         f'stroke="{COLOR_STROKE}" stroke-width="0.15"/>\n'
     )
 
     # Draw rings from outside in
-    out += _draw_cusp_ring(houses, seventh_house_degree_ut, show_zodiac_background_ring)
-    out += _draw_ruler_ring()
-    out += _draw_planet_ring(planets, planets_settings, seventh_house_degree_ut, houses)
-    out += _draw_house_ring(houses, seventh_house_degree_ut)
-    out += _draw_aspect_core(aspects_list, aspects_settings, seventh_house_degree_ut)
+    out.append(_draw_cusp_ring(houses, seventh_house_degree_ut, show_zodiac_background_ring))
+    out.append(_draw_ruler_ring())
+    out.append(_draw_planet_ring(planets, planets_settings, seventh_house_degree_ut, houses))
+    out.append(_draw_house_ring(houses, seventh_house_degree_ut))
+    out.append(_draw_aspect_core(aspects_list, aspects_settings, seventh_house_degree_ut))
 
     if show_zodiac_background_ring:
-        out += "</g>\n"  # Close the scale wrapper
+        out.append("</g>\n")  # Close the scale wrapper
 
-    out += "</g>\n"
-    return out
+    out.append("</g>\n")
+    return out.getvalue()
 
 
 # =============================================================================
@@ -1353,109 +1393,120 @@ def draw_modern_dual_horoscope(
     # ── FLAT CONCENTRIC DUAL-RING LAYOUT ──────────────────────────────────
     # Both rings exist at the same coordinate level, no nested scale() transforms.
 
-    out = f'<g kr:node="ModernDualHoroscope" kr:charttype="{chart_type}" transform="rotate(-90 {CENTER} {CENTER})">\n'
+    out = SvgFragmentBuffer()
+    out.append(
+        f'<g kr:node="ModernDualHoroscope" kr:charttype="{chart_type}" transform="rotate(-90 {CENTER} {CENTER})">\n'
+    )
 
     # Optional zodiac background ring (outermost)
     if show_zodiac_background_ring:
-        out += _draw_zodiac_background_ring(seventh_house_degree_ut)
+        out.append(_draw_zodiac_background_ring(seventh_house_degree_ut))
         s = ZODIAC_BG_SCALE
         tx = CENTER * (1 - s)
         ty = CENTER * (1 - s)
-        out += f'<g transform="translate({tx:.6f} {ty:.6f}) scale({s:.6f})">\n'
+        out.append(f'<g transform="translate({tx:.6f} {ty:.6f}) scale({s:.6f})">\n')
 
     # Background circle
-    out += f'<circle fill="{COLOR_BACKGROUND}" r="{R_CUSP_OUTER}" cx="{CENTER}" cy="{CENTER}" stroke="{COLOR_STROKE}" stroke-width="0.15"/>\n'
+    out.append(
+        f'<circle fill="{COLOR_BACKGROUND}" r="{R_CUSP_OUTER}" cx="{CENTER}" cy="{CENTER}" stroke="{COLOR_STROKE}" stroke-width="0.15"/>\n'
+    )
 
     # ─── CUSP RING (Subject 1's houses — shared, not duplicated) ────
-    out += _draw_cusp_ring(houses_1, seventh_house_degree_ut, show_zodiac_background_ring)
+    out.append(_draw_cusp_ring(houses_1, seventh_house_degree_ut, show_zodiac_background_ring))
 
     # ─── RULER RING (Subject 1's houses — shared) ───────────────────
-    out += _draw_ruler_ring()
+    out.append(_draw_ruler_ring())
 
     # ─── OUTER PLANET RING (Subject 2) ──────────────────────────────
-    out += _draw_planet_ring(
-        planets=planets_2,
-        planets_settings=planets_settings,
-        seventh_house_degree_ut=seventh_house_degree_ut,
-        houses=houses_1,  # Subject 1's houses for divider lines
-        min_separation=10.0,
-        ring_inner_r=SYN_R_OUTER_PLANET_INNER,
-        ring_outer_r=SYN_R_OUTER_PLANET_OUTER,
-        ring_fill_color=COLOR_OUTER_PLANET_RING,
-        line_outer_y=SYN_HOUSE_LINE_OUTER_Y1,
-        line_inner_y=SYN_HOUSE_LINE_OUTER_Y2,
-        planet_y_config={
-            "glyph_y": SYN_OUTER_PLANET_GLYPH_Y,
-            "degrees_y": SYN_OUTER_DEGREES_Y,
-            "sign_y": SYN_OUTER_SIGN_Y,
-            "minutes_y": SYN_OUTER_MINUTES_Y,
-            "rx_y": SYN_OUTER_RX_Y,
-        },
-        indicator_config={
-            "start_y": SYN_INDICATOR_START_Y,
-            "tick_length": -SYN_INDICATOR_TICK,  # tick outward (toward outer edge)
-            "arc_radius": SYN_INDICATOR_ARC_R_OUTWARD,  # arc just outside boundary
-        },
-        horoscope_id="1",
-        scale_config={
-            "planet_scale_base": SYN_PLANET_SCALE,
-            "degrees_font_size": SYN_DEGREES_FONT_SIZE,
-            "sign_scale_base": SYN_SIGN_SCALE,
-            "minutes_font_size": SYN_MINUTES_FONT_SIZE,
-            "rx_font_size": SYN_RX_FONT_SIZE,
-        },
+    out.append(
+        _draw_planet_ring(
+            planets=planets_2,
+            planets_settings=planets_settings,
+            seventh_house_degree_ut=seventh_house_degree_ut,
+            houses=houses_1,  # Subject 1's houses for divider lines
+            min_separation=10.0,
+            ring_inner_r=SYN_R_OUTER_PLANET_INNER,
+            ring_outer_r=SYN_R_OUTER_PLANET_OUTER,
+            ring_fill_color=COLOR_OUTER_PLANET_RING,
+            line_outer_y=SYN_HOUSE_LINE_OUTER_Y1,
+            line_inner_y=SYN_HOUSE_LINE_OUTER_Y2,
+            planet_y_config={
+                "glyph_y": SYN_OUTER_PLANET_GLYPH_Y,
+                "degrees_y": SYN_OUTER_DEGREES_Y,
+                "sign_y": SYN_OUTER_SIGN_Y,
+                "minutes_y": SYN_OUTER_MINUTES_Y,
+                "rx_y": SYN_OUTER_RX_Y,
+            },
+            indicator_config={
+                "start_y": SYN_INDICATOR_START_Y,
+                "tick_length": -SYN_INDICATOR_TICK,  # tick outward (toward outer edge)
+                "arc_radius": SYN_INDICATOR_ARC_R_OUTWARD,  # arc just outside boundary
+            },
+            horoscope_id="1",
+            scale_config={
+                "planet_scale_base": SYN_PLANET_SCALE,
+                "degrees_font_size": SYN_DEGREES_FONT_SIZE,
+                "sign_scale_base": SYN_SIGN_SCALE,
+                "minutes_font_size": SYN_MINUTES_FONT_SIZE,
+                "rx_font_size": SYN_RX_FONT_SIZE,
+            },
+        )
     )
 
     # ─── INNER PLANET RING (Subject 1) ──────────────────────────────
-    out += _draw_planet_ring(
-        planets=planets_1,
-        planets_settings=planets_settings,
-        seventh_house_degree_ut=seventh_house_degree_ut,
-        houses=houses_1,  # Subject 1's own houses
-        min_separation=10.0,
-        ring_inner_r=SYN_R_INNER_PLANET_INNER,
-        ring_outer_r=SYN_R_INNER_PLANET_OUTER,
-        ring_fill_color=COLOR_PLANET_RING,
-        line_outer_y=SYN_HOUSE_LINE_INNER_Y1,
-        line_inner_y=SYN_HOUSE_LINE_INNER_Y2,
-        planet_y_config={
-            "glyph_y": SYN_INNER_PLANET_GLYPH_Y,
-            "degrees_y": SYN_INNER_DEGREES_Y,
-            "sign_y": SYN_INNER_SIGN_Y,
-            "minutes_y": SYN_INNER_MINUTES_Y,
-            "rx_y": SYN_INNER_RX_Y,
-        },
-        indicator_config={
-            "start_y": SYN_INDICATOR_START_Y,
-            "tick_length": SYN_INDICATOR_TICK,  # tick inward (toward center)
-            "arc_radius": SYN_INDICATOR_ARC_R_INWARD,  # arc just inside boundary
-        },
-        horoscope_id="0",
-        scale_config={
-            "planet_scale_base": SYN_PLANET_SCALE_INNER,
-            "degrees_font_size": SYN_DEGREES_FONT_SIZE_INNER,
-            "sign_scale_base": SYN_SIGN_SCALE,
-            "minutes_font_size": SYN_MINUTES_FONT_SIZE,
-            "rx_font_size": SYN_RX_FONT_SIZE,
-        },
+    out.append(
+        _draw_planet_ring(
+            planets=planets_1,
+            planets_settings=planets_settings,
+            seventh_house_degree_ut=seventh_house_degree_ut,
+            houses=houses_1,  # Subject 1's own houses
+            min_separation=10.0,
+            ring_inner_r=SYN_R_INNER_PLANET_INNER,
+            ring_outer_r=SYN_R_INNER_PLANET_OUTER,
+            ring_fill_color=COLOR_PLANET_RING,
+            line_outer_y=SYN_HOUSE_LINE_INNER_Y1,
+            line_inner_y=SYN_HOUSE_LINE_INNER_Y2,
+            planet_y_config={
+                "glyph_y": SYN_INNER_PLANET_GLYPH_Y,
+                "degrees_y": SYN_INNER_DEGREES_Y,
+                "sign_y": SYN_INNER_SIGN_Y,
+                "minutes_y": SYN_INNER_MINUTES_Y,
+                "rx_y": SYN_INNER_RX_Y,
+            },
+            indicator_config={
+                "start_y": SYN_INDICATOR_START_Y,
+                "tick_length": SYN_INDICATOR_TICK,  # tick inward (toward center)
+                "arc_radius": SYN_INDICATOR_ARC_R_INWARD,  # arc just inside boundary
+            },
+            horoscope_id="0",
+            scale_config={
+                "planet_scale_base": SYN_PLANET_SCALE_INNER,
+                "degrees_font_size": SYN_DEGREES_FONT_SIZE_INNER,
+                "sign_scale_base": SYN_SIGN_SCALE,
+                "minutes_font_size": SYN_MINUTES_FONT_SIZE,
+                "rx_font_size": SYN_RX_FONT_SIZE,
+            },
+        )
     )
 
     # ─── HOUSE NUMBER RING (Subject 1's houses — shared) ────────────
-    out += _draw_house_ring(
-        houses=houses_1,
-        seventh_house_degree_ut=seventh_house_degree_ut,
-        line_inner_radius=SYN_R_ASPECT,
-        show_numbers=True,
-        house_inner_r=SYN_R_HOUSE_INNER,
-        house_outer_r=SYN_R_HOUSE_OUTER,
-        text_y=36.0,
+    out.append(
+        _draw_house_ring(
+            houses=houses_1,
+            seventh_house_degree_ut=seventh_house_degree_ut,
+            line_inner_radius=SYN_R_ASPECT,
+            show_numbers=True,
+            house_inner_r=SYN_R_HOUSE_INNER,
+            house_outer_r=SYN_R_HOUSE_OUTER,
+            text_y=36.0,
+        )
     )
 
     # ─── ASPECT CORE (cross-chart aspects) ──────────────────────────
-    out += _draw_aspect_core(aspects_list, aspects_settings, seventh_house_degree_ut, core_radius=SYN_R_ASPECT)
+    out.append(_draw_aspect_core(aspects_list, aspects_settings, seventh_house_degree_ut, core_radius=SYN_R_ASPECT))
 
     if show_zodiac_background_ring:
-        out += "</g>\n"  # Close zodiac bg scale wrapper
+        out.append("</g>\n")  # Close zodiac bg scale wrapper
 
-    out += "</g>\n"  # Close main group
-    return out
+    out.append("</g>\n")  # Close main group
+    return out.getvalue()
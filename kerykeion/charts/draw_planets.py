@@ -14,7 +14,13 @@ Main responsibilities:
 This is part of Kerykeion (C) 2025 Giacomo Battaglia
 """
 
-from kerykeion.charts.charts_utils import degreeDiff, sliceToX, sliceToY, convert_decimal_to_degree_string
+from kerykeion.charts.charts_utils import (
+    SvgFragmentBuffer,
+    convert_decimal_to_degree_string,
+    degreeDiff,
+    sliceToX,
+    sliceToY,
+)
 from kerykeion.schemas import KerykeionException, ChartType, KerykeionPointModel
 from kerykeion.schemas.kr_literals import Houses
 import logging
@@ -91,7 +97,7 @@ def draw_planets(
     """
     # Points to exclude from transit ring (house cusps)
     transit_ring_exclude_points: List[str] = list(get_args(Houses))
-    output = ""
+    output = SvgFragmentBuffer()
 
     # -------------------------------------------------------------------------
     # 1. Validate inputs for dual charts
@@ -159,7 +165,7 @@ def draw_planets(
 
         # Draw connecting lines for external view
         if external_view:
-            output = _draw_external_natal_lines(
+            _draw_external_natal_lines(
                 output,
                 radius,
                 third_circle_radius,
@@ -171,12 +177,14 @@ def draw_planets(
 
         # Draw the celestial point SVG element
         point_details = available_kerykeion_celestial_points[point_idx]
-        output += _generate_point_svg(
-            point_details,
-            point_x,
-            point_y,
-            scale_factor,
-            available_planets_setting[point_idx]["name"],
+        output.append(
+            _generate_point_svg(
+                point_details,
+                point_x,
+                point_y,
+                scale_factor,
+                available_planets_setting[point_idx]["name"],
+            )
         )
 
     # -------------------------------------------------------------------------
@@ -185,7 +193,7 @@ def draw_planets(
     if chart_type in ("Natal", "Composite", "SingleReturnChart"):
         # Single charts: draw indicators on outer ring
         if show_degree_indicators and first_circle_radius is not None and not external_view:
-            output = _draw_primary_point_indicators(
+            _draw_primary_point_indicators(
                 output=output,
                 radius=radius,
                 first_circle_radius=first_circle_radius,
@@ -201,7 +209,7 @@ def draw_planets(
         if show_degree_indicators:
             # Secondary/outer points (transit planets)
             if secondary_points_abs_positions and secondary_points_rel_positions:
-                output = _draw_secondary_points(
+                _draw_secondary_points(
                     output,
                     radius,
                     main_subject_first_house_degree_ut,
@@ -215,7 +223,7 @@ def draw_planets(
                     second_subject_available_kerykeion_celestial_points,
                 )
             # Primary/inner points (natal planets)
-            output = _draw_inner_point_indicators(
+            _draw_inner_point_indicators(
                 output=output,
                 radius=radius,
                 third_circle_radius=third_circle_radius,
@@ -226,7 +234,75 @@ def draw_planets(
                 points_settings=available_planets_setting,
             )
 
-    return output
+    return output.getvalue()
+
+
+def draw_secondary_planets(
+    radius: Union[int, float],
+    available_kerykeion_celestial_points: list[KerykeionPointModel],
+    available_planets_setting: Sequence[Mapping[str, Any]],
+    second_subject_available_kerykeion_celestial_points: list[KerykeionPointModel],
+    main_subject_first_house_degree_ut: Union[int, float],
+    main_subject_seventh_house_degree_ut: Union[int, float],
+    chart_type: ChartType,
+) -> str:
+    """
+    Draws only the outer-wheel celestial points of a dual chart.
+
+    Produces the same markup that ``draw_planets`` emits for the secondary
+    subject (with degree indicators enabled), so a renderer can keep the inner
+    wheel and redraw only the outer points, e.g. once per frame of a transit
+    timeline. Passing an empty secondary list to ``draw_planets`` gives the
+    complementary inner-wheel markup.
+
+    Args:
+        radius: Chart radius in pixels.
+        available_kerykeion_celestial_points: Points of the main (inner) subject.
+        available_planets_setting: Display settings of the active points.
+        second_subject_available_kerykeion_celestial_points: Points of the secondary subject.
+        main_subject_first_house_degree_ut: Ascendant degree of the main subject.
+        main_subject_seventh_house_degree_ut: Descendant degree of the main subject.
+        chart_type: Type of dual chart (Transit, Synastry, DualReturnChart).
+
+    Returns:
+        SVG markup string of the secondary points.
+    """
+    if chart_type not in DUAL_CHART_TYPES or not second_subject_available_kerykeion_celestial_points:
+        return ""
+
+    # The secondary connecting lines start from the last main point drawn by draw_planets
+    main_points_abs_positions = [p.abs_pos for p in available_kerykeion_celestial_points]
+    position_index_map = {main_points_abs_positions[i]: i for i in range(len(available_planets_setting))}
+    sorted_positions = sorted(position_index_map.keys())
+    position_adjustments = _calculate_planet_adjustments(
+        main_points_abs_positions,
+        available_planets_setting,
+        position_index_map,
+        sorted_positions,
+    )
+    main_offset = 0.0
+    if sorted_positions:
+        main_offset = _calculate_point_offset(
+            main_subject_seventh_house_degree_ut,
+            main_points_abs_positions[position_index_map[sorted_positions[-1]]],
+            position_adjustments[-1],
+        )
+
+    output = SvgFragmentBuffer()
+    _draw_secondary_points(
+        output,
+        radius,
+        main_subject_first_house_degree_ut,
+        main_subject_seventh_house_degree_ut,
+        [p.abs_pos for p in second_subject_available_kerykeion_celestial_points],
+        [p.position for p in second_subject_available_kerykeion_celestial_points],
+        available_planets_setting,
+        chart_type,
+        list(get_args(Houses)),
+        main_offset,
+        second_subject_available_kerykeion_celestial_points,
+    )
+    return output.getvalue()
 
 
 # =============================================================================
@@ -749,11 +825,12 @@ def _generate_point_svg(
     is_retrograde = point_details["retrograde"] is True
     retro_attr = ' kr:retrograde="true"' if is_retrograde else ""
 
-    svg = f'<g kr:node="ChartPoint" kr:house="{point_details["house"]}" '
-    svg += f'kr:sign="{point_details["sign"]}" kr:absoluteposition="{point_details["abs_pos"]}" '
-    svg += f'kr:signposition="{point_details["position"]}" kr:slug="{point_details["name"]}"{retro_attr} '
-    svg += f'transform="translate(-{12 * scale},-{12 * scale}) scale({scale})">'
-    svg += f'<use x="{x * (1 / scale)}" y="{y * (1 / scale)}" xlink:href="#{point_name}" />'
+    svg = SvgFragmentBuffer()
+    svg.append(f'<g kr:node="ChartPoint" kr:house="{point_details["house"]}" ')
+    svg.append(f'kr:sign="{point_details["sign"]}" kr:absoluteposition="{point_details["abs_pos"]}" ')
+    svg.append(f'kr:signposition="{point_details["position"]}" kr:slug="{point_details["name"]}"{retro_attr} ')
+    svg.append(f'transform="translate(-{12 * scale},-{12 * scale}) scale({scale})">')
+    svg.append(f'<use x="{x * (1 / scale)}" y="{y * (1 / scale)}" xlink:href="#{point_name}" />')
 
     if is_retrograde:
         # Position the retrograde symbol at the bottom-right foot of the planet glyph.
@@ -761,23 +838,23 @@ def _generate_point_svg(
         # y=+18 aligns the symbol with the glyph's baseline (foot).
         retro_x = x * (1 / scale) + 22
         retro_y = y * (1 / scale) + 18
-        svg += f'<g transform="translate({retro_x},{retro_y}) scale(0.55)">'
-        svg += '<use xlink:href="#retrograde" />'
-        svg += "</g>"
+        svg.append(f'<g transform="translate({retro_x},{retro_y}) scale(0.55)">')
+        svg.append('<use xlink:href="#retrograde" />')
+        svg.append("</g>")
 
-    svg += "</g>"
-    return svg
+    svg.append("</g>")
+    return svg.getvalue()
 
 
 def _draw_external_natal_lines(
-    output: str,
+    output: SvgFragmentBuffer,
     radius: Union[int, float],
     third_circle_radius: Union[int, float],
     point_radius: Union[int, float],
     true_offset: Union[int, float],
     adjusted_offset: Union[int, float],
     color: str,
-) -> str:
+) -> None:
     """
     Draw connecting lines for external view mode.
 
@@ -785,33 +862,28 @@ def _draw_external_natal_lines(
     position, and another from there to the adjusted (visual) position.
 
     Args:
-        output: Current SVG output to append to.
+        output: SVG buffer the lines are appended to.
         radius: Chart radius.
         third_circle_radius: Inner circle radius.
         point_radius: Point placement radius.
         true_offset: True angular position.
         adjusted_offset: Visually adjusted position.
         color: Line color.
-
-    Returns:
-        Updated SVG output with added lines.
     """
     # First line: from chart edge to intermediate position
     x1 = sliceToX(0, radius - third_circle_radius, true_offset) + third_circle_radius
     y1 = sliceToY(0, radius - third_circle_radius, true_offset) + third_circle_radius
     x2 = sliceToX(0, radius - point_radius - 30, true_offset) + point_radius + 30
     y2 = sliceToY(0, radius - point_radius - 30, true_offset) + point_radius + 30
-    output += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-    output += f'style="stroke-width:1px;stroke:{color};stroke-opacity:.3;"/>\n'
+    output.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" ')
+    output.append(f'style="stroke-width:1px;stroke:{color};stroke-opacity:.3;"/>\n')
 
     # Second line: from intermediate to final adjusted position
     x1, y1 = x2, y2
     x2 = sliceToX(0, radius - point_radius - 10, adjusted_offset) + point_radius + 10
     y2 = sliceToY(0, radius - point_radius - 10, adjusted_offset) + point_radius + 10
-    output += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-    output += f'style="stroke-width:1px;stroke:{color};stroke-opacity:.5;"/>\n'
-
-    return output
+    output.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" ')
+    output.append(f'style="stroke-width:1px;stroke:{color};stroke-opacity:.5;"/>\n')
 
 
 # =============================================================================
@@ -820,7 +892,7 @@ def _draw_external_natal_lines(
 
 
 def _draw_primary_point_indicators(
-    output: str,
+    output: SvgFragmentBuffer,
     radius: Union[int, float],
     first_circle_radius: Union[int, float],
     third_circle_radius: Union[int, float],
@@ -829,7 +901,7 @@ def _draw_primary_point_indicators(
     points_abs_positions: list[Union[int, float]],
     points_rel_positions: list[Union[int, float]],
     points_settings: Sequence[Mapping[str, Any]],
-) -> str:
+) -> None:
     """
     Draw degree indicators for primary points in single-subject charts.
 
@@ -837,7 +909,7 @@ def _draw_primary_point_indicators(
     and a rotated text label showing the degree within the sign.
 
     Args:
-        output: Current SVG output to append to.
+        output: SVG buffer the indicators are appended to.
         radius: Chart radius.
         first_circle_radius: Outer zodiac ring radius.
         third_circle_radius: Inner boundary radius.
@@ -846,9 +918,6 @@ def _draw_primary_point_indicators(
         points_abs_positions: Absolute positions of points.
         points_rel_positions: Positions within signs.
         points_settings: Display settings for points.
-
-    Returns:
-        Updated SVG output with added indicators.
     """
     # Calculate adjustments for overlapping indicators
     position_adjustments = _calculate_indicator_adjustments(points_abs_positions, points_settings)
@@ -866,8 +935,8 @@ def _draw_primary_point_indicators(
         y2 = sliceToY(0, radius - first_circle_radius - 4, point_offset) + first_circle_radius + 4
 
         point_color = points_settings[point_idx]["color"]
-        output += f'<line class="planet-degree-line" x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-        output += f'style="stroke: {point_color}; stroke-width: 1px; stroke-opacity:.8;"/>'
+        output.append(f'<line class="planet-degree-line" x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" ')
+        output.append(f'style="stroke: {point_color}; stroke-width: 1px; stroke-opacity:.8;"/>')
 
         # Draw degree text (always horizontal for readability)
         adjusted_point_offset = point_offset + position_adjustments[point_idx]
@@ -877,15 +946,13 @@ def _draw_primary_point_indicators(
         deg_y = sliceToY(0, radius - text_radius, adjusted_point_offset) + text_radius
 
         degree_text = convert_decimal_to_degree_string(points_rel_positions[point_idx], format_type="1")
-        output += f'<g transform="translate({deg_x},{deg_y})">'
-        output += f'<text text-anchor="middle" dominant-baseline="middle" '
-        output += f'style="fill: {point_color}; font-size: 10px;">{degree_text}</text></g>'
-
-    return output
+        output.append(f'<g transform="translate({deg_x},{deg_y})">')
+        output.append(f'<text text-anchor="middle" dominant-baseline="middle" ')
+        output.append(f'style="fill: {point_color}; font-size: 10px;">{degree_text}</text></g>')
 
 
 def _draw_inner_point_indicators(
-    output: str,
+    output: SvgFragmentBuffer,
     radius: Union[int, float],
     third_circle_radius: Union[int, float],
     first_house_degree: Union[int, float],
@@ -893,7 +960,7 @@ def _draw_inner_point_indicators(
     points_abs_positions: list[Union[int, float]],
     points_rel_positions: list[Union[int, float]],
     points_settings: Sequence[Mapping[str, Any]],
-) -> str:
+) -> None:
     """
     Draw degree indicators for inner/natal points in dual-subject charts.
 
@@ -901,7 +968,7 @@ def _draw_inner_point_indicators(
     between the natal planet ring and the zodiac signs.
 
     Args:
-        output: Current SVG output.
+        output: SVG buffer the indicators are appended to.
         radius: Chart radius.
         third_circle_radius: Inner boundary radius.
         first_house_degree: Ascendant degree.
@@ -909,9 +976,6 @@ def _draw_inner_point_indicators(
         points_abs_positions: Absolute positions.
         points_rel_positions: Sign positions.
         points_settings: Display settings.
-
-    Returns:
-        Updated SVG output with indicators.
     """
     position_adjustments = _calculate_indicator_adjustments(points_abs_positions, points_settings)
     zero_point = 360 - seventh_house_degree
@@ -928,8 +992,8 @@ def _draw_inner_point_indicators(
         y2 = sliceToY(0, radius - NATAL_INDICATOR_OFFSET - 4, point_offset) + NATAL_INDICATOR_OFFSET + 4
 
         point_color = points_settings[point_idx]["color"]
-        output += f'<line class="planet-degree-line-inner" x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-        output += f'style="stroke: {point_color}; stroke-width: 1px; stroke-opacity:.8;"/>'
+        output.append(f'<line class="planet-degree-line-inner" x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" ')
+        output.append(f'style="stroke: {point_color}; stroke-width: 1px; stroke-opacity:.8;"/>')
 
         # Draw degree text (always horizontal, positioned toward center)
         adjusted_point_offset = point_offset + position_adjustments[point_idx]
@@ -939,15 +1003,13 @@ def _draw_inner_point_indicators(
         deg_y = sliceToY(0, radius - text_radius, adjusted_point_offset) + text_radius
 
         degree_text = convert_decimal_to_degree_string(points_rel_positions[point_idx], format_type="1")
-        output += f'<g transform="translate({deg_x},{deg_y})">'
-        output += f'<text text-anchor="middle" dominant-baseline="middle" '
-        output += f'style="fill: {point_color}; font-size: 8px;">{degree_text}</text></g>'
-
-    return output
+        output.append(f'<g transform="translate({deg_x},{deg_y})">')
+        output.append(f'<text text-anchor="middle" dominant-baseline="middle" ')
+        output.append(f'style="fill: {point_color}; font-size: 8px;">{degree_text}</text></g>')
 
 
 def _draw_secondary_points(
-    output: str,
+    output: SvgFragmentBuffer,
     radius: Union[int, float],
     first_house_degree: Union[int, float],
     seventh_house_degree: Union[int, float],
@@ -958,7 +1020,7 @@ def _draw_secondary_points(
     exclude_points: list[str],
     main_offset: float,
     celestial_points: Union[list[KerykeionPointModel], None] = None,
-) -> str:
+) -> None:
     """
     Draw secondary celestial points for transit/synastry charts.
 
@@ -967,7 +1029,7 @@ def _draw_secondary_points(
     a small retrograde symbol (℞) is rendered next to the glyph.
 
     Args:
-        output: Current SVG output.
+        output: SVG buffer the points are appended to.
         radius: Chart radius.
         first_house_degree: Ascendant degree.
         seventh_house_degree: Descendant degree.
@@ -978,9 +1040,6 @@ def _draw_secondary_points(
         exclude_points: Points to exclude from rendering.
         main_offset: Offset for connecting line drawing.
         celestial_points: Celestial point models (used for retrograde detection).
-
-    Returns:
-        Updated SVG output with secondary points.
     """
     # Calculate position adjustments using secondary-specific spacing values
     # This differs from _calculate_indicator_adjustments which uses wider spacing
@@ -1032,17 +1091,19 @@ def _draw_secondary_points(
             and celestial_points[point_idx].retrograde is True
         )
         retro_attr = ' kr:retrograde="true"' if is_retrograde else ""
-        output += f'<g class="transit-planet-name"{retro_attr} transform="translate(-6,-6)"><g transform="scale(0.5)">'
-        output += f'<use x="{point_x * 2}" y="{point_y * 2}" xlink:href="#{points_settings[point_idx]["name"]}" />'
+        output.append(
+            f'<g class="transit-planet-name"{retro_attr} transform="translate(-6,-6)"><g transform="scale(0.5)">'
+        )
+        output.append(f'<use x="{point_x * 2}" y="{point_y * 2}" xlink:href="#{points_settings[point_idx]["name"]}" />')
         if is_retrograde:
             # Same offset logic as _generate_point_svg: bottom-right foot of the glyph.
             # Inner coordinate space is 2x due to scale(0.5) wrapper.
             retro_x = point_x * 2 + 22
             retro_y = point_y * 2 + 18
-            output += f'<g transform="translate({retro_x},{retro_y}) scale(0.55)">'
-            output += '<use xlink:href="#retrograde" />'
-            output += "</g>"
-        output += "</g></g>"
+            output.append(f'<g transform="translate({retro_x},{retro_y}) scale(0.55)">')
+            output.append('<use xlink:href="#retrograde" />')
+            output.append("</g>")
+        output.append("</g></g>")
 
         # Draw indicator line
         x1 = sliceToX(0, radius + 3, point_offset) - 3
@@ -1050,8 +1111,8 @@ def _draw_secondary_points(
         x2 = sliceToX(0, radius - 3, point_offset) + 3
         y2 = sliceToY(0, radius - 3, point_offset) + 3
         point_color = points_settings[point_idx]["color"]
-        output += f'<line class="transit-planet-line" x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-        output += f'style="stroke: {point_color}; stroke-width: 1px; stroke-opacity:.8;"/>'
+        output.append(f'<line class="transit-planet-line" x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" ')
+        output.append(f'style="stroke: {point_color}; stroke-width: 1px; stroke-opacity:.8;"/>')
 
         # Draw degree text (always horizontal for readability)
         adjusted_point_offset = point_offset + position_adjustments[point_idx]
@@ -1061,9 +1122,9 @@ def _draw_secondary_points(
         deg_y = sliceToY(0, radius - text_radius, adjusted_point_offset) + text_radius
 
         degree_text = convert_decimal_to_degree_string(points_rel_positions[point_idx], format_type="1")
-        output += f'<g transform="translate({deg_x},{deg_y})">'
-        output += f'<text text-anchor="middle" dominant-baseline="middle" '
-        output += f'style="fill: {point_color}; font-size: 10px;">{degree_text}</text></g>'
+        output.append(f'<g transform="translate({deg_x},{deg_y})">')
+        output.append(f'<text text-anchor="middle" dominant-baseline="middle" ')
+        output.append(f'style="fill: {point_color}; font-size: 10px;">{degree_text}</text></g>')
 
     # Draw connecting lines for the main reference point
     dropin = 36 if chart_type in DUAL_CHART_TYPES else 0
@@ -1072,8 +1133,8 @@ def _draw_secondary_points(
     x2 = sliceToX(0, radius - (dropin - 3), main_offset) + (dropin - 3)
     y2 = sliceToY(0, radius - (dropin - 3), main_offset) + (dropin - 3)
     point_color = points_settings[point_idx]["color"]
-    output += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-    output += f'style="stroke: {point_color}; stroke-width: 2px; stroke-opacity:.6;"/>'
+    output.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" ')
+    output.append(f'style="stroke: {point_color}; stroke-width: 2px; stroke-opacity:.6;"/>')
 
     # Second connecting line segment
     dropin = 160 if chart_type in DUAL_CHART_TYPES else 120
@@ -1081,7 +1142,5 @@ def _draw_secondary_points(
     y1 = sliceToY(0, radius - dropin, main_offset) + dropin
     x2 = sliceToX(0, radius - (dropin - 3), main_offset) + (dropin - 3)
     y2 = sliceToY(0, radius - (dropin - 3), main_offset) + (dropin - 3)
-    output += f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-    output += f'style="stroke: {point_color}; stroke-width: 2px; stroke-opacity:.6;"/>'
-
-    return output
+    output.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" ')
+    output.append(f'style="stroke: {point_color}; stroke-width: 2px; stroke-opacity:.6;"/>')
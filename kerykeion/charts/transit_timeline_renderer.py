@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""
+Transit Timeline Rendering
+==========================
+
+This module renders a time series of transits to one natal chart as a single
+animated wheel, or as a sequence of lightweight frame fragments.
+
+Rendering one full ChartDrawer SVG per frame repeats everything that does not
+move between frames: theme, zodiac, circles, natal houses, natal planets and
+grids. The timeline renderer draws that static natal wheel once, from a
+ChartDrawer of the first frame, and then only the transiting planets and the
+transit-to-natal aspect lines of each frame.
+
+Frames are drawn exactly as the classic Transit wheel draws them. The transit
+house cusps are transparent in Transit charts, so they stay in the static layer.
+
+Example:
+    >>> from kerykeion.charts.transit_timeline_renderer import TransitTimelineRenderer
+    >>> renderer = TransitTimelineRenderer(natal_subject, ephemeris_subjects, theme="dark")
+    >>> svg = renderer.generate_animated_svg_string(frame_duration=0.2)
+    >>> for frame in renderer.iter_frames():
+    ...     print(frame.date, len(frame.svg))
+
+This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterator, List, Mapping, Optional, Sequence
+
+from kerykeion.aspects import AspectsFactory
+from kerykeion.chart_data_factory import ChartDataFactory
+from kerykeion.charts.chart_drawer import ChartDrawer, _chart_template
+from kerykeion.charts.charts_utils import SvgFragmentBuffer
+from kerykeion.charts.draw_planets import draw_planets, draw_secondary_planets
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import AstrologicalPoint, KerykeionChartLanguage, KerykeionChartTheme
+from kerykeion.schemas.kr_models import ActiveAspect, AstrologicalSubjectModel
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_ASPECTS
+from kerykeion.transits_time_range_factory import TransitsTimeRangeFactory
+
+
+@dataclass(frozen=True)
+class TransitTimelineFrame:
+    """
+    One frame of a transit timeline.
+
+    Attributes:
+        index: Position of the frame in the timeline.
+        date: ISO 8601 local date and time of the transiting subject.
+        svg: SVG group with the transiting planets and aspect lines of the frame,
+            in the coordinates of the wheel drawn by the static layer.
+    """
+
+    index: int
+    date: str
+    svg: str
+
+
+class TransitTimelineRenderer:
+    """
+    Render the transits of a time series of subjects to one natal chart.
+
+    Args:
+        natal_subject (AstrologicalSubjectModel): Natal chart drawn on the inner wheel.
+        transit_subjects (Sequence[AstrologicalSubjectModel]): Time-ordered transiting
+            subjects, e.g. from ``EphemerisDataFactory.get_ephemeris_data_as_astrological_subjects()``.
+        active_points (list[AstrologicalPoint] | None): Points to draw and aspect, as in
+            ``ChartDataFactory.create_transit_chart_data``. None uses the natal subject's points.
+        active_aspects (list[ActiveAspect]): Aspect types and orbs. Defaults to DEFAULT_ACTIVE_ASPECTS.
+        axis_orb_limit (float | None): Optional orb threshold for the chart axes.
+        theme (KerykeionChartTheme | None): CSS theme, as in ChartDrawer. Defaults to "classic".
+        chart_language (KerykeionChartLanguage): Language of the labels. Defaults to "EN".
+        drawer_options (Mapping | None): Extra keyword arguments for the ChartDrawer of the
+            static layer (e.g. ``colors_settings``, ``show_aspect_icons``).
+
+    Raises:
+        KerykeionException: If there are no transit subjects or a wheel style other than
+            "classic" is requested.
+    """
+
+    def __init__(
+        self,
+        natal_subject: AstrologicalSubjectModel,
+        transit_subjects: Sequence[AstrologicalSubjectModel],
+        *,
+        active_points: Optional[List[AstrologicalPoint]] = None,
+        active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS,
+        axis_orb_limit: Optional[float] = None,
+        theme: Optional[KerykeionChartTheme] = "classic",
+        chart_language: KerykeionChartLanguage = "EN",
+        drawer_options: Optional[Mapping[str, Any]] = None,
+    ):
+        if not transit_subjects:
+            raise KerykeionException("A transit timeline needs at least one transit subject.")
+
+        drawer_options = dict(drawer_options or {})
+        if drawer_options.get("style", "classic") != "classic":
+            raise KerykeionException("Transit timelines are drawn on the classic wheel only.")
+
+        self.natal_subject = natal_subject
+        self.transit_subjects = transit_subjects
+        self.axis_orb_limit = axis_orb_limit
+
+        first_frame = ChartDataFactory.create_chart_data(
+            "Transit",
+            natal_subject,
+            transit_subjects[0],
+            active_points=active_points,
+            active_aspects=active_aspects,
+            include_house_comparison=False,
+            axis_orb_limit=axis_orb_limit,
+        )
+        self.active_points = first_frame.active_points
+        self.active_aspects = first_frame.active_aspects
+
+        self._drawer = ChartDrawer(first_frame, theme=theme, chart_language=chart_language, **drawer_options)
+        self._point_names = [body["name"].lower() for body in self._drawer.available_planets_setting]
+
+    @classmethod
+    def from_transits_factory(
+        cls,
+        factory: TransitsTimeRangeFactory,
+        **kwargs: Any,
+    ) -> "TransitTimelineRenderer":
+        """
+        Build a renderer for the natal chart, ephemeris points and aspect settings of a factory.
+
+        Args:
+            factory (TransitsTimeRangeFactory): Factory whose transit moments should be drawn.
+            **kwargs: Rendering options (``theme``, ``chart_language``, ``drawer_options``).
+
+        Returns:
+            TransitTimelineRenderer: Renderer with one frame per ephemeris data point.
+        """
+        return cls(
+            factory.natal_chart,
+            factory.ephemeris_data_points,
+            active_points=factory.active_points,
+            active_aspects=factory.active_aspects,
+            axis_orb_limit=factory.axis_orb_limit,
+            **kwargs,
+        )
+
+    # =========================================================================
+    # FRAMES
+    # =========================================================================
+
+    def iter_frames(self) -> Iterator[TransitTimelineFrame]:
+        """
+        Lazily render the frame fragments of the timeline in order.
+
+        Yields:
+            TransitTimelineFrame: The transit layer of each transit subject.
+        """
+        for index, transit_subject in enumerate(self.transit_subjects):
+            yield self._render_frame(index, transit_subject)
+
+    def _render_frame(self, index: int, transit_subject: AstrologicalSubjectModel) -> TransitTimelineFrame:
+        """Draw the transiting planets and aspect lines of one transit subject."""
+        d = self._drawer
+        aspects = AspectsFactory.dual_chart_aspects(
+            self.natal_subject,
+            transit_subject,
+            active_points=self.active_points,
+            active_aspects=self.active_aspects,
+            axis_orb_limit=self.axis_orb_limit,
+            first_subject_is_fixed=True,
+            second_subject_is_fixed=False,
+        ).aspects
+
+        date = transit_subject.iso_formatted_local_datetime
+        label = datetime.fromisoformat(date).strftime("%Y-%m-%d %H:%M")
+
+        out = SvgFragmentBuffer()
+        out.append(f'<g kr:node="Transit_Frame" kr:index="{index}" kr:date="{date}">')
+        out.append(
+            f'<text x="0" y="12" style="fill: var(--kerykeion-chart-color-paper-0); font-size: 12px">{label}</text>'
+        )
+        out.append(
+            draw_secondary_planets(
+                radius=d.main_radius,
+                available_kerykeion_celestial_points=d.available_kerykeion_celestial_points,
+                available_planets_setting=d.available_planets_setting,
+                second_subject_available_kerykeion_celestial_points=d._collect_subject_points(
+                    transit_subject, self._point_names
+                ),
+                main_subject_first_house_degree_ut=self.natal_subject.first_house.abs_pos,
+                main_subject_seventh_house_degree_ut=self.natal_subject.seventh_house.abs_pos,
+                chart_type="Transit",
+            )
+        )
+        out.append(d._draw_all_aspects_lines(d.main_radius, d.main_radius - 160, aspects))
+        out.append("</g>")
+        return TransitTimelineFrame(index=index, date=date, svg=out.getvalue())
+
+    # =========================================================================
+    # SVG OUTPUT
+    # =========================================================================
+
+    def generate_static_svg_string(self, minify: bool = False, remove_css_variables: bool = False) -> str:
+        """
+        Render the static natal wheel with an empty ``Transit_Frames`` group.
+
+        Frame fragments from ``iter_frames()`` can be placed inside that group
+        to show any moment of the timeline.
+
+        Args:
+            minify (bool): Remove whitespace and quotes for compactness.
+            remove_css_variables (bool): Embed CSS variable definitions.
+
+        Returns:
+            str: SVG markup of the natal wheel.
+        """
+        return self._render_wheel("", minify, remove_css_variables)
+
+    def generate_animated_svg_string(
+        self,
+        frame_duration: float = 0.2,
+        *,
+        loop: bool = True,
+        minify: bool = False,
+        remove_css_variables: bool = False,
+    ) -> str:
+        """
+        Render the whole timeline as one SVG animated with SMIL.
+
+        Every frame is a group shown for ``frame_duration`` seconds in turn.
+        Viewers without SMIL support show the first frame.
+
+        Args:
+            frame_duration (float): Seconds each frame is shown. Defaults to 0.2.
+            loop (bool): Restart after the last frame; otherwise it stays visible.
+                Defaults to True.
+            minify (bool): Remove whitespace and quotes for compactness.
+            remove_css_variables (bool): Embed CSS variable definitions.
+
+        Returns:
+            str: SVG markup of the animated timeline.
+
+        Raises:
+            KerykeionException: If frame_duration is not positive.
+        """
+        if frame_duration <= 0:
+            raise KerykeionException(f"frame_duration must be positive, got {frame_duration}.")
+
+        total = len(self.transit_subjects)
+        repeat = 'repeatCount="indefinite"' if loop else 'repeatCount="1" fill="freeze"'
+        frames = SvgFragmentBuffer()
+        for frame in self.iter_frames():
+            if total == 1:
+                frames.append(frame.svg)
+                continue
+
+            # Discrete visibility keyframes: hidden, visible during this frame's slot, hidden
+            values, key_times = [], []
+            if frame.index > 0:
+                values.append("hidden")
+                key_times.append("0")
+            values.append("visible")
+            key_times.append(f"{frame.index / total:.9g}")
+            if frame.index < total - 1:
+                values.append("hidden")
+                key_times.append(f"{(frame.index + 1) / total:.9g}")
+
+            visibility = "visible" if frame.index == 0 else "hidden"
+            frames.append(f'<g visibility="{visibility}">')
+            frames.append(
+                f'<animate attributeName="visibility" calcMode="discrete" values="{";".join(values)}" '
+                f'keyTimes="{";".join(key_times)}" dur="{total * frame_duration:.9g}s" {repeat} />'
+            )
+            frames.append(frame.svg)
+            frames.append("</g>")
+
+        return self._render_wheel(frames.getvalue(), minify, remove_css_variables)
+
+    def _render_wheel(self, frames_svg: str, minify: bool, remove_css_variables: bool) -> str:
+        """Substitute the static natal layer and the given frames into the wheel-only template."""
+        d = self._drawer
+        template_dict = d._create_template_dictionary(custom_title=self._title())
+        template_dict["makePlanets"] = draw_planets(
+            available_kerykeion_celestial_points=d.available_kerykeion_celestial_points,
+            available_planets_setting=d.available_planets_setting,
+            second_subject_available_kerykeion_celestial_points=[],
+            radius=d.main_radius,
+            main_subject_first_house_degree_ut=self.natal_subject.first_house.abs_pos,
+            main_subject_seventh_house_degree_ut=self.natal_subject.seventh_house.abs_pos,
+            chart_type=d.chart_type,
+            third_circle_radius=d.third_circle_radius,
+            external_view=d.external_view,
+            second_circle_radius=d.second_circle_radius,
+            show_degree_indicators=d.show_degree_indicators,
+        )
+        template_dict["makeAspects"] = f'<g kr:node="Transit_Frames">{frames_svg}</g>'
+        template_dict["viewbox"] = d._wheel_only_viewbox()
+        template = _chart_template("wheel_only.xml").substitute(template_dict)
+        return d._apply_svg_post_processing(template, minify, remove_css_variables)
+
+    def _title(self) -> str:
+        """Chart title with the natal name and the first and last transit dates."""
+        d = self._drawer
+        first = datetime.fromisoformat(self.transit_subjects[0].iso_formatted_local_datetime)
+        last = datetime.fromisoformat(self.transit_subjects[-1].iso_formatted_local_datetime)
+        return (
+            f"{d._truncate_name(self.natal_subject.name)} - {d._translate('transits', 'Transits')} "
+            f"{first:%Y-%m-%d} / {last:%Y-%m-%d}"
+        )
+
+
+__all__ = ["TransitTimelineFrame", "TransitTimelineRenderer"]
@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+"""
+Compatibility Search Module
+
+This module scores one query subject against a large pool of candidates with the
+Ciro Discepolo method used by RelationshipScoreFactory, without computing a full
+synastry for every pair.
+
+The relationship score only depends on the Sun, Moon, Ascendant, Venus and Mars
+longitudes and on the quality of the Sun sign, so every candidate is reduced
+once to a CompatibilityVector holding just that data. The pool keeps the vectors
+in flat per-point columns and scores them in a tight loop that evaluates only
+the nine point pairs the scoring rules look at, with the same aspect settings,
+first-match order and orb thresholds as AspectsFactory. Scores are therefore
+identical to ``RelationshipScoreFactory(query, candidate).get_relationship_score()``.
+
+The full RelationshipScoreModel (aspects and score breakdown) can be requested
+for the top-k winners only.
+
+Classes:
+    CompatibilityVector: Compact per-subject scoring data
+    CompatibilityMatch: One ranked search result
+    CompatibilitySearch: Pool of candidates with batched scoring and top-k search
+
+Example:
+    >>> from kerykeion.compatibility_search import CompatibilitySearch
+    >>> search = CompatibilitySearch(candidate_subjects)
+    >>> for match in search.top_k(query_subject, k=5, with_breakdown=True):
+    ...     print(match.key, match.score_value, match.score_description)
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import heapq
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from kerykeion.aspects import AspectsFactory
+from kerykeion.instrumentation import swe
+from kerykeion.relationship_score_factory import (
+    DESTINY_SIGN_POINTS,
+    HIGH_PRECISION_ORBIT_THRESHOLD,
+    MAJOR_ASPECT_POINTS_HIGH_PRECISION,
+    MAJOR_ASPECT_POINTS_STANDARD,
+    MINOR_ASPECT_POINTS,
+    MOON_ASCENDANT_ASPECT_POINTS,
+    SUN_ASCENDANT_ASPECT_POINTS,
+    VENUS_MARS_ASPECT_POINTS,
+    RelationshipScoreFactory,
+)
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import RelationshipScoreDescription
+from kerykeion.schemas.kr_models import AstrologicalSubjectModel, RelationshipScoreModel
+from kerykeion.settings.chart_defaults import DEFAULT_CHART_ASPECTS_SETTINGS
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_ASPECTS
+
+
+#: Points used by the relationship score, in vector order.
+COMPATIBILITY_POINTS = ("Sun", "Moon", "Ascendant", "Venus", "Mars")
+
+_SUN, _MOON, _ASCENDANT, _VENUS, _MARS = range(len(COMPATIBILITY_POINTS))
+
+# (query point, candidate point, rule) for every pair the scoring rules look at.
+_SCORED_PAIRS = (
+    (_SUN, _SUN, "sun_sun"),
+    (_SUN, _MOON, "sun_moon"),
+    (_MOON, _SUN, "sun_moon"),
+    (_SUN, _ASCENDANT, "sun_ascendant"),
+    (_ASCENDANT, _SUN, "sun_ascendant"),
+    (_MOON, _ASCENDANT, "moon_ascendant"),
+    (_ASCENDANT, _MOON, "moon_ascendant"),
+    (_VENUS, _MARS, "venus_mars"),
+    (_MARS, _VENUS, "venus_mars"),
+)
+
+# Aspect name -> (points within the high precision orb, points otherwise)
+_PointsTable = Dict[str, Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class CompatibilityVector:
+    """
+    Compact scoring data of one subject.
+
+    Attributes:
+        key: Identifier returned in search results (the subject name by default).
+        sun, moon, ascendant, venus, mars: Absolute longitudes, or None when the point
+            is not among the subject's active points.
+        sun_sign: Sun sign abbreviation (e.g. "Ari").
+        sun_quality: Quality of the Sun sign ("Cardinal", "Fixed" or "Mutable").
+    """
+
+    key: str
+    sun: Optional[float]
+    moon: Optional[float]
+    ascendant: Optional[float]
+    venus: Optional[float]
+    mars: Optional[float]
+    sun_sign: str
+    sun_quality: str
+
+    @classmethod
+    def from_subject(cls, subject: AstrologicalSubjectModel, key: Optional[str] = None) -> "CompatibilityVector":
+        """
+        Extract the compatibility vector of a subject.
+
+        Args:
+            subject: The astrological subject.
+            key: Optional identifier; defaults to ``subject.name``.
+
+        Raises:
+            KerykeionException: If the subject has no Sun.
+        """
+        if subject.sun is None:
+            raise KerykeionException(f"Subject {subject.name!r} has no Sun position.")
+
+        active_points = set(subject.active_points)
+
+        def longitude(point_name: str) -> Optional[float]:
+            point = getattr(subject, point_name.lower(), None)
+            if point is None or point_name not in active_points:
+                return None
+            return point.abs_pos
+
+        return cls(
+            key=subject.name if key is None else key,
+            sun=longitude("Sun"),
+            moon=longitude("Moon"),
+            ascendant=longitude("Ascendant"),
+            venus=longitude("Venus"),
+            mars=longitude("Mars"),
+            sun_sign=subject.sun.sign,
+            sun_quality=subject.sun.quality,
+        )
+
+    @property
+    def longitudes(self) -> Tuple[Optional[float], ...]:
+        """Longitudes in ``COMPATIBILITY_POINTS`` order."""
+        return (self.sun, self.moon, self.ascendant, self.venus, self.mars)
+
+
+@dataclass(frozen=True)
+class CompatibilityMatch:
+    """
+    One ranked result of a compatibility search.
+
+    Attributes:
+        index: Position of the candidate in the pool.
+        key: Candidate key (see CompatibilityVector).
+        score_value: Relationship score, identical to RelationshipScoreFactory.
+        score_description: Categorical description of the score.
+        is_destiny_sign: Whether both Sun signs share the same quality.
+        relationship_score: Full RelationshipScoreModel when a breakdown was requested.
+    """
+
+    index: int
+    key: str
+    score_value: int
+    score_description: RelationshipScoreDescription
+    is_destiny_sign: bool
+    relationship_score: Optional[RelationshipScoreModel] = None
+
+
+def _build_points_tables(use_only_major_aspects: bool) -> Dict[str, _PointsTable]:
+    """Map every scoring rule to the points awarded for each aspect name."""
+    aspect_names = [setting["name"] for setting in DEFAULT_CHART_ASPECTS_SETTINGS]
+    if use_only_major_aspects:
+        aspect_names = [name for name in aspect_names if name in RelationshipScoreFactory.MAJOR_ASPECTS]
+
+    def graded(major_aspects: Iterable[str]) -> _PointsTable:
+        table = {name: (MINOR_ASPECT_POINTS, MINOR_ASPECT_POINTS) for name in aspect_names}
+        for name in major_aspects:
+            if name in table:
+                table[name] = (MAJOR_ASPECT_POINTS_HIGH_PRECISION, MAJOR_ASPECT_POINTS_STANDARD)
+        return table
+
+    def flat(points: int) -> _PointsTable:
+        return {name: (points, points) for name in aspect_names}
+
+    return {
+        "sun_sun": graded({"conjunction", "opposition", "square"}),
+        "sun_moon": graded({"conjunction"}),
+        "sun_ascendant": flat(SUN_ASCENDANT_ASPECT_POINTS),
+        "moon_ascendant": flat(MOON_ASCENDANT_ASPECT_POINTS),
+        "venus_mars": flat(VENUS_MARS_ASPECT_POINTS),
+    }
+
+
+def _score_description(score_value: int) -> RelationshipScoreDescription:
+    """Map a numeric score to its description, as RelationshipScoreFactory does."""
+    for description, threshold in RelationshipScoreFactory.SCORE_MAPPING:
+        if score_value < threshold:
+            return description  # type: ignore[return-value]
+    return "Rare Exceptional"
+
+
+class CompatibilitySearch:
+    """
+    Score a query subject against a pool of candidates and rank the best matches.
+
+    Args:
+        candidates (Iterable): AstrologicalSubjectModel instances or precomputed
+            CompatibilityVector instances (e.g. loaded from a database).
+        use_only_major_aspects (bool, optional): Same meaning as in RelationshipScoreFactory.
+            Defaults to True.
+        keep_subjects (bool, optional): Keep a reference to the candidate subjects so that
+            ``top_k(..., with_breakdown=True)`` can compute full results without a loader.
+            Defaults to True.
+
+    Raises:
+        KerykeionException: If a candidate is neither a subject nor a CompatibilityVector.
+    """
+
+    def __init__(
+        self,
+        candidates: Iterable[Union[AstrologicalSubjectModel, CompatibilityVector]],
+        *,
+        use_only_major_aspects: bool = True,
+        keep_subjects: bool = True,
+    ):
+        self.use_only_major_aspects = use_only_major_aspects
+        self._points_tables = _build_points_tables(use_only_major_aspects)
+        # (degree, orb, name) in AspectsFactory order, with the default active orbs
+        self._aspect_settings = tuple(
+            (setting["degree"], setting["orb"], setting["name"])
+            for setting in AspectsFactory.resolve_aspect_settings(
+                DEFAULT_CHART_ASPECTS_SETTINGS, DEFAULT_ACTIVE_ASPECTS
+            )
+        )
+
+        self._keys: List[str] = []
+        self._qualities: List[str] = []
+        # One column per point; NaN marks a missing point
+        self._columns: Tuple[array, ...] = tuple(array("d") for _ in COMPATIBILITY_POINTS)
+        self._subjects: List[Optional[AstrologicalSubjectModel]] = []
+
+        for candidate in candidates:
+            if isinstance(candidate, CompatibilityVector):
+                vector, subject = candidate, None
+            elif isinstance(candidate, AstrologicalSubjectModel):
+                vector, subject = CompatibilityVector.from_subject(candidate), candidate
+            else:
+                raise KerykeionException(f"Unsupported compatibility candidate: {type(candidate).__name__}.")
+
+            self._keys.append(vector.key)
+            self._qualities.append(vector.sun_quality)
+            for column, value in zip(self._columns, vector.longitudes):
+                column.append(math.nan if value is None else value)
+            self._subjects.append(subject if keep_subjects else None)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def score_all(self, query: Union[AstrologicalSubjectModel, CompatibilityVector]) -> List[int]:
+        """
+        Score the query against every candidate of the pool.
+
+        Args:
+            query: The query subject or its CompatibilityVector.
+
+        Returns:
+            One relationship score per candidate, in pool order.
+        """
+        query_vector = query if isinstance(query, CompatibilityVector) else CompatibilityVector.from_subject(query)
+        query_longitudes = query_vector.longitudes
+
+        # Keep only the pairs whose query point exists
+        pairs = [
+            (query_longitudes[query_point], self._columns[candidate_point], self._points_tables[rule])
+            for query_point, candidate_point, rule in _SCORED_PAIRS
+            if query_longitudes[query_point] is not None
+        ]
+        aspect_settings = self._aspect_settings
+        query_quality = query_vector.sun_quality
+
+        scores: List[int] = []
+        append = scores.append
+        for index, quality in enumerate(self._qualities):
+            score = DESTINY_SIGN_POINTS if quality == query_quality else 0
+            for query_longitude, column, points_table in pairs:
+                candidate_longitude = column[index]
+                if candidate_longitude != candidate_longitude:  # NaN: point not active
+                    continue
+                distance = abs(swe.difdeg2n(query_longitude, candidate_longitude))
+                for degree, orb, name in aspect_settings:
+                    if (degree - orb) <= distance <= (degree + orb):
+                        points = points_table.get(name)
+                        if points is not None:
+                            high_precision = abs(distance - degree) <= HIGH_PRECISION_ORBIT_THRESHOLD
+                            score += points[0] if high_precision else points[1]
+                        break
+            append(score)
+        return scores
+
+    def top_k(
+        self,
+        query: Union[AstrologicalSubjectModel, CompatibilityVector],
+        k: int = 10,
+        *,
+        with_breakdown: bool = False,
+        subject_loader: Optional[Callable[[str], AstrologicalSubjectModel]] = None,
+    ) -> List[CompatibilityMatch]:
+        """
+        Return the k best matches for the query, best first.
+
+        Ties are ranked by pool order.
+
+        Args:
+            query: The query subject, or its CompatibilityVector when no breakdown is needed.
+            k: Number of matches to return.
+            with_breakdown: Compute the full RelationshipScoreModel for each winner.
+            subject_loader: Callable ``key -> AstrologicalSubjectModel`` used for winners
+                whose subject is not kept in the pool.
+
+        Returns:
+            Up to k CompatibilityMatch objects.
+
+        Raises:
+            KerykeionException: If k is not positive, or a breakdown is requested and a subject
+                is not available.
+        """
+        if k < 1:
+            raise KerykeionException(f"k must be a positive integer, got {k}.")
+
+        scores = self.score_all(query)
+        best_indices: Sequence[int] = heapq.nlargest(k, range(len(scores)), key=lambda i: (scores[i], -i))
+        query_quality = (
+            query.sun_quality if isinstance(query, CompatibilityVector) else query.sun.quality  # type: ignore[union-attr]
+        )
+
+        matches = []
+        for index in best_indices:
+            relationship_score = None
+            if with_breakdown:
+                relationship_score = self._full_score(query, index, subject_loader)
+            matches.append(
+                CompatibilityMatch(
+                    index=index,
+                    key=self._keys[index],
+                    score_value=scores[index],
+                    score_description=_score_description(scores[index]),
+                    is_destiny_sign=self._qualities[index] == query_quality,
+                    relationship_score=relationship_score,
+                )
+            )
+        return matches
+
+    def _full_score(
+        self,
+        query: Union[AstrologicalSubjectModel, CompatibilityVector],
+        index: int,
+        subject_loader: Optional[Callable[[str], AstrologicalSubjectModel]],
+    ) -> RelationshipScoreModel:
+        """Run RelationshipScoreFactory for one winner."""
+        if not isinstance(query, AstrologicalSubjectModel):
+            raise KerykeionException("A full breakdown requires the query AstrologicalSubjectModel.")
+
+        candidate = self._subjects[index]
+        if candidate is None:
+            if subject_loader is None:
+                raise KerykeionException(
+                    f"Subject {self._keys[index]!r} is not kept in the pool; pass subject_loader to get a breakdown."
+                )
+            candidate = subject_loader(self._keys[index])
+
+        return RelationshipScoreFactory(
+            query, candidate, use_only_major_aspects=self.use_only_major_aspects
+        ).get_relationship_score()
+
+
+__all__ = [
+    "COMPATIBILITY_POINTS",
+    "CompatibilityVector",
+    "CompatibilityMatch",
+    "CompatibilitySearch",
+]
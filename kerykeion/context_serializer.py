@@ -12,7 +12,7 @@ of astrological data in semantic XML format.
 Optional/None fields are omitted from the output rather than rendered as empty.
 """
 
-from typing import Union
+from typing import Iterator, TextIO, Union
 from xml.sax.saxutils import escape, quoteattr
 from kerykeion.schemas.kr_models import (
     KerykeionPointModel,
@@ -100,6 +100,33 @@ def _el(tag: str, text, **kwargs) -> str:
     return f"{_o(tag, **kwargs)}{_xe(text)}{_c(tag)}"
 
 
+# ============================================================================
+# Precompiled Element Emitters
+# ============================================================================
+# Aspects dominate large documents (a transit range holds one list per moment),
+# so their tags are emitted from a fixed template instead of going through the
+# generic ``_attrs`` kwargs loop. All AspectModel fields are required, so no
+# attribute is ever omitted; numeric values never need escaping.
+
+
+def _natal_aspect_xml(aspect: AspectModel) -> str:
+    """Emit a natal-format ``<aspect />`` tag (same output as ``_sc``)."""
+    return (
+        f"<aspect type={quoteattr(aspect.aspect)} p1={quoteattr(aspect.p1_name)} p2={quoteattr(aspect.p2_name)} "
+        f'orb="{aspect.orbit:.2f}" angle="{aspect.aspect_degrees}" '
+        f"movement={quoteattr(aspect.aspect_movement.lower())} />"
+    )
+
+
+def _dual_aspect_xml(aspect: AspectModel, p2_owner: str) -> str:
+    """Emit a synastry/transit-format ``<aspect />`` tag (same output as ``_sc``)."""
+    return (
+        f"<aspect type={quoteattr(aspect.aspect)} p1_name={quoteattr(aspect.p1_name)} "
+        f"p1_owner={quoteattr(aspect.p1_owner)} p2_name={quoteattr(aspect.p2_name)} "
+        f'p2_owner={quoteattr(p2_owner)} orb="{aspect.orbit:.2f}" angle="{aspect.aspect_degrees}" />'
+    )
+
+
 # ============================================================================
 # Individual Model Converters
 # ============================================================================
@@ -198,27 +225,9 @@ def aspect_to_context(aspect: AspectModel, is_synastry: bool = False, is_transit
             <aspect type="opposition" p1_name="Sun" p1_owner="John" p2_name="Jupiter" p2_owner="Transit" orb="6.42" angle="180" />
     """
     if is_synastry:
-        p2_owner = "Transit" if is_transit else aspect.p2_owner
-        return _sc(
-            "aspect",
-            type=aspect.aspect,
-            p1_name=aspect.p1_name,
-            p1_owner=aspect.p1_owner,
-            p2_name=aspect.p2_name,
-            p2_owner=p2_owner,
-            orb=f"{aspect.orbit:.2f}",
-            angle=str(aspect.aspect_degrees),
-        )
+        return _dual_aspect_xml(aspect, "Transit" if is_transit else aspect.p2_owner)
     else:
-        return _sc(
-            "aspect",
-            type=aspect.aspect,
-            p1=aspect.p1_name,
-            p2=aspect.p2_name,
-            orb=f"{aspect.orbit:.2f}",
-            angle=str(aspect.aspect_degrees),
-            movement=aspect.aspect_movement.lower(),
-        )
+        return _natal_aspect_xml(aspect)
 
 
 def point_in_house_to_context(point_in_house: PointInHouseModel) -> str:
@@ -253,29 +262,16 @@ def point_in_house_to_context(point_in_house: PointInHouseModel) -> str:
     return _sc("point_in_house", **attrs)
 
 
-def house_comparison_to_context(house_comparison: HouseComparisonModel, is_transit: bool = False) -> str:
-    """
-    Transform a HouseComparisonModel into an XML ``<house_overlay>`` element.
-
-    Provides bidirectional house overlay analysis between two subjects.
-
-    Args:
-        house_comparison: A HouseComparisonModel with bidirectional house placements.
-        is_transit: If True, handles transit chart logic.
-
-    Returns:
-        A multi-line XML string describing the house comparison.
-    """
-    lines = [_o("house_overlay")]
+def _iter_house_comparison_lines(house_comparison: HouseComparisonModel, is_transit: bool, indent: str):
+    """Yield the lines of a ``<house_overlay>`` element, each prefixed with *indent*."""
+    yield f"{indent}{_o('house_overlay')}"
 
     # First subject's points in second subject's houses
     if house_comparison.first_points_in_second_houses:
-        lines.append(
-            f"  {_o('first_points_in_second', subject=house_comparison.first_subject_name, target=house_comparison.second_subject_name)}"
-        )
+        yield f"{indent}  {_o('first_points_in_second', subject=house_comparison.first_subject_name, target=house_comparison.second_subject_name)}"
         for point in house_comparison.first_points_in_second_houses:
-            lines.append(f"    {point_in_house_to_context(point)}")
-        lines.append(f"  {_c('first_points_in_second')}")
+            yield f"{indent}    {point_in_house_to_context(point)}"
+        yield f"{indent}  {_c('first_points_in_second')}"
 
     # Second subject's points in first subject's houses
     if house_comparison.second_points_in_first_houses:
@@ -283,10 +279,10 @@ def house_comparison_to_context(house_comparison: HouseComparisonModel, is_trans
             subj, tgt = "Transit", house_comparison.first_subject_name
         else:
             subj, tgt = house_comparison.second_subject_name, house_comparison.first_subject_name
-        lines.append(f"  {_o('second_points_in_first', subject=subj, target=tgt)}")
+        yield f"{indent}  {_o('second_points_in_first', subject=subj, target=tgt)}"
         for point in house_comparison.second_points_in_first_houses:
-            lines.append(f"    {point_in_house_to_context(point)}")
-        lines.append(f"  {_c('second_points_in_first')}")
+            yield f"{indent}    {point_in_house_to_context(point)}"
+        yield f"{indent}  {_c('second_points_in_first')}"
 
     # First subject's cusps in second subject's houses
     if house_comparison.first_cusps_in_second_houses:
@@ -294,10 +290,10 @@ def house_comparison_to_context(house_comparison: HouseComparisonModel, is_trans
             subj, tgt = house_comparison.first_subject_name, "Transit"
         else:
             subj, tgt = house_comparison.first_subject_name, house_comparison.second_subject_name
-        lines.append(f"  {_o('first_cusps_in_second', subject=subj, target=tgt)}")
+        yield f"{indent}  {_o('first_cusps_in_second', subject=subj, target=tgt)}"
         for cusp in house_comparison.first_cusps_in_second_houses:
-            lines.append(f"    {point_in_house_to_context(cusp)}")
-        lines.append(f"  {_c('first_cusps_in_second')}")
+            yield f"{indent}    {point_in_house_to_context(cusp)}"
+        yield f"{indent}  {_c('first_cusps_in_second')}"
 
     # Second subject's cusps in first subject's houses
     if house_comparison.second_cusps_in_first_houses:
@@ -305,13 +301,28 @@ def house_comparison_to_context(house_comparison: HouseComparisonModel, is_trans
             subj, tgt = "Transit", house_comparison.first_subject_name
         else:
             subj, tgt = house_comparison.second_subject_name, house_comparison.first_subject_name
-        lines.append(f"  {_o('second_cusps_in_first', subject=subj, target=tgt)}")
+        yield f"{indent}  {_o('second_cusps_in_first', subject=subj, target=tgt)}"
         for cusp in house_comparison.second_cusps_in_first_houses:
-            lines.append(f"    {point_in_house_to_context(cusp)}")
-        lines.append(f"  {_c('second_cusps_in_first')}")
+            yield f"{indent}    {point_in_house_to_context(cusp)}"
+        yield f"{indent}  {_c('second_cusps_in_first')}"
+
+    yield f"{indent}{_c('house_overlay')}"
 
-    lines.append(_c("house_overlay"))
-    return "\n".join(lines)
+
+def house_comparison_to_context(house_comparison: HouseComparisonModel, is_transit: bool = False) -> str:
+    """
+    Transform a HouseComparisonModel into an XML ``<house_overlay>`` element.
+
+    Provides bidirectional house overlay analysis between two subjects.
+
+    Args:
+        house_comparison: A HouseComparisonModel with bidirectional house placements.
+        is_transit: If True, handles transit chart logic.
+
+    Returns:
+        A multi-line XML string describing the house comparison.
+    """
+    return "\n".join(_iter_house_comparison_lines(house_comparison, is_transit, ""))
 
 
 def element_distribution_to_context(distribution: ElementDistributionModel) -> str:
@@ -359,31 +370,56 @@ def quality_distribution_to_context(distribution: QualityDistributionModel) -> s
     )
 
 
-def astrological_subject_to_context(
-    subject: Union[AstrologicalSubjectModel, CompositeSubjectModel, PlanetReturnModel], is_transit_subject: bool = False
-) -> str:
-    """
-    Transform an AstrologicalSubjectModel into a comprehensive XML ``<chart>`` element.
+_CELESTIAL_POINT_NAMES = (
+    "sun",
+    "moon",
+    "mercury",
+    "venus",
+    "mars",
+    "jupiter",
+    "saturn",
+    "uranus",
+    "neptune",
+    "pluto",
+    "chiron",
+    "mean_lilith",
+    "true_lilith",
+    "ceres",
+    "pallas",
+    "juno",
+    "vesta",
+)
+_AXES_NAMES = ("ascendant", "descendant", "medium_coeli", "imum_coeli", "vertex", "anti_vertex")
+_NODE_NAMES = ("true_north_lunar_node", "true_south_lunar_node")
+_HOUSE_NAMES = (
+    "first_house",
+    "second_house",
+    "third_house",
+    "fourth_house",
+    "fifth_house",
+    "sixth_house",
+    "seventh_house",
+    "eighth_house",
+    "ninth_house",
+    "tenth_house",
+    "eleventh_house",
+    "twelfth_house",
+)
 
-    Provides a complete description of an astrological chart including metadata,
-    planetary positions, house cusps, and lunar phase.
 
-    Args:
-        subject: An AstrologicalSubjectModel, CompositeSubjectModel, or PlanetReturnModel.
-        is_transit_subject: If True, uses ``<transit_data>`` instead of ``<birth_data>``.
-
-    Returns:
-        A multi-line XML string describing the complete chart.
-    """
-    lines = [_o("chart", name=subject.name)]
+def _iter_subject_lines(
+    subject: Union[AstrologicalSubjectModel, CompositeSubjectModel, PlanetReturnModel],
+    is_transit_subject: bool,
+    indent: str,
+):
+    """Yield the lines of a ``<chart>`` element, each prefixed with *indent*."""
+    yield f"{indent}{_o('chart', name=subject.name)}"
 
     # Birth/Event data (for regular subjects)
     if isinstance(subject, AstrologicalSubjectModel):
         data_tag = "transit_data" if is_transit_subject else "birth_data"
         lng_dir = "W" if subject.lng < 0 else "E"
-        lines.append(
-            f"  {_sc(data_tag, date=f'{subject.year}-{subject.month:02d}-{subject.day:02d} {subject.hour:02d}:{subject.minute:02d}', city=subject.city, nation=subject.nation, lat=f'{subject.lat:.2f}', lng=f'{subject.lng:.2f}', lng_dir=lng_dir, tz=subject.tz_str)}"
-        )
+        yield f"{indent}  {_sc(data_tag, date=f'{subject.year}-{subject.month:02d}-{subject.day:02d} {subject.hour:02d}:{subject.minute:02d}', city=subject.city, nation=subject.nation, lat=f'{subject.lat:.2f}', lng=f'{subject.lng:.2f}', lng_dir=lng_dir, tz=subject.tz_str)}"
 
     # Chart configuration
     config_attrs: dict = {
@@ -393,233 +429,202 @@ def astrological_subject_to_context(
     }
     if subject.sidereal_mode:
         config_attrs["sidereal_mode"] = subject.sidereal_mode
-    lines.append(f"  {_sc('config', **config_attrs)}")
+    yield f"{indent}  {_sc('config', **config_attrs)}"
 
     # Composite chart specific info
     if isinstance(subject, CompositeSubjectModel):
-        lines.append(
-            f"  {_sc('composite_info', type=subject.composite_chart_type, first_subject=subject.first_subject.name, second_subject=subject.second_subject.name)}"
-        )
+        yield f"{indent}  {_sc('composite_info', type=subject.composite_chart_type, first_subject=subject.first_subject.name, second_subject=subject.second_subject.name)}"
 
     # Planet Return specific info
     if isinstance(subject, PlanetReturnModel):
-        lines.append(f"  {_sc('return_info', type=subject.return_type)}")
+        yield f"{indent}  {_sc('return_info', type=subject.return_type)}"
 
     # Celestial Points (planets)
-    celestial_point_names = [
-        "sun",
-        "moon",
-        "mercury",
-        "venus",
-        "mars",
-        "jupiter",
-        "saturn",
-        "uranus",
-        "neptune",
-        "pluto",
-        "chiron",
-        "mean_lilith",
-        "true_lilith",
-        "ceres",
-        "pallas",
-        "juno",
-        "vesta",
-    ]
     planet_lines = []
-    for point_name in celestial_point_names:
+    for point_name in _CELESTIAL_POINT_NAMES:
         point = getattr(subject, point_name, None)
         if point is not None:
-            planet_lines.append(f"    {kerykeion_point_to_context(point)}")
+            planet_lines.append(f"{indent}    {kerykeion_point_to_context(point)}")
 
     if planet_lines:
-        lines.append(f"  {_o('planets')}")
-        lines.extend(planet_lines)
-        lines.append(f"  {_c('planets')}")
+        yield f"{indent}  {_o('planets')}"
+        yield from planet_lines
+        yield f"{indent}  {_c('planets')}"
 
     # Important points (axes and lunar nodes)
-    axes = ["ascendant", "descendant", "medium_coeli", "imum_coeli", "vertex", "anti_vertex"]
     axes_lines = []
-    for axis_name in axes:
+    for axis_name in _AXES_NAMES + _NODE_NAMES:
         axis = getattr(subject, axis_name, None)
         if axis is not None:
-            axes_lines.append(f"    {kerykeion_point_to_context(axis)}")
-
-    for node_name in ["true_north_lunar_node", "true_south_lunar_node"]:
-        node = getattr(subject, node_name, None)
-        if node is not None:
-            axes_lines.append(f"    {kerykeion_point_to_context(node)}")
+            axes_lines.append(f"{indent}    {kerykeion_point_to_context(axis)}")
 
     if axes_lines:
-        lines.append(f"  {_o('axes')}")
-        lines.extend(axes_lines)
-        lines.append(f"  {_c('axes')}")
+        yield f"{indent}  {_o('axes')}"
+        yield from axes_lines
+        yield f"{indent}  {_c('axes')}"
 
     # House cusps
-    house_names = [
-        "first_house",
-        "second_house",
-        "third_house",
-        "fourth_house",
-        "fifth_house",
-        "sixth_house",
-        "seventh_house",
-        "eighth_house",
-        "ninth_house",
-        "tenth_house",
-        "eleventh_house",
-        "twelfth_house",
-    ]
-    lines.append(f"  {_o('houses')}")
-    for house_name in house_names:
+    yield f"{indent}  {_o('houses')}"
+    for house_name in _HOUSE_NAMES:
         house = getattr(subject, house_name, None)
         if house is not None:
-            lines.append(
-                f"    {_sc('house', name=house.name, cusp=f'{house.position:.2f}', sign=SIGN_FULL_NAMES.get(house.sign, house.sign))}"
-            )
-    lines.append(f"  {_c('houses')}")
+            yield f"{indent}    {_sc('house', name=house.name, cusp=f'{house.position:.2f}', sign=SIGN_FULL_NAMES.get(house.sign, house.sign))}"
+    yield f"{indent}  {_c('houses')}"
 
     # Lunar phase (if present)
     if subject.lunar_phase is not None:
-        lines.append(f"  {lunar_phase_to_context(subject.lunar_phase)}")
+        yield f"{indent}  {lunar_phase_to_context(subject.lunar_phase)}"
 
-    lines.append(_c("chart"))
-    return "\n".join(lines)
+    yield f"{indent}{_c('chart')}"
 
 
-def single_chart_data_to_context(chart_data: SingleChartDataModel) -> str:
+def astrological_subject_to_context(
+    subject: Union[AstrologicalSubjectModel, CompositeSubjectModel, PlanetReturnModel], is_transit_subject: bool = False
+) -> str:
     """
-    Transform a SingleChartDataModel into an XML ``<chart_analysis>`` element.
+    Transform an AstrologicalSubjectModel into a comprehensive XML ``<chart>`` element.
+
+    Provides a complete description of an astrological chart including metadata,
+    planetary positions, house cusps, and lunar phase.
 
     Args:
-        chart_data: A SingleChartDataModel containing complete chart data.
+        subject: An AstrologicalSubjectModel, CompositeSubjectModel, or PlanetReturnModel.
+        is_transit_subject: If True, uses ``<transit_data>`` instead of ``<birth_data>``.
 
     Returns:
-        A multi-line XML string describing the chart data.
+        A multi-line XML string describing the complete chart.
     """
-    lines = [_o("chart_analysis", type=chart_data.chart_type)]
+    return "\n".join(_iter_subject_lines(subject, is_transit_subject, ""))
+
+
+def _iter_active_configuration_lines(chart_data: Union[SingleChartDataModel, DualChartDataModel]):
+    """Yield the ``<active_points>`` and ``<active_aspects>`` lines of a chart analysis."""
+    yield f"  {_el('active_points', ', '.join(chart_data.active_points))}"
+    active_aspects_str = ", ".join([f"{a['name']} ({a['orb']})" for a in chart_data.active_aspects])
+    yield f"  {_el('active_aspects', active_aspects_str)}"
+
+
+def _iter_single_chart_data_lines(chart_data: SingleChartDataModel):
+    """Yield the lines of a single-chart ``<chart_analysis>`` element."""
+    yield _o("chart_analysis", type=chart_data.chart_type)
 
     # Subject information
-    subject_xml = astrological_subject_to_context(chart_data.subject)
-    for line in subject_xml.split("\n"):
-        lines.append(f"  {line}")
+    yield from _iter_subject_lines(chart_data.subject, False, "  ")
 
     # Element and quality distributions
-    lines.append(f"  {element_distribution_to_context(chart_data.element_distribution)}")
-    lines.append(f"  {quality_distribution_to_context(chart_data.quality_distribution)}")
+    yield f"  {element_distribution_to_context(chart_data.element_distribution)}"
+    yield f"  {quality_distribution_to_context(chart_data.quality_distribution)}"
 
     # Aspects (natal format)
     if chart_data.aspects:
-        lines.append(f"  {_o('aspects', count=str(len(chart_data.aspects)))}")
+        yield f"  {_o('aspects', count=str(len(chart_data.aspects)))}"
         for aspect in chart_data.aspects:
-            lines.append(f"    {aspect_to_context(aspect, is_synastry=False)}")
-        lines.append(f"  {_c('aspects')}")
+            yield f"    {_natal_aspect_xml(aspect)}"
+        yield f"  {_c('aspects')}"
 
     # Active configuration
-    lines.append(f"  {_el('active_points', ', '.join(chart_data.active_points))}")
-    active_aspects_str = ", ".join([f"{a['name']} ({a['orb']})" for a in chart_data.active_aspects])
-    lines.append(f"  {_el('active_aspects', active_aspects_str)}")
+    yield from _iter_active_configuration_lines(chart_data)
 
-    lines.append(_c("chart_analysis"))
-    return "\n".join(lines)
+    yield _c("chart_analysis")
 
 
-def dual_chart_data_to_context(chart_data: DualChartDataModel) -> str:
+def single_chart_data_to_context(chart_data: SingleChartDataModel) -> str:
     """
-    Transform a DualChartDataModel into an XML ``<chart_analysis>`` element.
+    Transform a SingleChartDataModel into an XML ``<chart_analysis>`` element.
 
     Args:
-        chart_data: A DualChartDataModel containing dual chart data.
+        chart_data: A SingleChartDataModel containing complete chart data.
 
     Returns:
-        A multi-line XML string describing the dual chart data.
+        A multi-line XML string describing the chart data.
     """
-    lines = []
+    return "\n".join(_iter_single_chart_data_lines(chart_data))
+
+
+def _iter_dual_chart_data_lines(chart_data: DualChartDataModel):
+    """Yield the lines of a dual-chart ``<chart_analysis>`` element."""
     is_transit = chart_data.chart_type == "Transit"
 
-    lines.append(_o("chart_analysis", type=chart_data.chart_type))
+    yield _o("chart_analysis", type=chart_data.chart_type)
 
     # First subject
-    lines.append(f"  {_o('first_subject')}")
-    first_xml = astrological_subject_to_context(chart_data.first_subject)
-    for line in first_xml.split("\n"):
-        lines.append(f"    {line}")
-    lines.append(f"  {_c('first_subject')}")
+    yield f"  {_o('first_subject')}"
+    yield from _iter_subject_lines(chart_data.first_subject, False, "    ")
+    yield f"  {_c('first_subject')}"
 
     # Second subject (or transit subject)
     wrapper_tag = "transit_subject" if is_transit else "second_subject"
-    lines.append(f"  {_o(wrapper_tag)}")
-    second_xml = astrological_subject_to_context(chart_data.second_subject, is_transit_subject=is_transit)
-    for line in second_xml.split("\n"):
-        lines.append(f"    {line}")
-    lines.append(f"  {_c(wrapper_tag)}")
+    yield f"  {_o(wrapper_tag)}"
+    yield from _iter_subject_lines(chart_data.second_subject, is_transit, "    ")
+    yield f"  {_c(wrapper_tag)}"
 
     # Inter-chart aspects (synastry format)
     if chart_data.aspects:
-        lines.append(f"  {_o('aspects', count=str(len(chart_data.aspects)))}")
+        yield f"  {_o('aspects', count=str(len(chart_data.aspects)))}"
         for aspect in chart_data.aspects:
-            lines.append(f"    {aspect_to_context(aspect, is_synastry=True, is_transit=is_transit)}")
-        lines.append(f"  {_c('aspects')}")
+            yield f"    {_dual_aspect_xml(aspect, 'Transit' if is_transit else aspect.p2_owner)}"
+        yield f"  {_c('aspects')}"
 
     # House comparison analysis
     if chart_data.house_comparison is not None:
-        hc_xml = house_comparison_to_context(chart_data.house_comparison, is_transit=is_transit)
-        for line in hc_xml.split("\n"):
-            lines.append(f"  {line}")
+        yield from _iter_house_comparison_lines(chart_data.house_comparison, is_transit, "  ")
 
     # Relationship score (for synastry)
     if chart_data.relationship_score is not None:
         score = chart_data.relationship_score
-        lines.append(
-            f"  {_sc('relationship_score', value=str(score.score_value), max='44', description=score.score_description, destiny_sign=str(score.is_destiny_sign).lower())}"
-        )
+        yield f"  {_sc('relationship_score', value=str(score.score_value), max='44', description=score.score_description, destiny_sign=str(score.is_destiny_sign).lower())}"
 
     # Element and quality distributions
-    lines.append(f"  {element_distribution_to_context(chart_data.element_distribution)}")
-    lines.append(f"  {quality_distribution_to_context(chart_data.quality_distribution)}")
+    yield f"  {element_distribution_to_context(chart_data.element_distribution)}"
+    yield f"  {quality_distribution_to_context(chart_data.quality_distribution)}"
 
     # Active configuration
-    lines.append(f"  {_el('active_points', ', '.join(chart_data.active_points))}")
-    active_aspects_str = ", ".join([f"{a['name']} ({a['orb']})" for a in chart_data.active_aspects])
-    lines.append(f"  {_el('active_aspects', active_aspects_str)}")
+    yield from _iter_active_configuration_lines(chart_data)
 
-    lines.append(_c("chart_analysis"))
-    return "\n".join(lines)
+    yield _c("chart_analysis")
 
 
-def transit_moment_to_context(transit: TransitMomentModel) -> str:
+def dual_chart_data_to_context(chart_data: DualChartDataModel) -> str:
     """
-    Transform a TransitMomentModel into an XML ``<transit_moment>`` element.
+    Transform a DualChartDataModel into an XML ``<chart_analysis>`` element.
 
     Args:
-        transit: A TransitMomentModel representing a transit snapshot.
+        chart_data: A DualChartDataModel containing dual chart data.
 
     Returns:
-        An XML string describing the transit moment.
+        A multi-line XML string describing the dual chart data.
     """
+    return "\n".join(_iter_dual_chart_data_lines(chart_data))
+
+
+def _iter_transit_moment_lines(transit: TransitMomentModel, indent: str):
+    """Yield the lines of a ``<transit_moment>`` element, each prefixed with *indent*."""
     if transit.aspects:
-        lines = [_o("transit_moment", date=transit.date)]
-        lines.append(f"  {_o('aspects', count=str(len(transit.aspects)))}")
+        yield f"{indent}{_o('transit_moment', date=transit.date)}"
+        yield f"{indent}  {_o('aspects', count=str(len(transit.aspects)))}"
         for aspect in transit.aspects:
-            lines.append(f"    {aspect_to_context(aspect, is_synastry=True, is_transit=True)}")
-        lines.append(f"  {_c('aspects')}")
-        lines.append(_c("transit_moment"))
-        return "\n".join(lines)
+            yield f"{indent}    {_dual_aspect_xml(aspect, 'Transit')}"
+        yield f"{indent}  {_c('aspects')}"
+        yield f"{indent}{_c('transit_moment')}"
     else:
-        return _sc("transit_moment", date=transit.date, aspects="0")
+        yield f"{indent}{_sc('transit_moment', date=transit.date, aspects='0')}"
 
 
-def transits_time_range_to_context(transits: TransitsTimeRangeModel) -> str:
+def transit_moment_to_context(transit: TransitMomentModel) -> str:
     """
-    Transform a TransitsTimeRangeModel into an XML ``<transit_analysis>`` element.
+    Transform a TransitMomentModel into an XML ``<transit_moment>`` element.
 
     Args:
-        transits: A TransitsTimeRangeModel containing multiple transit moments.
+        transit: A TransitMomentModel representing a transit snapshot.
 
     Returns:
-        A multi-line XML string describing the transit time range.
+        An XML string describing the transit moment.
     """
-    lines = []
+    return "\n".join(_iter_transit_moment_lines(transit, ""))
+
 
+def _iter_transits_time_range_lines(transits: TransitsTimeRangeModel):
+    """Yield the lines of a ``<transit_analysis>`` element."""
     attrs: dict = {"moments": str(len(transits.transits))}
     if transits.subject:
         attrs["subject"] = transits.subject.name
@@ -627,15 +632,28 @@ def transits_time_range_to_context(transits: TransitsTimeRangeModel) -> str:
         attrs["from_date"] = transits.dates[0]
         attrs["to_date"] = transits.dates[-1]
 
-    lines.append(_o("transit_analysis", **attrs))
+    yield _o("transit_analysis", **attrs)
 
     for transit in transits.transits:
-        transit_xml = transit_moment_to_context(transit)
-        for line in transit_xml.split("\n"):
-            lines.append(f"  {line}")
+        yield from _iter_transit_moment_lines(transit, "  ")
 
-    lines.append(_c("transit_analysis"))
-    return "\n".join(lines)
+    yield _c("transit_analysis")
+
+
+def transits_time_range_to_context(transits: TransitsTimeRangeModel) -> str:
+    """
+    Transform a TransitsTimeRangeModel into an XML ``<transit_analysis>`` element.
+
+    For long ranges prefer :func:`iter_context` or :func:`write_context`, which
+    stream the same document without building it in memory.
+
+    Args:
+        transits: A TransitsTimeRangeModel containing multiple transit moments.
+
+    Returns:
+        A multi-line XML string describing the transit time range.
+    """
+    return "\n".join(_iter_transits_time_range_lines(transits))
 
 
 def moon_phase_overview_to_context(overview: MoonPhaseOverviewModel) -> str:
@@ -911,72 +929,62 @@ def moon_phase_overview_to_context(overview: MoonPhaseOverviewModel) -> str:
 # ============================================================================
 
 
-def to_context(
-    model: Union[
-        KerykeionPointModel,
-        LunarPhaseModel,
-        AstrologicalSubjectModel,
-        CompositeSubjectModel,
-        PlanetReturnModel,
-        AspectModel,
-        SingleChartDataModel,
-        DualChartDataModel,
-        ElementDistributionModel,
-        QualityDistributionModel,
-        TransitMomentModel,
-        TransitsTimeRangeModel,
-        PointInHouseModel,
-        HouseComparisonModel,
-        MoonPhaseOverviewModel,
-    ],
-) -> str:
-    """
-    Main dispatcher function to convert any Kerykeion model to XML context.
+ContextModel = Union[
+    KerykeionPointModel,
+    LunarPhaseModel,
+    AstrologicalSubjectModel,
+    CompositeSubjectModel,
+    PlanetReturnModel,
+    AspectModel,
+    SingleChartDataModel,
+    DualChartDataModel,
+    ElementDistributionModel,
+    QualityDistributionModel,
+    TransitMomentModel,
+    TransitsTimeRangeModel,
+    PointInHouseModel,
+    HouseComparisonModel,
+    MoonPhaseOverviewModel,
+]
 
-    This function automatically detects the model type and routes to the
-    appropriate transformer function.
 
-    Args:
-        model: Any supported Kerykeion Pydantic model.
+def _iter_context_lines(model: ContextModel) -> Iterator[str]:
+    """
+    Yield the XML context of *model* as lines (without trailing newlines).
 
-    Returns:
-        A string containing the XML representation of the model.
+    Large containers (chart data and transit ranges) are generated lazily, line
+    by line; small models are yielded as a single, possibly multi-line, item.
+    Joining the items with ``"\\n"`` gives exactly the output of :func:`to_context`.
 
     Raises:
         TypeError: If the model type is not supported.
-
-    Example:
-        >>> from kerykeion import AstrologicalSubjectFactory, to_context
-        >>> subject = AstrologicalSubjectFactory.from_birth_data(...)
-        >>> context = to_context(subject)
-        >>> print(context)
     """
     if isinstance(model, SingleChartDataModel):
-        return single_chart_data_to_context(model)
+        return _iter_single_chart_data_lines(model)
     elif isinstance(model, DualChartDataModel):
-        return dual_chart_data_to_context(model)
+        return _iter_dual_chart_data_lines(model)
     elif isinstance(model, TransitsTimeRangeModel):
-        return transits_time_range_to_context(model)
+        return _iter_transits_time_range_lines(model)
     elif isinstance(model, TransitMomentModel):
-        return transit_moment_to_context(model)
+        return _iter_transit_moment_lines(model, "")
     elif isinstance(model, MoonPhaseOverviewModel):
-        return moon_phase_overview_to_context(model)
+        return iter((moon_phase_overview_to_context(model),))
     elif isinstance(model, (AstrologicalSubjectModel, CompositeSubjectModel, PlanetReturnModel)):
-        return astrological_subject_to_context(model)
+        return _iter_subject_lines(model, False, "")
     elif isinstance(model, KerykeionPointModel):
-        return kerykeion_point_to_context(model)
+        return iter((kerykeion_point_to_context(model),))
     elif isinstance(model, LunarPhaseModel):
-        return lunar_phase_to_context(model)
+        return iter((lunar_phase_to_context(model),))
     elif isinstance(model, AspectModel):
-        return aspect_to_context(model)
+        return iter((aspect_to_context(model),))
     elif isinstance(model, ElementDistributionModel):
-        return element_distribution_to_context(model)
+        return iter((element_distribution_to_context(model),))
     elif isinstance(model, QualityDistributionModel):
-        return quality_distribution_to_context(model)
+        return iter((quality_distribution_to_context(model),))
     elif isinstance(model, PointInHouseModel):
-        return point_in_house_to_context(model)
+        return iter((point_in_house_to_context(model),))
     elif isinstance(model, HouseComparisonModel):
-        return house_comparison_to_context(model)
+        return _iter_house_comparison_lines(model, False, "")
     else:
         raise TypeError(
             f"Unsupported model type: {type(model).__name__}. "
@@ -989,8 +997,98 @@ def to_context(
         )
 
 
+def to_context(model: ContextModel) -> str:
+    """
+    Main dispatcher function to convert any Kerykeion model to XML context.
+
+    This function automatically detects the model type and routes to the
+    appropriate transformer function.
+
+    Args:
+        model: Any supported Kerykeion Pydantic model.
+
+    Returns:
+        A string containing the XML representation of the model.
+
+    Raises:
+        TypeError: If the model type is not supported.
+
+    Example:
+        >>> from kerykeion import AstrologicalSubjectFactory, to_context
+        >>> subject = AstrologicalSubjectFactory.from_birth_data(...)
+        >>> context = to_context(subject)
+        >>> print(context)
+    """
+    return "\n".join(_iter_context_lines(model))
+
+
+def iter_context(model: ContextModel, lines_per_chunk: int = 256) -> Iterator[str]:
+    """
+    Stream the XML context of a model in chunks instead of one large string.
+
+    Useful for long transit ranges and other large models: the document is
+    generated incrementally, so memory stays bounded and the first bytes are
+    available immediately. The concatenation of all chunks is byte-identical
+    to :func:`to_context`.
+
+    Args:
+        model: Any supported Kerykeion Pydantic model.
+        lines_per_chunk: Number of XML lines grouped into each yielded chunk.
+
+    Yields:
+        Consecutive fragments of the XML document.
+
+    Raises:
+        TypeError: If the model type is not supported.
+        ValueError: If ``lines_per_chunk`` is not positive.
+
+    Example:
+        >>> with open("transits.xml", "w", encoding="utf-8") as f:
+        ...     for chunk in iter_context(transits_model):
+        ...         f.write(chunk)
+    """
+    if lines_per_chunk < 1:
+        raise ValueError(f"lines_per_chunk must be a positive integer, got {lines_per_chunk}.")
+
+    lines = _iter_context_lines(model)
+    buffer: list[str] = []
+    separator = ""
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= lines_per_chunk:
+            yield separator + "\n".join(buffer)
+            buffer.clear()
+            separator = "\n"
+    if buffer:
+        yield separator + "\n".join(buffer)
+
+
+def write_context(model: ContextModel, stream: TextIO, lines_per_chunk: int = 256) -> int:
+    """
+    Write the XML context of a model to a text stream.
+
+    Args:
+        model: Any supported Kerykeion Pydantic model.
+        stream: Writable text stream (open file, ``io.StringIO``, ``sys.stdout``...).
+        lines_per_chunk: Number of XML lines written per ``stream.write`` call.
+
+    Returns:
+        The number of characters written.
+
+    Raises:
+        TypeError: If the model type is not supported.
+    """
+    written = 0
+    for chunk in iter_context(model, lines_per_chunk):
+        stream.write(chunk)
+        written += len(chunk)
+    return written
+
+
 __all__ = [
     "to_context",
+    "iter_context",
+    "write_context",
     "kerykeion_point_to_context",
     "lunar_phase_to_context",
     "aspect_to_context",
@@ -11,6 +11,7 @@ Key Features:
     - Multiple time interval support (days, hours, minutes)
     - Configurable astrological calculation systems
     - Built-in performance safeguards and limits
+    - Lazy streaming mode, one data point or one chunk at a time, for unbounded ranges
     - Multiple output formats (dictionaries or model instances)
     - Complete AstrologicalSubject instance generation
 
@@ -65,10 +66,18 @@ from kerykeion.schemas import (
     PerspectiveType,
     ZodiacType,
 )
+from kerykeion.position_cache import ChebyshevPositionCache
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Any, Dict, Literal, Union, List
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Literal, Optional, TypeVar, Union, List
 import logging
 
+#: One data point of get_ephemeris_data(): a dictionary or an EphemerisDictModel.
+EphemerisRecord = Union[Dict[str, Any], EphemerisDictModel]
+
+_T = TypeVar("_T")
+
 
 class EphemerisDataFactory:
     """
@@ -121,10 +130,18 @@ class EphemerisDataFactory:
         custom_ayanamsa_ayan_t0 (Union[float, None], optional): The ayanamsa value (in degrees)
             at the reference epoch t0. Only used when sidereal_mode is "USER".
             Defaults to None.
+        position_cache (Union[ChebyshevPositionCache, None], optional): Precomputed Chebyshev
+            positions used instead of Swiss Ephemeris for the bodies and dates they cover.
+            Results then match Swiss Ephemeris within the cache tolerance. Defaults to None.
+        lazy (bool, optional): Streaming mode. The dates are generated on the fly instead of
+            being stored, and the max_days/max_hours/max_minutes caps are not enforced, so
+            the range can be arbitrarily long. Use with iter_ephemeris_data() and
+            iter_subjects() to keep memory constant. Defaults to False.
 
     Raises:
         ValueError: If step_type is not one of "days", "hours", or "minutes".
-        ValueError: If the calculated number of data points exceeds the respective maximum limit.
+        ValueError: If the calculated number of data points exceeds the respective maximum limit
+            (not raised in lazy mode).
         ValueError: If no valid dates are generated from the input parameters.
 
     Examples:
@@ -147,11 +164,18 @@ class EphemerisDataFactory:
         ... )
         >>> subjects = factory.get_ephemeris_data_as_astrological_subjects()
 
+        Stream a century of daily data in chunks of 365 points:
+
+        >>> factory = EphemerisDataFactory(datetime(1950, 1, 1), datetime(2050, 1, 1), lazy=True)
+        >>> for chunk in factory.iter_ephemeris_data(chunk_size=365):
+        ...     process(chunk)
+
     Note:
         Large date ranges with small step intervals can generate thousands of data points,
         which may require significant computation time and memory. The factory includes
         warnings for calculations exceeding 1000 data points and enforces maximum limits
-        to prevent system overload.
+        to prevent system overload. Lazy factories skip both, since their iterators hold
+        only one data point (or one chunk) at a time.
     """
 
     def __init__(
@@ -173,6 +197,8 @@ class EphemerisDataFactory:
         max_minutes: Union[int, None] = 525600,
         custom_ayanamsa_t0: Union[float, None] = None,
         custom_ayanamsa_ayan_t0: Union[float, None] = None,
+        position_cache: Optional[ChebyshevPositionCache] = None,
+        lazy: bool = False,
     ):
         self.start_datetime = start_datetime
         self.end_datetime = end_datetime
@@ -191,47 +217,68 @@ class EphemerisDataFactory:
         self.max_days = max_days
         self.max_hours = max_hours
         self.max_minutes = max_minutes
+        self.position_cache = position_cache
 
-        self.dates_list = []
-        if self.step_type == "days":
-            self.dates_list = [
-                self.start_datetime + timedelta(days=i * self.step)
-                for i in range((self.end_datetime - self.start_datetime).days // self.step + 1)
-            ]
-            if max_days and (len(self.dates_list) > max_days):
-                raise ValueError(
-                    f"Too many days: {len(self.dates_list)} > {self.max_days}. To prevent this error, set max_days to a higher value or reduce the date range."
-                )
+        self.lazy = lazy
 
+        if self.step_type == "days":
+            self._dates_count = (self.end_datetime - self.start_datetime).days // self.step + 1
+            self._step_delta = timedelta(days=self.step)
+            limit, unit = max_days, "days"
         elif self.step_type == "hours":
             hours_diff = (self.end_datetime - self.start_datetime).total_seconds() / 3600
-            self.dates_list = [
-                self.start_datetime + timedelta(hours=i * self.step) for i in range(int(hours_diff) // self.step + 1)
-            ]
-            if max_hours and (len(self.dates_list) > max_hours):
-                raise ValueError(
-                    f"Too many hours: {len(self.dates_list)} > {self.max_hours}. To prevent this error, set max_hours to a higher value or reduce the date range."
-                )
-
+            self._dates_count = int(hours_diff) // self.step + 1
+            self._step_delta = timedelta(hours=self.step)
+            limit, unit = max_hours, "hours"
         elif self.step_type == "minutes":
             minutes_diff = (self.end_datetime - self.start_datetime).total_seconds() / 60
-            self.dates_list = [
-                self.start_datetime + timedelta(minutes=i * self.step)
-                for i in range(int(minutes_diff) // self.step + 1)
-            ]
-            if max_minutes and (len(self.dates_list) > max_minutes):
-                raise ValueError(
-                    f"Too many minutes: {len(self.dates_list)} > {self.max_minutes}. To prevent this error, set max_minutes to a higher value or reduce the date range."
-                )
-
+            self._dates_count = int(minutes_diff) // self.step + 1
+            self._step_delta = timedelta(minutes=self.step)
+            limit, unit = max_minutes, "minutes"
         else:
             raise ValueError(f"Invalid step type: {self.step_type}")
 
-        if not self.dates_list:
+        if self._dates_count <= 0:
             raise ValueError("No dates found. Check the date range and step values.")
 
-        if len(self.dates_list) > 1000:
-            logging.warning(f"Large number of dates: {len(self.dates_list)}. The calculation may take a while.")
+        # Streaming factories never hold the dates (nor the results) in memory:
+        # neither the max_* caps nor the size warning apply to them.
+        self._dates_list: Optional[List[datetime]] = None
+        if not self.lazy:
+            if limit and self._dates_count > limit:
+                raise ValueError(
+                    f"Too many {unit}: {self._dates_count} > {limit}. To prevent this error, set max_{unit} to a higher value or reduce the date range."
+                )
+            self._dates_list = list(self._generate_dates())
+            if self._dates_count > 1000:
+                logging.warning(f"Large number of dates: {self._dates_count}. The calculation may take a while.")
+
+    @property
+    def dates_list(self) -> List[datetime]:
+        """
+        The dates of the series, built on first access for lazy factories.
+
+        Prefer :meth:`iter_dates` for lazy factories over long ranges.
+        """
+        if self._dates_list is None:
+            self._dates_list = list(self._generate_dates())
+        return self._dates_list
+
+    @dates_list.setter
+    def dates_list(self, value: List[datetime]) -> None:
+        self._dates_list = value
+
+    def __len__(self) -> int:
+        """Number of data points in the series."""
+        return len(self._dates_list) if self._dates_list is not None else self._dates_count
+
+    def _generate_dates(self) -> Iterator[datetime]:
+        for index in range(self._dates_count):
+            yield self.start_datetime + self._step_delta * index
+
+    def iter_dates(self) -> Iterator[datetime]:
+        """Yield the dates of the series one by one, without building the list."""
+        return iter(self._dates_list) if self._dates_list is not None else self._generate_dates()
 
     def get_ephemeris_data(self, as_model: bool = False) -> list:
         """
@@ -284,47 +331,12 @@ class EphemerisDataFactory:
 
         Note:
             - The calculation time is proportional to the number of data points
-            - For large datasets (>1000 points), consider using the method in batches
+            - For large datasets (>1000 points), consider iter_ephemeris_data() instead
             - Planet order and availability depend on the configured perspective type
             - House system affects the house cusp calculations
             - All positions are in the configured zodiac system (tropical/sidereal)
         """
-        ephemeris_data_list: List[Dict[str, Any]] = []
-        for date in self.dates_list:
-            subject = AstrologicalSubjectFactory.from_birth_data(
-                year=date.year,
-                month=date.month,
-                day=date.day,
-                hour=date.hour,
-                minute=date.minute,
-                lng=self.lng,
-                lat=self.lat,
-                tz_str=self.tz_str,
-                city="Placeholder",
-                nation="Placeholder",
-                online=False,
-                zodiac_type=self.zodiac_type,
-                sidereal_mode=self.sidereal_mode,
-                houses_system_identifier=self.houses_system_identifier,
-                perspective_type=self.perspective_type,
-                is_dst=self.is_dst,
-                custom_ayanamsa_t0=self.custom_ayanamsa_t0,
-                custom_ayanamsa_ayan_t0=self.custom_ayanamsa_ayan_t0,
-            )
-
-            houses_list = get_houses_list(subject)
-            available_planets = get_available_astrological_points_list(subject)
-
-            ephemeris_data_list.append({"date": date.isoformat(), "planets": available_planets, "houses": houses_list})
-
-        if as_model:
-            # Type narrowing: at this point, the dict structure matches EphemerisDictModel
-            return [
-                EphemerisDictModel(date=data["date"], planets=data["planets"], houses=data["houses"])
-                for data in ephemeris_data_list
-            ]  # type: ignore
-
-        return ephemeris_data_list
+        return list(self.iter_ephemeris_data(as_model=as_model))
 
     def get_ephemeris_data_as_astrological_subjects(self, as_model: bool = False) -> List[AstrologicalSubjectModel]:
         """
@@ -399,39 +411,114 @@ class EphemerisDataFactory:
             - More computationally intensive than get_ephemeris_data()
             - Each subject performs full astrological calculations
             - Memory usage scales with the number of data points
-            - Consider processing in batches for very large date ranges
+            - For very large date ranges, use iter_subjects() to process them in chunks
             - Ideal for comprehensive analysis requiring full chart features
 
         See Also:
             get_ephemeris_data(): For lightweight dictionary-based ephemeris data
+            iter_subjects(): For the streaming version of this method
             AstrologicalSubject: For details on available methods and properties
         """
-        subjects_list = []
-        for date in self.dates_list:
-            subject = AstrologicalSubjectFactory.from_birth_data(
-                year=date.year,
-                month=date.month,
-                day=date.day,
-                hour=date.hour,
-                minute=date.minute,
-                lng=self.lng,
-                lat=self.lat,
-                tz_str=self.tz_str,
-                city="Placeholder",
-                nation="Placeholder",
-                online=False,
-                zodiac_type=self.zodiac_type,
-                sidereal_mode=self.sidereal_mode,
-                houses_system_identifier=self.houses_system_identifier,
-                perspective_type=self.perspective_type,
-                is_dst=self.is_dst,
-                custom_ayanamsa_t0=self.custom_ayanamsa_t0,
-                custom_ayanamsa_ayan_t0=self.custom_ayanamsa_ayan_t0,
-            )
-
-            subjects_list.append(subject)
-
-        return subjects_list
+        return list(self._iter_subjects())
+
+    # =========================================================================
+    # STREAMING API
+    # =========================================================================
+
+    def iter_ephemeris_data(
+        self, as_model: bool = False, chunk_size: Optional[int] = None
+    ) -> Iterator[Union[EphemerisRecord, List[EphemerisRecord]]]:
+        """
+        Stream the data points of get_ephemeris_data() one by one or in chunks.
+
+        Each data point is computed when the iterator reaches it, so only the current
+        point (or chunk) is held in memory whatever the length of the range.
+
+        Args:
+            as_model (bool, optional): Yield EphemerisDictModel instances instead of
+                dictionaries. Defaults to False.
+            chunk_size (Optional[int], optional): If given, yield lists of up to
+                chunk_size data points instead of single points. Defaults to None.
+
+        Yields:
+            The data points (or lists of data points) in time order, with the same
+            structure as the items returned by get_ephemeris_data().
+
+        Raises:
+            ValueError: If chunk_size is not a positive integer.
+        """
+        _check_chunk_size(chunk_size)
+        records = self._iter_records(as_model)
+        return _chunked(records, chunk_size) if chunk_size is not None else records
+
+    def iter_subjects(
+        self, chunk_size: Optional[int] = None
+    ) -> Iterator[Union[AstrologicalSubjectModel, List[AstrologicalSubjectModel]]]:
+        """
+        Stream the subjects of get_ephemeris_data_as_astrological_subjects().
+
+        Args:
+            chunk_size (Optional[int], optional): If given, yield lists of up to
+                chunk_size subjects instead of single subjects. Defaults to None.
+
+        Yields:
+            AstrologicalSubjectModel instances (or lists of them) in time order.
+
+        Raises:
+            ValueError: If chunk_size is not a positive integer.
+        """
+        _check_chunk_size(chunk_size)
+        subjects = self._iter_subjects()
+        return _chunked(subjects, chunk_size) if chunk_size is not None else subjects
+
+    def _iter_records(self, as_model: bool) -> Iterator[EphemerisRecord]:
+        for date, subject in zip(self.iter_dates(), self._iter_subjects()):
+            record = {
+                "date": date.isoformat(),
+                "planets": get_available_astrological_points_list(subject),
+                "houses": get_houses_list(subject),
+            }
+            yield EphemerisDictModel(**record) if as_model else record
+
+    def _iter_subjects(self) -> Iterator[AstrologicalSubjectModel]:
+        """Lazily compute one AstrologicalSubjectModel per date of the series."""
+        for date in self.iter_dates():
+            with self.position_cache.activate() if self.position_cache is not None else nullcontext():
+                subject = AstrologicalSubjectFactory.from_birth_data(
+                    year=date.year,
+                    month=date.month,
+                    day=date.day,
+                    hour=date.hour,
+                    minute=date.minute,
+                    lng=self.lng,
+                    lat=self.lat,
+                    tz_str=self.tz_str,
+                    city="Placeholder",
+                    nation="Placeholder",
+                    online=False,
+                    zodiac_type=self.zodiac_type,
+                    sidereal_mode=self.sidereal_mode,
+                    houses_system_identifier=self.houses_system_identifier,
+                    perspective_type=self.perspective_type,
+                    is_dst=self.is_dst,
+                    custom_ayanamsa_t0=self.custom_ayanamsa_t0,
+                    custom_ayanamsa_ayan_t0=self.custom_ayanamsa_ayan_t0,
+                )
+            yield subject
+
+
+def _check_chunk_size(chunk_size: Optional[int]) -> None:
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}.")
+
+
+def _chunked(items: Iterable[_T], chunk_size: int) -> Iterator[List[_T]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
 
 
 if __name__ == "__main__":
@@ -0,0 +1,473 @@
+# -*- coding: utf-8 -*-
+"""
+Ephemeris Events Module
+
+This module provides EphemerisEventFinder, which finds the exact times of sign
+ingresses, stations and retrograde shadow periods over a date range.
+
+Detecting these events from an EphemerisDataFactory grid needs one full subject
+per grid step and is only as precise as the step. The finder instead samples
+the longitude and speed of each body with ``swe.calc_ut`` at a step shorter than
+the body's shortest retrograde period, brackets every change of sign of the
+speed (stations) and every sign boundary crossed between two samples
+(ingresses), and refines each bracket by root finding. A year of Mercury costs a
+few hundred ephemeris calls and every event is exact to about 1e-6 days.
+
+Shadow periods follow the usual definition: the pre-shadow starts when the
+planet first reaches the longitude of its coming direct station, and the
+post-shadow ends when it comes back to the longitude of its retrograde station.
+
+Classes:
+    EphemerisEvent: One ingress, station or shadow boundary
+    RetrogradePeriod: Stations and shadow boundaries of one retrograde cycle
+    EphemerisEventFinder: Event finder over a date range
+
+Example:
+    >>> from datetime import datetime
+    >>> from kerykeion.ephemeris_events import EphemerisEventFinder
+    >>> finder = EphemerisEventFinder(["Mercury", "Mars"])
+    >>> for event in finder.iter_events(datetime(2025, 1, 1), datetime(2026, 1, 1)):
+    ...     print(event.date, event.point, event.event_type, event.sign)
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import heapq
+import math
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union, get_args
+
+from kerykeion.astrological_subject_factory import STANDARD_PLANETS, ChartConfiguration, ephemeris_context
+from kerykeion.instrumentation import swe
+from kerykeion.position_cache import _to_julian_day
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import (
+    AstrologicalPoint,
+    EphemerisEventType,
+    PerspectiveType,
+    SiderealMode,
+    Sign,
+    ZodiacType,
+)
+from kerykeion.utilities import julian_to_datetime
+
+_EPHE_PATH = str(Path(__file__).parent.absolute() / "sweph")
+
+_SIGNS: Tuple[Sign, ...] = get_args(Sign)
+
+#: Bodies searched when none are given.
+DEFAULT_EVENT_BODIES: Tuple[AstrologicalPoint, ...] = (
+    "Sun",
+    "Moon",
+    "Mercury",
+    "Venus",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Uranus",
+    "Neptune",
+    "Pluto",
+    "Chiron",
+)
+
+# Sampling step in days; it must be shorter than the body's shortest retrograde
+# (or direct) period, so that no pair of stations falls between two samples.
+_SCAN_STEP_DAYS: Dict[str, float] = {
+    "Sun": 4,
+    "Moon": 1,
+    "Mercury": 2,
+    "Venus": 3,
+    "Mars": 4,
+    "Jupiter": 8,
+    "Saturn": 8,
+    "Uranus": 8,
+    "Neptune": 8,
+    "Pluto": 8,
+    "Mean_North_Lunar_Node": 8,
+    "Mean_Lilith": 4,
+    "Chiron": 8,
+}
+_DEFAULT_SCAN_STEP_DAYS = 0.5
+
+# Longest span, in days, from the start of a pre-shadow to the end of the
+# following post-shadow. Only these bodies have shadow periods.
+_SHADOW_SPAN_DAYS: Dict[str, float] = {
+    "Mercury": 70,
+    "Venus": 130,
+    "Mars": 230,
+    "Jupiter": 370,
+    "Saturn": 370,
+    "Uranus": 370,
+    "Neptune": 370,
+    "Pluto": 370,
+    "Chiron": 370,
+}
+
+_PERSPECTIVE_FLAGS = ("Apparent Geocentric", "True Geocentric", "Heliocentric")
+
+#: Precision of the event times, in days (about 0.1 seconds).
+TIME_TOLERANCE_DAYS = 1e-6
+
+
+class EphemerisEvent(NamedTuple):
+    """
+    One ephemeris event.
+
+    Attributes:
+        event_type: "Ingress", "Station Retrograde", "Station Direct", "Shadow Start"
+            or "Shadow End".
+        point: Body name.
+        julian_day: Julian Day (UT) of the event.
+        date: ISO formatted UTC datetime of the event.
+        longitude: Longitude of the body at the event.
+        sign: Sign of the body at the event (the sign entered, for an ingress).
+        previous_sign: Sign left, for an ingress; None otherwise.
+    """
+
+    event_type: EphemerisEventType
+    point: str
+    julian_day: float
+    date: str
+    longitude: float
+    sign: Sign
+    previous_sign: Optional[Sign] = None
+
+
+class RetrogradePeriod(NamedTuple):
+    """
+    One retrograde cycle of a body.
+
+    Attributes:
+        point: Body name.
+        shadow_start: Start of the pre-shadow.
+        station_retrograde: Retrograde station.
+        station_direct: Direct station.
+        shadow_end: End of the post-shadow.
+    """
+
+    point: str
+    shadow_start: EphemerisEvent
+    station_retrograde: EphemerisEvent
+    station_direct: EphemerisEvent
+    shadow_end: EphemerisEvent
+
+
+def _find_root(
+    function: Callable[[float], float], start: float, end: float, value_start: float, value_end: float
+) -> float:
+    """Root of ``function`` in [start, end], where it changes sign (Illinois regula falsi)."""
+    if value_start == 0:
+        return start
+    if value_end == 0:
+        return end
+    side = 0
+    while end - start > TIME_TOLERANCE_DAYS:
+        middle = (start * value_end - end * value_start) / (value_end - value_start)
+        if not start < middle < end:
+            middle = (start + end) / 2
+        value_middle = function(middle)
+        if value_middle == 0:
+            return middle
+        if (value_middle > 0) == (value_end > 0):
+            end, value_end = middle, value_middle
+            if side == -1:
+                value_start /= 2
+            side = -1
+        else:
+            start, value_start = middle, value_middle
+            if side == 1:
+                value_end /= 2
+            side = 1
+    return (start + end) / 2
+
+
+class EphemerisEventFinder:
+    """
+    Find ingresses, stations and retrograde shadows by root finding.
+
+    Args:
+        bodies: Bodies to search. Defaults to DEFAULT_EVENT_BODIES (Sun to Pluto, Chiron).
+        zodiac_type: "Tropical" or "Sidereal"; ingresses depend on it.
+        sidereal_mode: Sidereal mode for the sidereal zodiac.
+        perspective_type: "Apparent Geocentric", "True Geocentric" or "Heliocentric".
+        custom_ayanamsa_t0: Reference epoch of a "USER" sidereal mode.
+        custom_ayanamsa_ayan_t0: Ayanamsa at that epoch for a "USER" sidereal mode.
+
+    Raises:
+        KerykeionException: If a body is not computed directly by Swiss Ephemeris or
+            the perspective is not supported.
+    """
+
+    def __init__(
+        self,
+        bodies: Optional[Iterable[AstrologicalPoint]] = None,
+        *,
+        zodiac_type: ZodiacType = "Tropical",
+        sidereal_mode: Optional[SiderealMode] = None,
+        perspective_type: PerspectiveType = "Apparent Geocentric",
+        custom_ayanamsa_t0: Optional[float] = None,
+        custom_ayanamsa_ayan_t0: Optional[float] = None,
+    ):
+        self.bodies: List[AstrologicalPoint] = list(dict.fromkeys(DEFAULT_EVENT_BODIES if bodies is None else bodies))
+        for body in self.bodies:
+            if body not in STANDARD_PLANETS:
+                raise KerykeionException(f"Events are not available for {body}.")
+        if perspective_type not in _PERSPECTIVE_FLAGS:
+            raise KerykeionException(
+                f"Perspective {perspective_type!r} is not supported. Use one of: {', '.join(_PERSPECTIVE_FLAGS)}."
+            )
+        self.config = ChartConfiguration(
+            zodiac_type=zodiac_type,
+            sidereal_mode=sidereal_mode,
+            perspective_type=perspective_type,
+            custom_ayanamsa_t0=custom_ayanamsa_t0,
+            custom_ayanamsa_ayan_t0=custom_ayanamsa_ayan_t0,
+        )
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def iter_events(
+        self,
+        start: Union[float, datetime],
+        end: Union[float, datetime],
+        event_types: Optional[Iterable[EphemerisEventType]] = None,
+    ) -> Iterator[EphemerisEvent]:
+        """
+        Stream the events of all bodies in time order.
+
+        Args:
+            start: First instant, as a Julian Day (UT) or a datetime (naive means UTC).
+            end: Last instant.
+            event_types: Event types to report. Defaults to all of them.
+
+        Yields:
+            EphemerisEvent: Events with ``start <= julian_day <= end``, in time order.
+        """
+        start_jd, end_jd = self._range(start, end)
+        wanted = frozenset(get_args(EphemerisEventType) if event_types is None else event_types)
+        body_streams = [self._iter_body_events(body, start_jd, end_jd, wanted) for body in self.bodies]
+        return heapq.merge(*body_streams, key=lambda event: event.julian_day)
+
+    def retrograde_periods(
+        self, body: AstrologicalPoint, start: Union[float, datetime], end: Union[float, datetime]
+    ) -> Iterator[RetrogradePeriod]:
+        """
+        Retrograde cycles of a body overlapping a date range, shadows included.
+
+        Args:
+            body: A body with shadow periods (Mercury to Pluto, Chiron).
+            start: First instant, as a Julian Day (UT) or a datetime (naive means UTC).
+            end: Last instant.
+
+        Yields:
+            RetrogradePeriod: Cycles whose pre-shadow to post-shadow span overlaps the range.
+
+        Raises:
+            KerykeionException: If the body has no retrograde cycles.
+        """
+        if body not in _SHADOW_SPAN_DAYS:
+            raise KerykeionException(f"{body} has no retrograde shadow periods.")
+        start_jd, end_jd = self._range(start, end)
+        planet_id = STANDARD_PLANETS[body]
+        span = _SHADOW_SPAN_DAYS[body]
+
+        station_retrograde: Optional[EphemerisEvent] = None
+        stations = self._iter_body_events(
+            body, start_jd - span, end_jd + span, frozenset({"Station Retrograde", "Station Direct"})
+        )
+        for station in stations:
+            if station.event_type == "Station Retrograde":
+                station_retrograde = station
+                continue
+            if station_retrograde is None:
+                continue
+            with ephemeris_context(ephe_path=_EPHE_PATH, config=self.config, lng=0.0, lat=0.0) as iflag:
+                shadow_start, shadow_end = self._shadows(body, planet_id, iflag, station_retrograde, station)
+            if shadow_end.julian_day >= start_jd and shadow_start.julian_day <= end_jd:
+                yield RetrogradePeriod(body, shadow_start, station_retrograde, station, shadow_end)
+            station_retrograde = None
+
+    # =========================================================================
+    # SEARCH
+    # =========================================================================
+
+    @staticmethod
+    def _range(start: Union[float, datetime], end: Union[float, datetime]) -> Tuple[float, float]:
+        start_jd, end_jd = _to_julian_day(start), _to_julian_day(end)
+        if end_jd < start_jd:
+            raise KerykeionException("The end of the range must not be before its start.")
+        return start_jd, end_jd
+
+    def _event(
+        self,
+        event_type: EphemerisEventType,
+        body: str,
+        julian_day: float,
+        longitude: float,
+        sign_index: Optional[int] = None,
+        previous_sign_index: Optional[int] = None,
+    ) -> EphemerisEvent:
+        longitude %= 360
+        if sign_index is None:
+            sign_index = int(longitude // 30) % 12
+        date = julian_to_datetime(julian_day).replace(tzinfo=timezone.utc).isoformat()
+        return EphemerisEvent(
+            event_type=event_type,
+            point=body,
+            julian_day=julian_day,
+            date=date,
+            longitude=longitude,
+            sign=_SIGNS[sign_index],
+            previous_sign=None if previous_sign_index is None else _SIGNS[previous_sign_index],
+        )
+
+    def _iter_body_events(
+        self, body: str, start_jd: float, end_jd: float, wanted: frozenset
+    ) -> Iterator[EphemerisEvent]:
+        """Events of one body in time order, scanning one step at a time."""
+        planet_id = STANDARD_PLANETS[body]
+        step = _SCAN_STEP_DAYS.get(body, _DEFAULT_SCAN_STEP_DAYS)
+        with_shadows = body in _SHADOW_SPAN_DAYS and not wanted.isdisjoint({"Shadow Start", "Shadow End"})
+        # Shadow events are found when their direct station is, up to a whole cycle
+        # later than the pre-shadow start, so events are held back for that long.
+        horizon = _SHADOW_SPAN_DAYS[body] if with_shadows else 0.0
+        scan_start = start_jd - horizon
+        scan_end = end_jd + horizon
+
+        pending: List[Tuple[float, int, EphemerisEvent]] = []
+        counter = 0
+        station_retrograde: Optional[EphemerisEvent] = None
+
+        def push(event: EphemerisEvent) -> None:
+            nonlocal counter
+            if event.event_type in wanted and start_jd <= event.julian_day <= end_jd:
+                heapq.heappush(pending, (event.julian_day, counter, event))
+                counter += 1
+
+        previous_jd = scan_start
+        previous: Optional[Tuple[float, float]] = None
+        while previous_jd < scan_end:
+            next_jd = min(previous_jd + step, scan_end)
+            with ephemeris_context(ephe_path=_EPHE_PATH, config=self.config, lng=0.0, lat=0.0) as iflag:
+
+                def sample(julian_day: float) -> Tuple[float, float]:
+                    position = swe.calc_ut(julian_day, planet_id, iflag)[0]
+                    return position[0], position[3]
+
+                if previous is None:
+                    previous = sample(previous_jd)
+                current = sample(next_jd)
+
+                for event in self._step_events(body, sample, previous_jd, next_jd, previous, current):
+                    push(event)
+                    if event.event_type == "Station Retrograde":
+                        station_retrograde = event
+                    elif event.event_type == "Station Direct" and with_shadows and station_retrograde is not None:
+                        for shadow in self._shadows(body, planet_id, iflag, station_retrograde, event):
+                            push(shadow)
+                        station_retrograde = None
+
+            previous_jd, previous = next_jd, current
+            while pending and pending[0][0] < previous_jd - horizon:
+                yield heapq.heappop(pending)[2]
+
+        while pending:
+            yield heapq.heappop(pending)[2]
+
+    def _step_events(
+        self,
+        body: str,
+        sample: Callable[[float], Tuple[float, float]],
+        start_jd: float,
+        end_jd: float,
+        start_sample: Tuple[float, float],
+        end_sample: Tuple[float, float],
+    ) -> List[EphemerisEvent]:
+        """Stations and ingresses between two samples, in time order."""
+        events: List[EphemerisEvent] = []
+        pieces = [(start_jd, start_sample), (end_jd, end_sample)]
+
+        start_speed, end_speed = start_sample[1], end_sample[1]
+        if (start_speed > 0 > end_speed) or (start_speed < 0 < end_speed):
+            station_jd = _find_root(lambda julian_day: sample(julian_day)[1], start_jd, end_jd, start_speed, end_speed)
+            station_sample = sample(station_jd)
+            event_type: EphemerisEventType = "Station Retrograde" if start_speed > 0 else "Station Direct"
+            pieces.insert(1, (station_jd, station_sample))
+            station_event = self._event(event_type, body, station_jd, station_sample[0])
+        else:
+            station_event = None
+
+        # Between stations the longitude is monotonic, so every sign boundary
+        # passed between the ends of a piece is crossed exactly once.
+        for (piece_start, (start_longitude, _)), (piece_end, (end_longitude, _)) in zip(pieces, pieces[1:]):
+            motion = swe.difdeg2n(end_longitude, start_longitude)
+            if motion > 0:
+                boundaries = range(
+                    math.floor(start_longitude / 30) + 1, math.floor((start_longitude + motion) / 30) + 1
+                )
+            else:
+                boundaries = range(math.floor(start_longitude / 30), math.floor((start_longitude + motion) / 30), -1)
+            for boundary in boundaries:
+                boundary_longitude = (boundary * 30) % 360
+
+                def offset(julian_day: float, target: float = boundary_longitude) -> float:
+                    return swe.difdeg2n(sample(julian_day)[0], target)
+
+                start_offset = swe.difdeg2n(start_longitude, boundary_longitude)
+                end_offset = swe.difdeg2n(end_longitude, boundary_longitude)
+                ingress_jd = _find_root(offset, piece_start, piece_end, start_offset, end_offset)
+                entered = boundary % 12 if motion > 0 else (boundary - 1) % 12
+                left = (boundary - 1) % 12 if motion > 0 else boundary % 12
+                events.append(self._event("Ingress", body, ingress_jd, boundary_longitude, entered, left))
+
+            if station_event is not None and piece_end == station_event.julian_day:
+                events.append(station_event)
+
+        return events
+
+    def _shadows(
+        self,
+        body: str,
+        planet_id: int,
+        iflag: int,
+        station_retrograde: EphemerisEvent,
+        station_direct: EphemerisEvent,
+    ) -> Tuple[EphemerisEvent, EphemerisEvent]:
+        """Pre-shadow start and post-shadow end around a pair of stations."""
+        step = _SCAN_STEP_DAYS.get(body, _DEFAULT_SCAN_STEP_DAYS)
+
+        def crossing(origin: float, target: float, direction: int) -> float:
+            def offset(julian_day: float) -> float:
+                return swe.difdeg2n(swe.calc_ut(julian_day, planet_id, iflag)[0][0], target)
+
+            near, near_offset = origin, offset(origin)
+            while True:
+                far = near + direction * step
+                far_offset = offset(far)
+                if (far_offset <= 0) if direction < 0 else (far_offset >= 0):
+                    break
+                near, near_offset = far, far_offset
+            if direction < 0:
+                return _find_root(offset, far, near, far_offset, near_offset)
+            return _find_root(offset, near, far, near_offset, far_offset)
+
+        shadow_start_jd = crossing(station_retrograde.julian_day, station_direct.longitude, -1)
+        shadow_end_jd = crossing(station_direct.julian_day, station_retrograde.longitude, 1)
+        return (
+            self._event("Shadow Start", body, shadow_start_jd, station_direct.longitude),
+            self._event("Shadow End", body, shadow_end_jd, station_retrograde.longitude),
+        )
+
+
+__all__ = [
+    "DEFAULT_EVENT_BODIES",
+    "TIME_TOLERANCE_DAYS",
+    "EphemerisEvent",
+    "EphemerisEventFinder",
+    "RetrogradePeriod",
+]
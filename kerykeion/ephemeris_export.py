@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+Ephemeris and Transit Export
+============================
+
+This module streams the results of EphemerisDataFactory and
+TransitsTimeRangeFactory to flat, analytics-friendly formats: CSV, JSON Lines,
+columnar batches and (when ``pyarrow`` is installed) Apache Arrow / Parquet.
+
+Results are flattened into rows with a fixed schema:
+
+- Ephemeris rows have one ``date`` column followed, for every point, by
+  ``<point>_abs_pos``, ``<point>_speed`` and ``<point>_house`` and, for every
+  house, by ``<house>_abs_pos`` (e.g. ``sun_abs_pos``, ``first_house_abs_pos``).
+- Transit rows have one row per aspect (see ``TRANSIT_COLUMNS``).
+
+The ``date`` column is always an ISO 8601 UTC timestamp with an explicit
+offset (e.g. ``2023-12-31T23:00:00+00:00``), whatever the source.
+
+When a factory is passed directly, the data points are computed lazily while
+the rows are written, so decades of ephemeris never have to be held in memory.
+
+Example:
+    >>> from datetime import datetime
+    >>> from kerykeion import EphemerisDataFactory
+    >>> from kerykeion.ephemeris_export import write_csv, ephemeris_rows
+    >>> factory = EphemerisDataFactory(datetime(1950, 1, 1), datetime(2050, 1, 1), lazy=True)
+    >>> write_csv(ephemeris_rows(factory), "ephemeris.csv")
+
+This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, TextIO, Union
+
+import pytz
+
+from kerykeion.ephemeris_data_factory import EphemerisDataFactory
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_models import (
+    AstrologicalSubjectModel,
+    EphemerisDictModel,
+    KerykeionPointModel,
+    TransitMomentModel,
+    TransitsTimeRangeModel,
+)
+from kerykeion.transits_time_range_factory import TransitsTimeRangeFactory
+from kerykeion.utilities import get_available_astrological_points_list, get_houses_list
+
+
+#: Per-point columns of an ephemeris row, in order.
+EPHEMERIS_POINT_FIELDS = ("abs_pos", "speed", "house")
+
+#: Columns of a transit row, in order.
+TRANSIT_COLUMNS = (
+    "date",
+    "p1_name",
+    "p1_abs_pos",
+    "p1_speed",
+    "p2_name",
+    "p2_abs_pos",
+    "p2_speed",
+    "aspect",
+    "aspect_degrees",
+    "orbit",
+    "diff",
+    "aspect_movement",
+)
+
+#: A flat export row: column name to scalar value (None for missing values).
+ExportRow = Dict[str, Any]
+
+EphemerisSource = Union[
+    EphemerisDataFactory,
+    Iterable[Union[Mapping[str, Any], EphemerisDictModel, AstrologicalSubjectModel]],
+]
+TransitSource = Union[TransitsTimeRangeFactory, TransitsTimeRangeModel, Iterable[TransitMomentModel]]
+
+
+# =============================================================================
+# ROW BUILDERS
+# =============================================================================
+
+
+def _ephemeris_row(
+    date: str, planets: Iterable[KerykeionPointModel], houses: Iterable[KerykeionPointModel]
+) -> ExportRow:
+    """Flatten the points and house cusps of one moment into a single row."""
+    row: ExportRow = {"date": date}
+    for point in planets:
+        prefix = point.name.lower()
+        for field in EPHEMERIS_POINT_FIELDS:
+            row[f"{prefix}_{field}"] = getattr(point, field)
+    for house in houses:
+        row[f"{house.name.lower()}_abs_pos"] = house.abs_pos
+    return row
+
+
+def _utc_iso(date: str, tz_str: str) -> str:
+    """Convert an ISO date, read in ``tz_str`` when it has no offset, to an ISO UTC timestamp."""
+    moment = datetime.fromisoformat(date)
+    if moment.tzinfo is None:
+        moment = pytz.timezone(tz_str).localize(moment)
+    return moment.astimezone(pytz.utc).isoformat()
+
+
+def ephemeris_rows(source: EphemerisSource, tz_str: str = "Etc/UTC") -> Iterator[ExportRow]:
+    """
+    Flatten ephemeris data into rows, one per moment.
+
+    The ``date`` column is the ISO UTC timestamp of the moment for every kind of source.
+
+    Args:
+        source: An EphemerisDataFactory (computed lazily, row by row), or an iterable of
+            the items returned by ``get_ephemeris_data()`` (dicts or EphemerisDictModel)
+            or ``get_ephemeris_data_as_astrological_subjects()``.
+        tz_str: Timezone of the local dates of dict and EphemerisDictModel records, i.e.
+            the ``tz_str`` of the factory that produced them (default "Etc/UTC").
+
+    Yields:
+        Flat rows with the ``date`` column and the per-point and per-house columns.
+
+    Raises:
+        KerykeionException: If an item of the iterable is not a supported ephemeris record.
+    """
+    items = source._iter_subjects() if isinstance(source, EphemerisDataFactory) else source
+    for item in items:
+        if isinstance(item, AstrologicalSubjectModel):
+            yield _ephemeris_row(
+                item.iso_formatted_utc_datetime, get_available_astrological_points_list(item), get_houses_list(item)
+            )
+        elif isinstance(item, (Mapping, EphemerisDictModel)):
+            yield _ephemeris_row(_utc_iso(item["date"], tz_str), item["planets"], item["houses"])
+        else:
+            raise KerykeionException(f"Unsupported ephemeris record: {type(item).__name__}.")
+
+
+def transit_rows(source: TransitSource) -> Iterator[ExportRow]:
+    """
+    Flatten transit moments into rows, one per aspect.
+
+    Args:
+        source: A TransitsTimeRangeFactory (computed lazily, moment by moment), a
+            TransitsTimeRangeModel, or an iterable of TransitMomentModel.
+
+    Yields:
+        Flat rows with the columns listed in ``TRANSIT_COLUMNS``.
+    """
+    if isinstance(source, TransitsTimeRangeFactory):
+        moments: Iterable[TransitMomentModel] = source._iter_transit_moments()
+    elif isinstance(source, TransitsTimeRangeModel):
+        moments = source.transits
+    else:
+        moments = source
+
+    for moment in moments:
+        for aspect in moment.aspects:
+            yield {
+                "date": moment.date,
+                "p1_name": aspect.p1_name,
+                "p1_abs_pos": aspect.p1_abs_pos,
+                "p1_speed": aspect.p1_speed,
+                "p2_name": aspect.p2_name,
+                "p2_abs_pos": aspect.p2_abs_pos,
+                "p2_speed": aspect.p2_speed,
+                "aspect": aspect.aspect,
+                "aspect_degrees": aspect.aspect_degrees,
+                "orbit": aspect.orbit,
+                "diff": aspect.diff,
+                "aspect_movement": aspect.aspect_movement,
+            }
+
+
+# =============================================================================
+# WRITERS
+# =============================================================================
+
+
+def _open_text_output(destination: Union[str, Path, TextIO]):
+    """Return ``(stream, should_close)`` for a path or an already open text stream."""
+    if isinstance(destination, (str, Path)):
+        return open(destination, "w", encoding="utf-8", newline=""), True
+    return destination, False
+
+
+def write_csv(rows: Iterable[ExportRow], destination: Union[str, Path, TextIO]) -> int:
+    """
+    Stream rows to CSV. The header is taken from the first row.
+
+    Args:
+        rows: Rows from ``ephemeris_rows`` or ``transit_rows``.
+        destination: Output path or writable text stream (opened with ``newline=""``).
+
+    Returns:
+        The number of data rows written.
+
+    Raises:
+        KerykeionException: If a later row has columns that are not in the header.
+    """
+    stream, should_close = _open_text_output(destination)
+    count = 0
+    try:
+        writer: Optional[csv.DictWriter] = None
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(stream, fieldnames=list(row), restval="")
+                writer.writeheader()
+            try:
+                writer.writerow(row)
+            except ValueError as exc:
+                raise KerykeionException(f"Row {count} does not match the CSV header: {exc}") from exc
+            count += 1
+    finally:
+        if should_close:
+            stream.close()
+    return count
+
+
+def write_jsonl(rows: Iterable[ExportRow], destination: Union[str, Path, TextIO]) -> int:
+    """
+    Stream rows to JSON Lines (one JSON object per line).
+
+    Args:
+        rows: Rows from ``ephemeris_rows`` or ``transit_rows``.
+        destination: Output path or writable text stream.
+
+    Returns:
+        The number of rows written.
+    """
+    stream, should_close = _open_text_output(destination)
+    count = 0
+    try:
+        for row in rows:
+            stream.write(json.dumps(row, ensure_ascii=False))
+            stream.write("\n")
+            count += 1
+    finally:
+        if should_close:
+            stream.close()
+    return count
+
+
+def iter_column_batches(rows: Iterable[ExportRow], batch_size: int = 10_000) -> Iterator[Dict[str, List[Any]]]:
+    """
+    Group rows into columnar batches (column name to list of values).
+
+    The columns are fixed by the first row; missing values are filled with None.
+    Batches can be handed to ``pyarrow.RecordBatch.from_pydict``,
+    ``pandas.DataFrame`` or a database bulk loader.
+
+    Args:
+        rows: Rows from ``ephemeris_rows`` or ``transit_rows``.
+        batch_size: Maximum number of rows per batch.
+
+    Yields:
+        Columnar batches of at most ``batch_size`` rows.
+
+    Raises:
+        ValueError: If ``batch_size`` is not positive.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}.")
+
+    columns: Optional[List[str]] = None
+    batch: Dict[str, List[Any]] = {}
+    size = 0
+    for row in rows:
+        if columns is None:
+            columns = list(row)
+            batch = {column: [] for column in columns}
+        for column in columns:
+            batch[column].append(row.get(column))
+        size += 1
+        if size >= batch_size:
+            yield batch
+            batch = {column: [] for column in columns}
+            size = 0
+    if size:
+        yield batch
+
+
+def _import_pyarrow():
+    """Import pyarrow, raising a KerykeionException with an install hint if missing."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise KerykeionException(
+            "Arrow/Parquet export requires the optional 'pyarrow' package (pip install pyarrow)."
+        ) from exc
+    return pyarrow
+
+
+def iter_arrow_batches(rows: Iterable[ExportRow], batch_size: int = 10_000) -> Iterator[Any]:
+    """
+    Group rows into ``pyarrow.RecordBatch`` objects. Requires ``pyarrow``.
+
+    Args:
+        rows: Rows from ``ephemeris_rows`` or ``transit_rows``.
+        batch_size: Maximum number of rows per batch.
+
+    Yields:
+        ``pyarrow.RecordBatch`` objects sharing the schema inferred from the first batch.
+
+    Raises:
+        KerykeionException: If pyarrow is not installed.
+    """
+    pa = _import_pyarrow()
+    schema = None
+    for batch in iter_column_batches(rows, batch_size):
+        record_batch = pa.RecordBatch.from_pydict(batch, schema=schema)
+        schema = record_batch.schema
+        yield record_batch
+
+
+def write_parquet(rows: Iterable[ExportRow], path: Union[str, Path], batch_size: int = 10_000) -> int:
+    """
+    Stream rows to a Parquet file, one row group per batch. Requires ``pyarrow``.
+
+    Args:
+        rows: Rows from ``ephemeris_rows`` or ``transit_rows``.
+        path: Output file path.
+        batch_size: Maximum number of rows per row group.
+
+    Returns:
+        The number of rows written.
+
+    Raises:
+        KerykeionException: If pyarrow is not installed.
+    """
+    pa = _import_pyarrow()
+    writer = None
+    count = 0
+    try:
+        for record_batch in iter_arrow_batches(rows, batch_size):
+            if writer is None:
+                writer = pa.parquet.ParquetWriter(str(path), record_batch.schema)
+            writer.write_batch(record_batch)
+            count += record_batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+__all__ = [
+    "EPHEMERIS_POINT_FIELDS",
+    "TRANSIT_COLUMNS",
+    "ephemeris_rows",
+    "transit_rows",
+    "write_csv",
+    "write_jsonl",
+    "iter_column_batches",
+    "iter_arrow_batches",
+    "write_parquet",
+]
+
+
+if __name__ == "__main__":
+    import sys
+
+    factory = EphemerisDataFactory(datetime(2024, 1, 1), datetime(2024, 1, 5))
+    write_csv(ephemeris_rows(factory), sys.stdout)
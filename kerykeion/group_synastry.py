@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""
+Group Synastry Module
+
+This module computes the synastry aspects of every pair of subjects in a group
+(a family, a team, a class) in one pass, instead of one
+``AspectsFactory.dual_chart_aspects`` call per ordered pair.
+
+Each dual chart call extracts the active points of both subjects again, rebuilds
+the orb settings and creates pydantic models for every aspect. The matrix reads
+the longitudes and speeds of every subject once into flat per-point columns,
+resolves the aspect settings once and checks each unordered pair of subjects a
+single time: aspects are symmetric, so the aspects of (B, A) are those of (A, B)
+with the points swapped. Results are kept as lightweight GroupAspect tuples and
+expanded into DualChartAspectsModel only on request, identical to the model
+``AspectsFactory.dual_chart_aspects`` returns for the same pair and settings.
+
+Classes:
+    GroupAspect: One aspect between a point of one subject and a point of another
+    GroupSynastryMatrix: Pairwise aspects of a group of subjects
+
+Example:
+    >>> from kerykeion.group_synastry import GroupSynastryMatrix
+    >>> matrix = GroupSynastryMatrix([anna, bruno, carla, dario])
+    >>> for first, second in matrix.pairs():
+    ...     print(matrix.keys[first], matrix.keys[second], len(matrix.aspects(first, second)))
+    >>> synastry = matrix.dual_chart_aspects(0, 2)  # DualChartAspectsModel
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import math
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from kerykeion.aspects import AspectsFactory
+from kerykeion.aspects.aspects_factory import AXES_LIST
+from kerykeion.aspects.aspects_utils import calculate_aspect_movement
+from kerykeion.instrumentation import swe
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import AspectMovementType, AspectName, AstrologicalPoint
+from kerykeion.schemas.kr_models import (
+    ActiveAspect,
+    AspectModel,
+    AstrologicalSubjectModel,
+    CompositeSubjectModel,
+    DualChartAspectsModel,
+    PlanetReturnModel,
+)
+from kerykeion.settings.chart_defaults import DEFAULT_CELESTIAL_POINTS_SETTINGS, DEFAULT_CHART_ASPECTS_SETTINGS
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_ASPECTS
+
+GroupSubject = Union[AstrologicalSubjectModel, CompositeSubjectModel, PlanetReturnModel]
+
+
+class GroupAspect(NamedTuple):
+    """
+    One aspect between a point of the first subject and a point of the second.
+
+    Attributes:
+        p1_name: Point of the first subject.
+        p2_name: Point of the second subject.
+        aspect: Aspect name.
+        orbit: Orb (deviation from the exact aspect) in degrees.
+        aspect_degrees: Exact angle of the aspect.
+        diff: Absolute difference between the two longitudes.
+        aspect_movement: "Applying", "Separating" or "Static".
+    """
+
+    p1_name: AstrologicalPoint
+    p2_name: AstrologicalPoint
+    aspect: AspectName
+    orbit: float
+    aspect_degrees: float
+    diff: float
+    aspect_movement: AspectMovementType
+
+
+class GroupSynastryMatrix:
+    """
+    Synastry aspects of every pair of subjects in a group.
+
+    The points compared are the requested active points (the first subject's
+    active points by default) that every subject of the group has active, so
+    the aspects of a pair equal ``AspectsFactory.dual_chart_aspects`` called
+    with ``active_points=matrix.active_points``.
+
+    Args:
+        subjects: The subjects of the group; at least two.
+        active_points: Points to compare. Defaults to the first subject's active points.
+        active_aspects: Aspects and orbs. Defaults to DEFAULT_ACTIVE_ASPECTS.
+        keys: Identifiers of the subjects. Defaults to their names.
+
+    Raises:
+        KerykeionException: If fewer than two subjects are given, or the keys do not
+            match the subjects.
+    """
+
+    def __init__(
+        self,
+        subjects: Iterable[GroupSubject],
+        *,
+        active_points: Optional[Sequence[AstrologicalPoint]] = None,
+        active_aspects: Optional[List[ActiveAspect]] = None,
+        keys: Optional[Sequence[str]] = None,
+    ):
+        self.subjects: List[GroupSubject] = list(subjects)
+        if len(self.subjects) < 2:
+            raise KerykeionException("A group synastry needs at least two subjects.")
+        if keys is not None and len(keys) != len(self.subjects):
+            raise KerykeionException(f"Got {len(keys)} keys for {len(self.subjects)} subjects.")
+        self.keys: List[str] = list(keys) if keys is not None else [subject.name for subject in self.subjects]
+
+        common = set(self.subjects[0].active_points if active_points is None else active_points)
+        for subject in self.subjects:
+            common.intersection_update(subject.active_points)
+        # Same resolved list and point order as AspectsFactory.dual_chart_aspects
+        self.active_points: List[AstrologicalPoint] = sorted(common)
+        self.active_aspects: List[ActiveAspect] = list(
+            active_aspects if active_aspects is not None else DEFAULT_ACTIVE_ASPECTS
+        )
+        self._point_names: Tuple[AstrologicalPoint, ...] = tuple(
+            setting["name"] for setting in DEFAULT_CELESTIAL_POINTS_SETTINGS if setting["name"] in common
+        )
+        self._point_ids: Dict[str, int] = {
+            setting["name"]: setting["id"] for setting in DEFAULT_CELESTIAL_POINTS_SETTINGS
+        }
+        # (degree, orb, name) in AspectsFactory order
+        self._aspect_settings: Tuple[Tuple[float, float, AspectName], ...] = tuple(
+            (setting["degree"], setting["orb"], setting["name"])
+            for setting in AspectsFactory.resolve_aspect_settings(DEFAULT_CHART_ASPECTS_SETTINGS, self.active_aspects)
+        )
+
+        # One flat column per subject, points in _point_names order; NaN marks a missing point
+        self._longitudes: List[array] = []
+        self._speeds: List[array] = []
+        for subject in self.subjects:
+            points = [subject[name.lower()] for name in self._point_names]
+            self._longitudes.append(array("d", (math.nan if p is None else p["abs_pos"] for p in points)))
+            self._speeds.append(array("d", ((p.get("speed") or 0.0) if p is not None else 0.0 for p in points)))
+
+        self._aspects: Dict[Tuple[int, int], Tuple[GroupAspect, ...]] = self._compute_all_pairs()
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self.subjects)
+
+    @property
+    def points(self) -> Tuple[AstrologicalPoint, ...]:
+        """Points compared, in the order aspects are reported."""
+        return self._point_names
+
+    def pairs(self) -> Iterator[Tuple[int, int]]:
+        """Yield every unordered pair of subject indices ``(first, second)`` with ``first < second``."""
+        count = len(self.subjects)
+        for first in range(count):
+            for second in range(first + 1, count):
+                yield first, second
+
+    def aspects(self, first: int, second: int) -> Tuple[GroupAspect, ...]:
+        """
+        Aspects between two subjects of the group.
+
+        Args:
+            first: Index of the subject whose points are ``p1``.
+            second: Index of the subject whose points are ``p2``.
+
+        Returns:
+            Tuple[GroupAspect, ...]: Aspects in the order of ``AspectsFactory.dual_chart_aspects``.
+
+        Raises:
+            KerykeionException: If an index is out of range or both indices are equal.
+        """
+        self._check_pair(first, second)
+        if first < second:
+            return self._aspects[first, second]
+        order = {name: index for index, name in enumerate(self._point_names)}
+        first_longitudes, second_longitudes = self._longitudes[first], self._longitudes[second]
+        swapped = []
+        for aspect in self._aspects[second, first]:
+            # difdeg2n is not exactly antisymmetric in floating point: measure the orb
+            # in this direction, as AspectsFactory would.
+            distance = abs(
+                swe.difdeg2n(first_longitudes[order[aspect.p2_name]], second_longitudes[order[aspect.p1_name]])
+            )
+            swapped.append(
+                aspect._replace(
+                    p1_name=aspect.p2_name, p2_name=aspect.p1_name, orbit=abs(distance - aspect.aspect_degrees)
+                )
+            )
+        swapped.sort(key=lambda aspect: (order[aspect.p1_name], order[aspect.p2_name]))
+        return tuple(swapped)
+
+    def aspect_counts(self) -> List[List[int]]:
+        """Return the symmetric matrix of aspect counts, with zeros on the diagonal."""
+        count = len(self.subjects)
+        matrix = [[0] * count for _ in range(count)]
+        for (first, second), aspects in self._aspects.items():
+            matrix[first][second] = matrix[second][first] = len(aspects)
+        return matrix
+
+    def dual_chart_aspects(self, first: int, second: int) -> DualChartAspectsModel:
+        """
+        Expand the aspects of one ordered pair into a DualChartAspectsModel.
+
+        The model equals ``AspectsFactory.dual_chart_aspects(subjects[first],
+        subjects[second], active_points=self.active_points, active_aspects=self.active_aspects)``.
+        """
+        first_subject, second_subject = self.subjects[first], self.subjects[second]
+        order = {name: index for index, name in enumerate(self._point_names)}
+        first_longitudes, second_longitudes = self._longitudes[first], self._longitudes[second]
+        first_speeds, second_speeds = self._speeds[first], self._speeds[second]
+        point_ids = self._point_ids
+
+        aspect_models = []
+        for aspect in self.aspects(first, second):
+            p1, p2 = order[aspect.p1_name], order[aspect.p2_name]
+            aspect_models.append(
+                AspectModel(
+                    p1_name=aspect.p1_name,
+                    p1_owner=first_subject.name,
+                    p1_abs_pos=first_longitudes[p1],
+                    p2_name=aspect.p2_name,
+                    p2_owner=second_subject.name,
+                    p2_abs_pos=second_longitudes[p2],
+                    aspect=aspect.aspect,
+                    orbit=aspect.orbit,
+                    aspect_degrees=aspect.aspect_degrees,
+                    diff=aspect.diff,
+                    p1=point_ids.get(aspect.p1_name, 0),
+                    p2=point_ids.get(aspect.p2_name, 0),
+                    aspect_movement=aspect.aspect_movement,
+                    p1_speed=first_speeds[p1],
+                    p2_speed=second_speeds[p2],
+                )
+            )
+        return DualChartAspectsModel(
+            first_subject=first_subject,
+            second_subject=second_subject,
+            aspects=aspect_models,
+            active_points=list(self.active_points),
+            active_aspects=list(self.active_aspects),
+        )
+
+    def iter_dual_chart_aspects(self, *, ordered: bool = False) -> Iterator[Tuple[int, int, DualChartAspectsModel]]:
+        """
+        Expand every pair into a DualChartAspectsModel.
+
+        Args:
+            ordered: Yield both (A, B) and (B, A) instead of each unordered pair once.
+
+        Yields:
+            Tuple[int, int, DualChartAspectsModel]: The two subject indices and their model.
+        """
+        for first, second in self.pairs():
+            yield first, second, self.dual_chart_aspects(first, second)
+            if ordered:
+                yield second, first, self.dual_chart_aspects(second, first)
+
+    # =========================================================================
+    # BATCHED PASS
+    # =========================================================================
+
+    def _compute_all_pairs(self) -> Dict[Tuple[int, int], Tuple[GroupAspect, ...]]:
+        names = self._point_names
+        point_range = range(len(names))
+        aspect_settings = self._aspect_settings
+        is_axis = [name in AXES_LIST for name in names]
+        longitudes, speeds = self._longitudes, self._speeds
+
+        results: Dict[Tuple[int, int], Tuple[GroupAspect, ...]] = {}
+        for first, second in self.pairs():
+            first_longitudes, second_longitudes = longitudes[first], longitudes[second]
+            found: List[GroupAspect] = []
+            for p1 in point_range:
+                first_longitude = first_longitudes[p1]
+                if first_longitude != first_longitude:  # NaN: point not computed
+                    continue
+                for p2 in point_range:
+                    second_longitude = second_longitudes[p2]
+                    if second_longitude != second_longitude:
+                        continue
+                    distance = abs(swe.difdeg2n(first_longitude, second_longitude))
+                    for degree, orb, name in aspect_settings:
+                        if (degree - orb) <= distance <= (degree + orb):
+                            break
+                    else:
+                        continue
+
+                    movement: AspectMovementType
+                    if is_axis[p1] and is_axis[p2]:
+                        movement = "Static"
+                    else:
+                        movement = calculate_aspect_movement(
+                            first_longitude, second_longitude, degree, speeds[first][p1], speeds[second][p2]
+                        )
+                    found.append(
+                        GroupAspect(
+                            names[p1],
+                            names[p2],
+                            name,
+                            abs(distance - degree),
+                            degree,
+                            abs(first_longitude - second_longitude),
+                            movement,
+                        )
+                    )
+            results[first, second] = tuple(found)
+        return results
+
+    def _check_pair(self, first: int, second: int) -> None:
+        count = len(self.subjects)
+        if not (0 <= first < count and 0 <= second < count):
+            raise KerykeionException(f"Subject indices must be between 0 and {count - 1}, got ({first}, {second}).")
+        if first == second:
+            raise KerykeionException("A synastry needs two different subjects.")
+
+
+__all__ = [
+    "GroupAspect",
+    "GroupSynastryMatrix",
+]
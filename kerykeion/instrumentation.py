@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentation Module
+
+This module provides opt-in timing of the named stages of subject and chart
+creation, together with counts of the Swiss Ephemeris calls they make.
+
+Library code marks its stages with ``stage(name)``. Outside a ``Profiler``
+block this returns a shared no-op context manager, so the cost of a disabled
+stage is one context variable lookup. Inside a block, every stage records its
+wall time.
+
+Kerykeion calls Swiss Ephemeris through ``swe``, a thin stand-in for the
+``swisseph`` module exported here. Attributes are looked up on ``swisseph``
+at call time, so ``mock.patch("swisseph.calc_ut")`` applies as usual; inside a
+counting profiler the functions are returned wrapped to count the call. The
+``swisseph`` module itself is never modified, so other threads and calls made
+directly to ``swisseph`` (by user code or other libraries) are neither slowed
+down nor counted.
+
+Stages are aggregated by name. Stages can be nested (``chart.circles`` runs
+inside ``chart.template``), so their times overlap; Swiss Ephemeris calls are
+attributed to the innermost running stage only.
+
+Stage names used by Kerykeion:
+    subject.location, subject.time_conversion, subject.houses, subject.planets,
+    subject.tnos, subject.fixed_stars, subject.arabic_parts, subject.vertex,
+    subject.validation, chart.language, chart.layout, chart.template, chart.circles,
+    chart.aspects, chart.info, chart.grids, chart.house_comparison,
+    chart.template_model, chart.substitution, chart.inline_css, chart.minify
+
+Classes:
+    StageStats: Aggregated timings of one stage
+    ProfileReport: Stage timings and Swiss Ephemeris call counts
+    Profiler: Context manager enabling the instrumentation
+
+Example:
+    >>> from kerykeion import AstrologicalSubjectFactory
+    >>> from kerykeion.instrumentation import Profiler
+    >>> with Profiler() as profiler:
+    ...     subject = AstrologicalSubjectFactory.from_birth_data(
+    ...         "John", 1990, 1, 1, 12, 0, lng=0.0, lat=51.5, tz_str="Europe/London", online=False
+    ...     )
+    >>> print(profiler.report.format())
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import functools
+import logging
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+import swisseph
+
+logger = logging.getLogger(__name__)
+
+# Profiler of the current context, or None when instrumentation is disabled
+_ACTIVE_PROFILER: ContextVar[Optional["Profiler"]] = ContextVar("kerykeion_active_profiler", default=None)
+
+_NULL_STAGE: ContextManager[None] = nullcontext()
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+
+@dataclass
+class StageStats:
+    """
+    Aggregated timings of one stage.
+
+    Attributes:
+        calls: Number of times the stage ran.
+        total_seconds: Wall time summed over all runs.
+        max_seconds: Longest single run.
+        swe_calls: Swiss Ephemeris calls made while this was the innermost stage.
+    """
+
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    swe_calls: int = 0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average wall time of one run."""
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+@dataclass
+class ProfileReport:
+    """
+    Stage timings and Swiss Ephemeris call counts of a profiled block.
+
+    Attributes:
+        stages: Statistics by stage name, in order of first use.
+        swe_calls: Swiss Ephemeris call counts by function name.
+        total_seconds: Wall time of the whole profiled block.
+    """
+
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    swe_calls: Dict[str, int] = field(default_factory=dict)
+    total_seconds: float = 0.0
+
+    @property
+    def total_swe_calls(self) -> int:
+        """Number of Swiss Ephemeris calls of all functions."""
+        return sum(self.swe_calls.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the report to plain data, e.g. for JSON serialization.
+
+        Returns:
+            Dict[str, Any]: ``total_seconds``, ``stages`` and ``swe_calls``.
+        """
+        return {
+            "total_seconds": self.total_seconds,
+            "stages": {
+                name: {
+                    "calls": stats.calls,
+                    "total_seconds": stats.total_seconds,
+                    "mean_seconds": stats.mean_seconds,
+                    "max_seconds": stats.max_seconds,
+                    "swe_calls": stats.swe_calls,
+                }
+                for name, stats in self.stages.items()
+            },
+            "swe_calls": dict(self.swe_calls),
+        }
+
+    def format(self) -> str:
+        """
+        Format the report as a plain text table.
+
+        Returns:
+            str: One line per stage, followed by the Swiss Ephemeris call counts.
+        """
+        name_width = max([len(name) for name in self.stages] + [len("stage")])
+        lines = [f"{'stage':<{name_width}}  {'calls':>7}  {'total ms':>10}  {'mean ms':>9}  {'swe calls':>9}"]
+        for name, stats in self.stages.items():
+            lines.append(
+                f"{name:<{name_width}}  {stats.calls:>7}  {stats.total_seconds * 1000:>10.3f}"
+                f"  {stats.mean_seconds * 1000:>9.3f}  {stats.swe_calls:>9}"
+            )
+        lines.append(f"total: {self.total_seconds * 1000:.3f} ms, {self.total_swe_calls} swe calls")
+        if self.swe_calls:
+            counts = sorted(self.swe_calls.items(), key=lambda item: -item[1])
+            lines.append("swe: " + ", ".join(f"{name}={count}" for name, count in counts))
+        return "\n".join(lines)
+
+
+# =============================================================================
+# PROFILER
+# =============================================================================
+
+
+class _StageTimer:
+    """Times one run of a stage for a profiler and the profilers enclosing it."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        profiler: Optional[Profiler] = self.profiler
+        while profiler is not None:
+            profiler.report.stages.setdefault(self.name, StageStats())
+            profiler._stack.append(self.name)
+            profiler = profiler._parent
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        elapsed = perf_counter() - self.start
+        profiler: Optional[Profiler] = self.profiler
+        while profiler is not None:
+            profiler._stack.pop()
+            stats = profiler.report.stages[self.name]
+            stats.calls += 1
+            stats.total_seconds += elapsed
+            if elapsed > stats.max_seconds:
+                stats.max_seconds = elapsed
+            profiler = profiler._parent
+
+
+class Profiler:
+    """
+    Enable stage timing and Swiss Ephemeris call counting for a block.
+
+    Profilers apply to the context that entered them (the current thread or
+    asyncio task); work done in other threads is not recorded. They can be
+    nested, in which case each of them records the stages of the block.
+
+    Args:
+        count_swe_calls: Count the Swiss Ephemeris calls made by Kerykeion in
+            this context.
+        log_level: If set, the formatted report is logged at this level on exit.
+        callback: Called with the ProfileReport on exit.
+
+    Attributes:
+        report: The ProfileReport, updated while the block runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        count_swe_calls: bool = True,
+        log_level: Optional[int] = None,
+        callback: Optional[Callable[[ProfileReport], None]] = None,
+    ):
+        self.count_swe_calls = count_swe_calls
+        self.log_level = log_level
+        self.callback = callback
+        self.report = ProfileReport()
+        self._stack: List[str] = []
+        self._parent: Optional["Profiler"] = None
+        # Whether this profiler or an enclosing one counts Swiss Ephemeris calls
+        self._counting = False
+        self._token: Optional[Token] = None
+        self._start = 0.0
+
+    def __enter__(self) -> "Profiler":
+        if self._token is not None:
+            raise RuntimeError("This Profiler is already active.")
+        self._parent = _ACTIVE_PROFILER.get()
+        self._counting = self.count_swe_calls or (self._parent is not None and self._parent._counting)
+        self._token = _ACTIVE_PROFILER.set(self)
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.report.total_seconds += perf_counter() - self._start
+        if self._token is not None:
+            _ACTIVE_PROFILER.reset(self._token)
+        self._token = None
+        self._parent = None
+
+        if self.log_level is not None:
+            logger.log(self.log_level, "Kerykeion profile:\n%s", self.report.format())
+        if self.callback is not None:
+            self.callback(self.report)
+
+    def _count_swe_call(self, function_name: str) -> None:
+        profiler: Optional[Profiler] = self
+        while profiler is not None:
+            if profiler.count_swe_calls:
+                report = profiler.report
+                report.swe_calls[function_name] = report.swe_calls.get(function_name, 0) + 1
+                if profiler._stack:
+                    report.stages[profiler._stack[-1]].swe_calls += 1
+            profiler = profiler._parent
+
+
+# =============================================================================
+# HOOKS
+# =============================================================================
+
+
+def stage(name: str) -> ContextManager[None]:
+    """
+    Mark a named stage of work.
+
+    Args:
+        name: Stage name, e.g. ``"subject.houses"``.
+
+    Returns:
+        ContextManager[None]: A timer when a Profiler is active in the current
+        context, otherwise a shared no-op context manager.
+    """
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        return _NULL_STAGE
+    return _StageTimer(profiler, name)
+
+
+def _counting_wrapper(profiler: Profiler, function_name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profiler._count_swe_call(function_name)
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+class _CountedSwissEphemeris:
+    """
+    The ``swisseph`` module as called by Kerykeion.
+
+    Attributes are read from ``swisseph`` on every access. Functions accessed
+    while a counting Profiler is active in the current context are wrapped to
+    count the call; classes (such as ``swe.Error``), constants and everything
+    accessed outside a counting profiler are returned unchanged.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(swisseph, name)
+        profiler = _ACTIVE_PROFILER.get()
+        if profiler is None or not profiler._counting or not callable(value) or isinstance(value, type):
+            return value
+        return _counting_wrapper(profiler, name, value)
+
+    def __dir__(self) -> List[str]:
+        return dir(swisseph)
+
+
+#: Swiss Ephemeris entry point of Kerykeion: use ``swe.calc_ut(...)`` etc. instead
+#: of importing ``swisseph`` directly, so that profilers can count the calls.
+swe = _CountedSwissEphemeris()
+
+
+__all__ = [
+    "ProfileReport",
+    "Profiler",
+    "StageStats",
+    "stage",
+    "swe",
+]
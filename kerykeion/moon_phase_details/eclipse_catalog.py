@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Eclipse Catalog
+
+Global solar and lunar eclipses are a small, fixed set of events, but finding
+the next one with Swiss Ephemeris is among the most expensive calls made by
+``MoonPhaseDetailsFactory``. This module keeps every eclipse of a date range in a
+catalog (Julian Day of maximum, Swiss Ephemeris type flags and magnitude) and
+answers "next eclipse after this instant" with a binary search.
+
+The catalog bundled in ``eclipse_catalog.csv`` covers 1800-2400, the range of
+the Swiss Ephemeris files Kerykeion targets. It is rebuilt with
+``scripts/generate_eclipse_catalog.py``; ``compute_next_solar_eclipse_jd`` and
+``compute_next_lunar_eclipse_jd`` fall back to the live search outside it.
+
+File format: ``#`` comment lines, one ``start_jd,end_jd`` line with the covered
+range, then one ``kind,julian_day,retflag,magnitude`` line per eclipse, where
+``kind`` is ``S`` (solar) or ``L`` (lunar).
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Literal, NamedTuple, Optional, Tuple, Union
+
+from kerykeion.instrumentation import swe
+from kerykeion.moon_phase_details.utils import (
+    ECL_PARTIAL,
+    ECL_TOTAL,
+    configure_ephemeris_path,
+    search_next_lunar_eclipse_jd,
+    search_next_solar_eclipse_jd,
+)
+from kerykeion.schemas import KerykeionException
+
+logger = logging.getLogger(__name__)
+
+EclipseKind = Literal["solar", "lunar"]
+
+#: Path of the catalog shipped with Kerykeion.
+ECLIPSE_CATALOG_PATH = Path(__file__).with_name("eclipse_catalog.csv")
+
+_KIND_CODES: Dict[str, EclipseKind] = {"S": "solar", "L": "lunar"}
+_LIVE_SEARCH: Dict[EclipseKind, Callable[[float], Optional[Tuple[int, float]]]] = {
+    "solar": search_next_solar_eclipse_jd,
+    "lunar": search_next_lunar_eclipse_jd,
+}
+
+
+class EclipseCatalogEntry(NamedTuple):
+    """
+    One eclipse of the catalog.
+
+    Attributes:
+        julian_day: Julian Day (UT) of the maximum eclipse.
+        retflag: Swiss Ephemeris eclipse type flags (see ``describe_*_eclipse_type``).
+        magnitude: Magnitude at maximum: the NASA magnitude for solar eclipses, the
+            umbral magnitude for umbral lunar eclipses and the penumbral magnitude
+            for penumbral ones.
+    """
+
+    julian_day: float
+    retflag: int
+    magnitude: float
+
+
+class EclipseCatalog:
+    """
+    Solar and lunar eclipses of a Julian Day range, searchable by time.
+
+    Args:
+        start_jd: First instant covered by the catalog.
+        end_jd: Last instant covered by the catalog.
+        solar: Solar eclipses in time order, through the first one after ``end_jd``.
+        lunar: Lunar eclipses in time order, through the first one after ``end_jd``.
+    """
+
+    def __init__(
+        self,
+        start_jd: float,
+        end_jd: float,
+        solar: Iterable[EclipseCatalogEntry],
+        lunar: Iterable[EclipseCatalogEntry],
+    ):
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self._entries: Dict[EclipseKind, List[EclipseCatalogEntry]] = {"solar": list(solar), "lunar": list(lunar)}
+        self._julian_days: Dict[EclipseKind, List[float]] = {
+            kind: [entry.julian_day for entry in entries] for kind, entries in self._entries.items()
+        }
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def entries(self, kind: EclipseKind) -> Tuple[EclipseCatalogEntry, ...]:
+        """Return the eclipses of one kind in time order."""
+        return tuple(self._entries[kind])
+
+    def covers(self, julian_day: float) -> bool:
+        """Return True if the catalog answers queries at ``julian_day``."""
+        return self.start_jd <= julian_day <= self.end_jd
+
+    def next_eclipse(self, kind: EclipseKind, julian_day: float) -> Optional[EclipseCatalogEntry]:
+        """
+        Return the first eclipse of ``kind`` whose maximum is after ``julian_day``.
+
+        Args:
+            kind: "solar" or "lunar".
+            julian_day: Julian Day (UT) to search from.
+
+        Returns:
+            Optional[EclipseCatalogEntry]: The eclipse, or None when ``julian_day`` is
+            outside the catalog range.
+        """
+        if not self.covers(julian_day):
+            return None
+        julian_days = self._julian_days[kind]
+        index = bisect_right(julian_days, julian_day)
+        return self._entries[kind][index] if index < len(julian_days) else None
+
+    # =========================================================================
+    # BUILD, READ AND WRITE
+    # =========================================================================
+
+    @classmethod
+    def build(cls, start_jd: float, end_jd: float) -> "EclipseCatalog":
+        """
+        Build a catalog with Swiss Ephemeris live searches.
+
+        Each search starts one day after the previous maximum, well short of the
+        shortest gap between two eclipses of the same kind.
+
+        Raises:
+            KerykeionException: If the range is empty or a search fails.
+        """
+        if end_jd < start_jd:
+            raise KerykeionException("The end of the range must not be before its start.")
+        iflag = configure_ephemeris_path()
+        kinds: Dict[EclipseKind, List[EclipseCatalogEntry]] = {"solar": [], "lunar": []}
+        for kind, entries in kinds.items():
+            julian_day = start_jd
+            while not entries or entries[-1].julian_day <= end_jd:
+                result = _LIVE_SEARCH[kind](julian_day)
+                if result is None:
+                    raise KerykeionException(f"The {kind} eclipse search failed after Julian Day {julian_day}.")
+                retflag, eclipse_jd = result
+                entries.append(EclipseCatalogEntry(eclipse_jd, retflag, _magnitude(kind, eclipse_jd, retflag, iflag)))
+                julian_day = eclipse_jd + 1.0
+        return cls(start_jd, end_jd, kinds["solar"], kinds["lunar"])
+
+    @classmethod
+    def read(cls, path: Union[str, Path]) -> "EclipseCatalog":
+        """
+        Read a catalog file.
+
+        Raises:
+            KerykeionException: If the file is malformed.
+        """
+        kinds: Dict[EclipseKind, List[EclipseCatalogEntry]] = {"solar": [], "lunar": []}
+        bounds: Optional[Tuple[float, float]] = None
+        with open(path, "r", encoding="utf-8") as file:
+            try:
+                for line in file:
+                    if not line.strip() or line.startswith("#"):
+                        continue
+                    fields = line.rstrip("\n").split(",")
+                    if bounds is None:
+                        bounds = (float(fields[0]), float(fields[1]))
+                        continue
+                    kinds[_KIND_CODES[fields[0]]].append(
+                        EclipseCatalogEntry(float(fields[1]), int(fields[2]), float(fields[3]))
+                    )
+            except (IndexError, KeyError, ValueError) as exc:
+                raise KerykeionException(f"Malformed eclipse catalog {path}: {line.strip()!r}") from exc
+        if bounds is None:
+            raise KerykeionException(f"Malformed eclipse catalog {path}: the range line is missing.")
+        return cls(bounds[0], bounds[1], kinds["solar"], kinds["lunar"])
+
+    def write(self, path: Union[str, Path]) -> None:
+        """Write the catalog in the format read by :meth:`read`."""
+        codes = {kind: code for code, kind in _KIND_CODES.items()}
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("# Kerykeion eclipse catalog, generated by scripts/generate_eclipse_catalog.py\n")
+            file.write("# start_jd,end_jd then kind,julian_day,retflag,magnitude (S = solar, L = lunar)\n")
+            file.write(f"{self.start_jd!r},{self.end_jd!r}\n")
+            for kind, entries in self._entries.items():
+                for entry in entries:
+                    file.write(f"{codes[kind]},{entry.julian_day!r},{entry.retflag},{entry.magnitude:.4f}\n")
+
+
+def _magnitude(kind: EclipseKind, julian_day: float, retflag: int, iflag: int) -> float:
+    """Magnitude of an eclipse at its maximum."""
+    if kind == "solar":
+        return float(swe.sol_eclipse_where(julian_day, iflag)[2][8])
+    attributes = swe.lun_eclipse_how(julian_day, (0.0, 0.0, 0.0), iflag)[1]
+    return float(attributes[0] if retflag & (ECL_TOTAL | ECL_PARTIAL) else attributes[1])
+
+
+@lru_cache(maxsize=1)
+def load_eclipse_catalog() -> Optional[EclipseCatalog]:
+    """
+    Load the bundled eclipse catalog once per process.
+
+    Returns:
+        Optional[EclipseCatalog]: The catalog, or None if the file is missing or
+        unreadable, in which case callers use the live search.
+    """
+    try:
+        return EclipseCatalog.read(ECLIPSE_CATALOG_PATH)
+    except (OSError, KerykeionException) as exc:
+        logger.warning("Eclipse catalog unavailable, using live eclipse searches: %s", exc)
+        return None
+
+
+__all__ = [
+    "ECLIPSE_CATALOG_PATH",
+    "EclipseCatalog",
+    "EclipseCatalogEntry",
+    "EclipseKind",
+    "load_eclipse_catalog",
+]
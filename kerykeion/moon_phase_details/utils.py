@@ -12,7 +12,8 @@ Responsibilities:
     - Sidereal time computation
     - Coordinate transformations (equatorial -> horizontal)
     - Precise sunrise/sunset calculation via Swiss Ephemeris
-    - Global solar and lunar eclipse search via Swiss Ephemeris
+    - Global solar and lunar eclipse search via Swiss Ephemeris, answered
+      from the bundled eclipse catalog where it applies
 
 These helpers keep the main factory module focused on building domain models
 and orchestrating the overall moon phase context, while encapsulating the
@@ -26,7 +27,8 @@ import math
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Tuple
-import swisseph as swe
+
+from kerykeion.instrumentation import swe
 
 logger = logging.getLogger(__name__)
 
@@ -165,7 +167,9 @@ def compute_next_solar_eclipse_jd(jd_start: float) -> Optional[Tuple[int, float]
     """
     Compute the next global solar eclipse after the given Julian day.
 
-    Uses Swiss Ephemeris to find the next solar eclipse visible anywhere on Earth.
+    Inside the range of the bundled eclipse catalog (1800-2400) the answer is a
+    lookup; outside it, or when the catalog is unavailable, Swiss Ephemeris
+    searches for the next solar eclipse visible anywhere on Earth.
 
     Args:
         jd_start: Starting Julian Day in Universal Time (UT).
@@ -184,6 +188,29 @@ def compute_next_solar_eclipse_jd(jd_start: float) -> Optional[Tuple[int, float]
         ...     retflag, eclipse_jd = result
         ...     eclipse_type = describe_solar_eclipse_type(retflag)
     """
+    # Imported here: the catalog is built with the live search below.
+    from kerykeion.moon_phase_details.eclipse_catalog import load_eclipse_catalog
+
+    catalog = load_eclipse_catalog()
+    entry = catalog.next_eclipse("solar", jd_start) if catalog is not None else None
+    if entry is not None:
+        return entry.retflag, entry.julian_day
+    return search_next_solar_eclipse_jd(jd_start)
+
+
+def search_next_solar_eclipse_jd(jd_start: float) -> Optional[Tuple[int, float]]:
+    """
+    Search the next global solar eclipse after the given Julian day with Swiss Ephemeris.
+
+    This is the live search behind :func:`compute_next_solar_eclipse_jd`, which
+    only calls it outside the eclipse catalog.
+
+    Args:
+        jd_start: Starting Julian Day in Universal Time (UT).
+
+    Returns:
+        Optional[Tuple[int, float]]: (retflag, eclipse_jd), or None if the search fails.
+    """
     try:
         iflag = configure_ephemeris_path()
         result = swe.sol_eclipse_when_glob(jd_start, iflag)
@@ -203,7 +230,9 @@ def compute_next_lunar_eclipse_jd(jd_start: float) -> Optional[Tuple[int, float]
     """
     Compute the next global lunar eclipse after the given Julian day.
 
-    Uses Swiss Ephemeris to find the next lunar eclipse visible anywhere on Earth.
+    Inside the range of the bundled eclipse catalog (1800-2400) the answer is a
+    lookup; outside it, or when the catalog is unavailable, Swiss Ephemeris
+    searches for the next lunar eclipse visible anywhere on Earth.
 
     Args:
         jd_start: Starting Julian Day in Universal Time (UT).
@@ -222,6 +251,29 @@ def compute_next_lunar_eclipse_jd(jd_start: float) -> Optional[Tuple[int, float]
         ...     retflag, eclipse_jd = result
         ...     eclipse_type = describe_lunar_eclipse_type(retflag)
     """
+    # Imported here: the catalog is built with the live search below.
+    from kerykeion.moon_phase_details.eclipse_catalog import load_eclipse_catalog
+
+    catalog = load_eclipse_catalog()
+    entry = catalog.next_eclipse("lunar", jd_start) if catalog is not None else None
+    if entry is not None:
+        return entry.retflag, entry.julian_day
+    return search_next_lunar_eclipse_jd(jd_start)
+
+
+def search_next_lunar_eclipse_jd(jd_start: float) -> Optional[Tuple[int, float]]:
+    """
+    Search the next global lunar eclipse after the given Julian day with Swiss Ephemeris.
+
+    This is the live search behind :func:`compute_next_lunar_eclipse_jd`, which
+    only calls it outside the eclipse catalog.
+
+    Args:
+        jd_start: Starting Julian Day in Universal Time (UT).
+
+    Returns:
+        Optional[Tuple[int, float]]: (retflag, eclipse_jd), or None if the search fails.
+    """
     try:
         iflag = configure_ephemeris_path()
         result = swe.lun_eclipse_when(jd_start, iflag)
@@ -556,6 +608,8 @@ __all__ = [
     "configure_ephemeris_path",
     "compute_next_solar_eclipse_jd",
     "compute_next_lunar_eclipse_jd",
+    "search_next_solar_eclipse_jd",
+    "search_next_lunar_eclipse_jd",
     "compute_sun_rise_set_swe",
     "compute_lunar_phase_jd",
     "greenwich_mean_sidereal_time",
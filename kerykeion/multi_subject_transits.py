@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Multi-Subject Transits Module
+
+This module provides the MultiSubjectTransitEngine class, which finds the
+transits of many natal charts at once.
+
+TransitsTimeRangeFactory compares every transiting point with every natal
+point of a single subject, so running it for N subjects repeats the whole
+aspect loop N times against the same transiting positions. The engine instead
+indexes the natal points of all subjects in one array sorted by longitude.
+For every timestep, transiting point and aspect, the natal points within the
+aspect orb are found with a binary-search range query, so the cost per step is
+roughly O(points x aspects x log(natal points) + hits) instead of
+O(subjects x points^2).
+
+Every candidate returned by the range queries is classified with the same
+aspect settings, first-match order and orbs as AspectsFactory, so the events
+are exactly the aspects TransitsTimeRangeFactory would report.
+
+Classes:
+    TransitEvent: One transit aspect of one subject at one moment
+    MultiSubjectTransitEngine: Inverted longitude index over natal points
+
+Example:
+    >>> from datetime import datetime
+    >>> from kerykeion import EphemerisDataFactory
+    >>> from kerykeion.multi_subject_transits import MultiSubjectTransitEngine
+    >>> engine = MultiSubjectTransitEngine(natal_subjects)
+    >>> ephemeris = EphemerisDataFactory(datetime(2025, 1, 1), datetime(2025, 1, 31))
+    >>> for event in engine.iter_events(ephemeris):
+    ...     print(event.subject_key, event.date, event.transit_point, event.aspect, event.natal_point)
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from kerykeion.aspects import AspectsFactory
+from kerykeion.aspects.aspects_factory import AXES_LIST
+from kerykeion.aspects.aspects_utils import calculate_aspect_movement
+from kerykeion.ephemeris_data_factory import EphemerisDataFactory
+from kerykeion.instrumentation import swe
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import AspectMovementType, AstrologicalPoint
+from kerykeion.schemas.kr_models import ActiveAspect, AstrologicalSubjectModel
+from kerykeion.settings.chart_defaults import DEFAULT_CELESTIAL_POINTS_SETTINGS, DEFAULT_CHART_ASPECTS_SETTINGS
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_ASPECTS, DEFAULT_ACTIVE_POINTS
+
+# Widening of the range query windows, so floating point rounding of the window
+# bounds never drops a natal point that sits exactly on the edge of an orb.
+_WINDOW_EPSILON = 1e-9
+
+
+class TransitEvent(NamedTuple):
+    """
+    One aspect between a transiting point and a natal point of one subject.
+
+    Attributes:
+        subject_key: Key of the natal subject (its name unless given explicitly).
+        date: ISO formatted UTC datetime of the transit moment.
+        transit_point: Name of the transiting point.
+        natal_point: Name of the natal point.
+        aspect: Aspect name (e.g. "trine").
+        orbit: Distance from the exact aspect, in degrees.
+        aspect_degrees: Exact angle of the aspect.
+        transit_abs_pos: Longitude of the transiting point.
+        natal_abs_pos: Longitude of the natal point.
+        aspect_movement: "Applying", "Separating" or "Static", as in TransitsTimeRangeFactory.
+    """
+
+    subject_key: str
+    date: str
+    transit_point: str
+    natal_point: str
+    aspect: str
+    orbit: float
+    aspect_degrees: float
+    transit_abs_pos: float
+    natal_abs_pos: float
+    aspect_movement: AspectMovementType
+
+
+class MultiSubjectTransitEngine:
+    """
+    Find the transits of many natal subjects with a sorted longitude index.
+
+    Args:
+        natal_subjects (Mapping | Iterable, optional): Natal charts to index, either as a
+            mapping ``key -> subject`` or as subjects keyed by their name.
+        active_points (List[AstrologicalPoint], optional): Points compared on both sides.
+            As in TransitsTimeRangeFactory, each pair also requires the point to be active
+            in the natal and in the transit subject. Defaults to DEFAULT_ACTIVE_POINTS.
+        active_aspects (List[ActiveAspect], optional): Aspects and orbs to look for.
+            Defaults to DEFAULT_ACTIVE_ASPECTS.
+
+    Attributes:
+        active_points: Points compared on both sides.
+        active_aspects: Aspect types and orbs considered.
+    """
+
+    def __init__(
+        self,
+        natal_subjects: Union[Mapping[str, AstrologicalSubjectModel], Iterable[AstrologicalSubjectModel]] = (),
+        *,
+        active_points: Sequence[AstrologicalPoint] = DEFAULT_ACTIVE_POINTS,
+        active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS,
+    ):
+        self.active_points = list(active_points)
+        self.active_aspects = active_aspects
+
+        # Points in DEFAULT_CELESTIAL_POINTS_SETTINGS order, as AspectsFactory iterates them
+        active_set = set(self.active_points)
+        self._ordered_points = [
+            point["name"] for point in DEFAULT_CELESTIAL_POINTS_SETTINGS if point["name"] in active_set
+        ]
+        # (degree, orb, name) in AspectsFactory first-match order
+        self._aspect_settings: Tuple[Tuple[float, float, str], ...] = tuple(
+            (setting["degree"], setting["orb"], setting["name"])
+            for setting in AspectsFactory.resolve_aspect_settings(DEFAULT_CHART_ASPECTS_SETTINGS, active_aspects)
+        )
+
+        self._keys: List[str] = []
+        self._subject_points: List[FrozenSet[str]] = []
+        self._interned_point_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        # Unsorted entries: (longitude, subject index, point name)
+        self._pending: List[Tuple[float, int, str]] = []
+        # Sorted index, rebuilt lazily after additions
+        self._index_longitudes = array("d")
+        self._index_entries: List[Tuple[int, str]] = []
+        self._index_is_stale = False
+
+        if isinstance(natal_subjects, Mapping):
+            for key, subject in natal_subjects.items():
+                self.add_subject(subject, key=key)
+        else:
+            for subject in natal_subjects:
+                self.add_subject(subject)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # =========================================================================
+    # INDEX
+    # =========================================================================
+
+    def add_subject(self, subject: AstrologicalSubjectModel, key: Optional[str] = None) -> None:
+        """
+        Index the natal points of a subject.
+
+        Args:
+            subject: The natal chart.
+            key: Identifier used in the events; defaults to ``subject.name``.
+        """
+        positions = {}
+        for point_name in subject.active_points:
+            point = getattr(subject, point_name.lower(), None)
+            if point is not None:
+                positions[point_name] = point.abs_pos
+        self.add_positions(subject.name if key is None else key, positions)
+
+    def add_positions(self, key: str, positions: Mapping[str, float]) -> None:
+        """
+        Index precomputed natal longitudes (e.g. loaded from a database).
+
+        Args:
+            key: Identifier used in the events.
+            positions: Mapping ``point name -> absolute longitude``. Only the points in
+                ``active_points`` are indexed; the keys are also the subject's active points.
+
+        Raises:
+            KerykeionException: If a longitude is outside [0, 360).
+        """
+        subject_index = len(self._keys)
+        point_names = frozenset(positions)
+        self._keys.append(key)
+        self._subject_points.append(self._interned_point_sets.setdefault(point_names, point_names))
+
+        for point_name in self._ordered_points:
+            if point_name not in positions:
+                continue
+            longitude = positions[point_name]
+            if not 0 <= longitude < 360:
+                raise KerykeionException(f"Longitude of {point_name} for {key!r} must be in [0, 360), got {longitude}.")
+            self._pending.append((longitude, subject_index, point_name))
+        self._index_is_stale = True
+
+    def _ensure_index(self) -> None:
+        """Merge the pending natal points into the sorted index."""
+        if not self._index_is_stale:
+            return
+        entries = sorted(
+            [(longitude, *entry) for longitude, entry in zip(self._index_longitudes, self._index_entries)]
+            + self._pending
+        )
+        self._index_longitudes = array("d", (entry[0] for entry in entries))
+        self._index_entries = [(entry[1], entry[2]) for entry in entries]
+        self._pending = []
+        self._index_is_stale = False
+
+    def _candidates_in_arc(self, start: float, end: float) -> range:
+        """Index positions with longitude in [start, end], where 0 <= start <= end < 360."""
+        longitudes = self._index_longitudes
+        return range(bisect_left(longitudes, start), bisect_right(longitudes, end))
+
+    def _candidates_near(self, longitude: float, candidates: set) -> None:
+        """Add to ``candidates`` every index position within an orb of any active aspect."""
+        for degree, orb, _ in self._aspect_settings:
+            low = degree - orb - _WINDOW_EPSILON
+            high = degree + orb + _WINDOW_EPSILON
+            # The angular distance is in [0, 180]; a natal point at distance in
+            # [low, high] lies on either side of the transiting point.
+            for start, end in ((longitude + low, longitude + high), (longitude - high, longitude - low)):
+                if end - start >= 360:
+                    candidates.update(range(len(self._index_longitudes)))
+                    return
+                start %= 360
+                end %= 360
+                if start <= end:
+                    candidates.update(self._candidates_in_arc(start, end))
+                else:
+                    candidates.update(self._candidates_in_arc(start, 360))
+                    candidates.update(self._candidates_in_arc(0, end))
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def events_at(self, transit_subject: AstrologicalSubjectModel) -> Iterator[TransitEvent]:
+        """
+        Yield the transit events of every indexed subject for one moment.
+
+        Events are grouped by transiting point, in the AspectsFactory point order.
+
+        Args:
+            transit_subject: The sky at the transit moment (e.g. from EphemerisDataFactory).
+
+        Yields:
+            TransitEvent: One event per aspect within orb.
+        """
+        self._ensure_index()
+        date = transit_subject.iso_formatted_utc_datetime
+        transit_active = set(transit_subject.active_points)
+        aspect_settings = self._aspect_settings
+        longitudes = self._index_longitudes
+        entries = self._index_entries
+
+        for transit_point_name in self._ordered_points:
+            if transit_point_name not in transit_active:
+                continue
+            transit_point = getattr(transit_subject, transit_point_name.lower(), None)
+            if transit_point is None:
+                continue
+            transit_longitude = transit_point.abs_pos
+            transit_speed = transit_point.speed or 0.0
+
+            candidates: set = set()
+            self._candidates_near(transit_longitude, candidates)
+
+            for position in sorted(candidates):
+                subject_index, natal_point_name = entries[position]
+                if natal_point_name not in transit_active:
+                    continue
+                if transit_point_name not in self._subject_points[subject_index]:
+                    continue
+
+                natal_longitude = longitudes[position]
+                distance = abs(swe.difdeg2n(transit_longitude, natal_longitude))
+                for degree, orb, aspect_name in aspect_settings:
+                    if (degree - orb) <= distance <= (degree + orb):
+                        break
+                else:
+                    continue
+
+                if transit_point_name in AXES_LIST and natal_point_name in AXES_LIST:
+                    movement: AspectMovementType = "Static"
+                else:
+                    # Natal points are fixed, as in TransitsTimeRangeFactory
+                    movement = calculate_aspect_movement(transit_longitude, natal_longitude, degree, transit_speed, 0.0)
+
+                yield TransitEvent(
+                    subject_key=self._keys[subject_index],
+                    date=date,
+                    transit_point=transit_point_name,
+                    natal_point=natal_point_name,
+                    aspect=aspect_name,
+                    orbit=abs(distance - degree),
+                    aspect_degrees=degree,
+                    transit_abs_pos=transit_longitude,
+                    natal_abs_pos=natal_longitude,
+                    aspect_movement=movement,
+                )
+
+    def iter_events(
+        self, ephemeris: Union[EphemerisDataFactory, Iterable[AstrologicalSubjectModel]]
+    ) -> Iterator[TransitEvent]:
+        """
+        Stream the transit events of every indexed subject over a time range.
+
+        Args:
+            ephemeris: An EphemerisDataFactory (computed lazily, one step at a time) or an
+                iterable of transit subjects in time order.
+
+        Yields:
+            TransitEvent: Events in time order, then by transiting point.
+        """
+        transit_subjects = ephemeris._iter_subjects() if isinstance(ephemeris, EphemerisDataFactory) else ephemeris
+        for transit_subject in transit_subjects:
+            yield from self.events_at(transit_subject)
+
+
+__all__ = ["TransitEvent", "MultiSubjectTransitEngine"]
@@ -70,11 +70,11 @@ License: AGPL-3.0
 
 import calendar
 import logging
-import swisseph as swe
 
 from datetime import datetime, timezone
 from typing import Union
 
+from kerykeion.instrumentation import swe
 from kerykeion.schemas import KerykeionException
 from kerykeion.fetch_geonames import FetchGeonames
 from kerykeion.utilities import julian_to_datetime, datetime_to_julian
@@ -0,0 +1,521 @@
+# -*- coding: utf-8 -*-
+"""
+Chebyshev Position Cache Module
+
+This module provides ChebyshevPositionCache, a precomputed approximation of
+body positions over a time range that answers position queries without calling
+Swiss Ephemeris.
+
+For every body the range is split into segments. On each segment the ecliptic
+longitude, the longitude speed and the declination are sampled with
+``swe.calc_ut`` at Chebyshev nodes and stored as Chebyshev series; a query
+evaluates three short series with the Clenshaw recurrence.
+
+Error bound:
+    Every segment is checked against Swiss Ephemeris at three instants that are
+    not sampling nodes. A segment whose error exceeds ``tolerance`` (longitude
+    and declination, degrees) or ``speed_tolerance`` (degrees/day) is split in
+    half, down to ``min_segment_days``. With the defaults (1e-6 degrees, about
+    0.004 arcseconds, and 1e-5 degrees/day) the measured errors are well below
+    the precision of the positions reported by Kerykeion. The osculating True
+    Node is checked against 100 times the tolerances, as Swiss Ephemeris itself
+    is noisy at that level for it, and True Lilith is not cached. The largest error
+    measured for each body is available in ``max_errors``. Near a station the
+    interpolated speed can differ in sign from Swiss Ephemeris when the true
+    speed is smaller than ``speed_tolerance``.
+
+The cache covers one set of calculation flags (tropical zodiac; apparent
+geocentric, true geocentric or heliocentric perspective). While it is active
+(``with cache.activate():``, a shortcut for
+``AstrologicalSubjectFactory.precomputed_positions(cache)``),
+AstrologicalSubjectFactory takes the positions of the covered bodies from it;
+any other body, instant or configuration (sidereal zodiac, topocentric
+perspective) still goes to Swiss Ephemeris.
+EphemerisDataFactory accepts a cache through its ``position_cache`` argument;
+TransitsTimeRangeFactory consumes the subjects of such a factory, so transit
+searches over the cached range benefit as well.
+
+Example:
+    >>> from datetime import datetime
+    >>> from kerykeion import EphemerisDataFactory
+    >>> from kerykeion.position_cache import ChebyshevPositionCache
+    >>> cache = ChebyshevPositionCache.build(datetime(2000, 1, 1), datetime(2030, 1, 1))
+    >>> cache.save("positions.krcheb")
+    >>> factory = EphemerisDataFactory(
+    ...     datetime(2024, 1, 1), datetime(2024, 12, 31), step_type="hours",
+    ...     position_cache=ChebyshevPositionCache.load("positions.krcheb"),
+    ... )
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import math
+import struct
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from kerykeion.astrological_subject_factory import STANDARD_PLANETS, AstrologicalSubjectFactory
+from kerykeion.instrumentation import swe
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import AstrologicalPoint, PerspectiveType
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS
+from kerykeion.utilities import datetime_to_julian
+
+
+_EPHE_PATH = str(Path(__file__).parent.absolute() / "sweph")
+
+# File format: magic, then header and one block per body (little endian).
+_FILE_MAGIC = b"KRCHEB01"
+_HEADER_FORMAT = "<ddiIddd"  # start, end, iflag, body count, tolerance, speed tolerance, min segment days
+_BODY_FORMAT = "<iIIddd"  # body id, coefficients per series, segment count, max errors (lon, speed, decl)
+
+#: Number of Chebyshev coefficients per series and segment.
+DEFAULT_COEFFICIENTS = 14
+
+# Initial segment length in days; fast or irregular bodies use shorter segments.
+_SEGMENT_DAYS: Dict[str, float] = {
+    "Sun": 32,
+    "Moon": 4,
+    "Mercury": 8,
+    "Venus": 16,
+    "Mars": 32,
+    "Jupiter": 64,
+    "Saturn": 64,
+    "Uranus": 64,
+    "Neptune": 64,
+    "Pluto": 64,
+    "Mean_North_Lunar_Node": 128,
+    "True_North_Lunar_Node": 2,
+    "Mean_Lilith": 64,
+    "Earth": 32,
+}
+_DEFAULT_SEGMENT_DAYS = 32
+
+# The osculating True Node carries numerical noise of its own (about 1e-5 degrees),
+# so its segments are verified against a proportionally looser tolerance.
+_TOLERANCE_SCALE: Dict[str, float] = {"True_North_Lunar_Node": 100}
+
+# The osculating lunar apogee oscillates too fast to be interpolated efficiently.
+_UNSUPPORTED_BODIES = frozenset({"True_Lilith"})
+
+# Normalized instants (in [-1, 1]) where every fitted segment is verified.
+_CHECK_POINTS = (-0.5, 0.0, 0.5)
+
+_PERSPECTIVE_FLAGS: Dict[str, int] = {
+    "Apparent Geocentric": 0,
+    "True Geocentric": swe.FLG_TRUEPOS,
+    "Heliocentric": swe.FLG_HELCTR,
+}
+
+
+def _to_julian_day(moment: Union[float, datetime]) -> float:
+    """Convert a Julian Day or a datetime (naive datetimes are UTC) to a Julian Day (UT)."""
+    if isinstance(moment, datetime):
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return datetime_to_julian(moment.astimezone(timezone.utc))
+    return float(moment)
+
+
+def _chebyshev_fit(values: List[float]) -> List[float]:
+    """Chebyshev coefficients of the samples taken at the Chebyshev nodes."""
+    count = len(values)
+    coefficients = []
+    for order in range(count):
+        total = 0.0
+        for node, value in enumerate(values):
+            total += value * math.cos(math.pi * order * (node + 0.5) / count)
+        coefficients.append(2.0 * total / count)
+    coefficients[0] /= 2.0
+    return coefficients
+
+
+def _chebyshev_eval(coefficients: array, offset: int, count: int, x: float) -> float:
+    """Evaluate ``count`` coefficients starting at ``offset`` with the Clenshaw recurrence."""
+    b1 = b2 = 0.0
+    two_x = 2.0 * x
+    for index in range(offset + count - 1, offset, -1):
+        b1, b2 = two_x * b1 - b2 + coefficients[index], b1
+    return x * b1 - b2 + coefficients[offset]
+
+
+class _BodySegments:
+    """Chebyshev segments of one body: boundaries and, per segment, longitude, speed and declination series."""
+
+    __slots__ = ("count", "boundaries", "coefficients", "max_errors")
+
+    def __init__(self, count: int, boundaries: array, coefficients: array, max_errors: Tuple[float, float, float]):
+        self.count = count
+        self.boundaries = boundaries
+        self.coefficients = coefficients
+        self.max_errors = max_errors
+
+    def evaluate(self, julian_day: float) -> Tuple[float, float, float]:
+        boundaries = self.boundaries
+        segment = bisect_right(boundaries, julian_day) - 1
+        if segment >= len(boundaries) - 1:
+            segment = len(boundaries) - 2
+        start = boundaries[segment]
+        x = 2.0 * (julian_day - start) / (boundaries[segment + 1] - start) - 1.0
+        count = self.count
+        offset = segment * 3 * count
+        longitude = _chebyshev_eval(self.coefficients, offset, count, x) % 360.0
+        speed = _chebyshev_eval(self.coefficients, offset + count, count, x)
+        declination = _chebyshev_eval(self.coefficients, offset + 2 * count, count, x)
+        return longitude, speed, declination
+
+
+class ChebyshevPositionCache:
+    """
+    Chebyshev interpolation of body positions over a time range.
+
+    Build it with ``build()`` or read it with ``load()``.
+
+    Attributes:
+        start_jd: First covered Julian Day (UT).
+        end_jd: Last covered Julian Day (UT).
+        iflag: Swiss Ephemeris flags the positions were computed with.
+        tolerance: Maximum longitude and declination error checked while fitting, in degrees.
+        speed_tolerance: Maximum speed error checked while fitting, in degrees/day.
+    """
+
+    def __init__(
+        self,
+        start_jd: float,
+        end_jd: float,
+        iflag: int,
+        bodies: Dict[int, _BodySegments],
+        *,
+        tolerance: float,
+        speed_tolerance: float,
+        min_segment_days: float,
+    ):
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.iflag = iflag
+        self.tolerance = tolerance
+        self.speed_tolerance = speed_tolerance
+        self.min_segment_days = min_segment_days
+        self._bodies = bodies
+
+    # =========================================================================
+    # BUILD
+    # =========================================================================
+
+    @classmethod
+    def build(
+        cls,
+        start: Union[float, datetime],
+        end: Union[float, datetime],
+        bodies: Optional[Iterable[AstrologicalPoint]] = None,
+        *,
+        perspective_type: PerspectiveType = "Apparent Geocentric",
+        coefficients: int = DEFAULT_COEFFICIENTS,
+        tolerance: float = 1e-6,
+        speed_tolerance: float = 1e-5,
+        min_segment_days: float = 1 / 64,
+    ) -> "ChebyshevPositionCache":
+        """
+        Fit the Chebyshev segments of the given bodies over a time range.
+
+        Args:
+            start: First instant, as a Julian Day (UT) or a datetime (naive means UTC).
+            end: Last instant, as a Julian Day (UT) or a datetime.
+            bodies: Points to cache. Defaults to the default active points that Swiss
+                Ephemeris computes directly (Sun to Pluto, True Node, Chiron, Mean Lilith).
+            perspective_type: "Apparent Geocentric", "True Geocentric" or "Heliocentric".
+            coefficients: Chebyshev coefficients per series and segment.
+            tolerance: Longitude and declination error tolerance, in degrees.
+            speed_tolerance: Speed error tolerance, in degrees/day.
+            min_segment_days: Shortest segment produced by splitting.
+
+        Returns:
+            ChebyshevPositionCache: The fitted cache.
+
+        Raises:
+            KerykeionException: If the range is empty, a body is not supported or the
+                perspective cannot be cached.
+        """
+        start_jd, end_jd = _to_julian_day(start), _to_julian_day(end)
+        if end_jd <= start_jd:
+            raise KerykeionException("The end of the cached range must be after its start.")
+        if perspective_type not in _PERSPECTIVE_FLAGS:
+            raise KerykeionException(
+                f"Perspective {perspective_type!r} cannot be cached. "
+                f"Supported perspectives: {', '.join(_PERSPECTIVE_FLAGS)}."
+            )
+        if coefficients < 2:
+            raise KerykeionException(f"coefficients must be at least 2, got {coefficients}.")
+
+        if bodies is None:
+            bodies = [point for point in DEFAULT_ACTIVE_POINTS if point in STANDARD_PLANETS]
+        body_names = list(dict.fromkeys(bodies))
+        for body_name in body_names:
+            if body_name not in STANDARD_PLANETS or body_name in _UNSUPPORTED_BODIES:
+                raise KerykeionException(f"{body_name} cannot be cached by the position cache.")
+
+        iflag = swe.FLG_SWIEPH | swe.FLG_SPEED | _PERSPECTIVE_FLAGS[perspective_type]
+        cache = cls(
+            start_jd,
+            end_jd,
+            iflag,
+            {},
+            tolerance=tolerance,
+            speed_tolerance=speed_tolerance,
+            min_segment_days=min_segment_days,
+        )
+
+        swe.set_ephe_path(_EPHE_PATH)
+        try:
+            for body_name in body_names:
+                cache._bodies[STANDARD_PLANETS[body_name]] = cache._fit_body(
+                    STANDARD_PLANETS[body_name],
+                    _SEGMENT_DAYS.get(body_name, _DEFAULT_SEGMENT_DAYS),
+                    coefficients,
+                    _TOLERANCE_SCALE.get(body_name, 1),
+                )
+        finally:
+            swe.close()
+        return cache
+
+    def _sample(self, planet_id: int, julian_day: float) -> Tuple[float, float, float]:
+        """Swiss Ephemeris longitude, speed and declination."""
+        ecliptic = swe.calc_ut(julian_day, planet_id, self.iflag)[0]
+        equatorial = swe.calc_ut(julian_day, planet_id, self.iflag | swe.FLG_EQUATORIAL)[0]
+        return ecliptic[0], ecliptic[3], equatorial[1]
+
+    def _fit_segment(
+        self, planet_id: int, start: float, end: float, count: int, tolerance_scale: float
+    ) -> Tuple[List[float], Tuple[float, float, float], bool]:
+        """Fit one segment and verify it; returns (coefficients, errors, within tolerance)."""
+        half = (end - start) / 2.0
+        middle = start + half
+        samples = [
+            self._sample(planet_id, middle + half * math.cos(math.pi * (node + 0.5) / count)) for node in range(count)
+        ]
+
+        # Unwrap the longitudes so the series is continuous across 0/360
+        reference = samples[0][0]
+        longitudes = [reference + (sample[0] - reference + 180.0) % 360.0 - 180.0 for sample in samples]
+        series = (
+            _chebyshev_fit(longitudes)
+            + _chebyshev_fit([sample[1] for sample in samples])
+            + _chebyshev_fit([sample[2] for sample in samples])
+        )
+        segment = _BodySegments(count, array("d", (start, end)), array("d", series), (0.0, 0.0, 0.0))
+
+        errors = [0.0, 0.0, 0.0]
+        for x in _CHECK_POINTS:
+            julian_day = middle + half * x
+            expected = self._sample(planet_id, julian_day)
+            actual = segment.evaluate(julian_day)
+            errors[0] = max(errors[0], abs((actual[0] - expected[0] + 180.0) % 360.0 - 180.0))
+            errors[1] = max(errors[1], abs(actual[1] - expected[1]))
+            errors[2] = max(errors[2], abs(actual[2] - expected[2]))
+
+        tolerance = self.tolerance * tolerance_scale
+        within = (
+            errors[0] <= tolerance and errors[2] <= tolerance and errors[1] <= self.speed_tolerance * tolerance_scale
+        )
+        return series, (errors[0], errors[1], errors[2]), within
+
+    def _fit_body(self, planet_id: int, segment_days: float, count: int, tolerance_scale: float) -> _BodySegments:
+        """Fit a body over the whole range, splitting segments that exceed the tolerances."""
+        boundaries = array("d")
+        coefficients = array("d")
+        max_errors = [0.0, 0.0, 0.0]
+
+        pending = []
+        start = self.start_jd
+        while start < self.end_jd:
+            pending.append((start, min(start + segment_days, self.end_jd)))
+            start += segment_days
+        pending.reverse()
+
+        while pending:
+            start, end = pending.pop()
+            series, errors, within = self._fit_segment(planet_id, start, end, count, tolerance_scale)
+            if not within and (end - start) / 2.0 >= self.min_segment_days:
+                middle = (start + end) / 2.0
+                pending.append((middle, end))
+                pending.append((start, middle))
+                continue
+
+            boundaries.append(start)
+            coefficients.extend(series)
+            max_errors = [max(current, error) for current, error in zip(max_errors, errors)]
+
+        boundaries.append(self.end_jd)
+        return _BodySegments(count, boundaries, coefficients, (max_errors[0], max_errors[1], max_errors[2]))
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    @property
+    def bodies(self) -> List[AstrologicalPoint]:
+        """Names of the cached bodies."""
+        names = {planet_id: name for name, planet_id in STANDARD_PLANETS.items()}
+        return [names[planet_id] for planet_id in self._bodies]
+
+    @property
+    def max_errors(self) -> Dict[AstrologicalPoint, Tuple[float, float, float]]:
+        """Largest measured (longitude, speed, declination) error of each body."""
+        names = {planet_id: name for name, planet_id in STANDARD_PLANETS.items()}
+        return {names[planet_id]: segments.max_errors for planet_id, segments in self._bodies.items()}
+
+    def covers(self, body: AstrologicalPoint, julian_day: float) -> bool:
+        """Whether the cache can answer for ``body`` at ``julian_day``."""
+        planet_id = STANDARD_PLANETS.get(body)
+        return planet_id in self._bodies and self.start_jd <= julian_day <= self.end_jd
+
+    def position(self, body: AstrologicalPoint, moment: Union[float, datetime]) -> Tuple[float, float, float]:
+        """
+        Interpolated position of a body.
+
+        Args:
+            body: A cached point name (e.g. "Mars").
+            moment: Julian Day (UT) or datetime (naive means UTC).
+
+        Returns:
+            Tuple[float, float, float]: (longitude, speed, declination).
+
+        Raises:
+            KerykeionException: If the body or instant is not covered.
+        """
+        julian_day = _to_julian_day(moment)
+        if not self.covers(body, julian_day):
+            raise KerykeionException(f"{body} at Julian Day {julian_day} is not covered by the position cache.")
+        return self._bodies[STANDARD_PLANETS[body]].evaluate(julian_day)
+
+    def lookup(self, julian_day: float, planet_id: int, iflag: int) -> Optional[Tuple[float, float, float]]:
+        """Interpolated position for a Swiss Ephemeris request, or None if it is not covered."""
+        if iflag != self.iflag or not self.start_jd <= julian_day <= self.end_jd:
+            return None
+        segments = self._bodies.get(planet_id)
+        if segments is None:
+            return None
+        return segments.evaluate(julian_day)
+
+    @contextmanager
+    def activate(self) -> Iterator["ChebyshevPositionCache"]:
+        """
+        Make AstrologicalSubjectFactory use this cache inside the ``with`` block.
+
+        Installs the cache with ``AstrologicalSubjectFactory.precomputed_positions()``.
+
+        Example:
+            >>> with cache.activate():
+            ...     subject = AstrologicalSubjectFactory.from_birth_data(...)
+        """
+        with AstrologicalSubjectFactory.precomputed_positions(self):
+            yield self
+
+    # =========================================================================
+    # BINARY FILE
+    # =========================================================================
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the cache to a compact binary file (little-endian doubles).
+
+        Args:
+            path: Output file path.
+        """
+        with open(path, "wb") as output_file:
+            output_file.write(_FILE_MAGIC)
+            output_file.write(
+                struct.pack(
+                    _HEADER_FORMAT,
+                    self.start_jd,
+                    self.end_jd,
+                    self.iflag,
+                    len(self._bodies),
+                    self.tolerance,
+                    self.speed_tolerance,
+                    self.min_segment_days,
+                )
+            )
+            for planet_id, segments in self._bodies.items():
+                output_file.write(
+                    struct.pack(
+                        _BODY_FORMAT, planet_id, segments.count, len(segments.boundaries) - 1, *segments.max_errors
+                    )
+                )
+                _write_doubles(output_file, segments.boundaries)
+                _write_doubles(output_file, segments.coefficients)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ChebyshevPositionCache":
+        """
+        Read a cache written by ``save()``.
+
+        Args:
+            path: Input file path.
+
+        Raises:
+            KerykeionException: If the file is not a position cache.
+        """
+        with open(path, "rb") as input_file:
+            if input_file.read(len(_FILE_MAGIC)) != _FILE_MAGIC:
+                raise KerykeionException(f"{path} is not a Kerykeion position cache file.")
+            start_jd, end_jd, iflag, body_count, tolerance, speed_tolerance, min_segment_days = _read_struct(
+                input_file, _HEADER_FORMAT
+            )
+            bodies: Dict[int, _BodySegments] = {}
+            for _ in range(body_count):
+                planet_id, count, segment_count, *errors = _read_struct(input_file, _BODY_FORMAT)
+                boundaries = _read_doubles(input_file, segment_count + 1)
+                coefficients = _read_doubles(input_file, segment_count * 3 * count)
+                bodies[planet_id] = _BodySegments(count, boundaries, coefficients, (errors[0], errors[1], errors[2]))
+
+        return cls(
+            start_jd,
+            end_jd,
+            iflag,
+            bodies,
+            tolerance=tolerance,
+            speed_tolerance=speed_tolerance,
+            min_segment_days=min_segment_days,
+        )
+
+
+def _write_doubles(output_file, values: array) -> None:
+    """Write an array of doubles in little-endian order."""
+    data = array("d", values)
+    if not _IS_LITTLE_ENDIAN:
+        data.byteswap()
+    data.tofile(output_file)
+
+
+def _read_doubles(input_file, count: int) -> array:
+    """Read ``count`` little-endian doubles."""
+    data = array("d")
+    try:
+        data.fromfile(input_file, count)
+    except EOFError as exc:
+        raise KerykeionException("Truncated position cache file.") from exc
+    if not _IS_LITTLE_ENDIAN:
+        data.byteswap()
+    return data
+
+
+def _read_struct(input_file, struct_format: str) -> tuple:
+    """Read and unpack one struct, failing cleanly on truncated files."""
+    size = struct.calcsize(struct_format)
+    data = input_file.read(size)
+    if len(data) != size:
+        raise KerykeionException("Truncated position cache file.")
+    return struct.unpack(struct_format, data)
+
+
+_IS_LITTLE_ENDIAN = struct.pack("=H", 1) == struct.pack("<H", 1)
+
+
+__all__ = ["ChebyshevPositionCache", "DEFAULT_COEFFICIENTS"]
@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+"""
+Relocation Module
+
+This module provides RelocationEngine, which evaluates the location-dependent
+part of a chart (house cusps, angles and the houses of the planets) for many
+places at once, plus the Astro*Carto*Graphy lines of the chart.
+
+Relocating a chart with AstrologicalSubjectFactory recomputes every body for
+each place, although only the houses and angles depend on the location. The
+engine keeps the body longitudes of an already computed subject and, for each
+location, runs only the Swiss Ephemeris house calculation (a few microseconds),
+so world maps with tens of thousands of locations stay cheap. Grid results are
+returned as compact ``array`` columns, ready to be turned into raster layers.
+
+Astro*Carto*Graphy lines are computed analytically from the right ascension
+and declination of each body: MC and IC lines are meridians, ASC and DSC lines
+are sampled over the requested latitudes (NaN where the body is circumpolar).
+
+Classes:
+    RelocatedChart: Houses, angles and body houses at one location
+    RelocationGrid: Compact columns for many locations
+    AstroCartoGraphyLine: One MC/IC/ASC/DSC line of one body
+    RelocationEngine: Relocation and Astro*Carto*Graphy calculator
+
+Example:
+    >>> from kerykeion import AstrologicalSubjectFactory
+    >>> from kerykeion.relocation import RelocationEngine
+    >>> engine = RelocationEngine(subject)
+    >>> engine.relocate(40.7128, -74.0060).ascendant
+    >>> grid = engine.grid(range(-60, 61, 2), range(-180, 180, 2))
+    >>> lines = engine.astrocartography_lines()
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import math
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Literal, NamedTuple, Optional, Sequence, Tuple
+
+from kerykeion.aspects.aspects_factory import LOCATION_DEPENDENT_POINTS
+from kerykeion.astrological_subject_factory import STANDARD_PLANETS, ChartConfiguration, ephemeris_context
+from kerykeion.instrumentation import swe
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import AstrologicalPoint, HousesSystemIdentifier
+from kerykeion.schemas.kr_models import AstrologicalSubjectModel
+from kerykeion.utilities import check_and_adjust_polar_latitude
+
+_EPHE_PATH = str(Path(__file__).parent.absolute() / "sweph")
+
+AstroCartoGraphyAngle = Literal["MC", "IC", "ASC", "DSC"]
+
+
+def _house_number(longitude: float, cusps: Sequence[float]) -> int:
+    """House (1-12) containing ``longitude``, with the clockwise arc rule of ``get_planet_house``."""
+    for index in range(12):
+        start = cusps[index]
+        span = (cusps[(index + 1) % 12] - start) % 360
+        if (longitude - start) % 360 < span:
+            return index + 1
+    return 0
+
+
+def _normalize_longitude(longitude: float) -> float:
+    """Geographic longitude in [-180, 180)."""
+    return (longitude + 180.0) % 360.0 - 180.0
+
+
+class RelocatedChart(NamedTuple):
+    """
+    Location-dependent part of a chart.
+
+    Attributes:
+        lat: Latitude of the location.
+        lng: Longitude of the location.
+        cusps: The 12 house cusp longitudes.
+        ascendant: Ascendant longitude.
+        medium_coeli: Midheaven longitude.
+        vertex: Vertex longitude.
+        houses: House number (1-12) of each relocated body.
+    """
+
+    lat: float
+    lng: float
+    cusps: Tuple[float, ...]
+    ascendant: float
+    medium_coeli: float
+    vertex: float
+    houses: Dict[str, int]
+
+
+@dataclass(frozen=True)
+class RelocationGrid:
+    """
+    Relocation results for many locations, stored column by column.
+
+    Location ``i`` has cusps ``cusps[12 * i : 12 * i + 12]``. Locations where the
+    house system is undefined (e.g. Placidus beyond the polar circles) have NaN
+    cusps and angles and house number 0.
+
+    Attributes:
+        points: Bodies placed in houses, in the order of ``houses``.
+        lat: Latitude of each location.
+        lng: Longitude of each location.
+        ascendant: Ascendant longitude of each location.
+        medium_coeli: Midheaven longitude of each location.
+        cusps: House cusps, 12 per location.
+        houses: For each body, its house number (1-12) at each location.
+    """
+
+    points: Tuple[str, ...]
+    lat: array
+    lng: array
+    ascendant: array
+    medium_coeli: array
+    cusps: array
+    houses: Dict[str, array]
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+
+class AstroCartoGraphyLine(NamedTuple):
+    """
+    Places where a body is on one of the four angles.
+
+    Attributes:
+        point: Body name.
+        angle: "MC", "IC", "ASC" or "DSC".
+        lat: Sampled latitudes.
+        lng: Longitude of the line at each latitude (NaN where the body never
+            rises or sets).
+    """
+
+    point: str
+    angle: AstroCartoGraphyAngle
+    lat: array
+    lng: array
+
+
+class RelocationEngine:
+    """
+    Relocate one chart to many places without recomputing its bodies.
+
+    Args:
+        subject: The chart to relocate. Its Julian Day, zodiac and house system are used.
+        houses_system_identifier: House system for the relocated charts. Defaults to
+            the subject's house system.
+        points: Bodies to place in houses. Defaults to the subject's active points whose
+            position does not depend on the location.
+        custom_ayanamsa_t0: Reference epoch of a "USER" sidereal mode (not stored on the subject).
+        custom_ayanamsa_ayan_t0: Ayanamsa at that epoch for a "USER" sidereal mode.
+
+    Raises:
+        KerykeionException: If the subject has no Julian Day or a point is not available.
+
+    Note:
+        The body longitudes are those of the subject. For topocentric charts they keep the
+        parallax of the original location.
+    """
+
+    def __init__(
+        self,
+        subject: AstrologicalSubjectModel,
+        *,
+        houses_system_identifier: Optional[HousesSystemIdentifier] = None,
+        points: Optional[Iterable[AstrologicalPoint]] = None,
+        custom_ayanamsa_t0: Optional[float] = None,
+        custom_ayanamsa_ayan_t0: Optional[float] = None,
+    ):
+        if subject.julian_day is None:
+            raise KerykeionException(f"{subject.name} has no Julian Day and cannot be relocated.")
+
+        self.subject = subject
+        self.julian_day = subject.julian_day
+        self.config = ChartConfiguration(
+            zodiac_type=subject.zodiac_type,
+            sidereal_mode=subject.sidereal_mode,
+            houses_system_identifier=houses_system_identifier or subject.houses_system_identifier,
+            perspective_type=subject.perspective_type,
+            custom_ayanamsa_t0=custom_ayanamsa_t0,
+            custom_ayanamsa_ayan_t0=custom_ayanamsa_ayan_t0,
+        )
+        self._hsys = self.config.houses_system_identifier.encode()
+
+        explicit_points = points is not None
+        if points is None:
+            points = [point for point in subject.active_points if point not in LOCATION_DEPENDENT_POINTS]
+        self.longitudes: Dict[str, float] = {}
+        for point_name in points:
+            if point_name in LOCATION_DEPENDENT_POINTS:
+                raise KerykeionException(f"{point_name} depends on the location and cannot be relocated.")
+            point = getattr(subject, point_name.lower(), None)
+            if point is None:
+                if explicit_points:
+                    raise KerykeionException(f"{point_name} is not available on {subject.name}.")
+                continue
+            self.longitudes[point_name] = point.abs_pos
+
+    # =========================================================================
+    # HOUSES
+    # =========================================================================
+
+    def _houses(self, lat: float, lng: float, iflag: int) -> Optional[Tuple[Sequence[float], Sequence[float]]]:
+        """Cusps and angles at one location, or None where the house system is undefined."""
+        try:
+            return swe.houses_ex(self.julian_day, lat, lng, self._hsys, iflag)
+        except swe.Error:
+            return None
+
+    def relocate(self, lat: float, lng: float, adjust_polar_latitude: bool = True) -> RelocatedChart:
+        """
+        Houses, angles and body houses at one location.
+
+        Args:
+            lat: Latitude in degrees.
+            lng: Longitude in degrees.
+            adjust_polar_latitude: Clamp latitudes beyond ±66° to ±66°, as
+                AstrologicalSubjectFactory does, so the result matches a chart built at
+                the same place. Set to False to keep the latitude and raise where the
+                house system is undefined.
+
+        Raises:
+            KerykeionException: If the house system is undefined at this latitude.
+        """
+        return next(self.iter_locations([(lat, lng)], adjust_polar_latitude=adjust_polar_latitude))
+
+    def iter_locations(
+        self, locations: Iterable[Tuple[float, float]], adjust_polar_latitude: bool = True
+    ) -> Iterator[RelocatedChart]:
+        """
+        Relocate the chart to each ``(lat, lng)`` pair, e.g. a list of cities.
+
+        Args:
+            locations: ``(lat, lng)`` pairs in degrees.
+            adjust_polar_latitude: Clamp latitudes beyond ±66° to ±66°, as
+                AstrologicalSubjectFactory does; ``RelocatedChart.lat`` is then the
+                clamped latitude. Set to False to keep the latitude and raise where the
+                house system is undefined.
+
+        Yields:
+            RelocatedChart: One result per location, in order.
+
+        Raises:
+            KerykeionException: If the house system is undefined at a location.
+        """
+        # Each location runs in its own ephemeris context and is yielded outside it, so
+        # calculations made by the consumer between two results cannot reset the
+        # Swiss Ephemeris state (sidereal mode, ephemeris path) under the generator.
+        for lat, lng in locations:
+            if adjust_polar_latitude:
+                lat = check_and_adjust_polar_latitude(lat)
+            with ephemeris_context(
+                ephe_path=_EPHE_PATH, config=self.config, lng=self.subject.lng, lat=self.subject.lat
+            ) as iflag:
+                houses = self._houses(lat, lng, iflag)
+            if houses is None:
+                raise KerykeionException(
+                    f"House system {self.config.houses_system_identifier} is undefined at latitude {lat}."
+                )
+            cusps, ascmc = houses
+            yield RelocatedChart(
+                lat=lat,
+                lng=lng,
+                cusps=tuple(cusps),
+                ascendant=ascmc[0],
+                medium_coeli=ascmc[1],
+                vertex=ascmc[3],
+                houses={
+                    point_name: _house_number(longitude, cusps) for point_name, longitude in self.longitudes.items()
+                },
+            )
+
+    def grid(self, latitudes: Iterable[float], longitudes: Iterable[float]) -> RelocationGrid:
+        """
+        Relocate the chart over a latitude/longitude grid.
+
+        Locations are ordered by latitude, then by longitude.
+
+        Args:
+            latitudes: Grid latitudes in degrees.
+            longitudes: Grid longitudes in degrees.
+
+        Returns:
+            RelocationGrid: Columns with ``len(latitudes) * len(longitudes)`` locations.
+        """
+        longitudes = list(longitudes)
+        return self.locations_grid((lat, lng) for lat in latitudes for lng in longitudes)
+
+    def locations_grid(self, locations: Iterable[Tuple[float, float]]) -> RelocationGrid:
+        """
+        Relocate the chart to arbitrary ``(lat, lng)`` pairs, returning compact columns.
+
+        Locations where the house system is undefined get NaN cusps and angles and house 0.
+        Unlike ``relocate``, polar latitudes are not clamped, so maps show where the house
+        system breaks down.
+        """
+        points = tuple(self.longitudes)
+        point_longitudes = [self.longitudes[point_name] for point_name in points]
+        lat_column, lng_column = array("d"), array("d")
+        ascendant_column, medium_coeli_column, cusps_column = array("d"), array("d"), array("d")
+        house_columns = [array("b") for _ in points]
+        undefined_cusps = [math.nan] * 12
+
+        with ephemeris_context(
+            ephe_path=_EPHE_PATH, config=self.config, lng=self.subject.lng, lat=self.subject.lat
+        ) as iflag:
+            for lat, lng in locations:
+                lat_column.append(lat)
+                lng_column.append(lng)
+                houses = self._houses(lat, lng, iflag)
+                if houses is None:
+                    ascendant_column.append(math.nan)
+                    medium_coeli_column.append(math.nan)
+                    cusps_column.extend(undefined_cusps)
+                    for column in house_columns:
+                        column.append(0)
+                    continue
+
+                cusps, ascmc = houses
+                ascendant_column.append(ascmc[0])
+                medium_coeli_column.append(ascmc[1])
+                cusps_column.extend(cusps)
+                for column, longitude in zip(house_columns, point_longitudes):
+                    column.append(_house_number(longitude, cusps))
+
+        return RelocationGrid(
+            points=points,
+            lat=lat_column,
+            lng=lng_column,
+            ascendant=ascendant_column,
+            medium_coeli=medium_coeli_column,
+            cusps=cusps_column,
+            houses=dict(zip(points, house_columns)),
+        )
+
+    # =========================================================================
+    # ASTRO*CARTO*GRAPHY
+    # =========================================================================
+
+    def astrocartography_lines(
+        self,
+        bodies: Optional[Iterable[AstrologicalPoint]] = None,
+        latitudes: Optional[Iterable[float]] = None,
+    ) -> List[AstroCartoGraphyLine]:
+        """
+        Astro*Carto*Graphy lines of the chart.
+
+        Lines use the apparent geocentric right ascension and declination of each body
+        (positions "in mundo", ecliptic latitude included), whatever the chart's zodiac
+        or perspective.
+
+        Args:
+            bodies: Bodies to draw. Defaults to the relocated points that Swiss Ephemeris
+                computes directly (planets, nodes, Lilith, Chiron, asteroids).
+            latitudes: Sampled latitudes. Defaults to -80 to 80 in steps of 1 degree.
+
+        Returns:
+            List[AstroCartoGraphyLine]: MC, IC, ASC and DSC lines of each body.
+
+        Raises:
+            KerykeionException: If a body is not computed directly by Swiss Ephemeris.
+        """
+        if bodies is None:
+            bodies = [point for point in self.longitudes if point in STANDARD_PLANETS and point != "Earth"]
+        sampled_latitudes = array("d", range(-80, 81) if latitudes is None else latitudes)
+
+        lines: List[AstroCartoGraphyLine] = []
+        swe.set_ephe_path(_EPHE_PATH)
+        try:
+            greenwich_sidereal_degrees = swe.sidtime(self.julian_day) * 15.0
+            for body_name in bodies:
+                if body_name not in STANDARD_PLANETS or body_name == "Earth":
+                    raise KerykeionException(f"Astro*Carto*Graphy lines are not available for {body_name}.")
+                equatorial = swe.calc_ut(
+                    self.julian_day, STANDARD_PLANETS[body_name], swe.FLG_SWIEPH | swe.FLG_EQUATORIAL
+                )[0]
+                lines.extend(
+                    self._body_lines(
+                        body_name, equatorial[0], equatorial[1], greenwich_sidereal_degrees, sampled_latitudes
+                    )
+                )
+        finally:
+            swe.close()
+        return lines
+
+    @staticmethod
+    def _body_lines(
+        body_name: str,
+        right_ascension: float,
+        declination: float,
+        greenwich_sidereal_degrees: float,
+        latitudes: array,
+    ) -> List[AstroCartoGraphyLine]:
+        """MC, IC, ASC and DSC lines of a body from its equatorial coordinates."""
+        culmination = _normalize_longitude(right_ascension - greenwich_sidereal_degrees)
+        anticulmination = _normalize_longitude(culmination + 180.0)
+        tan_declination = math.tan(math.radians(declination))
+
+        rising, setting = array("d"), array("d")
+        for lat in latitudes:
+            # Hour angle of the body on the horizon: cos(H0) = -tan(lat) * tan(declination)
+            cos_hour_angle = -math.tan(math.radians(lat)) * tan_declination
+            if abs(cos_hour_angle) > 1.0:
+                rising.append(math.nan)
+                setting.append(math.nan)
+                continue
+            hour_angle = math.degrees(math.acos(cos_hour_angle))
+            rising.append(_normalize_longitude(culmination - hour_angle))
+            setting.append(_normalize_longitude(culmination + hour_angle))
+
+        return [
+            AstroCartoGraphyLine(body_name, "MC", latitudes, array("d", [culmination] * len(latitudes))),
+            AstroCartoGraphyLine(body_name, "IC", latitudes, array("d", [anticulmination] * len(latitudes))),
+            AstroCartoGraphyLine(body_name, "ASC", latitudes, rising),
+            AstroCartoGraphyLine(body_name, "DSC", latitudes, setting),
+        ]
+
+
+__all__ = ["AstroCartoGraphyLine", "RelocatedChart", "RelocationEngine", "RelocationGrid"]
@@ -50,6 +50,8 @@ from .kr_models import (
     ActiveAspect,
     TransitMomentModel,
     TransitsTimeRangeModel,
+    TransitAspectSpanModel,
+    TransitTimelineModel,
 )
 from .chart_template_model import ChartTemplateModel
 from .settings_models import KerykeionSettingsModel
@@ -105,4 +107,6 @@ __all__ = [
     "ActiveAspect",
     "TransitMomentModel",
     "TransitsTimeRangeModel",
+    "TransitAspectSpanModel",
+    "TransitTimelineModel",
 ]
@@ -384,6 +384,9 @@ AspectName: TypeAlias = Literal[
 ReturnType: TypeAlias = Literal["Lunar", "Solar"]
 """Literal type for Return Types"""
 
+EphemerisEventType: TypeAlias = Literal["Ingress", "Station Retrograde", "Station Direct", "Shadow Start", "Shadow End"]
+"""Literal type for the events found by EphemerisEventFinder"""
+
 
 # ---------------------------------------------------------------------------
 # Deprecated aliases for backward compatibility with Kerykeion v4.x
@@ -872,6 +872,64 @@ class TransitsTimeRangeModel(SubscriptableBaseModel):
     dates: Optional[List[str]] = Field(description="ISO 8601 formatted dates of all transit moments.")
 
 
+class TransitAspectSpanModel(SubscriptableBaseModel):
+    """
+    One uninterrupted run of a transit aspect within a transit timeline.
+
+    The span starts at the first moment the aspect is within orb and ends at the
+    last one. The fields that stay fixed during the run are stored once. The
+    changing ones are stored as trajectories with one value per moment of the span.
+
+    Attributes:
+        start_index: Index in the timeline dates of the first moment of the span.
+        end_index: Index of the last moment of the span (inclusive).
+        exact_indices: Indices of the moments closest to each exact aspect within
+            the span (more than one when a retrograde station repeats the aspect).
+        p1_abs_positions: Longitude of the transiting point at each moment. Only
+            stored in lossless timelines, otherwise None.
+        p1_speeds: Speed of the transiting point at each moment. Only stored in
+            lossless timelines, otherwise None.
+        orbits: Orb at each moment.
+        movements: Aspect movement at each moment, one letter per moment:
+            "A" (Applying), "S" (Separating) or "X" (Static).
+    """
+
+    p1_name: str
+    p1_owner: str
+    p2_name: str
+    p2_owner: str
+    p2_abs_pos: float
+    p2_speed: float = 0.0
+    aspect: str
+    aspect_degrees: int
+    p1: int
+    p2: int
+    start_index: int
+    end_index: int
+    exact_indices: List[int] = Field(default_factory=list)
+    p1_abs_positions: Optional[List[float]] = None
+    p1_speeds: Optional[List[float]] = None
+    orbits: List[float]
+    movements: str
+
+
+class TransitTimelineModel(SubscriptableBaseModel):
+    """
+    Delta-encoded form of TransitsTimeRangeModel.
+
+    Instead of the full aspect list of every moment, the timeline stores one
+    span per aspect run, with its start, end and exact moments and its orb
+    trajectory. Its size grows with the number of aspect runs, not with the
+    sampling density. A lossless timeline also keeps the transiting positions
+    and speeds, from which ``kerykeion.transit_timeline`` rebuilds the
+    per-moment view of any moment, or the whole TransitsTimeRangeModel.
+    """
+
+    spans: List[TransitAspectSpanModel] = Field(description="Aspect runs, ordered by start moment.")
+    subject: Optional[AstrologicalSubjectModel] = Field(description="Astrological subject data.")
+    dates: List[str] = Field(description="ISO 8601 formatted dates of all transit moments.")
+
+
 class PointInHouseModel(SubscriptableBaseModel):
     """
     Represents an astrological point from one subject positioned within another subject's house.
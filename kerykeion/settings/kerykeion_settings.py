@@ -1,8 +1,9 @@
 """
 Utilities for loading Kerykeion configuration settings from Python sources.
 
-The translation strings are now stored directly in :mod:`translation_strings`,
-so the loader simply wraps those dictionaries (or any user-provided overrides).
+The translation strings are stored per language in :mod:`translation_strings`
+and imported on first use, so the loader simply wraps those dictionaries (or
+any user-provided overrides).
 """
 
 from __future__ import annotations
@@ -27,7 +28,7 @@ def load_settings_mapping(settings_source: Optional[SettingsSource] = None) -> M
     Returns:
         Mapping[str, Any]: The resolved configuration dictionary.
     """
-    language_settings = deepcopy(LANGUAGE_SETTINGS)
+    language_settings = {code: deepcopy(strings) for code, strings in LANGUAGE_SETTINGS.items()}
 
     if settings_source:
         overrides = cast(Mapping[str, Any], settings_source)
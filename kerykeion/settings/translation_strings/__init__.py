@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""Translation strings extracted from the legacy JSON configuration.
+
+Each bundled language lives in its own module of this package (``en.py``,
+``it.py``, ...) and is imported the first time it is requested, so a process
+that only renders English charts never parses the other languages.
+
+This module exposes the `LANGUAGE_SETTINGS` mapping used across the project.
+It behaves like the dictionary it replaces: indexing, iteration and
+assignment all work, but a language is only loaded on first access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, MutableMapping
+from copy import deepcopy
+from functools import lru_cache
+from importlib import import_module
+from typing import Any
+
+BUNDLED_LANGUAGES: tuple[str, ...] = ("EN", "FR", "PT", "IT", "CN", "ES", "RU", "TR", "DE", "HI")
+"""Codes of the languages shipped with Kerykeion, in their historical order."""
+
+
+@lru_cache(maxsize=None)
+def load_bundled_language(code: str) -> dict[str, Any]:
+    """
+    Import the translation strings of one bundled language.
+
+    The module is imported once per process; later calls return the same
+    dictionary, so callers that need to modify it must copy it first.
+
+    Args:
+        code: Language code, one of :data:`BUNDLED_LANGUAGES`.
+
+    Returns:
+        dict[str, Any]: The translation strings for ``code``.
+
+    Raises:
+        KeyError: If ``code`` is not a bundled language.
+    """
+    if code not in BUNDLED_LANGUAGES:
+        raise KeyError(code)
+    return import_module(f"{__name__}.{code.lower()}").STRINGS
+
+
+class LazyLanguageSettings(MutableMapping[str, dict[str, Any]]):
+    """Language code to translation strings mapping that loads languages on first access."""
+
+    def __init__(self) -> None:
+        self._languages: dict[str, Any] = {}
+        self._removed: set[str] = set()
+
+    def __getitem__(self, code: str) -> dict[str, Any]:
+        if code in self._languages:
+            return self._languages[code]
+        if code in self._removed or code not in BUNDLED_LANGUAGES:
+            raise KeyError(code)
+        strings = self._languages[code] = load_bundled_language(code)
+        return strings
+
+    def __setitem__(self, code: str, value: dict[str, Any]) -> None:
+        self._languages[code] = value
+        self._removed.discard(code)
+
+    def __delitem__(self, code: str) -> None:
+        if code not in self:
+            raise KeyError(code)
+        self._languages.pop(code, None)
+        if code in BUNDLED_LANGUAGES:
+            self._removed.add(code)
+
+    def __contains__(self, code: object) -> bool:
+        if code in self._languages:
+            return True
+        return code in BUNDLED_LANGUAGES and code not in self._removed
+
+    def __iter__(self) -> Iterator[str]:
+        for code in BUNDLED_LANGUAGES:
+            if code in self:
+                yield code
+        for code in self._languages:
+            if code not in BUNDLED_LANGUAGES:
+                yield code
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, dict[str, Any]]:
+        # Copying used to yield a plain dict of every language; keep that contract.
+        return {code: deepcopy(self[code], memo) for code in self}
+
+    def loaded_languages(self) -> tuple[str, ...]:
+        """Return the codes whose strings have already been loaded or assigned."""
+        return tuple(self._languages)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(codes={list(self)!r}, loaded={list(self._languages)!r})"
+
+
+LANGUAGE_SETTINGS = LazyLanguageSettings()
+
+__all__ = ["BUNDLED_LANGUAGES", "LANGUAGE_SETTINGS", "LazyLanguageSettings", "load_bundled_language"]
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""Chinese (CN) chart translation strings."""
+
+STRINGS = {
+    "info": "命盤資訊",
+    "cusp": "宮",
+    "longitude": "經度",
+    "latitude": "緯度",
+    "north": "北",
+    "east": "東",
+    "south": "南",
+    "west": "西",
+    "fire": "火",
+    "earth": "土",
+    "air": "風",
+    "water": "水",
+    "and_word": "與",
+    "transits": "流年合盤",
+    "type": "盤型",
+    "couple_aspects": "相位",
+    "synastry_aspects": "相位",
+    "transit_aspects": "流年相位",
+    "planets_and_house": "行星 與 宫位",
+    "transit_name": "流年名稱",
+    "lunar_phase": "月相",
+    "lunation_day": "朔望月日",
+    "day": "日",
+    "composite_chart": "合盤",
+    "midpoints": "中點",
+    "north_letter": "北",
+    "east_letter": "東",
+    "south_letter": "南",
+    "west_letter": "西",
+    "tropical": "熱帶",
+    "sidereal": "恆星",
+    "zodiac": "黃道",
+    "ayanamsa": "阿揚那姆沙",
+    "apparent_geocentric": "視地心",
+    "heliocentric": "日心",
+    "topocentric": "站心",
+    "true_geocentric": "真地心",
+    "new_moon": "新月",
+    "waxing_crescent": "娥眉月",
+    "first_quarter": "上弦月",
+    "waxing_gibbous": "盈凸月",
+    "full_moon": "滿月",
+    "waning_gibbous": "虧凸月",
+    "last_quarter": "下弦月",
+    "waning_crescent": "殘月",
+    "houses": "宮位系統",
+    "domification": "宫位划分",
+    "houses_system_A": "等宮",
+    "houses_system_B": "阿卡比提烏斯",
+    "houses_system_C": "坎帕努斯",
+    "houses_system_D": "等宮 (MC)",
+    "houses_system_F": "卡特極-等",
+    "houses_system_H": "地平/方位",
+    "houses_system_I": "日照",
+    "houses_system_i": "日照/高度",
+    "houses_system_K": "科赫",
+    "houses_system_L": "普倫 SD",
+    "houses_system_M": "莫里努斯",
+    "houses_system_N": "等宮/1=白羊",
+    "houses_system_O": "波菲里",
+    "houses_system_P": "普拉西達斯",
+    "houses_system_Q": "普倫 SR",
+    "houses_system_R": "雷焦蒙塔努斯",
+    "houses_system_S": "斯里帕蒂",
+    "houses_system_T": "波利奇/佩奇",
+    "houses_system_U": "克魯辛斯基-比薩-戈爾澤",
+    "houses_system_V": "等宮/韋洛",
+    "houses_system_W": "等宮/整體星座",
+    "houses_system_X": "軸向旋轉系統/子午線宮",
+    "houses_system_Y": "APC宮位",
+    "Natal": "本命盤",
+    "ExternalNatal": "外部本命盤",
+    "Synastry": "合盤",
+    "Transit": "運行",
+    "Composite": "合成盤",
+    "solar_return": "太陽回歸",
+    "lunar_return": "月亮回歸",
+    "return_aspects": "本命与回归相位",
+    "inner_wheel": "内轮",
+    "outer_wheel": "外轮",
+    "house_position_comparison": "宫位比较",
+    "cusp_position_comparison": "宫头位置比较",
+    "transit_cusp": "运行宫头",
+    "return_cusp": "回归宫头",
+    "house": "宫位",
+    "return_point": "回归点",
+    "Return": "回归",
+    "natal": "本命",
+    "perspective_type": "视角",
+    "location": "位置",
+    "day_of_week": "星期",
+    "weekdays": {
+        "Monday": "星期一",
+        "Tuesday": "星期二",
+        "Wednesday": "星期三",
+        "Thursday": "星期四",
+        "Friday": "星期五",
+        "Saturday": "星期六",
+        "Sunday": "星期日",
+    },
+    "elements": "元素",
+    "qualities": "性质",
+    "cardinal": "本位",
+    "fixed": "固定",
+    "mutable": "变动",
+    "birth_chart": "出生图",
+    "chart_info_natal_label": "本命盤",
+    "chart_info_transit_label": "運行",
+    "celestial_points": {
+        "Sun": "太陽",
+        "Moon": "月亮",
+        "Mercury": "水星",
+        "Venus": "金星",
+        "Mars": "火星",
+        "Jupiter": "木星",
+        "Saturn": "土星",
+        "Uranus": "天王星",
+        "Neptune": "海王星",
+        "Pluto": "冥王星",
+        "Ascendant": "上升點",
+        "Medium_Coeli": "上中天",
+        "Descendant": "下降點",
+        "Imum_Coeli": "下中天",
+        "True_North_Lunar_Node": "真北交点",
+        "Mean_North_Lunar_Node": "平均北交点",
+        "True_South_Lunar_Node": "真南交点",
+        "Mean_South_Lunar_Node": "平均南交点",
+        "Chiron": "凱龍星",
+        "Mean_Lilith": "黑月亮",
+        "True_Lilith": "真黑月亮",
+        "Earth": "地球",
+        "Pholus": "福路斯",
+        "Ceres": "穀神星",
+        "Pallas": "智神星",
+        "Juno": "婚神星",
+        "Vesta": "灶神星",
+        "Eris": "鬩神星",
+        "Sedna": "塞德娜",
+        "Haumea": "妊神星",
+        "Makemake": "鳥神星",
+        "Ixion": "伊克西翁",
+        "Orcus": "奥库斯",
+        "Quaoar": "夸瓦尔",
+        "Regulus": "軒轅十四",
+        "Spica": "角宿一",
+        "Aldebaran": "畢宿五",
+        "Antares": "心宿二",
+        "Sirius": "天狼星",
+        "Fomalhaut": "北落師門",
+        "Algol": "大陵五",
+        "Betelgeuse": "參宿四",
+        "Canopus": "老人星",
+        "Procyon": "南河三",
+        "Arcturus": "大角星",
+        "Pollux": "北河三",
+        "Deneb": "天津四",
+        "Altair": "牛郎星",
+        "Rigel": "參宿七",
+        "Achernar": "水委一",
+        "Capella": "五車二",
+        "Vega": "織女星",
+        "Alcyone": "昴宿六",
+        "Alphecca": "貫索四",
+        "Algorab": "軫宿一",
+        "Deneb_Algedi": "壘壁陣四",
+        "Alkaid": "搖光",
+        "Pars_Fortunae": "財富點",
+        "Pars_Spiritus": "精神點",
+        "Pars_Amoris": "愛情點",
+        "Pars_Fidei": "信仰點",
+        "Vertex": "命運點",
+        "Anti_Vertex": "反命運點",
+    },
+}
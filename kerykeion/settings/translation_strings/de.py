@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+"""German (DE) chart translation strings."""
+
+STRINGS = {
+    "info": "Informationen",
+    "cusp": "Haus",
+    "longitude": "Längengrad",
+    "latitude": "Breitengrad",
+    "north": "Norden",
+    "east": "Osten",
+    "south": "Süden",
+    "west": "Westen",
+    "fire": "Feuer",
+    "earth": "Erde",
+    "air": "Luft",
+    "water": "Wasser",
+    "and_word": "und",
+    "transits": "Transite für",
+    "type": "Typ",
+    "couple_aspects": "Aspekte des Paares",
+    "synastry_aspects": "Aspekte des Paares",
+    "transit_aspects": "Transitaspekte",
+    "planets_and_house": "Punkte für",
+    "transit_name": "Zum Zeitpunkt des Transits",
+    "lunar_phase": "Mondphase",
+    "lunation_day": "Lunationstag",
+    "day": "Tag",
+    "composite_chart": "Komposit-Chart",
+    "midpoints": "Mittelpunkte",
+    "north_letter": "N",
+    "east_letter": "E",
+    "south_letter": "S",
+    "west_letter": "W",
+    "tropical": "Tropisch",
+    "sidereal": "Siderisch",
+    "zodiac": "Tierkreis",
+    "ayanamsa": "Ayanamsa",
+    "apparent_geocentric": "Scheinbar Geozentrisch",
+    "heliocentric": "Heliozentrisch",
+    "topocentric": "Topozentrisch",
+    "true_geocentric": "Wahrhaft Geozentrisch",
+    "new_moon": "Neumond",
+    "waxing_crescent": "Zunehmende Sichel",
+    "first_quarter": "Erstes Viertel",
+    "waxing_gibbous": "Zunehmender Mond",
+    "full_moon": "Vollmond",
+    "waning_gibbous": "Abnehmender Mond",
+    "last_quarter": "Letztes Viertel",
+    "waning_crescent": "Abnehmende Sichel",
+    "houses": "Häuser",
+    "domification": "Domifikation",
+    "houses_system_A": "Gleich",
+    "houses_system_B": "Alcabitius",
+    "houses_system_C": "Campanus",
+    "houses_system_D": "Gleich (MC)",
+    "houses_system_F": "Carter poli-äqu.",
+    "houses_system_H": "Horizont/Azimut",
+    "houses_system_I": "Sunshine",
+    "houses_system_i": "Sunshine/alt.",
+    "houses_system_K": "Koch",
+    "houses_system_L": "Pullen SD",
+    "houses_system_M": "Morinus",
+    "houses_system_N": "Gleich/1=Widder",
+    "houses_system_O": "Porphyrius",
+    "houses_system_P": "Placidus",
+    "houses_system_Q": "Pullen SR",
+    "houses_system_R": "Regiomontanus",
+    "houses_system_S": "Sripati",
+    "houses_system_T": "Polich/Page",
+    "houses_system_U": "Krusinski-Pisa-Goelzer",
+    "houses_system_V": "Gleich/Vehlow",
+    "houses_system_W": "Gleich/Ganzes Zeichen",
+    "houses_system_X": "Axiales Rotationssystem/Meridianhäuser",
+    "houses_system_Y": "APC Häuser",
+    "Natal": "Radix",
+    "ExternalNatal": "Externes Radix",
+    "Synastry": "Synastrie",
+    "Transit": "Transit",
+    "Composite": "Composit",
+    "Return": "Rückkehr",
+    "solar_return": "Sonnenrückkehr",
+    "lunar_return": "Mondrückkehr",
+    "return_aspects": "Aspekte vom Radix zum Return",
+    "inner_wheel": "Innerer Kreis",
+    "outer_wheel": "Äußerer Kreis",
+    "house_position_comparison": "Vergleich der Häuserpositionen",
+    "return_point": "Rückkehrpunkt",
+    "natal": "Radix",
+    "perspective_type": "Perspektive",
+    "location": "Ort",
+    "day_of_week": "Wochentag",
+    "weekdays": {
+        "Monday": "Montag",
+        "Tuesday": "Dienstag",
+        "Wednesday": "Mittwoch",
+        "Thursday": "Donnerstag",
+        "Friday": "Freitag",
+        "Saturday": "Samstag",
+        "Sunday": "Sonntag",
+    },
+    "elements": "Elemente",
+    "qualities": "Qualitäten",
+    "cardinal": "Kardinal",
+    "fixed": "Fix",
+    "mutable": "Veränderlich",
+    "birth_chart": "Geburtshoroskop",
+    "chart_info_natal_label": "Radix",
+    "chart_info_transit_label": "Transit",
+    "celestial_points": {
+        "Sun": "Sonne",
+        "Moon": "Mond",
+        "Mercury": "Merkur",
+        "Venus": "Venus",
+        "Mars": "Mars",
+        "Jupiter": "Jupiter",
+        "Saturn": "Saturn",
+        "Uranus": "Uranus",
+        "Neptune": "Neptun",
+        "Pluto": "Pluto",
+        "Ascendant": "Asz",
+        "Medium_Coeli": "MC",
+        "Descendant": "DSC",
+        "Imum_Coeli": "IC",
+        "True_North_Lunar_Node": "Nordknoten (T)",
+        "Mean_North_Lunar_Node": "Nordknoten (M)",
+        "True_South_Lunar_Node": "Südknoten (T)",
+        "Mean_South_Lunar_Node": "Südknoten (M)",
+        "Chiron": "Chiron",
+        "Mean_Lilith": "Lilith",
+        "True_Lilith": "Lilith (T)",
+        "Earth": "Erde",
+        "Pholus": "Pholus",
+        "Ceres": "Ceres",
+        "Pallas": "Pallas",
+        "Juno": "Juno",
+        "Vesta": "Vesta",
+        "Eris": "Eris",
+        "Sedna": "Sedna",
+        "Haumea": "Haumea",
+        "Makemake": "Makemake",
+        "Ixion": "Ixion",
+        "Orcus": "Orcus",
+        "Quaoar": "Quaoar",
+        "Regulus": "Regulus",
+        "Spica": "Spica",
+        "Aldebaran": "Aldebaran",
+        "Antares": "Antares",
+        "Sirius": "Sirius",
+        "Fomalhaut": "Fomalhaut",
+        "Algol": "Algol",
+        "Betelgeuse": "Beteigeuze",
+        "Canopus": "Canopus",
+        "Procyon": "Prokyon",
+        "Arcturus": "Arktur",
+        "Pollux": "Pollux",
+        "Deneb": "Deneb",
+        "Altair": "Altair",
+        "Rigel": "Rigel",
+        "Achernar": "Achernar",
+        "Capella": "Capella",
+        "Vega": "Vega",
+        "Alcyone": "Alcyone",
+        "Alphecca": "Alphecca",
+        "Algorab": "Algorab",
+        "Deneb_Algedi": "Deneb Algedi",
+        "Alkaid": "Alkaid",
+        "Pars_Fortunae": "Glückspunkt",
+        "Pars_Spiritus": "Geistpunkt",
+        "Pars_Amoris": "Liebespunkt",
+        "Pars_Fidei": "Glaubenspunkt",
+        "Vertex": "Vertex",
+        "Anti_Vertex": "Anti-Vertex",
+    },
+}
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""English (EN) chart translation strings."""
+
+STRINGS = {
+    "info": "Info",
+    "cusp": "Cusp",
+    "longitude": "Longitude",
+    "latitude": "Latitude",
+    "north": "North",
+    "east": "East",
+    "south": "South",
+    "west": "West",
+    "fire": "Fire",
+    "earth": "Earth",
+    "air": "Air",
+    "water": "Water",
+    "and_word": "and",
+    "transits": "Transits for",
+    "type": "Type",
+    "couple_aspects": "Couple aspects",
+    "synastry_aspects": "Synastry aspects",
+    "transit_aspects": "Transit aspects",
+    "planets_and_house": "Points for",
+    "transit_name": "At the time of the transit",
+    "lunar_phase": "Lunar phase",
+    "lunation_day": "Lunation Day",
+    "day": "Day",
+    "composite_chart": "Composite Chart",
+    "midpoints": "Midpoints",
+    "north_letter": "N",
+    "east_letter": "E",
+    "south_letter": "S",
+    "west_letter": "W",
+    "tropical": "Tropical",
+    "sidereal": "Sidereal",
+    "zodiac": "Zodiac",
+    "ayanamsa": "Ayanamsa",
+    "apparent_geocentric": "Apparent Geocentric",
+    "heliocentric": "Heliocentric",
+    "topocentric": "Topocentric",
+    "true_geocentric": "True Geocentric",
+    "new_moon": "New Moon",
+    "waxing_crescent": "Waxing Crescent",
+    "first_quarter": "First Quarter",
+    "waxing_gibbous": "Waxing Gibbous",
+    "full_moon": "Full Moon",
+    "waning_gibbous": "Waning Gibbous",
+    "last_quarter": "Last Quarter",
+    "waning_crescent": "Waning Crescent",
+    "houses": "Houses",
+    "domification": "Domification",
+    "houses_system_A": "Equal",
+    "houses_system_B": "Alcabitius",
+    "houses_system_C": "Campanus",
+    "houses_system_D": "Equal (MC)",
+    "houses_system_F": "Carter poli-equ.",
+    "houses_system_H": "Horizon/Azimut",
+    "houses_system_I": "Sunshine",
+    "houses_system_i": "Sunshine/alt.",
+    "houses_system_K": "Koch",
+    "houses_system_L": "Pullen SD",
+    "houses_system_M": "Morinus",
+    "houses_system_N": "Equal/1=Aries",
+    "houses_system_O": "Porphyry",
+    "houses_system_P": "Placidus",
+    "houses_system_Q": "Pullen SR",
+    "houses_system_R": "Regiomontanus",
+    "houses_system_S": "Sripati",
+    "houses_system_T": "Polich/Page",
+    "houses_system_U": "Krusinski-Pisa-Goelzer",
+    "houses_system_V": "Equal/Vehlow",
+    "houses_system_W": "Equal/Whole sign",
+    "houses_system_X": "Axial rotation system/Meridian houses",
+    "houses_system_Y": "APC houses",
+    "Natal": "Natal",
+    "ExternalNatal": "External Natal",
+    "Synastry": "Synastry",
+    "Transit": "Transit",
+    "Composite": "Composite",
+    "solar_return": "Solar Return",
+    "lunar_return": "Lunar Return",
+    "return_aspects": "Natal-Return Aspects",
+    "inner_wheel": "Inner Wheel",
+    "outer_wheel": "Outer Wheel",
+    "house_position_comparison": "House Position Comparison",
+    "cusp_position_comparison": "Cusp Position Comparison",
+    "transit_cusp": "Transit Cusp",
+    "return_cusp": "Return Cusp",
+    "house": "House",
+    "return_point": "Return Point",
+    "Return": "Return",
+    "natal": "Natal",
+    "perspective_type": "Perspective",
+    "location": "Location",
+    "day_of_week": "Day of Week",
+    "weekdays": {
+        "Monday": "Monday",
+        "Tuesday": "Tuesday",
+        "Wednesday": "Wednesday",
+        "Thursday": "Thursday",
+        "Friday": "Friday",
+        "Saturday": "Saturday",
+        "Sunday": "Sunday",
+    },
+    "elements": "Elements",
+    "qualities": "Qualities",
+    "cardinal": "Cardinal",
+    "fixed": "Fixed",
+    "mutable": "Mutable",
+    "birth_chart": "Birth Chart",
+    "chart_info_natal_label": "Natal",
+    "chart_info_transit_label": "Transit",
+    "celestial_points": {
+        "Sun": "Sun",
+        "Moon": "Moon",
+        "Mercury": "Mercury",
+        "Venus": "Venus",
+        "Mars": "Mars",
+        "Jupiter": "Jupiter",
+        "Saturn": "Saturn",
+        "Uranus": "Uranus",
+        "Neptune": "Neptune",
+        "Pluto": "Pluto",
+        "Ascendant": "Asc",
+        "Medium_Coeli": "Mc",
+        "Descendant": "Dsc",
+        "Imum_Coeli": "Ic",
+        "True_North_Lunar_Node": "N. Node (T)",
+        "Mean_North_Lunar_Node": "N. Node (M)",
+        "Chiron": "Chiron",
+        "Mean_Lilith": "Lilith",
+        "True_South_Lunar_Node": "S. Node (T)",
+        "Mean_South_Lunar_Node": "S. Node (M)",
+        "True_Lilith": "Lilith (T)",
+        "Earth": "Earth",
+        "Pholus": "Pholus",
+        "Ceres": "Ceres",
+        "Pallas": "Pallas",
+        "Juno": "Juno",
+        "Vesta": "Vesta",
+        "Eris": "Eris",
+        "Sedna": "Sedna",
+        "Haumea": "Haumea",
+        "Makemake": "Makemake",
+        "Ixion": "Ixion",
+        "Orcus": "Orcus",
+        "Quaoar": "Quaoar",
+        "Regulus": "Regulus",
+        "Spica": "Spica",
+        "Aldebaran": "Aldebaran",
+        "Antares": "Antares",
+        "Sirius": "Sirius",
+        "Fomalhaut": "Fomalhaut",
+        "Algol": "Algol",
+        "Betelgeuse": "Betelgeuse",
+        "Canopus": "Canopus",
+        "Procyon": "Procyon",
+        "Arcturus": "Arcturus",
+        "Pollux": "Pollux",
+        "Deneb": "Deneb",
+        "Altair": "Altair",
+        "Rigel": "Rigel",
+        "Achernar": "Achernar",
+        "Capella": "Capella",
+        "Vega": "Vega",
+        "Alcyone": "Alcyone",
+        "Alphecca": "Alphecca",
+        "Algorab": "Algorab",
+        "Deneb_Algedi": "Deneb Algedi",
+        "Alkaid": "Alkaid",
+        "Pars_Fortunae": "Part of Fortune",
+        "Pars_Spiritus": "Part of Spirit",
+        "Pars_Amoris": "Part of Love",
+        "Pars_Fidei": "Part of Faith",
+        "Vertex": "Vertex",
+        "Anti_Vertex": "Anti-Vertex",
+    },
+}
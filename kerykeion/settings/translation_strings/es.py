@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""Spanish (ES) chart translation strings."""
+
+STRINGS = {
+    "info": "Información",
+    "cusp": "Casa",
+    "longitude": "Longitud",
+    "latitude": "Latitud",
+    "north": "Norte",
+    "east": "Este",
+    "south": "Sur",
+    "west": "Oeste",
+    "fire": "Fuego",
+    "earth": "Tierra",
+    "air": "Aire",
+    "water": "Agua",
+    "and_word": "y",
+    "transits": "Tránsitos para",
+    "type": "Tipo",
+    "couple_aspects": "Aspectos de la pareja",
+    "synastry_aspects": "Aspectos de la pareja",
+    "transit_aspects": "Aspectos de tránsito",
+    "planets_and_house": "Puntos para",
+    "transit_name": "En el momento del tránsito",
+    "lunar_phase": "Fase lunar",
+    "lunation_day": "Día de Lunación",
+    "day": "Día",
+    "composite_chart": "Carta Compuesta",
+    "midpoints": "Puntos Medios",
+    "north_letter": "N",
+    "east_letter": "E",
+    "south_letter": "S",
+    "west_letter": "W",
+    "tropical": "Tropical",
+    "sidereal": "Sideral",
+    "zodiac": "Zodiaco",
+    "ayanamsa": "Ayanamsa",
+    "apparent_geocentric": "Geocéntrico Aparente",
+    "heliocentric": "Heliocéntrico",
+    "topocentric": "Topocéntrico",
+    "true_geocentric": "Geocéntrico Verdadero",
+    "new_moon": "Luna Nueva",
+    "waxing_crescent": "Luna Creciente",
+    "first_quarter": "Cuarto Creciente",
+    "waxing_gibbous": "Luna Gibosa Creciente",
+    "full_moon": "Luna Llena",
+    "waning_gibbous": "Luna Gibosa Menguante",
+    "last_quarter": "Cuarto Menguante",
+    "waning_crescent": "Luna Menguante",
+    "houses": "Casas",
+    "domification": "Domificación",
+    "houses_system_A": "Iguales",
+    "houses_system_B": "Alcabicio",
+    "houses_system_C": "Campanus",
+    "houses_system_D": "Iguales (MC)",
+    "houses_system_F": "Carter poli-equ.",
+    "houses_system_H": "Horizonte/Azimut",
+    "houses_system_I": "Sunshine",
+    "houses_system_i": "Sunshine/alt.",
+    "houses_system_K": "Koch",
+    "houses_system_L": "Pullen SD",
+    "houses_system_M": "Morinus",
+    "houses_system_N": "Iguales/1=Aries",
+    "houses_system_O": "Porfirio",
+    "houses_system_P": "Placidus",
+    "houses_system_Q": "Pullen SR",
+    "houses_system_R": "Regiomontanus",
+    "houses_system_S": "Sripati",
+    "houses_system_T": "Polich/Page",
+    "houses_system_U": "Krusinski-Pisa-Goelzer",
+    "houses_system_V": "Iguales/Vehlow",
+    "houses_system_W": "Iguales/Signo completo",
+    "houses_system_X": "Sistema de rotación axial/Casas meridianas",
+    "houses_system_Y": "Casas APC",
+    "Natal": "Natal",
+    "ExternalNatal": "Natal Externo",
+    "Synastry": "Sinastría",
+    "Transit": "Tránsito",
+    "Composite": "Compuesto",
+    "Return": "Retorno",
+    "solar_return": "Retorno Solar",
+    "lunar_return": "Retorno Lunar",
+    "return_aspects": "Aspectos entre natal y retorno",
+    "inner_wheel": "Rueda interna",
+    "outer_wheel": "Rueda externa",
+    "house_position_comparison": "Comparación de posiciones en casas",
+    "cusp_position_comparison": "Comparación de posiciones de cúspides",
+    "transit_cusp": "Cúspide de tránsito",
+    "return_cusp": "Cúspide de retorno",
+    "house": "Casa",
+    "return_point": "Punto (ret.)",
+    "natal": "Natal",
+    "perspective_type": "Perspectiva",
+    "location": "Ubicación",
+    "day_of_week": "Día de la semana",
+    "weekdays": {
+        "Monday": "Lunes",
+        "Tuesday": "Martes",
+        "Wednesday": "Miércoles",
+        "Thursday": "Jueves",
+        "Friday": "Viernes",
+        "Saturday": "Sábado",
+        "Sunday": "Domingo",
+    },
+    "elements": "Elementos",
+    "qualities": "Cualidades",
+    "cardinal": "Cardinal",
+    "fixed": "Fijo",
+    "mutable": "Mutable",
+    "birth_chart": "Carta Natal",
+    "chart_info_natal_label": "Natal",
+    "chart_info_transit_label": "Tránsito",
+    "celestial_points": {
+        "Sun": "Sol",
+        "Moon": "Luna",
+        "Mercury": "Mercurio",
+        "Venus": "Venus",
+        "Mars": "Marte",
+        "Jupiter": "Júpiter",
+        "Saturn": "Saturno",
+        "Uranus": "Urano",
+        "Neptune": "Neptuno",
+        "Pluto": "Plutón",
+        "Ascendant": "Asc",
+        "Medium_Coeli": "Mc",
+        "Descendant": "Dsc",
+        "Imum_Coeli": "Ic",
+        "True_North_Lunar_Node": "Nodo N. (V)",
+        "Mean_North_Lunar_Node": "Nodo N. (M)",
+        "True_South_Lunar_Node": "Nodo S. (V)",
+        "Mean_South_Lunar_Node": "Nodo S. (M)",
+        "Chiron": "Quirón",
+        "Mean_Lilith": "Lilith",
+        "True_Lilith": "Lilith (V)",
+        "Earth": "Tierra",
+        "Pholus": "Pholus",
+        "Ceres": "Ceres",
+        "Pallas": "Palas",
+        "Juno": "Juno",
+        "Vesta": "Vesta",
+        "Eris": "Eris",
+        "Sedna": "Sedna",
+        "Haumea": "Haumea",
+        "Makemake": "Makemake",
+        "Ixion": "Ixión",
+        "Orcus": "Orco",
+        "Quaoar": "Quaoar",
+        "Regulus": "Régulo",
+        "Spica": "Spica",
+        "Aldebaran": "Aldebarán",
+        "Antares": "Antares",
+        "Sirius": "Sirio",
+        "Fomalhaut": "Fomalhaut",
+        "Algol": "Algol",
+        "Betelgeuse": "Betelgeuse",
+        "Canopus": "Canopo",
+        "Procyon": "Proción",
+        "Arcturus": "Arturo",
+        "Pollux": "Pólux",
+        "Deneb": "Deneb",
+        "Altair": "Altair",
+        "Rigel": "Rigel",
+        "Achernar": "Achernar",
+        "Capella": "Capella",
+        "Vega": "Vega",
+        "Alcyone": "Alcyone",
+        "Alphecca": "Alphecca",
+        "Algorab": "Algorab",
+        "Deneb_Algedi": "Deneb Algedi",
+        "Alkaid": "Alkaid",
+        "Pars_Fortunae": "Pars Fortunae",
+        "Pars_Spiritus": "Pars Spiritus",
+        "Pars_Amoris": "Pars Amoris",
+        "Pars_Fidei": "Pars Fidei",
+        "Vertex": "Vertex",
+        "Anti_Vertex": "Anti-Vertex",
+    },
+}
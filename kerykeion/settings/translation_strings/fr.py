@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""French (FR) chart translation strings."""
+
+STRINGS = {
+    "info": "Informations",
+    "cusp": "Maison",
+    "longitude": "Longitude",
+    "latitude": "Latitude",
+    "north": "Nord",
+    "east": "Est",
+    "south": "Sud",
+    "west": "Ouest",
+    "fire": "Feu",
+    "earth": "Terre",
+    "air": "Air",
+    "water": "Eau",
+    "and_word": "et",
+    "transits": "Transites pour",
+    "type": "Type",
+    "couple_aspects": "Les aspects",
+    "synastry_aspects": "Les aspects",
+    "transit_aspects": "Les aspects de transit",
+    "planets_and_house": "Points pour",
+    "transit_name": "Au moment de la transition",
+    "lunar_phase": "Phase Lunaire",
+    "lunation_day": "Jour de Lunaison",
+    "day": "Jour",
+    "composite_chart": "Carte Composite",
+    "midpoints": "Milieux",
+    "north_letter": "N",
+    "east_letter": "E",
+    "south_letter": "S",
+    "west_letter": "W",
+    "tropical": "Tropical",
+    "sidereal": "Sidéral",
+    "zodiac": "Zodiaque",
+    "ayanamsa": "Ayanamsa",
+    "apparent_geocentric": "Géocentrique Apparent",
+    "heliocentric": "Héliocentrique",
+    "topocentric": "Topocentrique",
+    "true_geocentric": "Géocentrique Vrai",
+    "new_moon": "Nouvelle Lune",
+    "waxing_crescent": "Premier Croissant",
+    "first_quarter": "Premier Quartier",
+    "waxing_gibbous": "Lune Gibbeuse Croissante",
+    "full_moon": "Pleine Lune",
+    "waning_gibbous": "Lune Gibbeuse Décroissante",
+    "last_quarter": "Dernier Quartier",
+    "waning_crescent": "Dernier Croissant",
+    "houses": "Maisons",
+    "domification": "Domification",
+    "houses_system_A": "Égales",
+    "houses_system_B": "Alcabitius",
+    "houses_system_C": "Campanus",
+    "houses_system_D": "Égales (MC)",
+    "houses_system_F": "Carter poli-equ.",
+    "houses_system_H": "Horizon/Azimut",
+    "houses_system_I": "Sunshine",
+    "houses_system_i": "Sunshine/alt.",
+    "houses_system_K": "Koch",
+    "houses_system_L": "Pullen SD",
+    "houses_system_M": "Morinus",
+    "houses_system_N": "Égales/1=Bélier",
+    "houses_system_O": "Porphyre",
+    "houses_system_P": "Placidus",
+    "houses_system_Q": "Pullen SR",
+    "houses_system_R": "Regiomontanus",
+    "houses_system_S": "Sripati",
+    "houses_system_T": "Polich/Page",
+    "houses_system_U": "Krusinski-Pisa-Goelzer",
+    "houses_system_V": "Égales/Vehlow",
+    "houses_system_W": "Égales/Signe entier",
+    "houses_system_X": "Système de rotation axiale/Maisons méridiennes",
+    "houses_system_Y": "Maisons APC",
+    "Natal": "Natal",
+    "ExternalNatal": "Natal Externe",
+    "Synastry": "Synastrie",
+    "Transit": "Transit",
+    "Composite": "Composite",
+    "solar_return": "Retour Solaire",
+    "lunar_return": "Retour Lunaire",
+    "return_aspects": "Aspects natal-retour",
+    "inner_wheel": "Cercle intérieur",
+    "outer_wheel": "Cercle extérieur",
+    "house_position_comparison": "Comparaison des positions en maisons",
+    "cusp_position_comparison": "Comparaison des positions des cusps",
+    "transit_cusp": "Cusp de transit",
+    "return_cusp": "Cusp de retour",
+    "house": "Maison",
+    "return_point": "Point (rév.)",
+    "Return": "Révolution",
+    "natal": "Radix",
+    "perspective_type": "Perspective",
+    "location": "Lieu",
+    "day_of_week": "Jour de la semaine",
+    "weekdays": {
+        "Monday": "Lundi",
+        "Tuesday": "Mardi",
+        "Wednesday": "Mercredi",
+        "Thursday": "Jeudi",
+        "Friday": "Vendredi",
+        "Saturday": "Samedi",
+        "Sunday": "Dimanche",
+    },
+    "elements": "Éléments",
+    "qualities": "Qualités",
+    "cardinal": "Cardinal",
+    "fixed": "Fixe",
+    "mutable": "Mutable",
+    "birth_chart": "Thème Natal",
+    "chart_info_natal_label": "Natal",
+    "chart_info_transit_label": "Transit",
+    "celestial_points": {
+        "Sun": "Soleil",
+        "Moon": "Lune",
+        "Mercury": "Mercure",
+        "Venus": "Vénus",
+        "Mars": "Mars",
+        "Jupiter": "Jupiter",
+        "Saturn": "Saturne",
+        "Uranus": "Uranus",
+        "Neptune": "Neptune",
+        "Pluto": "Pluton",
+        "Ascendant": "Asc",
+        "Medium_Coeli": "Mc",
+        "Descendant": "Dsc",
+        "Imum_Coeli": "Ic",
+        "True_North_Lunar_Node": "Nœud N. (V)",
+        "Mean_North_Lunar_Node": "Nœud N. (M)",
+        "True_South_Lunar_Node": "Nœud S. (V)",
+        "Mean_South_Lunar_Node": "Nœud S. (M)",
+        "Chiron": "Chiron",
+        "Mean_Lilith": "Lilith",
+        "True_Lilith": "Lilith (V)",
+        "Earth": "Terre",
+        "Pholus": "Pholus",
+        "Ceres": "Cérès",
+        "Pallas": "Pallas",
+        "Juno": "Junon",
+        "Vesta": "Vesta",
+        "Eris": "Eris",
+        "Sedna": "Sedna",
+        "Haumea": "Haumea",
+        "Makemake": "Makemake",
+        "Ixion": "Ixion",
+        "Orcus": "Orcus",
+        "Quaoar": "Quaoar",
+        "Regulus": "Regulus",
+        "Spica": "Spica",
+        "Aldebaran": "Aldébaran",
+        "Antares": "Antarès",
+        "Sirius": "Sirius",
+        "Fomalhaut": "Fomalhaut",
+        "Algol": "Algol",
+        "Betelgeuse": "Bételgeuse",
+        "Canopus": "Canopus",
+        "Procyon": "Procyon",
+        "Arcturus": "Arcturus",
+        "Pollux": "Pollux",
+        "Deneb": "Deneb",
+        "Altair": "Altaïr",
+        "Rigel": "Rigel",
+        "Achernar": "Achernar",
+        "Capella": "Capella",
+        "Vega": "Vega",
+        "Alcyone": "Alcyone",
+        "Alphecca": "Alphecca",
+        "Algorab": "Algorab",
+        "Deneb_Algedi": "Deneb Algedi",
+        "Alkaid": "Alkaid",
+        "Pars_Fortunae": "Pars Fortunae",
+        "Pars_Spiritus": "Pars Spiritus",
+        "Pars_Amoris": "Pars Amoris",
+        "Pars_Fidei": "Pars Fidei",
+        "Vertex": "Vertex",
+        "Anti_Vertex": "Anti-Vertex",
+    },
+}
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+"""Hindi (HI) chart translation strings."""
+
+STRINGS = {
+    "info": "जानकारी",
+    "cusp": "घर",
+    "longitude": "देशांतर",
+    "latitude": "अक्षांश",
+    "north": "उत्तर",
+    "east": "पूर्व",
+    "south": "दक्षिण",
+    "west": "पश्चिम",
+    "fire": "अग्नि",
+    "earth": "पृथ्वी",
+    "air": "वायु",
+    "water": "जल",
+    "and_word": "और",
+    "transits": "गोचर के लिए",
+    "type": "प्रकार",
+    "couple_aspects": "जोड़ी के पहलू",
+    "synastry_aspects": "जोड़ी के पहलू",
+    "transit_aspects": "गोचर के पहलू",
+    "planets_and_house": "अंक के लिए",
+    "transit_name": "गोचर के समय",
+    "lunar_phase": "चंद्र चरण",
+    "lunation_day": "चंद्र चक्र दिन",
+    "day": "दिन",
+    "composite_chart": "संयुक्त चार्ट",
+    "midpoints": "मध्य बिंदु",
+    "north_letter": "उ",
+    "east_letter": "पू",
+    "south_letter": "द",
+    "west_letter": "प",
+    "tropical": "ट्रॉपिकल",
+    "sidereal": "साइडीरियल",
+    "zodiac": "राशि",
+    "ayanamsa": "अयनांश",
+    "apparent_geocentric": "आभासी भूकेंद्रीय",
+    "heliocentric": "सूर्यकेंद्रीय",
+    "topocentric": "स्थानकेंद्रीय",
+    "true_geocentric": "वास्तविक भूकेंद्रीय",
+    "new_moon": "अमावस्या",
+    "waxing_crescent": "शुक्ल पक्ष प्रथमा",
+    "first_quarter": "शुक्ल पक्ष सप्तमी",
+    "waxing_gibbous": "शुक्ल पक्ष त्रयोदशी",
+    "full_moon": "पूर्णिमा",
+    "waning_gibbous": "कृष्ण पक्ष त्रयोदशी",
+    "last_quarter": "कृष्ण पक्ष सप्तमी",
+    "waning_crescent": "कृष्ण पक्ष प्रथमा",
+    "houses": "भावों",
+    "domification": "गृह",
+    "houses_system_A": "समान",
+    "houses_system_B": "अल्काबितियस",
+    "houses_system_C": "कैम्पानस",
+    "houses_system_D": "समान (MC)",
+    "houses_system_F": "कार्टर बहु-सम",
+    "houses_system_H": "क्षितिज/अज़ीमुथ",
+    "houses_system_I": "सनशाइन",
+    "houses_system_i": "सनशाइन/वैकल्पिक",
+    "houses_system_K": "कोच",
+    "houses_system_L": "पुल्लेन SD",
+    "houses_system_M": "मोरिनस",
+    "houses_system_N": "समान/1=मेष",
+    "houses_system_O": "पोरफिरी",
+    "houses_system_P": "प्लासिडस",
+    "houses_system_Q": "पुल्लेन SR",
+    "houses_system_R": "रेजियोमोंटेनस",
+    "houses_system_S": "श्रीपति",
+    "houses_system_T": "पोलिच/पेज",
+    "houses_system_U": "क्रुसिंस्की-पिसा-गोल्ज़र",
+    "houses_system_V": "समान/वेहलो",
+    "houses_system_W": "समान/पूर्ण राशि",
+    "houses_system_X": "धुरी घूर्णन प्रणाली/मेरिडियन भाव",
+    "houses_system_Y": "APC भाव",
+    "Natal": "जन्म",
+    "ExternalNatal": "बाहरी जन्म",
+    "Synastry": "सिनेस्ट्री",
+    "Transit": "गोचर",
+    "Composite": "संयुक्त",
+    "Return": "वापसी",
+    "solar_return": "सौर वापसी",
+    "lunar_return": "चंद्र वापसी",
+    "return_aspects": "जन्म से रिटर्न तक के पहलू",
+    "inner_wheel": "भीतरी चक्र",
+    "outer_wheel": "बाहरी चक्र",
+    "house_position_comparison": "भाव स्थिति तुलना",
+    "return_point": "पुनरागमन बिंदु",
+    "natal": "जन्म कुंडली",
+    "perspective_type": "दृष्टिकोण",
+    "location": "स्थान",
+    "day_of_week": "सप्ताह का दिन",
+    "weekdays": {
+        "Monday": "सोमवार",
+        "Tuesday": "मंगलवार",
+        "Wednesday": "बुधवार",
+        "Thursday": "गुरुवार",
+        "Friday": "शुक्रवार",
+        "Saturday": "शनिवार",
+        "Sunday": "रविवार",
+    },
+    "elements": "तत्व",
+    "qualities": "गुण",
+    "cardinal": "चल",
+    "fixed": "स्थिर",
+    "mutable": "द्विस्वभाव",
+    "birth_chart": "जन्म चार्ट",
+    "chart_info_natal_label": "जन्म",
+    "chart_info_transit_label": "गोचर",
+    "celestial_points": {
+        "Sun": "सूर्य",
+        "Moon": "चंद्रमा",
+        "Mercury": "बुध",
+        "Venus": "शुक्र",
+        "Mars": "मंगल",
+        "Jupiter": "गुरु",
+        "Saturn": "शनि",
+        "Uranus": "यूरेनस",
+        "Neptune": "नेपच्यून",
+        "Pluto": "प्लूटो",
+        "Ascendant": "आस",
+        "Medium_Coeli": "एमसी",
+        "Descendant": "डीएससी",
+        "Imum_Coeli": "आईसी",
+        "True_North_Lunar_Node": "उत्तर नोड (T)",
+        "Mean_North_Lunar_Node": "उत्तर नोड (M)",
+        "True_South_Lunar_Node": "दक्षिण नोड (T)",
+        "Mean_South_Lunar_Node": "दक्षिण नोड (M)",
+        "Chiron": "किरोन",
+        "Mean_Lilith": "लिलिथ",
+        "True_Lilith": "लिलिथ (T)",
+        "Earth": "पृथ्वी",
+        "Pholus": "फोलस",
+        "Ceres": "सेरेस",
+        "Pallas": "पैलास",
+        "Juno": "जूनो",
+        "Vesta": "वेस्टा",
+        "Eris": "एरिस",
+        "Sedna": "सेदना",
+        "Haumea": "हौमेया",
+        "Makemake": "माकेमाके",
+        "Ixion": "इक्षियन",
+        "Orcus": "ऑरकस",
+        "Quaoar": "क्वाओर",
+        "Regulus": "रेगुलस",
+        "Spica": "स्पाइका",
+        "Aldebaran": "अल्डेबरन",
+        "Antares": "एंटारेस",
+        "Sirius": "सीरियस",
+        "Fomalhaut": "फोमलहौत",
+        "Algol": "अल्गोल",
+        "Betelgeuse": "बेटेलज्यूज़",
+        "Canopus": "कैनोपस",
+        "Procyon": "प्रोसियोन",
+        "Arcturus": "आर्कटुरस",
+        "Pollux": "पोलक्स",
+        "Deneb": "डेनेब",
+        "Altair": "अल्टेयर",
+        "Rigel": "राइजेल",
+        "Achernar": "अचरनार",
+        "Capella": "कैपेला",
+        "Vega": "वेगा",
+        "Alcyone": "अल्सिओनी",
+        "Alphecca": "अल्फेक्का",
+        "Algorab": "अल्गोराब",
+        "Deneb_Algedi": "डेनेब अल्गेदी",
+        "Alkaid": "अल्काइड",
+        "Pars_Fortunae": "भाग्य अंश",
+        "Pars_Spiritus": "आत्मा अंश",
+        "Pars_Amoris": "प्रेम अंश",
+        "Pars_Fidei": "विश्वास अंश",
+        "Vertex": "वर्टेक्स",
+        "Anti_Vertex": "एंटी-वर्टेक्स",
+    },
+}
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""Italian (IT) chart translation strings."""
+
+STRINGS = {
+    "info": "Info",
+    "cusp": "Cuspide",
+    "longitude": "Longitudine",
+    "latitude": "Latitudine",
+    "north": "Nord",
+    "east": "Est",
+    "south": "Sud",
+    "west": "Ovest",
+    "fire": "Fuoco",
+    "earth": "Terra",
+    "air": "Aria",
+    "water": "Acqua",
+    "and_word": "e",
+    "transits": "Transiti per",
+    "type": "Tipo",
+    "couple_aspects": "Aspetti di coppia",
+    "synastry_aspects": "Aspetti di coppia",
+    "transit_aspects": "Aspetti di transito",
+    "planets_and_house": "Punti per",
+    "transit_name": "Al momento del transito",
+    "lunar_phase": "Fase lunare",
+    "lunation_day": "Giorno di Lunazione",
+    "day": "Giorno",
+    "composite_chart": "Tema Composito",
+    "midpoints": "Punti Medi",
+    "north_letter": "N",
+    "east_letter": "E",
+    "south_letter": "S",
+    "west_letter": "W",
+    "tropical": "Tropicale",
+    "sidereal": "Siderale",
+    "zodiac": "Zodiaco",
+    "ayanamsa": "Ayanamsa",
+    "apparent_geocentric": "Geocentrico Apparente",
+    "heliocentric": "Eliocentrico",
+    "topocentric": "Topocentrico",
+    "true_geocentric": "Geocentrico Vero",
+    "new_moon": "Luna Nuova",
+    "waxing_crescent": "Luna Crescente",
+    "first_quarter": "Primo Quarto",
+    "waxing_gibbous": "Gibbosa Crescente",
+    "full_moon": "Luna Piena",
+    "waning_gibbous": "Gibbosa Calante",
+    "last_quarter": "Ultimo Quarto",
+    "waning_crescent": "Luna Calante",
+    "houses": "Domificazione",
+    "domification": "Domificazione",
+    "houses_system_A": "Uguale",
+    "houses_system_B": "Alcabizio",
+    "houses_system_C": "Campano",
+    "houses_system_D": "Uguale (MC)",
+    "houses_system_F": "Carter poli-equ.",
+    "houses_system_H": "Orizzonte/Azimut",
+    "houses_system_I": "Sunshine",
+    "houses_system_i": "Sunshine/alt.",
+    "houses_system_K": "Koch",
+    "houses_system_L": "Pullen SD",
+    "houses_system_M": "Morinus",
+    "houses_system_N": "Uguale/1=Ariete",
+    "houses_system_O": "Porfirio",
+    "houses_system_P": "Placido",
+    "houses_system_Q": "Pullen SR",
+    "houses_system_R": "Regiomontano",
+    "houses_system_S": "Sripati",
+    "houses_system_T": "Polich/Page",
+    "houses_system_U": "Krusinski-Pisa-Goelzer",
+    "houses_system_V": "Uguale/Vehlow",
+    "houses_system_W": "Uguale/Segno intero",
+    "houses_system_X": "Sistema di rotazione assiale/Case meridiane",
+    "houses_system_Y": "Case APC",
+    "Natal": "Natale",
+    "ExternalNatal": "Natale Esterno",
+    "Synastry": "Sinastria",
+    "Transit": "Transito",
+    "Composite": "Composito",
+    "solar_return": "Ritorno Solare",
+    "lunar_return": "Ritorno Lunare",
+    "return_aspects": "Aspetti tra Tema Natale e Ritorno Solare",
+    "inner_wheel": "Cerchio Interno",
+    "outer_wheel": "Cerchio Esterno",
+    "house_position_comparison": "Confronto posizioni nelle case",
+    "cusp_position_comparison": "Confronto posizioni delle cuspidi",
+    "transit_cusp": "Cuspide di transito",
+    "return_cusp": "Cuspide di ritorno",
+    "house": "Casa",
+    "return_point": "Punto del rit.",
+    "Return": "Ritorno",
+    "natal": "Radix",
+    "perspective_type": "Prospettiva",
+    "location": "Località",
+    "day_of_week": "Giorno della settimana",
+    "weekdays": {
+        "Monday": "Lunedì",
+        "Tuesday": "Martedì",
+        "Wednesday": "Mercoledì",
+        "Thursday": "Giovedì",
+        "Friday": "Venerdì",
+        "Saturday": "Sabato",
+        "Sunday": "Domenica",
+    },
+    "elements": "Elementi",
+    "qualities": "Qualità",
+    "cardinal": "Cardinale",
+    "fixed": "Fisso",
+    "mutable": "Mutevole",
+    "birth_chart": "Tema Natale",
+    "chart_info_natal_label": "Natale",
+    "chart_info_transit_label": "Transito",
+    "celestial_points": {
+        "Sun": "Sole",
+        "Moon": "Luna",
+        "Mercury": "Mercurio",
+        "Venus": "Venere",
+        "Mars": "Marte",
+        "Jupiter": "Giove",
+        "Saturn": "Saturno",
+        "Uranus": "Urano",
+        "Neptune": "Nettuno",
+        "Pluto": "Plutone",
+        "Ascendant": "Asc",
+        "Medium_Coeli": "Mc",
+        "Descendant": "Dsc",
+        "Imum_Coeli": "Ic",
+        "True_North_Lunar_Node": "Nodo N. (V)",
+        "Mean_North_Lunar_Node": "Nodo N. (M)",
+        "True_South_Lunar_Node": "Nodo S. (V)",
+        "Mean_South_Lunar_Node": "Nodo S. (M)",
+        "Chiron": "Chirone",
+        "Mean_Lilith": "Lilith",
+        "True_Lilith": "Lilith (V)",
+        "Earth": "Terra",
+        "Pholus": "Pholus",
+        "Ceres": "Cerere",
+        "Pallas": "Pallade",
+        "Juno": "Giunone",
+        "Vesta": "Vesta",
+        "Eris": "Eris",
+        "Sedna": "Sedna",
+        "Haumea": "Haumea",
+        "Makemake": "Makemake",
+        "Ixion": "Issione",
+        "Orcus": "Orco",
+        "Quaoar": "Quaoar",
+        "Regulus": "Regolo",
+        "Spica": "Spica",
+        "Aldebaran": "Aldebaran",
+        "Antares": "Antares",
+        "Sirius": "Sirio",
+        "Fomalhaut": "Fomalhaut",
+        "Algol": "Algol",
+        "Betelgeuse": "Betelgeuse",
+        "Canopus": "Canopo",
+        "Procyon": "Procione",
+        "Arcturus": "Arturo",
+        "Pollux": "Polluce",
+        "Deneb": "Deneb",
+        "Altair": "Altair",
+        "Rigel": "Rigel",
+        "Achernar": "Achernar",
+        "Capella": "Capella",
+        "Vega": "Vega",
+        "Alcyone": "Alcyone",
+        "Alphecca": "Alphecca",
+        "Algorab": "Algorab",
+        "Deneb_Algedi": "Deneb Algedi",
+        "Alkaid": "Alkaid",
+        "Pars_Fortunae": "Pars Fortunae",
+        "Pars_Spiritus": "Pars Spiritus",
+        "Pars_Amoris": "Pars Amoris",
+        "Pars_Fidei": "Pars Fidei",
+        "Vertex": "Vertex",
+        "Anti_Vertex": "Anti-Vertex",
+    },
+}
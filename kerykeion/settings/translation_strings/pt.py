@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""Portuguese (PT) chart translation strings."""
+
+STRINGS = {
+    "info": "Informações",
+    "cusp": "Casa",
+    "longitude": "Longitude",
+    "latitude": "Latitude",
+    "north": "Norte",
+    "east": "Leste",
+    "south": "Sul",
+    "west": "Oeste",
+    "fire": "Fogo",
+    "earth": "Terra",
+    "air": "Ar",
+    "water": "Água",
+    "and_word": "e",
+    "transits": "Trânsitos para",
+    "type": "Tipo",
+    "couple_aspects": "Aspectos do casal",
+    "synastry_aspects": "Aspectos do casal",
+    "transit_aspects": "Aspectos do trânsito",
+    "planets_and_house": "Pontos para",
+    "transit_name": "No momento do trânsito",
+    "lunar_phase": "Fase lunar",
+    "lunation_day": "Dia de Lunação",
+    "day": "Dia",
+    "composite_chart": "Carta Composta",
+    "midpoints": "Meios",
+    "north_letter": "N",
+    "east_letter": "E",
+    "south_letter": "S",
+    "west_letter": "W",
+    "tropical": "Tropical",
+    "sidereal": "Sideral",
+    "zodiac": "Zodíaco",
+    "ayanamsa": "Ayanamsa",
+    "apparent_geocentric": "Geocêntrico Aparente",
+    "heliocentric": "Heliocêntrico",
+    "topocentric": "Topocêntrico",
+    "true_geocentric": "Geocêntrico Verdadeiro",
+    "new_moon": "Lua Nova",
+    "waxing_crescent": "Lua Crescente",
+    "first_quarter": "Quarto Crescente",
+    "waxing_gibbous": "Lua Gibosa Crescente",
+    "full_moon": "Lua Cheia",
+    "waning_gibbous": "Lua Gibosa Minguante",
+    "last_quarter": "Quarto Minguante",
+    "waning_crescent": "Lua Minguante",
+    "houses": "Casas",
+    "domification": "Domificação",
+    "houses_system_A": "Igual",
+    "houses_system_B": "Alcabítio",
+    "houses_system_C": "Campanus",
+    "houses_system_D": "Igual (MC)",
+    "houses_system_F": "Carter poli-equ.",
+    "houses_system_H": "Horizonte/Azimute",
+    "houses_system_I": "Sunshine",
+    "houses_system_i": "Sunshine/alt.",
+    "houses_system_K": "Koch",
+    "houses_system_L": "Pullen SD",
+    "houses_system_M": "Morinus",
+    "houses_system_N": "Igual/1=Áries",
+    "houses_system_O": "Porfírio",
+    "houses_system_P": "Placidus",
+    "houses_system_Q": "Pullen SR",
+    "houses_system_R": "Regiomontanus",
+    "houses_system_S": "Sripati",
+    "houses_system_T": "Polich/Page",
+    "houses_system_U": "Krusinski-Pisa-Goelzer",
+    "houses_system_V": "Igual/Vehlow",
+    "houses_system_W": "Igual/Signo inteiro",
+    "houses_system_X": "Sistema de rotação axial/Casas meridianas",
+    "houses_system_Y": "Casas APC",
+    "Natal": "Natal",
+    "ExternalNatal": "Natal Externo",
+    "Synastry": "Sinastria",
+    "Transit": "Trânsito",
+    "Composite": "Composto",
+    "Return": "Retorno",
+    "solar_return": "Retorno Solar",
+    "lunar_return": "Retorno Lunar",
+    "return_aspects": "Aspectos do natal para o retorno",
+    "inner_wheel": "Roda interna",
+    "outer_wheel": "Roda externa",
+    "house_position_comparison": "Comparação das posições nas casas",
+    "cusp_position_comparison": "Comparação das posições das cusps",
+    "transit_cusp": "Cusp de trânsito",
+    "return_cusp": "Cusp de retorno",
+    "house": "Casa",
+    "return_point": "Ponto (ret.)",
+    "natal": "Natal",
+    "perspective_type": "Perspectiva",
+    "location": "Localização",
+    "day_of_week": "Dia da semana",
+    "weekdays": {
+        "Monday": "Segunda",
+        "Tuesday": "Terça",
+        "Wednesday": "Quarta",
+        "Thursday": "Quinta",
+        "Friday": "Sexta",
+        "Saturday": "Sábado",
+        "Sunday": "Domingo",
+    },
+    "elements": "Elementos",
+    "qualities": "Qualidades",
+    "cardinal": "Cardinal",
+    "fixed": "Fixo",
+    "mutable": "Mutável",
+    "birth_chart": "Mapa Natal",
+    "chart_info_natal_label": "Natal",
+    "chart_info_transit_label": "Trânsito",
+    "celestial_points": {
+        "Sun": "Sol",
+        "Moon": "Lua",
+        "Mercury": "Mercúrio",
+        "Venus": "Vênus",
+        "Mars": "Marte",
+        "Jupiter": "Júpiter",
+        "Saturn": "Saturno",
+        "Uranus": "Urano",
+        "Neptune": "Netuno",
+        "Pluto": "Plutão",
+        "Ascendant": "Asc",
+        "Medium_Coeli": "Mc",
+        "Descendant": "Dsc",
+        "Imum_Coeli": "Ic",
+        "True_North_Lunar_Node": "Nodo N. (V)",
+        "Mean_North_Lunar_Node": "Nodo N. (M)",
+        "True_South_Lunar_Node": "Nodo S. (V)",
+        "Mean_South_Lunar_Node": "Nodo S. (M)",
+        "Chiron": "Quíron",
+        "Mean_Lilith": "Lilith",
+        "True_Lilith": "Lilith (V)",
+        "Earth": "Terra",
+        "Pholus": "Pholus",
+        "Ceres": "Ceres",
+        "Pallas": "Palas",
+        "Juno": "Juno",
+        "Vesta": "Vesta",
+        "Eris": "Éris",
+        "Sedna": "Sedna",
+        "Haumea": "Haumea",
+        "Makemake": "Makemake",
+        "Ixion": "Ixion",
+        "Orcus": "Orcus",
+        "Quaoar": "Quaoar",
+        "Regulus": "Régulo",
+        "Spica": "Spica",
+        "Aldebaran": "Aldebaran",
+        "Antares": "Antares",
+        "Sirius": "Sirius",
+        "Fomalhaut": "Fomalhaut",
+        "Algol": "Algol",
+        "Betelgeuse": "Betelgeuse",
+        "Canopus": "Canopus",
+        "Procyon": "Procyon",
+        "Arcturus": "Arcturus",
+        "Pollux": "Pollux",
+        "Deneb": "Deneb",
+        "Altair": "Altair",
+        "Rigel": "Rigel",
+        "Achernar": "Achernar",
+        "Capella": "Capella",
+        "Vega": "Vega",
+        "Alcyone": "Alcyone",
+        "Alphecca": "Alphecca",
+        "Algorab": "Algorab",
+        "Deneb_Algedi": "Deneb Algedi",
+        "Alkaid": "Alkaid",
+        "Pars_Fortunae": "Pars Fortunae",
+        "Pars_Spiritus": "Pars Spiritus",
+        "Pars_Amoris": "Pars Amoris",
+        "Pars_Fidei": "Pars Fidei",
+        "Vertex": "Vertex",
+        "Anti_Vertex": "Anti-Vertex",
+    },
+}
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+"""Russian (RU) chart translation strings."""
+
+STRINGS = {
+    "info": "Информация",
+    "cusp": "Дом",
+    "longitude": "Долгота",
+    "latitude": "Широта",
+    "north": "Север",
+    "east": "Восток",
+    "south": "Юг",
+    "west": "Запад",
+    "fire": "Огонь",
+    "earth": "Земля",
+    "air": "Воздух",
+    "water": "Вода",
+    "and_word": "и",
+    "transits": "Транзиты для",
+    "type": "Тип",
+    "couple_aspects": "Аспекты пары",
+    "synastry_aspects": "Аспекты пары",
+    "transit_aspects": "Транзитные аспекты",
+    "planets_and_house": "Пункты для",
+    "transit_name": "В момент транзита",
+    "lunar_phase": "Лунная фаза",
+    "lunation_day": "Лунационный день",
+    "day": "День",
+    "composite_chart": "Композитная карта",
+    "midpoints": "Средние точки",
+    "north_letter": "С",
+    "east_letter": "В",
+    "south_letter": "Ю",
+    "west_letter": "З",
+    "tropical": "Тропический",
+    "sidereal": "Сидереальный",
+    "zodiac": "Зодиак",
+    "ayanamsa": "Аянамса",
+    "apparent_geocentric": "Видимый Геоцентрический",
+    "heliocentric": "Гелиоцентрический",
+    "topocentric": "Топоцентрический",
+    "true_geocentric": "Истинный Геоцентрический",
+    "new_moon": "Новолуние",
+    "waxing_crescent": "Растущий Серп",
+    "first_quarter": "Первая Четверть",
+    "waxing_gibbous": "Растущая Луна",
+    "full_moon": "Полнолуние",
+    "waning_gibbous": "Убывающая Луна",
+    "last_quarter": "Последняя Четверть",
+    "waning_crescent": "Убывающий Серп",
+    "houses": "Дома",
+    "domification": "Домификация",
+    "houses_system_A": "Равные",
+    "houses_system_B": "Алькабитиус",
+    "houses_system_C": "Кампанус",
+    "houses_system_D": "Равные (MC)",
+    "houses_system_F": "Картер поли-экв.",
+    "houses_system_H": "Горизонт/Азимут",
+    "houses_system_I": "Саншайн",
+    "houses_system_i": "Саншайн/альт.",
+    "houses_system_K": "Кох",
+    "houses_system_L": "Пуллен SD",
+    "houses_system_M": "Моринус",
+    "houses_system_N": "Равные/1=Овен",
+    "houses_system_O": "Порфирий",
+    "houses_system_P": "Плацидус",
+    "houses_system_Q": "Пуллен SR",
+    "houses_system_R": "Региомонтанус",
+    "houses_system_S": "Шрипати",
+    "houses_system_T": "Полич/Пейдж",
+    "houses_system_U": "Крусински-Пиза-Гольцер",
+    "houses_system_V": "Равные/Велоу",
+    "houses_system_W": "Равные/Целый знак",
+    "houses_system_X": "Осевая система вращения/Меридианные дома",
+    "houses_system_Y": "Дома APC",
+    "Natal": "Натальная",
+    "ExternalNatal": "Внешняя Натальная",
+    "Synastry": "Синастрия",
+    "Transit": "Транзит",
+    "Composite": "Композит",
+    "solar_return": "Солнечное возвращение",
+    "lunar_return": "Лунное возвращение",
+    "return_aspects": "Аспекты от натала к возвращению",
+    "inner_wheel": "Внутреннее колесо",
+    "outer_wheel": "Внешнее колесо",
+    "house_position_comparison": "Сравнение положений в домах",
+    "return_point": "Точка воз.",
+    "Return": "Возвращение",
+    "natal": "Радикс",
+    "perspective_type": "Перспектива",
+    "location": "Местоположение",
+    "day_of_week": "День недели",
+    "weekdays": {
+        "Monday": "Понедельник",
+        "Tuesday": "Вторник",
+        "Wednesday": "Среда",
+        "Thursday": "Четверг",
+        "Friday": "Пятница",
+        "Saturday": "Суббота",
+        "Sunday": "Воскресенье",
+    },
+    "elements": "Стихии",
+    "qualities": "Качества",
+    "cardinal": "Кардинальный",
+    "fixed": "Фиксированный",
+    "mutable": "Мутабельный",
+    "birth_chart": "Натальная Карта",
+    "chart_info_natal_label": "Натальная",
+    "chart_info_transit_label": "Транзит",
+    "celestial_points": {
+        "Sun": "Солнце",
+        "Moon": "Луна",
+        "Mercury": "Меркурий",
+        "Venus": "Венера",
+        "Mars": "Марс",
+        "Jupiter": "Юпитер",
+        "Saturn": "Сатурн",
+        "Uranus": "Уран",
+        "Neptune": "Нептун",
+        "Pluto": "Плутон",
+        "Ascendant": "Асц",
+        "Medium_Coeli": "MC",
+        "Descendant": "ДСЦ",
+        "Imum_Coeli": "IC",
+        "True_North_Lunar_Node": "С. Узел (И)",
+        "Mean_North_Lunar_Node": "С. Узел (С)",
+        "True_South_Lunar_Node": "Ю. Узел (И)",
+        "Mean_South_Lunar_Node": "Ю. Узел (С)",
+        "Chiron": "Хирон",
+        "Mean_Lilith": "Лилит",
+        "True_Lilith": "Лилит (И)",
+        "Earth": "Земля",
+        "Pholus": "Фолус",
+        "Ceres": "Церера",
+        "Pallas": "Паллада",
+        "Juno": "Юнона",
+        "Vesta": "Веста",
+        "Eris": "Эрида",
+        "Sedna": "Седна",
+        "Haumea": "Хаумеа",
+        "Makemake": "Макемаке",
+        "Ixion": "Иксион",
+        "Orcus": "Оркус",
+        "Quaoar": "Квавар",
+        "Regulus": "Регул",
+        "Spica": "Спика",
+        "Aldebaran": "Альдебаран",
+        "Antares": "Антарес",
+        "Sirius": "Сириус",
+        "Fomalhaut": "Фомальгаут",
+        "Algol": "Алголь",
+        "Betelgeuse": "Бетельгейзе",
+        "Canopus": "Канопус",
+        "Procyon": "Процион",
+        "Arcturus": "Арктур",
+        "Pollux": "Поллукс",
+        "Deneb": "Денеб",
+        "Altair": "Альтаир",
+        "Rigel": "Ригель",
+        "Achernar": "Ахернар",
+        "Capella": "Капелла",
+        "Vega": "Вега",
+        "Alcyone": "Альциона",
+        "Alphecca": "Альфекка",
+        "Algorab": "Алгораб",
+        "Deneb_Algedi": "Денеб Альгеди",
+        "Alkaid": "Алькаид",
+        "Pars_Fortunae": "Жребий Фортуны",
+        "Pars_Spiritus": "Жребий Духа",
+        "Pars_Amoris": "Жребий Любви",
+        "Pars_Fidei": "Жребий Веры",
+        "Vertex": "Вертекс",
+        "Anti_Vertex": "Анти-Вертекс",
+    },
+}
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+"""Turkish (TR) chart translation strings."""
+
+STRINGS = {
+    "info": "Bilgi",
+    "cusp": "Ev",
+    "longitude": "Boylam",
+    "latitude": "Enlem",
+    "north": "Kuzey",
+    "east": "Doğu",
+    "south": "Güney",
+    "west": "Batı",
+    "fire": "Ateş",
+    "earth": "Toprak",
+    "air": "Hava",
+    "water": "Su",
+    "and_word": "ve",
+    "transits": "Geçişler için",
+    "type": "Tür",
+    "couple_aspects": "Çiftin Açılar",
+    "synastry_aspects": "Çiftin Açılar",
+    "transit_aspects": "Geçiş Açıları",
+    "planets_and_house": "Puanlar için",
+    "transit_name": "Geçiş anında",
+    "lunar_phase": "Ay Aşaması",
+    "lunation_day": "Ay Döngüsü Günü",
+    "day": "Gün",
+    "composite_chart": "Kompozit Harita",
+    "midpoints": "Orta Noktalar",
+    "north_letter": "K",
+    "east_letter": "D",
+    "south_letter": "G",
+    "west_letter": "B",
+    "tropical": "Tropikal",
+    "sidereal": "Sidereal",
+    "zodiac": "Burçlar",
+    "ayanamsa": "Ayanamsa",
+    "apparent_geocentric": "Görünen Jeosentrik",
+    "heliocentric": "Helyosentrik",
+    "topocentric": "Toposentrik",
+    "true_geocentric": "Gerçek Jeosentrik",
+    "new_moon": "Yeni Ay",
+    "waxing_crescent": "Hilal",
+    "first_quarter": "İlk Dördün",
+    "waxing_gibbous": "Şişkin Ay",
+    "full_moon": "Dolunay",
+    "waning_gibbous": "Küçülen Şişkin Ay",
+    "last_quarter": "Son Dördün",
+    "waning_crescent": "Küçülen Hilal",
+    "houses": "Evler",
+    "domification": "Domifikasyon",
+    "houses_system_A": "Eşit",
+    "houses_system_B": "Alkabisyus",
+    "houses_system_C": "Kampanus",
+    "houses_system_D": "Eşit (MC)",
+    "houses_system_F": "Carter poli-equ.",
+    "houses_system_H": "Ufuk/Azimut",
+    "houses_system_I": "Sunshine",
+    "houses_system_i": "Sunshine/alt.",
+    "houses_system_K": "Koch",
+    "houses_system_L": "Pullen SD",
+    "houses_system_M": "Morinus",
+    "houses_system_N": "Eşit/1=Koç",
+    "houses_system_O": "Porfiryus",
+    "houses_system_P": "Placidus",
+    "houses_system_Q": "Pullen SR",
+    "houses_system_R": "Regiomontanus",
+    "houses_system_S": "Sripati",
+    "houses_system_T": "Polich/Page",
+    "houses_system_U": "Krusinski-Pisa-Goelzer",
+    "houses_system_V": "Eşit/Vehlow",
+    "houses_system_W": "Eşit/Tam burç",
+    "houses_system_X": "Eksenel dönüş sistemi/Meridyen evleri",
+    "houses_system_Y": "APC evleri",
+    "Natal": "Doğum",
+    "ExternalNatal": "Harici Doğum",
+    "Synastry": "Sinastri",
+    "Transit": "Geçiş",
+    "Composite": "Kompozit",
+    "solar_return": "Güneş Dönüşü",
+    "lunar_return": "Ay Dönüşü",
+    "return_aspects": "Doğumdan dönüşe açılar",
+    "inner_wheel": "İç çember",
+    "outer_wheel": "Dış çember",
+    "house_position_comparison": "Ev konumu karşılaştırması",
+    "return_point": "Dönüş noktası",
+    "Return": "Dönüş",
+    "natal": "Doğum haritası",
+    "perspective_type": "Perspektif",
+    "location": "Konum",
+    "day_of_week": "Haftanın günü",
+    "weekdays": {
+        "Monday": "Pazartesi",
+        "Tuesday": "Salı",
+        "Wednesday": "Çarşamba",
+        "Thursday": "Perşembe",
+        "Friday": "Cuma",
+        "Saturday": "Cumartesi",
+        "Sunday": "Pazar",
+    },
+    "elements": "Elementler",
+    "qualities": "Nitelikler",
+    "cardinal": "Kardinal",
+    "fixed": "Sabit",
+    "mutable": "Değişken",
+    "birth_chart": "Doğum Haritası",
+    "chart_info_natal_label": "Doğum",
+    "chart_info_transit_label": "Geçiş",
+    "celestial_points": {
+        "Sun": "Güneş",
+        "Moon": "Ay",
+        "Mercury": "Merkür",
+        "Venus": "Venüs",
+        "Mars": "Mars",
+        "Jupiter": "Jüpiter",
+        "Saturn": "Satürn",
+        "Uranus": "Uranüs",
+        "Neptune": "Neptün",
+        "Pluto": "Plüton",
+        "Ascendant": "Yükselen",
+        "Medium_Coeli": "MC",
+        "Descendant": "İK",
+        "Imum_Coeli": "IC",
+        "True_North_Lunar_Node": "K. Düğümü (T)",
+        "Mean_North_Lunar_Node": "K. Düğümü (M)",
+        "Chiron": "Kiron",
+        "Mean_Lilith": "Lilith",
+        "True_South_Lunar_Node": "G. Düğümü (T)",
+        "Mean_South_Lunar_Node": "G. Düğümü (M)",
+        "True_Lilith": "Lilith (T)",
+        "Earth": "Dünya",
+        "Pholus": "Pholus",
+        "Ceres": "Ceres",
+        "Pallas": "Pallas",
+        "Juno": "Juno",
+        "Vesta": "Vesta",
+        "Eris": "Eris",
+        "Sedna": "Sedna",
+        "Haumea": "Haumea",
+        "Makemake": "Makemake",
+        "Ixion": "Ixion",
+        "Orcus": "Orcus",
+        "Quaoar": "Quaoar",
+        "Regulus": "Regulus",
+        "Spica": "Spica",
+        "Aldebaran": "Aldebaran",
+        "Antares": "Antares",
+        "Sirius": "Sirius",
+        "Fomalhaut": "Fomalhaut",
+        "Algol": "Algol",
+        "Betelgeuse": "Betelgeuse",
+        "Canopus": "Canopus",
+        "Procyon": "Procyon",
+        "Arcturus": "Arcturus",
+        "Pollux": "Pollux",
+        "Deneb": "Deneb",
+        "Altair": "Altair",
+        "Rigel": "Rigel",
+        "Achernar": "Achernar",
+        "Capella": "Capella",
+        "Vega": "Vega",
+        "Alcyone": "Alcyone",
+        "Alphecca": "Alphecca",
+        "Algorab": "Algorab",
+        "Deneb_Algedi": "Deneb Algedi",
+        "Alkaid": "Alkaid",
+        "Pars_Fortunae": "Talih Payı",
+        "Pars_Spiritus": "Ruh Payı",
+        "Pars_Amoris": "Aşk Payı",
+        "Pars_Fidei": "İnanç Payı",
+        "Vertex": "Vertex",
+        "Anti_Vertex": "Anti-Vertex",
+    },
+}
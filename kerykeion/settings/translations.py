@@ -4,7 +4,7 @@ Simple helpers to access chart translation strings.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from copy import deepcopy
 from typing import Any, Optional, TypeVar
 
@@ -15,13 +15,38 @@ T = TypeVar("T")
 _SENTINEL = object()
 
 
-def load_language_settings(overrides: Optional[Mapping[str, Any]] = None) -> dict[str, dict[str, Any]]:
-    """Return the available language settings merged with optional overrides."""
-    languages = deepcopy(LANGUAGE_SETTINGS)
-    if overrides:
-        data = overrides.get("language_settings", overrides)
-        languages = _deep_merge(languages, data)
-    return languages
+def load_language_settings(
+    overrides: Optional[Mapping[str, Any]] = None,
+    *,
+    languages: Optional[Iterable[str]] = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Return the available language settings merged with optional overrides.
+
+    Args:
+        overrides: Per-language overrides, optionally wrapped in a
+            ``"language_settings"`` key. Nested dictionaries are merged on top
+            of the bundled strings.
+        languages: Restrict the result to these language codes. Only the
+            selected bundled languages are loaded and copied, and overrides for
+            other languages are ignored. ``None`` returns every language.
+
+    Returns:
+        dict[str, dict[str, Any]]: Independent copies of the resolved strings,
+        keyed by language code.
+    """
+    data: Mapping[str, Any] = overrides.get("language_settings", overrides) if overrides else {}
+    if languages is None:
+        selected = list(LANGUAGE_SETTINGS)
+        selected.extend(code for code in data if code not in LANGUAGE_SETTINGS)
+    else:
+        selected = list(dict.fromkeys(languages))
+        data = {code: data[code] for code in selected if code in data}
+
+    resolved = {code: deepcopy(LANGUAGE_SETTINGS[code]) for code in selected if code in LANGUAGE_SETTINGS}
+    if data:
+        resolved = _deep_merge(resolved, data)
+    return resolved
 
 
 def get_translations(
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Sky Cache Module
+
+This module provides SkyCache, a shared cache of the location-independent part
+of subject calculation.
+
+AstrologicalSubjectFactory computes a subject in two stages. The sky stage
+calculates the planets, lunar nodes, asteroids, TNOs and fixed stars; with a
+geocentric or heliocentric perspective these depend only on the instant and
+the zodiac settings. The location stage calculates houses, angles, Vertex,
+sect and Arabic parts, and places the bodies of the sky in the houses.
+
+While a cache is active (``with cache.activate():``) every sky snapshot is
+stored under its Julian Day, calculation flags (zodiac and perspective),
+sidereal mode and requested points, and reused by later subjects with the same
+key. Charts for many places at the same instant therefore cost one sky
+calculation plus one location stage per place. Topocentric charts, whose
+positions depend on the observer, and subjects calculated while a
+ChebyshevPositionCache is active are never cached. The least recently used
+snapshots are evicted beyond ``maxsize``.
+
+Classes:
+    SkyCache: LRU cache of sky snapshots shared between subjects
+
+Example:
+    >>> from kerykeion import AstrologicalSubjectFactory
+    >>> from kerykeion.sky_cache import SkyCache
+    >>> cache = SkyCache()
+    >>> with cache.activate():
+    ...     subjects = [
+    ...         AstrologicalSubjectFactory.from_iso_utc_time(city, "2025-01-01T12:00:00Z", lng=lng, lat=lat, online=False)
+    ...         for city, lng, lat in cities
+    ...     ]
+    >>> cache.hits, cache.misses
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Hashable, Iterator, Optional
+
+from kerykeion.astrological_subject_factory import _ACTIVE_SKY_CACHE, SkySnapshot
+from kerykeion.schemas import KerykeionException
+
+
+#: Number of sky snapshots kept by default.
+DEFAULT_MAXSIZE = 1024
+
+
+class SkyCache:
+    """
+    Least recently used cache of sky snapshots.
+
+    The cache is thread safe and can be shared by subjects calculated in
+    different threads; ``activate()`` installs it for the current context only.
+
+    Args:
+        maxsize: Maximum number of snapshots kept (default 1024).
+
+    Attributes:
+        maxsize: Maximum number of snapshots kept.
+        hits: Number of sky stages answered from the cache.
+        misses: Number of sky stages calculated and stored.
+
+    Raises:
+        KerykeionException: If maxsize is smaller than 1.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if maxsize < 1:
+            raise KerykeionException(f"SkyCache maxsize must be at least 1, got {maxsize}.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._snapshots: "OrderedDict[Hashable, SkySnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __repr__(self) -> str:
+        return f"SkyCache(maxsize={self.maxsize}, size={len(self)}, hits={self.hits}, misses={self.misses})"
+
+    def lookup(self, key: Hashable) -> Optional[SkySnapshot]:
+        """
+        Return the snapshot stored under ``key`` and mark it as recently used.
+
+        Args:
+            key: Sky key built by AstrologicalSubjectFactory.
+
+        Returns:
+            Optional[SkySnapshot]: The snapshot, or None (counted as a miss) when absent.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self._snapshots.move_to_end(key)
+            self.hits += 1
+            return snapshot
+
+    def store(self, key: Hashable, snapshot: SkySnapshot) -> None:
+        """
+        Store a snapshot, evicting the least recently used ones beyond ``maxsize``.
+
+        Args:
+            key: Sky key built by AstrologicalSubjectFactory.
+            snapshot: Positions of the requested bodies.
+        """
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.maxsize:
+                self._snapshots.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every snapshot and reset the hit and miss counters."""
+        with self._lock:
+            self._snapshots.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @contextmanager
+    def activate(self) -> Iterator["SkyCache"]:
+        """
+        Make AstrologicalSubjectFactory share sky snapshots through this cache inside the ``with`` block.
+
+        Example:
+            >>> with cache.activate():
+            ...     subject = AstrologicalSubjectFactory.from_birth_data(...)
+        """
+        token = _ACTIVE_SKY_CACHE.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_SKY_CACHE.reset(token)
+
+
+__all__ = ["DEFAULT_MAXSIZE", "SkyCache"]
@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+"""
+Transit Timeline Module
+
+This module converts between the full transit output of TransitsTimeRangeFactory
+(one TransitMomentModel with a complete AspectModel list per sampled moment) and
+its delta-encoded form, TransitTimelineModel.
+
+Consecutive moments share almost all of their aspects, so the full form grows
+with the sampling density. The timeline stores each aspect run once, as a
+TransitAspectSpanModel: the fields that do not change (points, owners, natal
+longitude, aspect) plus the start, end and exact moments, and the trajectories
+of the orb and movement over the run. Its size grows with the number of runs
+instead.
+
+By default only those events and orbs are kept. A lossless timeline
+(``lossless=True``) also stores the trajectories of the transiting longitude
+and speed, so that every AspectModel of every moment is rebuilt exactly, in the
+AspectsFactory order, on demand.
+
+Classes:
+    TransitTimelineEvent: A start, exact or end moment of an aspect span
+    TransitTimelineEncoder: Incremental delta encoder, one moment at a time
+
+Functions:
+    build_transit_timeline: Encode transit moments into a TransitTimelineModel
+    transit_moment_at: Rebuild the TransitMomentModel of one moment
+    iter_transit_moments: Rebuild every TransitMomentModel in time order
+    expand_transit_timeline: Rebuild the full TransitsTimeRangeModel
+    iter_timeline_events: Stream the start, exact and end events in time order
+
+Example:
+    >>> from kerykeion.transit_timeline import expand_transit_timeline, iter_timeline_events
+    >>> factory = TransitsTimeRangeFactory(natal_chart, ephemeris_data)
+    >>> for event in iter_timeline_events(factory.get_transit_timeline()):
+    ...     print(event.date, event.kind, event.span.p1_name, event.span.aspect, event.span.p2_name)
+    >>> full = expand_transit_timeline(factory.get_transit_timeline(lossless=True))  # Same as get_transit_moments()
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+from typing import Dict, Iterable, Iterator, List, Literal, NamedTuple, Optional, Tuple, Union
+
+from kerykeion.instrumentation import swe
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_literals import AspectMovementType
+from kerykeion.schemas.kr_models import (
+    AspectModel,
+    AstrologicalSubjectModel,
+    TransitAspectSpanModel,
+    TransitMomentModel,
+    TransitsTimeRangeModel,
+    TransitTimelineModel,
+)
+from kerykeion.settings.chart_defaults import DEFAULT_CELESTIAL_POINTS_SETTINGS
+
+TimelineEventKind = Literal["start", "exact", "end"]
+
+_MOVEMENT_CODES: Dict[str, str] = {"Applying": "A", "Separating": "S", "Static": "X"}
+_MOVEMENTS: Dict[str, AspectMovementType] = {"A": "Applying", "S": "Separating", "X": "Static"}
+_EVENT_ORDER: Dict[str, int] = {"start": 0, "exact": 1, "end": 2}
+
+# AspectsFactory lists the aspects of a moment in DEFAULT_CELESTIAL_POINTS_SETTINGS
+# order, by first point and then by second point.
+_POINT_RANK: Dict[str, int] = {point["name"]: rank for rank, point in enumerate(DEFAULT_CELESTIAL_POINTS_SETTINGS)}
+
+# (p1_name, p2_name, aspect): one run of an aspect is one span
+_SpanKey = Tuple[str, str, str]
+
+
+class TransitTimelineEvent(NamedTuple):
+    """
+    A start, exact or end moment of a transit aspect span.
+
+    Attributes:
+        kind: "start" (first moment within orb), "exact" (moment closest to the exact
+            aspect) or "end" (last moment within orb).
+        index: Index of the moment in the timeline dates.
+        date: ISO formatted UTC datetime of the moment.
+        orbit: Orb at that moment.
+        span: The aspect span the event belongs to.
+    """
+
+    kind: TimelineEventKind
+    index: int
+    date: str
+    orbit: float
+    span: TransitAspectSpanModel
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+
+class _OpenSpan:
+    """A span still receiving moments, with plain lists for cheap appends."""
+
+    __slots__ = ("first", "start_index", "positions", "speeds", "orbits", "movements")
+
+    def __init__(self, aspect: AspectModel, index: int):
+        self.first = aspect
+        self.start_index = index
+        self.positions: List[float] = []
+        self.speeds: List[float] = []
+        self.orbits: List[float] = []
+        self.movements: List[str] = []
+
+    def continues_with(self, aspect: AspectModel) -> bool:
+        """True if ``aspect`` only differs from the run in its per-moment fields."""
+        first = self.first
+        return (
+            aspect.p2_abs_pos == first.p2_abs_pos
+            and aspect.p2_speed == first.p2_speed
+            and aspect.p1_owner == first.p1_owner
+            and aspect.p2_owner == first.p2_owner
+        )
+
+    def append(self, aspect: AspectModel) -> None:
+        self.positions.append(aspect.p1_abs_pos)
+        self.speeds.append(aspect.p1_speed)
+        self.orbits.append(aspect.orbit)
+        self.movements.append(_MOVEMENT_CODES[aspect.aspect_movement])
+
+    def close(self, clipped_start: bool, clipped_end: bool, lossless: bool) -> TransitAspectSpanModel:
+        first = self.first
+        return TransitAspectSpanModel(
+            p1_name=first.p1_name,
+            p1_owner=first.p1_owner,
+            p2_name=first.p2_name,
+            p2_owner=first.p2_owner,
+            p2_abs_pos=first.p2_abs_pos,
+            p2_speed=first.p2_speed,
+            aspect=first.aspect,
+            aspect_degrees=first.aspect_degrees,
+            p1=first.p1,
+            p2=first.p2,
+            start_index=self.start_index,
+            end_index=self.start_index + len(self.orbits) - 1,
+            exact_indices=[
+                self.start_index + offset
+                for offset in _exact_offsets(
+                    self.positions, self.orbits, first.p2_abs_pos, first.aspect_degrees, clipped_start, clipped_end
+                )
+            ],
+            p1_abs_positions=self.positions if lossless else None,
+            p1_speeds=self.speeds if lossless else None,
+            orbits=self.orbits,
+            movements="".join(self.movements),
+        )
+
+
+def _exact_offsets(
+    positions: List[float],
+    orbits: List[float],
+    natal_abs_pos: float,
+    aspect_degrees: float,
+    clipped_start: bool,
+    clipped_end: bool,
+) -> List[int]:
+    """
+    Offsets of the samples closest to each exact aspect of a run.
+
+    The aspect perfects where the transiting longitude crosses one of the two
+    exact points (natal longitude plus or minus the aspect angle). Between two
+    samples of the run, that shows as a sign change of the signed distance to the
+    nearer exact point. A fast point can also cross just before the first sample
+    of the run (its orb grows at once) or just after the last one (its orb is
+    still shrinking), and a run of a single sample crosses around it. The run's
+    edges only count when they are not the edges of the sampled range.
+    """
+    offsets = []
+    last = len(positions) - 1
+    if not clipped_start and (orbits[0] < orbits[1] if last else not clipped_end):
+        offsets.append(0)
+    ahead = natal_abs_pos + aspect_degrees
+    behind = natal_abs_pos - aspect_degrees
+    for offset in range(last):
+        target = (
+            ahead
+            if abs(swe.difdeg2n(positions[offset], ahead)) <= abs(swe.difdeg2n(positions[offset], behind))
+            else behind
+        )
+        before = swe.difdeg2n(positions[offset], target)
+        after = swe.difdeg2n(positions[offset + 1], target)
+        if before == 0:
+            offsets.append(offset)
+        elif (before < 0 < after or after < 0 < before) and abs(after - before) < 180:
+            offsets.append(offset if orbits[offset] <= orbits[offset + 1] else offset + 1)
+    if not clipped_end and (orbits[last] < orbits[last - 1] if last else not clipped_start):
+        offsets.append(last)
+    return sorted(set(offsets))
+
+
+class TransitTimelineEncoder:
+    """
+    Delta-encode transit moments one at a time.
+
+    Only the aspect runs still open are kept in memory besides the finished spans,
+    so a TransitsTimeRangeFactory stream can be encoded without building the full
+    moment list.
+
+    Args:
+        subject: Natal subject stored in the timeline. Defaults to None.
+        lossless: Also store the transiting positions and speeds of every moment,
+            so that the moments can be rebuilt. Defaults to False.
+    """
+
+    def __init__(self, subject: Optional[AstrologicalSubjectModel] = None, lossless: bool = False):
+        self.subject = subject
+        self.lossless = lossless
+        self._dates: List[str] = []
+        self._open: Dict[_SpanKey, _OpenSpan] = {}
+        self._closed: List[TransitAspectSpanModel] = []
+
+    def add_moment(self, moment: TransitMomentModel) -> None:
+        """Add the next moment in time order."""
+        index = len(self._dates)
+        self._dates.append(moment.date)
+        current: Dict[_SpanKey, _OpenSpan] = {}
+        for aspect in moment.aspects:
+            key = (aspect.p1_name, aspect.p2_name, aspect.aspect)
+            span = self._open.pop(key, None)
+            if span is not None and not span.continues_with(aspect):
+                self._closed.append(span.close(span.start_index == 0, False, self.lossless))
+                span = None
+            if span is None:
+                span = _OpenSpan(aspect, index)
+            span.append(aspect)
+            current[key] = span
+        for span in self._open.values():
+            self._closed.append(span.close(span.start_index == 0, False, self.lossless))
+        self._open = current
+
+    def finish(self) -> TransitTimelineModel:
+        """Close the runs still open at the last moment and return the timeline."""
+        for span in self._open.values():
+            self._closed.append(span.close(span.start_index == 0, True, self.lossless))
+        self._open = {}
+        spans = sorted(self._closed, key=_span_sort_key)
+        return TransitTimelineModel(spans=spans, subject=self.subject, dates=self._dates)
+
+
+def _span_sort_key(span: TransitAspectSpanModel) -> Tuple[int, int, int]:
+    return (
+        span.start_index,
+        _POINT_RANK.get(span.p1_name, len(_POINT_RANK)),
+        _POINT_RANK.get(span.p2_name, len(_POINT_RANK)),
+    )
+
+
+def build_transit_timeline(
+    transits: Union[TransitsTimeRangeModel, Iterable[TransitMomentModel]],
+    subject: Optional[AstrologicalSubjectModel] = None,
+    lossless: bool = False,
+) -> TransitTimelineModel:
+    """
+    Delta-encode transit moments.
+
+    Args:
+        transits: A TransitsTimeRangeModel, or TransitMomentModels in time order.
+        subject: Natal subject stored in the timeline; defaults to the subject of a
+            TransitsTimeRangeModel.
+        lossless: Also store the transiting positions and speeds, so that
+            expand_transit_timeline() can rebuild the same moments. Defaults to False.
+
+    Returns:
+        TransitTimelineModel: The timeline.
+    """
+    if isinstance(transits, TransitsTimeRangeModel):
+        subject = transits.subject if subject is None else subject
+        transits = transits.transits
+    encoder = TransitTimelineEncoder(subject, lossless)
+    for moment in transits:
+        encoder.add_moment(moment)
+    return encoder.finish()
+
+
+# =============================================================================
+# DECODING
+# =============================================================================
+
+
+def _check_lossless(timeline: TransitTimelineModel) -> None:
+    if any(span.p1_abs_positions is None or span.p1_speeds is None for span in timeline.spans):
+        raise KerykeionException(
+            "The timeline stores no transiting positions and speeds to rebuild the moments from. "
+            "Build it with lossless=True."
+        )
+
+
+def _aspect_at(span: TransitAspectSpanModel, index: int) -> AspectModel:
+    offset = index - span.start_index
+    p1_abs_pos = span.p1_abs_positions[offset]  # type: ignore[index]
+    return AspectModel(
+        p1_name=span.p1_name,
+        p1_owner=span.p1_owner,
+        p1_abs_pos=p1_abs_pos,
+        p2_name=span.p2_name,
+        p2_owner=span.p2_owner,
+        p2_abs_pos=span.p2_abs_pos,
+        aspect=span.aspect,
+        orbit=span.orbits[offset],
+        aspect_degrees=span.aspect_degrees,
+        diff=abs(p1_abs_pos - span.p2_abs_pos),
+        p1=span.p1,
+        p2=span.p2,
+        p1_speed=span.p1_speeds[offset],  # type: ignore[index]
+        p2_speed=span.p2_speed,
+        aspect_movement=_MOVEMENTS[span.movements[offset]],
+    )
+
+
+def _moment(timeline: TransitTimelineModel, index: int, spans: Iterable[TransitAspectSpanModel]) -> TransitMomentModel:
+    ordered = sorted(
+        spans,
+        key=lambda span: (
+            _POINT_RANK.get(span.p1_name, len(_POINT_RANK)),
+            _POINT_RANK.get(span.p2_name, len(_POINT_RANK)),
+        ),
+    )
+    return TransitMomentModel(date=timeline.dates[index], aspects=[_aspect_at(span, index) for span in ordered])
+
+
+def transit_moment_at(timeline: TransitTimelineModel, index: int) -> TransitMomentModel:
+    """
+    Rebuild the TransitMomentModel of one moment.
+
+    Args:
+        timeline: The delta-encoded timeline, built with ``lossless=True``.
+        index: Index of the moment in ``timeline.dates`` (negative indices count from the end).
+
+    Raises:
+        KerykeionException: If the index is out of range or the timeline is not lossless.
+    """
+    _check_lossless(timeline)
+    count = len(timeline.dates)
+    if not -count <= index < count:
+        raise KerykeionException(f"Moment index {index} is out of range for a timeline of {count} moments.")
+    index %= count
+    return _moment(timeline, index, (span for span in timeline.spans if span.start_index <= index <= span.end_index))
+
+
+def iter_transit_moments(timeline: TransitTimelineModel) -> Iterator[TransitMomentModel]:
+    """
+    Rebuild every TransitMomentModel of the timeline, in time order, one at a time.
+
+    Raises:
+        KerykeionException: If the timeline was not built with ``lossless=True``.
+    """
+    _check_lossless(timeline)
+    spans = sorted(timeline.spans, key=lambda span: span.start_index)
+    next_span = 0
+    active: List[TransitAspectSpanModel] = []
+    for index in range(len(timeline.dates)):
+        while next_span < len(spans) and spans[next_span].start_index == index:
+            active.append(spans[next_span])
+            next_span += 1
+        active = [span for span in active if span.end_index >= index]
+        yield _moment(timeline, index, active)
+
+
+def expand_transit_timeline(timeline: TransitTimelineModel) -> TransitsTimeRangeModel:
+    """Rebuild the full TransitsTimeRangeModel a lossless timeline was encoded from."""
+    return TransitsTimeRangeModel(
+        transits=list(iter_transit_moments(timeline)),
+        subject=timeline.subject,
+        dates=list(timeline.dates),
+    )
+
+
+def iter_timeline_events(timeline: TransitTimelineModel) -> Iterator[TransitTimelineEvent]:
+    """
+    Stream the start, exact and end events of every span in time order.
+
+    Events of the same moment come as starts, then exacts, then ends. A span
+    already within orb at the first moment starts there, and a span still within
+    orb at the last moment ends there.
+    """
+    events = []
+    for span in timeline.spans:
+        events.append(("start", span.start_index, span))
+        events.extend(("exact", index, span) for index in span.exact_indices)
+        events.append(("end", span.end_index, span))
+    events.sort(key=lambda event: (event[1], _EVENT_ORDER[event[0]]))
+    for kind, index, span in events:
+        yield TransitTimelineEvent(
+            kind=kind,  # type: ignore[arg-type]
+            index=index,
+            date=timeline.dates[index],
+            orbit=span.orbits[index - span.start_index],
+            span=span,
+        )
+
+
+__all__ = [
+    "TimelineEventKind",
+    "TransitTimelineEvent",
+    "TransitTimelineEncoder",
+    "build_transit_timeline",
+    "transit_moment_at",
+    "iter_transit_moments",
+    "expand_transit_timeline",
+    "iter_timeline_events",
+]
@@ -12,6 +12,7 @@ Key Features:
     - Structured output models for data analysis
     - Integration with ephemeris data generation
     - Batch processing of multiple time points
+    - Delta-encoded timeline output (aspect start, exact and end moments)
 
 The module generates comprehensive transit data by analyzing the angular relationships
 between transiting celestial bodies and natal chart positions, creating timestamped
@@ -55,16 +56,22 @@ Copyright: (C) 2025 Kerykeion Project
 License: AGPL-3.0
 """
 
-from typing import Union, List, Optional
+from typing import Iterator, Union, List, Optional
 from datetime import datetime, timedelta
 from kerykeion.schemas.kr_models import AstrologicalSubjectModel
 from kerykeion.astrological_subject_factory import AstrologicalSubjectFactory
 from kerykeion.aspects import AspectsFactory
 from kerykeion.ephemeris_data_factory import EphemerisDataFactory
 from kerykeion.schemas.kr_literals import AstrologicalPoint
-from kerykeion.schemas.kr_models import ActiveAspect, TransitMomentModel, TransitsTimeRangeModel
+from kerykeion.schemas.kr_models import (
+    ActiveAspect,
+    TransitMomentModel,
+    TransitsTimeRangeModel,
+    TransitTimelineModel,
+)
 from kerykeion.schemas.settings_models import KerykeionSettingsModel
 from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
+from kerykeion.transit_timeline import TransitTimelineEncoder
 from pathlib import Path
 
 
@@ -235,10 +242,50 @@ class TransitsTimeRangeFactory:
         See Also:
             TransitMomentModel: Individual transit moment structure
             TransitsTimeRangeModel: Complete transit dataset structure
+            get_transit_timeline(): Compact, delta-encoded version of this result
             AspectsFactory: Underlying aspect calculation engine
         """
-        transit_moments = []
+        transit_moments = list(self._iter_transit_moments())
 
+        # Create and return the complete transits model
+        return TransitsTimeRangeModel(
+            dates=[point.iso_formatted_utc_datetime for point in self.ephemeris_data_points],
+            subject=self.natal_chart,
+            transits=transit_moments,
+        )
+
+    def get_transit_timeline(self, lossless: bool = False) -> TransitTimelineModel:
+        """
+        Calculate the transits as a delta-encoded timeline.
+
+        The aspects are the ones get_transit_moments() would return. Instead of a
+        full aspect list per moment, the result holds one span per aspect run:
+        its start, end and exact moments and its orb trajectory. Its size follows
+        the number of aspect runs rather than the sampling density. The moments are
+        encoded as they are computed, so the full per-moment list is never built.
+
+        Args:
+            lossless: Also store the transiting positions and speeds of every
+                moment, so that the full moments can be rebuilt. Defaults to False.
+
+        Returns:
+            TransitTimelineModel: The timeline. ``kerykeion.transit_timeline`` streams
+            its start/exact/end events and, for a lossless timeline, rebuilds any
+            moment, or the whole TransitsTimeRangeModel, on demand.
+
+        Examples:
+            >>> from kerykeion.transit_timeline import expand_transit_timeline, transit_moment_at
+            >>> timeline = factory.get_transit_timeline(lossless=True)
+            >>> moment = transit_moment_at(timeline, 10)  # Same as get_transit_moments().transits[10]
+            >>> full = expand_transit_timeline(timeline)  # Same as get_transit_moments()
+        """
+        encoder = TransitTimelineEncoder(self.natal_chart, lossless)
+        for moment in self._iter_transit_moments():
+            encoder.add_moment(moment)
+        return encoder.finish()
+
+    def _iter_transit_moments(self) -> Iterator[TransitMomentModel]:
+        """Lazily compute one TransitMomentModel per ephemeris data point."""
         for ephemeris_point in self.ephemeris_data_points:
             # Calculate aspects between transit positions and natal chart
             aspects = AspectsFactory.dual_chart_aspects(
@@ -251,21 +298,11 @@ class TransitsTimeRangeFactory:
                 second_subject_is_fixed=True,  # Natal is fixed
             ).aspects
 
-            # Create a transit moment for this point in time
-            transit_moments.append(
-                TransitMomentModel(
-                    date=ephemeris_point.iso_formatted_utc_datetime,
-                    aspects=aspects,
-                )
+            yield TransitMomentModel(
+                date=ephemeris_point.iso_formatted_utc_datetime,
+                aspects=aspects,
             )
 
-        # Create and return the complete transits model
-        return TransitsTimeRangeModel(
-            dates=[point.iso_formatted_utc_datetime for point in self.ephemeris_data_points],
-            subject=self.natal_chart,
-            transits=transit_moments,
-        )
-
 
 if __name__ == "__main__":
     # Create a natal chart for the subject
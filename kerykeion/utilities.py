@@ -31,7 +31,8 @@ from kerykeion.schemas.kr_literals import (
     AstrologicalPoint,
     Houses,
 )
-from typing import Union, Optional, get_args, cast
+from typing import Callable, Union, Optional, get_args, cast
+from functools import lru_cache
 from logging import DEBUG, INFO, WARNING, ERROR, CRITICAL, basicConfig, getLogger
 import math
 import re
@@ -659,12 +660,90 @@ def julian_to_datetime(jd: float) -> datetime:
 # =============================================================================
 
 
+# Compiled once at import time: the inliner runs on every SVG rendered with
+# ``remove_css_variables=True``.
+_STYLE_TAG_PATTERN = re.compile(r"<style.*?>(.*?)</style>", re.DOTALL)
+_CSS_VARIABLE_DEFINITION_PATTERN = re.compile(r"--([a-zA-Z0-9_-]+)\s*:\s*([^;]+);")
+_CSS_VARIABLE_USAGE_PATTERN = re.compile(r"var\(\s*(--[\w-]+)\s*(,\s*([^)]+))?\s*\)")
+
+
+def _substitute_css_variable_references(text: str, lookup: Callable[[str], Optional[str]]) -> str:
+    """
+    Replace every var() reference in ``text`` in a single pass.
+
+    Args:
+        text: The text containing var() references
+        lookup: Callable returning the resolved value of a variable, or None if unknown
+
+    Returns:
+        The text with every reference replaced by its value, its fallback or an empty string
+    """
+
+    def replace_css_variable_reference(match: "re.Match[str]") -> str:
+        value = lookup(match.group(1).strip())
+        if value is not None:
+            return value
+
+        fallback_value = match.group(3)
+        if fallback_value:
+            return _substitute_css_variable_references(fallback_value.strip(), lookup)
+        return ""
+
+    return _CSS_VARIABLE_USAGE_PATTERN.sub(replace_css_variable_reference, text)
+
+
+@lru_cache(maxsize=32)
+def _resolve_css_variable_map(style_blocks: tuple[str, ...]) -> dict[str, str]:
+    """
+    Collect the CSS variables defined in the style blocks and resolve them to fixed values.
+
+    Nested references (a variable defined through another ``var()``) are expanded
+    recursively. A reference that is part of a cycle is treated as undefined, so it
+    falls back to its fallback value or to an empty string.
+
+    The result is cached per set of style blocks, which in practice means once per
+    chart theme. Callers must not mutate the returned dictionary.
+
+    Args:
+        style_blocks: Contents of the ``<style>`` blocks, in document order
+
+    Returns:
+        Mapping of variable names (including the leading ``--``) to resolved values
+    """
+    raw_variable_map: dict[str, str] = {}
+    for style_block in style_blocks:
+        for match in _CSS_VARIABLE_DEFINITION_PATTERN.finditer(style_block):
+            raw_variable_map[f"--{match.group(1)}"] = match.group(2).strip()
+
+    resolved_variable_map: dict[str, str] = {}
+    resolving: set[str] = set()
+
+    def resolve(variable_name: str) -> Optional[str]:
+        if variable_name in resolved_variable_map:
+            return resolved_variable_map[variable_name]
+        if variable_name not in raw_variable_map or variable_name in resolving:
+            return None
+
+        resolving.add(variable_name)
+        value = _substitute_css_variable_references(raw_variable_map[variable_name], resolve)
+        resolving.discard(variable_name)
+
+        resolved_variable_map[variable_name] = value
+        return value
+
+    for variable_name in raw_variable_map:
+        resolve(variable_name)
+
+    return resolved_variable_map
+
+
 def inline_css_variables_in_svg(svg_content: str) -> str:
     """
     Replace CSS custom properties (variables) with their values in SVG content.
 
-    Extracts CSS variables from style blocks, replaces var() references with actual values,
-    and removes all style blocks from the SVG.
+    Extracts CSS variables from style blocks, resolves nested references once,
+    replaces var() references with the resolved values in a single pass, and
+    removes all style blocks from the SVG.
 
     Args:
         svg_content: The original SVG string with CSS variables
@@ -672,35 +751,18 @@ def inline_css_variables_in_svg(svg_content: str) -> str:
     Returns:
         Modified SVG with CSS variables inlined and style blocks removed
     """
-    css_variable_map = {}
-    style_tag_pattern = re.compile(r"<style.*?>(.*?)</style>", re.DOTALL)
-    style_blocks = style_tag_pattern.findall(svg_content)
+    style_blocks = tuple(_STYLE_TAG_PATTERN.findall(svg_content))
+    css_variable_map = _resolve_css_variable_map(style_blocks)
 
-    for style_block in style_blocks:
-        css_variable_pattern = re.compile(r"--([a-zA-Z0-9_-]+)\s*:\s*([^;]+);")
-        for match in css_variable_pattern.finditer(style_block):
-            variable_name = match.group(1)
-            variable_value = match.group(2).strip()
-            css_variable_map[f"--{variable_name}"] = variable_value
-
-    svg_without_style_blocks = style_tag_pattern.sub("", svg_content)
-
-    def replace_css_variable_reference(match):
-        variable_name = match.group(1).strip()
-        fallback_value = match.group(3) if match.group(3) else None
-
-        if variable_name in css_variable_map:
-            return css_variable_map[variable_name]
-        elif fallback_value:
-            return fallback_value.strip()
-        else:
-            return ""
-
-    variable_usage_pattern = re.compile(r"var\(\s*(--[\w-]+)\s*(,\s*([^)]+))?\s*\)")
-
-    processed_svg = svg_without_style_blocks
-    while variable_usage_pattern.search(processed_svg):
-        processed_svg = variable_usage_pattern.sub(lambda m: replace_css_variable_reference(m), processed_svg)
+    svg_without_style_blocks = _STYLE_TAG_PATTERN.sub("", svg_content)
+
+    processed_svg = _substitute_css_variable_references(svg_without_style_blocks, css_variable_map.get)
+
+    # The usage pattern stops a fallback at its first ")", so a nested fallback
+    # such as var(--a, var(--b)) can leave a reference behind. The substring
+    # check keeps the common case to a single regex pass.
+    while "var(" in processed_svg and _CSS_VARIABLE_USAGE_PATTERN.search(processed_svg):
+        processed_svg = _substitute_css_variable_references(processed_svg, css_variable_map.get)
 
     return processed_svg
 
@@ -0,0 +1,627 @@
+# -*- coding: utf-8 -*-
+"""
+Wire Format Module
+
+This module provides a compact, versioned binary encoding of subjects and
+chart data, meant for caches and for passing results between processes or
+services where JSON is too large and too slow to parse.
+
+The layout is derived from the Pydantic models themselves, so every field is
+covered and the order of fields (and therefore of points) is fixed by the
+model definitions:
+
+* Strings are stored once in a table at the start of the payload and are
+  referenced by index.
+* Literal values (signs, elements, point names, aspect movements...) are
+  stored as one or two byte codes, the index of the value in the Literal.
+* Flat records (points, aspects, distributions) are packed with a single
+  ``struct`` call: a bitmask of the optional fields that are set, followed by
+  the codes, indexes and float64 values of the fields in model order.
+* Other models store the same bitmask, then their fields one after the other;
+  lists are prefixed with their length.
+
+Floats are stored as float64, so a decoded model is equal to the encoded one.
+Decoding does not run Pydantic validation: the payload can only carry values
+of the declared types, and models are built as ``model_construct`` does.
+
+Every payload starts with a header holding the magic bytes, the format
+version, the root model and a fingerprint of the model schemas. Decoding a
+payload written by another format version, or against models whose fields
+have changed, raises KerykeionException instead of returning wrong data.
+
+Header layout (little endian):
+    3 bytes magic ``KRW``, 1 byte format version, 1 byte root model code,
+    4 bytes schema fingerprint (CRC32)
+
+Functions:
+    to_wire: Encode a subject or chart data model
+    from_wire: Decode a payload produced by to_wire
+
+Example:
+    >>> from kerykeion import AstrologicalSubjectFactory, ChartDataFactory
+    >>> from kerykeion.wire_format import from_wire, to_wire
+    >>> subject = AstrologicalSubjectFactory.from_birth_data(
+    ...     "John", 1990, 1, 1, 12, 0, lng=0.0, lat=51.5, tz_str="Europe/London", online=False
+    ... )
+    >>> payload = to_wire(ChartDataFactory.create_natal_chart_data(subject))
+    >>> chart_data = from_wire(payload)
+
+Author: Giacomo Battaglia
+Copyright: (C) 2025 Kerykeion Project
+License: AGPL-3.0
+"""
+
+import struct
+import zlib
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from typing_extensions import is_typeddict
+
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_models import (
+    AstrologicalSubjectModel,
+    CompositeSubjectModel,
+    DualChartDataModel,
+    PlanetReturnModel,
+    SingleChartDataModel,
+)
+
+WIRE_FORMAT_VERSION = 1
+
+_MAGIC = b"KRW"
+_HEADER = struct.Struct("<3sBBI")
+
+# Models that can be the root of a payload, by code. Codes are part of the format.
+_ROOT_MODELS: Tuple[Type[BaseModel], ...] = (
+    AstrologicalSubjectModel,
+    CompositeSubjectModel,
+    PlanetReturnModel,
+    SingleChartDataModel,
+    DualChartDataModel,
+)
+
+WireModel = Union[
+    AstrologicalSubjectModel, CompositeSubjectModel, PlanetReturnModel, SingleChartDataModel, DualChartDataModel
+]
+
+# Encoder: (value, output buffer, string table) -> None
+# Decoder: (payload, offset, string list) -> (value, next offset)
+_Encoder = Callable[[Any, bytearray, Dict[str, int]], None]
+_Decoder = Callable[[memoryview, int, List[str]], Tuple[Any, int]]
+
+_DOUBLE = struct.Struct("<d")
+_INT = struct.Struct("<q")
+
+
+# =============================================================================
+# PRIMITIVES
+# =============================================================================
+
+
+def _write_varint(output: bytearray, value: int) -> None:
+    while value >= 0x80:
+        output.append((value & 0x7F) | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def _read_varint(data: memoryview, offset: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+def _literal_values(annotation: Any) -> Optional[Tuple[Any, ...]]:
+    """Values of a Literal, or of a Union of Literals, in declaration order."""
+    if get_origin(annotation) is Literal:
+        return get_args(annotation)
+    if get_origin(annotation) is Union:
+        values: List[Any] = []
+        for member in get_args(annotation):
+            if get_origin(member) is not Literal:
+                return None
+            values.extend(get_args(member))
+        return tuple(values)
+    return None
+
+
+def _split_optional(annotation: Any) -> Tuple[Any, bool]:
+    if get_origin(annotation) is Union:
+        members = [member for member in get_args(annotation) if member is not type(None)]
+        if len(members) < len(get_args(annotation)):
+            return (members[0] if len(members) == 1 else Union[tuple(members)]), True
+    return annotation, False
+
+
+class _Scalar:
+    """A fixed width field: struct format character plus conversions to and from the wire."""
+
+    __slots__ = ("format", "kind", "values", "codes", "descriptor")
+
+    def __init__(self, annotation: Any):
+        self.values: Tuple[Any, ...] = ()
+        self.codes: Dict[Any, int] = {}
+        literal_values = _literal_values(annotation)
+        if literal_values is not None:
+            self.kind = "literal"
+            self.values = literal_values
+            self.codes = {value: code for code, value in enumerate(literal_values)}
+            self.format = "B" if len(literal_values) <= 0xFF else "H"
+            self.descriptor = f"L{literal_values!r}"
+        elif annotation is str:
+            self.kind, self.format, self.descriptor = "string", "H", "s"
+        elif annotation is float:
+            self.kind, self.format, self.descriptor = "float", "d", "d"
+        elif annotation is bool:
+            self.kind, self.format, self.descriptor = "bool", "?", "?"
+        elif annotation is int:
+            self.kind, self.format, self.descriptor = "int", "q", "q"
+        else:
+            raise TypeError(f"Not a scalar: {annotation!r}")
+
+    @staticmethod
+    def supports(annotation: Any) -> bool:
+        return annotation in (str, float, bool, int) or _literal_values(annotation) is not None
+
+
+# =============================================================================
+# CODECS
+# =============================================================================
+
+
+class _Codec:
+    """Encoder, decoder and schema descriptor of one annotation."""
+
+    __slots__ = ("encode", "decode", "descriptor")
+
+    def __init__(self, encode: _Encoder, decode: _Decoder, descriptor: str):
+        self.encode = encode
+        self.decode = decode
+        self.descriptor = descriptor
+
+
+_MODEL_CODECS: Dict[Any, _Codec] = {}
+
+
+def _record_fields(record_type: Any) -> List[Tuple[str, Any]]:
+    if isinstance(record_type, type) and issubclass(record_type, BaseModel):
+        return [(name, info.annotation) for name, info in record_type.model_fields.items()]
+    return list(record_type.__annotations__.items())
+
+
+def _codec(annotation: Any) -> _Codec:
+    if _Scalar.supports(annotation):
+        return _scalar_codec(_Scalar(annotation))
+    if isinstance(annotation, type) and (issubclass(annotation, BaseModel) or is_typeddict(annotation)):
+        return _record_codec(annotation)
+
+    origin = get_origin(annotation)
+    if origin in (list, List):
+        item = get_args(annotation)[0]
+        if _Scalar.supports(item):
+            return _scalar_list_codec(_Scalar(item))
+        return _list_codec(_codec(item))
+    if origin is Union:
+        members = get_args(annotation)
+        if all(isinstance(member, type) and issubclass(member, BaseModel) for member in members):
+            return _model_union_codec(members)
+        if set(members) == {float, int}:
+            return _number_codec()
+    raise TypeError(f"The wire format does not support {annotation!r}")
+
+
+def _scalar_codec(scalar: _Scalar) -> _Codec:
+    packer = struct.Struct("<" + scalar.format)
+    kind = scalar.kind
+
+    def encode(value: Any, output: bytearray, strings: Dict[str, int]) -> None:
+        if kind == "string":
+            value = strings.setdefault(value, len(strings))
+        elif kind == "literal":
+            value = scalar.codes[value]
+        output += packer.pack(value)
+
+    def decode(data: memoryview, offset: int, strings: List[str]) -> Tuple[Any, int]:
+        (value,) = packer.unpack_from(data, offset)
+        if kind == "string":
+            value = strings[value]
+        elif kind == "literal":
+            value = scalar.values[value]
+        return value, offset + packer.size
+
+    return _Codec(encode, decode, scalar.descriptor)
+
+
+def _number_codec() -> _Codec:
+    """Union[float, int]: one type byte, then the value."""
+
+    def encode(value: Any, output: bytearray, strings: Dict[str, int]) -> None:
+        if type(value) is int:
+            output.append(1)
+            output += _INT.pack(value)
+        else:
+            output.append(0)
+            output += _DOUBLE.pack(value)
+
+    def decode(data: memoryview, offset: int, strings: List[str]) -> Tuple[Any, int]:
+        if data[offset]:
+            return _INT.unpack_from(data, offset + 1)[0], offset + 1 + _INT.size
+        return _DOUBLE.unpack_from(data, offset + 1)[0], offset + 1 + _DOUBLE.size
+
+    return _Codec(encode, decode, "n")
+
+
+def _list_codec(item: _Codec) -> _Codec:
+    encode_item = item.encode
+    decode_item = item.decode
+
+    def encode(value: Any, output: bytearray, strings: Dict[str, int]) -> None:
+        _write_varint(output, len(value))
+        for element in value:
+            encode_item(element, output, strings)
+
+    def decode(data: memoryview, offset: int, strings: List[str]) -> Tuple[Any, int]:
+        count, offset = _read_varint(data, offset)
+        items = []
+        for _ in range(count):
+            element, offset = decode_item(data, offset, strings)
+            items.append(element)
+        return items, offset
+
+    return _Codec(encode, decode, f"[{item.descriptor}]")
+
+
+def _scalar_list_codec(scalar: _Scalar) -> _Codec:
+    """A list of scalars: the length, then all items packed as one array."""
+    kind = scalar.kind
+
+    def encode(value: Any, output: bytearray, strings: Dict[str, int]) -> None:
+        if kind == "string":
+            value = [strings.setdefault(item, len(strings)) for item in value]
+        elif kind == "literal":
+            value = [scalar.codes[item] for item in value]
+        _write_varint(output, len(value))
+        output += struct.pack(f"<{len(value)}{scalar.format}", *value)
+
+    def decode(data: memoryview, offset: int, strings: List[str]) -> Tuple[Any, int]:
+        count, offset = _read_varint(data, offset)
+        packer = struct.Struct(f"<{count}{scalar.format}")
+        items = list(packer.unpack_from(data, offset))
+        if kind == "string":
+            items = [strings[item] for item in items]
+        elif kind == "literal":
+            items = [scalar.values[item] for item in items]
+        return items, offset + packer.size
+
+    return _Codec(encode, decode, f"[{scalar.descriptor}]")
+
+
+def _model_union_codec(members: Tuple[Type[BaseModel], ...]) -> _Codec:
+    """A union of models: the index of the concrete model, then the model."""
+    codecs = [_record_codec(member) for member in members]
+    tags = {member: tag for tag, member in enumerate(members)}
+
+    def encode(value: Any, output: bytearray, strings: Dict[str, int]) -> None:
+        tag = tags[type(value)]
+        output.append(tag)
+        codecs[tag].encode(value, output, strings)
+
+    def decode(data: memoryview, offset: int, strings: List[str]) -> Tuple[Any, int]:
+        return codecs[data[offset]].decode(data, offset + 1, strings)
+
+    return _Codec(encode, decode, "U(" + ",".join(member.__name__ for member in members) + ")")
+
+
+def _record_codec(record_type: Any) -> _Codec:
+    codec = _MODEL_CODECS.get(record_type)
+    if codec is not None:
+        return codec
+
+    # Recursive models resolve to this placeholder while they are compiled
+    placeholder = _Codec(
+        lambda value, output, strings: _MODEL_CODECS[record_type].encode(value, output, strings),
+        lambda data, offset, strings: _MODEL_CODECS[record_type].decode(data, offset, strings),
+        record_type.__name__,
+    )
+    _MODEL_CODECS[record_type] = placeholder
+
+    fields = []
+    for name, annotation in _record_fields(record_type):
+        annotation, optional = _split_optional(annotation)
+        fields.append((name, annotation, optional))
+
+    if all(_Scalar.supports(annotation) for _, annotation, _ in fields):
+        codec = _flat_record_codec(record_type, fields)
+    else:
+        codec = _nested_record_codec(record_type, fields)
+    _MODEL_CODECS[record_type] = codec
+    return codec
+
+
+def _record_builder(record_type: Any) -> Callable[[Dict[str, Any]], Any]:
+    if not (isinstance(record_type, type) and issubclass(record_type, BaseModel)):
+        return dict
+    if record_type.__private_attributes__ or record_type.__pydantic_post_init__:
+        construct = record_type.model_construct
+        return lambda values: construct(**values)
+
+    # What model_construct does when every field is given, without its per-field loop
+    field_names = frozenset(record_type.model_fields)
+    new_instance = record_type.__new__
+    set_attribute = object.__setattr__
+
+    def build(values: Dict[str, Any]) -> Any:
+        instance = new_instance(record_type)
+        set_attribute(instance, "__dict__", values)
+        set_attribute(instance, "__pydantic_fields_set__", set(field_names))
+        set_attribute(instance, "__pydantic_extra__", None)
+        set_attribute(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+def _record_getter(record_type: Any, names: List[str]) -> Callable[[Any], Tuple[Any, ...]]:
+    getter = attrgetter if isinstance(record_type, type) and issubclass(record_type, BaseModel) else itemgetter
+    if len(names) == 1:
+        single = getter(names[0])
+        return lambda record: (single(record),)
+    return getter(*names)
+
+
+def _flat_record_codec(record_type: Any, fields: List[Tuple[str, Any, bool]]) -> _Codec:
+    """
+    A record of scalar fields, packed with one struct call.
+
+    The payload is a varint bitmask of the optional fields that are set (only
+    when the record has optional fields), then the present fields in model
+    order. One struct is compiled per bitmask the first time it is seen.
+    """
+    names = [name for name, _, _ in fields]
+    scalars = [_Scalar(annotation) for _, annotation, _ in fields]
+    optional_bits = []
+    bit = 1
+    for _, _, optional in fields:
+        optional_bits.append(bit if optional else 0)
+        if optional:
+            bit <<= 1
+    optional_fields = [(position, bit) for position, bit in enumerate(optional_bits) if bit]
+    getter = _record_getter(record_type, names)
+    build = _record_builder(record_type)
+
+    string_fields = [position for position, scalar in enumerate(scalars) if scalar.kind == "string"]
+    literal_fields = [(position, scalar.codes) for position, scalar in enumerate(scalars) if scalar.kind == "literal"]
+
+    # Per bitmask: the struct of the present fields, the unpacked value of every
+    # field (absent ones point one past the end, where None is appended) and the
+    # string and literal fields among the unpacked values.
+    layouts: Dict[
+        int, Tuple[struct.Struct, Callable[[List[Any]], Tuple[Any, ...]], List[int], List[Tuple[int, Tuple[Any, ...]]]]
+    ] = {}
+
+    def layout_for(mask: int):
+        layout = layouts.get(mask)
+        if layout is None:
+            present = [position for position, bit in enumerate(optional_bits) if not bit or mask & bit]
+            unpacked_index = {position: index for index, position in enumerate(present)}
+            gather = [unpacked_index.get(position, len(present)) for position in range(len(fields))]
+            layout = layouts[mask] = (
+                struct.Struct("<" + "".join(scalars[position].format for position in present)),
+                itemgetter(*gather) if len(gather) > 1 else (lambda values: (values[gather[0]],)),
+                [unpacked_index[position] for position in string_fields if position in unpacked_index],
+                [
+                    (unpacked_index[position], scalars[position].values)
+                    for position, _ in literal_fields
+                    if position in unpacked_index
+                ],
+            )
+        return layout
+
+    def encode(value: Any, output: bytearray, strings: Dict[str, int]) -> None:
+        values = list(getter(value))
+        for position in string_fields:
+            if values[position] is not None:
+                values[position] = strings.setdefault(values[position], len(strings))
+        for position, codes in literal_fields:
+            if values[position] is not None:
+                values[position] = codes[values[position]]
+        mask = 0
+        if optional_fields:
+            for position, bit in optional_fields:
+                if values[position] is not None:
+                    mask |= bit
+            _write_varint(output, mask)
+            # Required fields are never None
+            values = [field_value for field_value in values if field_value is not None]
+        try:
+            output += layout_for(mask)[0].pack(*values)
+        except struct.error as error:
+            raise KerykeionException(f"Cannot encode {type(value).__name__} in the wire format: {error}") from error
+
+    def decode(data: memoryview, offset: int, strings: List[str]) -> Tuple[Any, int]:
+        mask = 0
+        if optional_fields:
+            mask, offset = _read_varint(data, offset)
+        packer, gather, string_indexes, literal_indexes = layout_for(mask)
+        values = list(packer.unpack_from(data, offset))
+        for index in string_indexes:
+            values[index] = strings[values[index]]
+        for index, literal_values in literal_indexes:
+            values[index] = literal_values[values[index]]
+        values.append(None)
+        return build(dict(zip(names, gather(values)))), offset + packer.size
+
+    descriptor = (
+        f"{record_type.__name__}{{"
+        + ",".join(
+            f"{name}:{scalar.descriptor}{'?' if optional else ''}"
+            for (name, _, optional), scalar in zip(fields, scalars)
+        )
+        + "}"
+    )
+    return _Codec(encode, decode, descriptor)
+
+
+def _nested_record_codec(record_type: Any, fields: List[Tuple[str, Any, bool]]) -> _Codec:
+    """A record with nested fields: bitmask of the optional fields set, then each present field."""
+    names = [name for name, _, _ in fields]
+    codecs = [_codec(annotation) for _, annotation, _ in fields]
+    optional_bits = []
+    bit = 1
+    for _, _, optional in fields:
+        optional_bits.append(bit if optional else 0)
+        if optional:
+            bit <<= 1
+    has_optional = bit > 1
+    getter = _record_getter(record_type, names)
+    build = _record_builder(record_type)
+    encoders = [codec.encode for codec in codecs]
+    decoders = [codec.decode for codec in codecs]
+    layout = list(zip(optional_bits, encoders))
+
+    def encode(value: Any, output: bytearray, strings: Dict[str, int]) -> None:
+        values = getter(value)
+        if has_optional:
+            mask = 0
+            for field_value, optional_bit in zip(values, optional_bits):
+                if optional_bit and field_value is not None:
+                    mask |= optional_bit
+            _write_varint(output, mask)
+        for field_value, (optional_bit, encode_field) in zip(values, layout):
+            if not optional_bit or field_value is not None:
+                encode_field(field_value, output, strings)
+
+    def decode(data: memoryview, offset: int, strings: List[str]) -> Tuple[Any, int]:
+        mask = 0
+        if has_optional:
+            mask, offset = _read_varint(data, offset)
+        values = {}
+        for name, optional_bit, decode_field in zip(names, optional_bits, decoders):
+            if optional_bit and not mask & optional_bit:
+                values[name] = None
+            else:
+                values[name], offset = decode_field(data, offset, strings)
+        return build(values), offset
+
+    descriptor = (
+        f"{record_type.__name__}{{"
+        + ",".join(
+            f"{name}:{codec.descriptor}{'?' if optional else ''}" for (name, _, optional), codec in zip(fields, codecs)
+        )
+        + "}"
+    )
+    return _Codec(encode, decode, descriptor)
+
+
+# Compiled once at import: the codecs and schema fingerprints of the root models
+_ROOT_CODECS = [_record_codec(model) for model in _ROOT_MODELS]
+_FINGERPRINTS = [zlib.crc32(codec.descriptor.encode("utf-8")) for codec in _ROOT_CODECS]
+_ROOT_CODES = {model: code for code, model in enumerate(_ROOT_MODELS)}
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+
+def to_wire(model: WireModel) -> bytes:
+    """
+    Encode a subject or chart data model in the binary wire format.
+
+    Args:
+        model: An AstrologicalSubjectModel, CompositeSubjectModel,
+            PlanetReturnModel, SingleChartDataModel or DualChartDataModel.
+
+    Returns:
+        bytes: The payload, starting with the versioned header.
+
+    Raises:
+        KerykeionException: If the model type is not supported, or a value
+            does not fit the format (e.g. more than 65536 distinct strings).
+    """
+    code = _ROOT_CODES.get(type(model))
+    if code is None:
+        raise KerykeionException(f"The wire format does not support {type(model).__name__}.")
+
+    strings: Dict[str, int] = {}
+    body = bytearray()
+    _ROOT_CODECS[code].encode(model, body, strings)
+    if len(strings) > 0x10000:
+        raise KerykeionException("Too many distinct strings for the wire format.")
+
+    output = bytearray(_HEADER.pack(_MAGIC, WIRE_FORMAT_VERSION, code, _FINGERPRINTS[code]))
+    _write_varint(output, len(strings))
+    for string in strings:
+        encoded = string.encode("utf-8")
+        _write_varint(output, len(encoded))
+        output += encoded
+    output += body
+    return bytes(output)
+
+
+def from_wire(data: bytes, expected_type: Optional[Type[BaseModel]] = None) -> WireModel:
+    """
+    Decode a payload produced by to_wire.
+
+    Args:
+        data: The payload.
+        expected_type: If given, the model type the payload must hold.
+
+    Returns:
+        The decoded model, equal to the encoded one.
+
+    Raises:
+        KerykeionException: If the payload is not in the wire format, was
+            written by another format version or schema, is truncated, or does
+            not hold expected_type.
+    """
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise KerykeionException("Not a Kerykeion wire format payload: too short.")
+    magic, version, code, fingerprint = _HEADER.unpack_from(view, 0)
+    if magic != _MAGIC:
+        raise KerykeionException("Not a Kerykeion wire format payload.")
+    if version != WIRE_FORMAT_VERSION:
+        raise KerykeionException(
+            f"Unsupported wire format version {version}; this Kerykeion reads version {WIRE_FORMAT_VERSION}."
+        )
+    if code >= len(_ROOT_MODELS):
+        raise KerykeionException(f"Unknown wire format model code {code}.")
+    if fingerprint != _FINGERPRINTS[code]:
+        raise KerykeionException(
+            f"The payload was written with a different {_ROOT_MODELS[code].__name__} schema; re-encode it."
+        )
+    if expected_type is not None and _ROOT_MODELS[code] is not expected_type:
+        raise KerykeionException(
+            f"Expected a {expected_type.__name__}, the payload holds a {_ROOT_MODELS[code].__name__}."
+        )
+
+    try:
+        offset = _HEADER.size
+        count, offset = _read_varint(view, offset)
+        strings = []
+        for _ in range(count):
+            length, offset = _read_varint(view, offset)
+            strings.append(str(view[offset : offset + length], "utf-8"))
+            offset += length
+        model, offset = _ROOT_CODECS[code].decode(view, offset, strings)
+    except (IndexError, struct.error, UnicodeDecodeError) as error:
+        raise KerykeionException(f"Corrupted or truncated wire format payload: {error}") from error
+    if offset != len(view):
+        raise KerykeionException("Corrupted wire format payload: trailing bytes.")
+    return model
+
+
+__all__ = [
+    "WIRE_FORMAT_VERSION",
+    "from_wire",
+    "to_wire",
+]
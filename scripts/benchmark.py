@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for Kerykeion with JSON baselines and regression gates.
+
+Every benchmark builds its inputs once, offline and from fixed birth data, and
+then times one call of the operation under test. Timings use ``timeit``-style
+auto-ranging: each round repeats the call until it takes at least
+``--min-time`` seconds, the garbage collector is paused during rounds, and the
+minimum, median and mean time per call over ``--rounds`` rounds are stored.
+
+Usage:
+    # Record a baseline (timings depend on the machine: compare on the same one)
+    python scripts/benchmark.py run --output .benchmarks/baseline.json
+
+    # Run again and fail if any benchmark is more than 25% slower
+    python scripts/benchmark.py compare .benchmarks/baseline.json --max-slowdown 0.25
+
+    # Looser gate for one benchmark, and only the chart benchmarks
+    python scripts/benchmark.py compare .benchmarks/baseline.json --filter chart --threshold chart.svg_minify=0.5
+
+    # Compare two saved runs without running anything
+    python scripts/benchmark.py compare old.json --current new.json
+
+    # Payload sizes of the binary wire format against model_dump_json
+    python scripts/benchmark.py sizes
+
+The comparison uses the median time per call by default (``--statistic``) and
+exits with status 1 when a benchmark exceeds its allowed slowdown.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from kerykeion import (  # noqa: E402
+    AlmanacGenerator,
+    AspectsFactory,
+    AstrologicalSubjectFactory,
+    ChartDataFactory,
+    ChartDrawer,
+    CompositeSubjectFactory,
+    EphemerisDataFactory,
+    GroupSynastryMatrix,
+    MoonPhaseDetailsFactory,
+    PlanetaryReturnFactory,
+    TransitsTimeRangeFactory,
+    to_context,
+)
+from kerykeion.schemas import AstrologicalSubjectModel  # noqa: E402
+from kerykeion.sky_cache import SkyCache  # noqa: E402
+from kerykeion.wire_format import from_wire, to_wire  # noqa: E402
+from kerykeion.settings.config_constants import ALL_ACTIVE_ASPECTS, ALL_ACTIVE_POINTS  # noqa: E402
+
+DEFAULT_OUTPUT = REPO_ROOT / ".benchmarks" / "baseline.json"
+FORMAT_VERSION = 1
+STATISTICS = ("min", "median", "mean")
+
+# Fixed birth data used by every benchmark
+FIRST_BIRTH = dict(year=1990, month=6, day=15, hour=14, minute=30, lng=12.4964, lat=41.9028, tz_str="Europe/Rome")
+SECOND_BIRTH = dict(year=1988, month=11, day=3, hour=7, minute=5, lng=-0.1276, lat=51.5072, tz_str="Europe/London")
+TRANSIT_MOMENT = dict(year=2025, month=3, day=20, hour=12, minute=0, lng=12.4964, lat=41.9028, tz_str="Europe/Rome")
+
+
+# =============================================================================
+# BENCHMARK DEFINITIONS
+# =============================================================================
+
+# Name -> setup function returning the zero-argument callable to time
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Callable[[], Any]]], Callable[[], Callable[[], Any]]]:
+    """Register a benchmark setup function under ``name``."""
+
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _subject(name: str, birth: Dict[str, Any], **kwargs: Any) -> AstrologicalSubjectModel:
+    return AstrologicalSubjectFactory.from_birth_data(
+        name, online=False, suppress_geonames_warning=True, **birth, **kwargs
+    )
+
+
+@benchmark("subject.natal_default")
+def _subject_natal_default():
+    return lambda: _subject("First", FIRST_BIRTH)
+
+
+@benchmark("subject.natal_all_points")
+def _subject_natal_all_points():
+    return lambda: _subject("First", FIRST_BIRTH, active_points=ALL_ACTIVE_POINTS)
+
+
+@benchmark("subject.sidereal")
+def _subject_sidereal():
+    return lambda: _subject("First", FIRST_BIRTH, zodiac_type="Sidereal", sidereal_mode="LAHIRI")
+
+
+@benchmark("subject.topocentric")
+def _subject_topocentric():
+    return lambda: _subject("First", FIRST_BIRTH, perspective_type="Topocentric")
+
+
+@benchmark("subject.cities_100_same_instant")
+def _subject_cities_100_same_instant():
+    cities = [(-170.0 + 3.4 * index, -60.0 + 1.2 * index) for index in range(100)]
+
+    def run():
+        with SkyCache().activate():
+            return [
+                AstrologicalSubjectFactory.from_iso_utc_time(
+                    "City", "2025-03-20T12:00:00Z", lng=lng, lat=lat, tz_str="Etc/UTC", online=False
+                )
+                for lng, lat in cities
+            ]
+
+    return run
+
+
+@benchmark("aspects.single")
+def _aspects_single():
+    first = _subject("First", FIRST_BIRTH)
+    return lambda: AspectsFactory.single_chart_aspects(first)
+
+
+@benchmark("aspects.dual")
+def _aspects_dual():
+    first, second = _subject("First", FIRST_BIRTH), _subject("Second", SECOND_BIRTH)
+    return lambda: AspectsFactory.dual_chart_aspects(first, second)
+
+
+@benchmark("aspects.group_10")
+def _aspects_group_10():
+    group = [
+        _subject(f"Member {day}", {**FIRST_BIRTH, "year": 1980 + day, "day": day, "hour": day % 24})
+        for day in range(1, 11)
+    ]
+    return lambda: GroupSynastryMatrix(group)
+
+
+@benchmark("chart_data.natal")
+def _chart_data_natal():
+    first = _subject("First", FIRST_BIRTH)
+    return lambda: ChartDataFactory.create_natal_chart_data(first)
+
+
+@benchmark("chart_data.synastry")
+def _chart_data_synastry():
+    first, second = _subject("First", FIRST_BIRTH), _subject("Second", SECOND_BIRTH)
+    return lambda: ChartDataFactory.create_synastry_chart_data(first, second)
+
+
+@benchmark("chart_data.transit")
+def _chart_data_transit():
+    first, transit = _subject("First", FIRST_BIRTH), _subject("Transit", TRANSIT_MOMENT)
+    return lambda: ChartDataFactory.create_transit_chart_data(first, transit)
+
+
+@benchmark("chart_data.composite")
+def _chart_data_composite():
+    first, second = _subject("First", FIRST_BIRTH), _subject("Second", SECOND_BIRTH)
+    composite = CompositeSubjectFactory(first, second).get_midpoint_composite_subject_model()
+    return lambda: ChartDataFactory.create_composite_chart_data(composite)
+
+
+@benchmark("chart_data.return")
+def _chart_data_return():
+    first = _subject("First", FIRST_BIRTH)
+    solar_return = _return_factory(first).next_return_from_date(2025, 1, 1, return_type="Solar")
+    return lambda: ChartDataFactory.create_return_chart_data(first, solar_return)
+
+
+@benchmark("chart.svg")
+def _chart_svg():
+    chart_data = ChartDataFactory.create_natal_chart_data(_subject("First", FIRST_BIRTH))
+    return lambda: ChartDrawer(chart_data).generate_svg_string()
+
+
+@benchmark("chart.svg_minify")
+def _chart_svg_minify():
+    chart_data = ChartDataFactory.create_natal_chart_data(_subject("First", FIRST_BIRTH))
+    return lambda: ChartDrawer(chart_data).generate_svg_string(minify=True, remove_css_variables=True)
+
+
+@benchmark("chart.svg_synastry")
+def _chart_svg_synastry():
+    first, second = _subject("First", FIRST_BIRTH), _subject("Second", SECOND_BIRTH)
+    chart_data = ChartDataFactory.create_synastry_chart_data(first, second)
+    return lambda: ChartDrawer(chart_data).generate_svg_string()
+
+
+@benchmark("chart.svg_all_points")
+def _chart_svg_all_points():
+    first = _subject("First", FIRST_BIRTH, active_points=ALL_ACTIVE_POINTS)
+    chart_data = ChartDataFactory.create_natal_chart_data(
+        first, active_points=ALL_ACTIVE_POINTS, active_aspects=ALL_ACTIVE_ASPECTS
+    )
+    return lambda: ChartDrawer(chart_data).generate_svg_string()
+
+
+@benchmark("chart.aspect_grid_synastry_all_points")
+def _chart_aspect_grid_synastry_all_points():
+    first = _subject("First", FIRST_BIRTH, active_points=ALL_ACTIVE_POINTS)
+    second = _subject("Second", SECOND_BIRTH, active_points=ALL_ACTIVE_POINTS)
+    chart_data = ChartDataFactory.create_synastry_chart_data(
+        first, second, active_points=ALL_ACTIVE_POINTS, active_aspects=ALL_ACTIVE_ASPECTS
+    )
+    return lambda: ChartDrawer(chart_data, double_chart_aspect_grid_type="table").generate_aspect_grid_only_svg_string()
+
+
+@benchmark("ephemeris.days_30")
+def _ephemeris_days_30():
+    start, end = datetime(2025, 1, 1), datetime(2025, 1, 31)
+    return lambda: EphemerisDataFactory(start, end).get_ephemeris_data_as_astrological_subjects()
+
+
+@benchmark("ephemeris.hours_48")
+def _ephemeris_hours_48():
+    start, end = datetime(2025, 1, 1), datetime(2025, 1, 3)
+    return lambda: EphemerisDataFactory(start, end, step_type="hours").get_ephemeris_data()
+
+
+@benchmark("transits.days_30")
+def _transits_days_30():
+    first = _subject("First", FIRST_BIRTH)
+    moments = EphemerisDataFactory(
+        datetime(2025, 1, 1), datetime(2025, 1, 31)
+    ).get_ephemeris_data_as_astrological_subjects()
+    return lambda: TransitsTimeRangeFactory(first, moments).get_transit_moments()
+
+
+@benchmark("returns.solar")
+def _returns_solar():
+    factory = _return_factory(_subject("First", FIRST_BIRTH))
+    return lambda: factory.next_return_from_date(2025, 1, 1, return_type="Solar")
+
+
+@benchmark("returns.lunar")
+def _returns_lunar():
+    factory = _return_factory(_subject("First", FIRST_BIRTH))
+    return lambda: factory.next_return_from_date(2025, 3, 1, return_type="Lunar")
+
+
+@benchmark("moon_phase.details")
+def _moon_phase_details():
+    first = _subject("First", FIRST_BIRTH)
+    return lambda: MoonPhaseDetailsFactory.from_subject(first)
+
+
+@benchmark("moon_phase.almanac_days_30")
+def _moon_phase_almanac_days_30():
+    almanac = AlmanacGenerator(FIRST_BIRTH["lng"], FIRST_BIRTH["lat"], FIRST_BIRTH["tz_str"])
+    start, end = datetime(2025, 1, 1), datetime(2025, 1, 30)
+    return lambda: list(almanac.iter_days(start, end))
+
+
+@benchmark("context.natal_chart")
+def _context_natal_chart():
+    chart_data = ChartDataFactory.create_natal_chart_data(_subject("First", FIRST_BIRTH))
+    return lambda: to_context(chart_data)
+
+
+def _serialization_samples() -> Dict[str, Any]:
+    first = _subject("First", FIRST_BIRTH)
+    second = _subject("Second", SECOND_BIRTH)
+    return {
+        "subject": first,
+        "natal": ChartDataFactory.create_natal_chart_data(first),
+        "synastry": ChartDataFactory.create_synastry_chart_data(first, second),
+    }
+
+
+def _register_serialization_benchmarks() -> None:
+    # model_dump_json / model_validate_json against to_wire / from_wire on the same models
+    for sample_name in ("subject", "natal", "synastry"):
+
+        def json_dump(sample_name=sample_name):
+            model = _serialization_samples()[sample_name]
+            return model.model_dump_json
+
+        def json_load(sample_name=sample_name):
+            model = _serialization_samples()[sample_name]
+            payload = model.model_dump_json()
+            return lambda: type(model).model_validate_json(payload)
+
+        def wire_encode(sample_name=sample_name):
+            model = _serialization_samples()[sample_name]
+            return lambda: to_wire(model)
+
+        def wire_decode(sample_name=sample_name):
+            payload = to_wire(_serialization_samples()[sample_name])
+            return lambda: from_wire(payload)
+
+        benchmark(f"serialize.json_dump_{sample_name}")(json_dump)
+        benchmark(f"serialize.json_load_{sample_name}")(json_load)
+        benchmark(f"serialize.wire_encode_{sample_name}")(wire_encode)
+        benchmark(f"serialize.wire_decode_{sample_name}")(wire_decode)
+
+
+_register_serialization_benchmarks()
+
+
+def payload_sizes() -> List[Dict[str, Any]]:
+    """Size in bytes of the JSON and wire format payloads of the serialization samples."""
+    sizes = []
+    for sample_name, model in _serialization_samples().items():
+        json_size = len(model.model_dump_json().encode("utf-8"))
+        wire_size = len(to_wire(model))
+        sizes.append({"sample": sample_name, "json": json_size, "wire": wire_size, "ratio": json_size / wire_size})
+    return sizes
+
+
+def _return_factory(subject: AstrologicalSubjectModel) -> PlanetaryReturnFactory:
+    return PlanetaryReturnFactory(
+        subject,
+        lng=FIRST_BIRTH["lng"],
+        lat=FIRST_BIRTH["lat"],
+        tz_str=FIRST_BIRTH["tz_str"],
+        online=False,
+    )
+
+
+# =============================================================================
+# TIMING
+# =============================================================================
+
+
+def time_benchmark(function: Callable[[], Any], rounds: int, min_time: float) -> Dict[str, Any]:
+    """
+    Time ``function`` over several rounds.
+
+    Args:
+        function: Zero-argument callable to time.
+        rounds: Number of timed rounds.
+        min_time: Minimum duration of a round, in seconds.
+
+    Returns:
+        Dict[str, Any]: Seconds per call (``min``, ``median``, ``mean``, ``stdev``),
+        ``loops`` per round and ``rounds``.
+    """
+    function()  # Warm up caches and lazy imports
+
+    # Find the number of loops that makes a round last at least min_time
+    loops = 1
+    while True:
+        start = perf_counter()
+        for _ in range(loops):
+            function()
+        if perf_counter() - start >= min_time:
+            break
+        loops *= 2
+
+    per_call: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(rounds):
+            gc.collect()
+            gc.disable()
+            start = perf_counter()
+            for _ in range(loops):
+                function()
+            per_call.append((perf_counter() - start) / loops)
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "min": min(per_call),
+        "median": statistics.median(per_call),
+        "mean": statistics.fmean(per_call),
+        "stdev": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "loops": loops,
+        "rounds": rounds,
+    }
+
+
+def _package_version(package: str) -> Optional[str]:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=False
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmarks(names: List[str], rounds: int, min_time: float) -> Dict[str, Any]:
+    """
+    Run the selected benchmarks.
+
+    Args:
+        names: Benchmark names, in run order.
+        rounds: Number of timed rounds per benchmark.
+        min_time: Minimum duration of a round, in seconds.
+
+    Returns:
+        Dict[str, Any]: JSON-serializable results with environment metadata.
+    """
+    results: Dict[str, Any] = {}
+    for name in names:
+        function = BENCHMARKS[name]()
+        results[name] = time_benchmark(function, rounds, min_time)
+        print(f"{name:<28} {results[name]['median'] * 1000:>10.3f} ms  (min {results[name]['min'] * 1000:.3f} ms)")
+
+    return {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "kerykeion": _package_version("kerykeion"),
+            "pyswisseph": _package_version("pyswisseph"),
+            "git_commit": _git_commit(),
+        },
+        "settings": {"rounds": rounds, "min_time": min_time},
+        "benchmarks": results,
+    }
+
+
+# =============================================================================
+# COMPARISON
+# =============================================================================
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    max_slowdown: float,
+    thresholds: Dict[str, float],
+    statistic: str = "median",
+) -> List[str]:
+    """
+    Compare two benchmark runs.
+
+    Args:
+        baseline: Results of the reference run.
+        current: Results of the run under test.
+        max_slowdown: Allowed relative slowdown, e.g. 0.25 for 25%.
+        thresholds: Allowed slowdown by benchmark name, overriding max_slowdown.
+        statistic: Timing compared: "min", "median" or "mean".
+
+    Returns:
+        List[str]: Names of the benchmarks slower than allowed.
+    """
+    regressions: List[str] = []
+    print(f"{'benchmark':<28} {'baseline ms':>12} {'current ms':>12} {'change':>9}  status")
+    for name, result in current["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if reference is None:
+            print(f"{name:<28} {'-':>12} {result[statistic] * 1000:>12.3f} {'-':>9}  new")
+            continue
+        change = result[statistic] / reference[statistic] - 1
+        allowed = thresholds.get(name, max_slowdown)
+        status = "ok"
+        if change > allowed:
+            status = f"SLOWER (allowed +{allowed:.0%})"
+            regressions.append(name)
+        elif change < -allowed:
+            status = "faster"
+        print(
+            f"{name:<28} {reference[statistic] * 1000:>12.3f} {result[statistic] * 1000:>12.3f} {change:>+9.1%}  {status}"
+        )
+    return regressions
+
+
+def _parse_thresholds(values: List[str]) -> Dict[str, float]:
+    thresholds = {}
+    for value in values:
+        name, separator, ratio = value.partition("=")
+        if not separator:
+            raise SystemExit(f"Invalid threshold {value!r}: expected NAME=RATIO")
+        thresholds[name] = float(ratio)
+    return thresholds
+
+
+def _selected_names(filters: List[str]) -> List[str]:
+    names = [name for name in BENCHMARKS if not filters or any(text in name for text in filters)]
+    if not names:
+        raise SystemExit(f"No benchmark matches {filters}. Available: {', '.join(BENCHMARKS)}")
+    return names
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the benchmark command line."""
+    parser = argparse.ArgumentParser(description="Run Kerykeion benchmarks and compare them with a baseline.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_arguments(subparser: argparse.ArgumentParser) -> None:
+        subparser.add_argument("--filter", action="append", default=[], help="Run benchmarks containing this text")
+        subparser.add_argument("--rounds", type=int, default=7, help="Timed rounds per benchmark (default: 7)")
+        subparser.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per round (default: 0.1)")
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks and save the results as JSON")
+    add_run_arguments(run_parser)
+    run_parser.add_argument(
+        "--output", type=Path, default=DEFAULT_OUTPUT, help=f"Output file (default: {DEFAULT_OUTPUT})"
+    )
+
+    compare_parser = subparsers.add_parser("compare", help="Compare with a baseline; exit 1 on regressions")
+    add_run_arguments(compare_parser)
+    compare_parser.add_argument("baseline", type=Path, help="Baseline JSON file")
+    compare_parser.add_argument("--current", type=Path, help="Compare this saved run instead of running now")
+    compare_parser.add_argument("--output", type=Path, help="Also save the new run to this file")
+    compare_parser.add_argument(
+        "--max-slowdown", type=float, default=0.25, help="Allowed relative slowdown (default: 0.25)"
+    )
+    compare_parser.add_argument(
+        "--threshold", action="append", default=[], help="Per-benchmark allowed slowdown, as NAME=RATIO"
+    )
+    compare_parser.add_argument("--statistic", choices=STATISTICS, default="median", help="Timing compared")
+
+    list_parser = subparsers.add_parser("list", help="List the available benchmarks")
+    list_parser.set_defaults(filter=[])
+
+    subparsers.add_parser("sizes", help="Print the wire format payload sizes against model_dump_json")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    if args.command == "sizes":
+        print(f"{'sample':<10}  {'json bytes':>10}  {'wire bytes':>10}  {'ratio':>6}")
+        for row in payload_sizes():
+            print(f"{row['sample']:<10}  {row['json']:>10}  {row['wire']:>10}  {row['ratio']:>5.1f}x")
+        return 0
+
+    if args.command == "run":
+        results = run_benchmarks(_selected_names(args.filter), args.rounds, args.min_time)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved {len(results['benchmarks'])} benchmarks to {args.output}")
+        return 0
+
+    thresholds = _parse_thresholds(args.threshold)
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if args.current is not None:
+        current = json.loads(args.current.read_text(encoding="utf-8"))
+        if args.filter:
+            names = _selected_names(args.filter)
+            selected = {name: result for name, result in current["benchmarks"].items() if name in names}
+            current = {**current, "benchmarks": selected}
+    else:
+        current = run_benchmarks(_selected_names(args.filter), args.rounds, args.min_time)
+        if args.output is not None:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+
+    if baseline.get("environment", {}).get("machine") != current.get("environment", {}).get("machine"):
+        print("warning: baseline was recorded on a different machine type; timings may not be comparable")
+
+    regressions = compare_results(baseline, current, args.max_slowdown, thresholds, args.statistic)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than allowed: {', '.join(regressions)}")
+        return 1
+    print("No performance regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Regenerate the bundled eclipse catalog (kerykeion/moon_phase_details/eclipse_catalog.csv).
+
+Runs the Swiss Ephemeris global solar and lunar eclipse searches over the
+range (1800-2400 by default) and writes every eclipse with its type flags and
+magnitude. Rebuild it after changing the ephemeris files or the search flags.
+
+Called by: poe regenerate:eclipses
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from time import perf_counter
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import swisseph as swe  # noqa: E402
+
+from kerykeion.moon_phase_details.eclipse_catalog import ECLIPSE_CATALOG_PATH, EclipseCatalog  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--start-year", type=int, default=1800, help="First year covered (from January 1st)")
+    parser.add_argument("--end-year", type=int, default=2400, help="Last year covered (up to January 1st)")
+    parser.add_argument("--output", type=Path, default=ECLIPSE_CATALOG_PATH, help="Catalog file to write")
+    args = parser.parse_args()
+
+    print(f"Searching eclipses from {args.start_year} to {args.end_year}...")
+    started = perf_counter()
+    catalog = EclipseCatalog.build(swe.julday(args.start_year, 1, 1, 0.0), swe.julday(args.end_year, 1, 1, 0.0))
+    catalog.write(args.output)
+    print(
+        f"Wrote {len(catalog.entries('solar'))} solar and {len(catalog.entries('lunar'))} lunar eclipses "
+        f"to {args.output} in {perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio Facade Tests.
+
+Tests for kerykeion.aio.AsyncKerykeion: parity with the synchronous
+factories, backpressure, context propagation to the worker thread, the
+process executor and asynchronous geocoding through a stubbed FetchGeonames.
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from kerykeion import AstrologicalSubjectFactory, ChartDataFactory, ChartDrawer
+from kerykeion.aio import AsyncKerykeion
+from kerykeion.instrumentation import Profiler
+from kerykeion.schemas import KerykeionException
+
+BIRTH = dict(lng=12.4964, lat=41.9028, tz_str="Europe/Rome")
+
+
+def _sync_subject(name="Async"):
+    return AstrologicalSubjectFactory.from_birth_data(
+        name, 1990, 6, 15, 14, 30, online=False, suppress_geonames_warning=True, **BIRTH
+    )
+
+
+class TestAsyncFactories:
+    def test_matches_synchronous_factories(self):
+        async def scenario():
+            async with AsyncKerykeion() as kerykeion:
+                subject = await kerykeion.create_subject("Async", 1990, 6, 15, 14, 30, online=False, **BIRTH)
+                chart_data = await kerykeion.natal_chart_data(subject)
+                svg = await kerykeion.render_svg(chart_data, theme="dark")
+                return subject, chart_data, svg
+
+        subject, chart_data, svg = asyncio.run(scenario())
+        expected_subject = _sync_subject()
+        expected_chart_data = ChartDataFactory.create_natal_chart_data(expected_subject)
+
+        assert subject == expected_subject
+        assert chart_data == expected_chart_data
+        assert svg == ChartDrawer(expected_chart_data, theme="dark").generate_svg_string()
+
+    def test_concurrent_calls_are_bounded(self):
+        async def scenario():
+            async with AsyncKerykeion(max_concurrency=2) as kerykeion:
+                tasks = [
+                    kerykeion.create_subject("Async", 1990, 6, 15, 14, 30, online=False, **BIRTH) for _ in range(6)
+                ]
+                running = asyncio.gather(*tasks)
+                await asyncio.sleep(0)
+                # Only max_concurrency calls hold the semaphore, the others wait in the loop
+                assert kerykeion._semaphore is not None and kerykeion._semaphore.locked()
+                return await running
+
+        subjects = asyncio.run(scenario())
+        assert len(subjects) == 6
+        assert all(subject == subjects[0] for subject in subjects)
+
+    def test_mixed_sidereal_and_topocentric_calls(self):
+        # Calls changing the global Swiss Ephemeris state must not leak into each other
+        async def scenario():
+            async with AsyncKerykeion() as kerykeion:
+                return await asyncio.gather(
+                    kerykeion.create_subject(
+                        "Sidereal", 1990, 6, 15, 14, 30, online=False, zodiac_type="Sidereal", **BIRTH
+                    ),
+                    kerykeion.create_subject("Tropical", 1990, 6, 15, 14, 30, online=False, **BIRTH),
+                    kerykeion.create_subject(
+                        "Topocentric", 1990, 6, 15, 14, 30, online=False, perspective_type="Topocentric", **BIRTH
+                    ),
+                )
+
+        sidereal, tropical, topocentric = asyncio.run(scenario())
+        assert tropical == _sync_subject("Tropical")
+        assert sidereal.sun.abs_pos < tropical.sun.abs_pos
+        assert topocentric.moon.abs_pos != tropical.moon.abs_pos
+
+    def test_context_is_propagated_to_the_worker(self):
+        async def scenario():
+            async with AsyncKerykeion() as kerykeion:
+                with Profiler() as profiler:
+                    await kerykeion.create_subject("Async", 1990, 6, 15, 14, 30, online=False, **BIRTH)
+                return profiler
+
+        profiler = asyncio.run(scenario())
+        assert profiler.report.stages["subject.planets"].calls == 1
+
+    def test_process_executor(self):
+        async def scenario():
+            async with AsyncKerykeion(executor="process", max_workers=2) as kerykeion:
+                subject = await kerykeion.create_subject("Async", 1990, 6, 15, 14, 30, online=False, **BIRTH)
+                solar_return = await kerykeion.planetary_return(
+                    subject, 2024, 1, 1, return_type="Solar", online=False, **BIRTH
+                )
+                return subject, solar_return
+
+        subject, solar_return = asyncio.run(scenario())
+        assert subject == _sync_subject()
+        assert solar_return.sun.abs_pos == pytest.approx(subject.sun.abs_pos, abs=1e-3)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(KerykeionException):
+            AsyncKerykeion(executor="fiber")
+        with pytest.raises(KerykeionException):
+            AsyncKerykeion(max_concurrency=0)
+
+
+class TestAsyncGeocoding:
+    @staticmethod
+    def _fetch_geonames(calls, data):
+        class StubGeonames:
+            def __init__(self, city_name, country_code, username, cache_expire_after_days):
+                calls.append((city_name, country_code, username, cache_expire_after_days, threading.current_thread()))
+
+            def get_serialized_data(self):
+                return dict(data)
+
+        return patch("kerykeion.astrological_subject_factory.FetchGeonames", StubGeonames)
+
+    def test_online_subject_uses_async_lookup(self):
+        calls = []
+        data = {"name": "Rome", "lat": "41.9028", "lng": "12.4964", "countryCode": "IT", "timezonestr": "Europe/Rome"}
+
+        async def scenario():
+            async with AsyncKerykeion(geonames_username="tester", cache_expire_after_days=7) as kerykeion:
+                first, second = await asyncio.gather(
+                    kerykeion.create_subject("Async", 1990, 6, 15, 14, 30, city="Rome", nation="IT"),
+                    kerykeion.create_subject("Async", 1990, 6, 15, 14, 30, city="rome", nation="it"),
+                )
+                third = await kerykeion.create_subject("Async", 1990, 6, 15, 14, 30, city="Rome", nation="IT")
+                return first, second, third
+
+        with self._fetch_geonames(calls, data):
+            first, second, third = asyncio.run(scenario())
+        expected = _sync_subject()
+
+        assert first.lat == expected.lat and first.tz_str == "Europe/Rome"
+        assert first.sun == expected.sun
+        assert first == third
+        assert second.model_copy(update={"city": "Rome", "nation": "IT"}) == first
+        # Concurrent lookups share one call; the later one goes back to FetchGeonames and its cache
+        assert [call[:4] for call in calls] == [("Rome", "IT", "tester", 7)] * 2
+        # Lookups run in the executor, not on the event loop thread
+        assert all(call[4] is not threading.main_thread() for call in calls)
+
+    def test_lookup_errors(self):
+        async def scenario():
+            async with AsyncKerykeion() as kerykeion:
+                with pytest.raises(KerykeionException, match="Missing data from geonames"):
+                    await kerykeion.geocode("Rome", "IT")
+
+        with self._fetch_geonames([], {}):
+            asyncio.run(scenario())
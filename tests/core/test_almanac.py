@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Almanac Tests.
+
+Tests for kerykeion.almanac: rise, set and transit times against the single-day
+Swiss Ephemeris helpers, seeded searches against independent per-day searches,
+major lunar phases, polar locations and input validation.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import swisseph as swe
+
+from kerykeion import AlmanacGenerator
+from kerykeion.almanac import MAJOR_PHASES
+from kerykeion.moon_phase_details.utils import compute_sun_rise_set_swe
+from kerykeion.schemas import KerykeionException
+from kerykeion.utilities import datetime_to_julian
+
+ROME = dict(lng=12.4964, lat=41.9028, tz_str="Europe/Rome")
+LONGYEARBYEN = dict(lng=15.6356, lat=78.2232, tz_str="Arctic/Longyearbyen")
+EVENT_FIELDS = ("sunrise", "sunset", "solar_noon", "moonrise", "moonset", "moon_transit")
+
+
+@pytest.fixture(scope="module")
+def rome():
+    return AlmanacGenerator(**ROME)
+
+
+@pytest.fixture(scope="module")
+def rome_march(rome):
+    return list(rome.iter_days(date(2025, 3, 1), date(2025, 3, 31)))
+
+
+class TestDailyEvents:
+    def test_one_entry_per_day(self, rome_march):
+        assert [day.date for day in rome_march] == [date(2025, 3, 1) + timedelta(days=n) for n in range(31)]
+
+    def test_events_fall_on_their_local_day(self, rome_march):
+        for day in rome_march:
+            for field in EVENT_FIELDS:
+                moment = getattr(day, field)
+                if moment is not None:
+                    assert moment.date() == day.date
+                    assert moment.tzinfo is not None
+
+    def test_sun_times_match_single_day_helper(self, rome, rome_march):
+        for day in rome_march:
+            midnight = rome.timezone.localize(datetime(day.date.year, day.date.month, day.date.day))
+            sunrise_jd, sunset_jd = compute_sun_rise_set_swe(
+                datetime_to_julian(midnight.astimezone(timezone.utc)), ROME["lat"], ROME["lng"]
+            )
+            assert abs(datetime_to_julian(day.sunrise.astimezone(timezone.utc)) - sunrise_jd) < 1e-6
+            assert abs(datetime_to_julian(day.sunset.astimezone(timezone.utc)) - sunset_jd) < 1e-6
+            assert day.sunrise < day.solar_noon < day.sunset
+            assert day.day_length == day.sunset - day.sunrise
+
+    def test_seeded_search_matches_independent_days(self, rome, rome_march):
+        for day in rome_march[::3]:
+            (alone,) = rome.iter_days(day.date, day.date)
+            assert alone == day
+
+    def test_moon_skips_an_event_each_month(self, rome_march):
+        for field in ("moonrise", "moonset", "moon_transit"):
+            missing = [day for day in rome_march if getattr(day, field) is None]
+            assert 1 <= len(missing) <= 2
+
+    def test_daylight_saving_day(self, rome_march):
+        (switch,) = [day for day in rome_march if day.date == date(2025, 3, 30)]
+        assert switch.sunrise.utcoffset() == timedelta(hours=2)
+        assert switch.solar_noon.hour == 13
+
+
+class TestLunarPhases:
+    def test_illumination_follows_phase_angle(self, rome_march):
+        for day in rome_march:
+            assert 0.0 <= day.moon_illumination <= 1.0
+            assert 0.0 <= day.moon_phase_angle < 360.0
+        full = max(rome_march, key=lambda day: day.moon_illumination)
+        assert full.date == date(2025, 3, 14)
+        assert full.moon_illumination > 0.99
+
+    def test_phase_events_match_phase_search(self, rome_march):
+        events = [event for day in rome_march for event in day.phase_events]
+        assert [event.phase for event in events] == ["First Quarter", "Full Moon", "Last Quarter", "New Moon"]
+        for event in events:
+            target = MAJOR_PHASES.index(event.phase) * 90.0
+            sun = swe.calc_ut(event.julian_day, swe.SUN)[0][0]
+            moon = swe.calc_ut(event.julian_day, swe.MOON)[0][0]
+            # The Moon gains about 12 degrees a day on the Sun: 1e-4 degrees is under a second.
+            assert abs(swe.difdeg2n(moon - sun, target)) < 1e-4
+
+    def test_full_year_of_phases(self, rome):
+        events = list(rome.iter_phase_events(date(2025, 1, 1), date(2025, 12, 31)))
+        assert 48 <= len(events) <= 50
+        assert all(earlier.julian_day < later.julian_day for earlier, later in zip(events, events[1:]))
+        for earlier, later in zip(events, events[1:]):
+            assert MAJOR_PHASES.index(later.phase) == (MAJOR_PHASES.index(earlier.phase) + 1) % 4
+
+
+class TestPolarAndValidation:
+    def test_midnight_sun(self):
+        days = list(AlmanacGenerator(**LONGYEARBYEN).iter_days(date(2025, 6, 1), date(2025, 6, 7)))
+        for day in days:
+            assert day.sunrise is None and day.sunset is None
+            assert day.solar_noon is not None
+            assert day.day_length is None
+
+    def test_invalid_inputs(self, rome):
+        with pytest.raises(KerykeionException, match="before its start"):
+            list(rome.iter_days(date(2025, 2, 1), date(2025, 1, 1)))
+        with pytest.raises(KerykeionException, match="Unknown timezone"):
+            AlmanacGenerator(12.0, 41.0, "Mars/Olympus_Mons")
+        with pytest.raises(KerykeionException, match="Invalid coordinates"):
+            AlmanacGenerator(200.0, 41.0, "Europe/Rome")
@@ -323,6 +323,17 @@ class TestAspectTypes:
         for a in result.aspects:
             assert a.aspect_movement in valid_movements
 
+    def test_resolve_aspect_settings(self):
+        """Only active aspects are kept, in settings order, with the active orbs."""
+        from kerykeion.settings.chart_defaults import DEFAULT_CHART_ASPECTS_SETTINGS
+
+        active = [{"name": "trine", "orb": 3}, {"name": "conjunction", "orb": 8}]
+        resolved = AspectsFactory.resolve_aspect_settings(DEFAULT_CHART_ASPECTS_SETTINGS, active)
+
+        assert [(s["name"], s["degree"], s["orb"]) for s in resolved] == [("conjunction", 0, 8), ("trine", 120, 3)]
+        # The defaults are left untouched
+        assert next(s for s in DEFAULT_CHART_ASPECTS_SETTINGS if s["name"] == "trine").get("orb") != 3
+
 
 # ============================================================================
 # 4. TestAspectIntegration
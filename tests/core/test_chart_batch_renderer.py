@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Chart Batch Renderer Tests.
+
+Tests for ChartBatchRenderer: parity with ChartDrawer output, serial and
+process pool execution, file output and per-item error reporting.
+"""
+
+import pytest
+
+from kerykeion import ChartDataFactory, ChartDrawer
+from kerykeion.charts import chart_batch_renderer
+from kerykeion.charts.chart_batch_renderer import ChartBatchRenderer, ChartRenderResult
+from kerykeion.schemas import KerykeionException
+
+
+@pytest.fixture(scope="module")
+def chart_data_list(john_lennon, yoko_ono):
+    return [
+        ChartDataFactory.create_natal_chart_data(john_lennon),
+        ChartDataFactory.create_natal_chart_data(yoko_ono),
+        ChartDataFactory.create_synastry_chart_data(john_lennon, yoko_ono),
+    ]
+
+
+def _expected_svgs(chart_data_list, **render_options):
+    return [
+        ChartDrawer(chart_data, theme="dark").generate_svg_string(**render_options) for chart_data in chart_data_list
+    ]
+
+
+class TestChartBatchRenderer:
+    def test_serial_matches_chart_drawer(self, chart_data_list):
+        renderer = ChartBatchRenderer(theme="dark", max_workers=1)
+        results = sorted(renderer.iter_svg_strings(chart_data_list), key=lambda result: result.index)
+
+        assert [result.index for result in results] == [0, 1, 2]
+        assert all(result.ok for result in results)
+        assert [result.svg for result in results] == _expected_svgs(chart_data_list)
+
+    def test_process_pool_matches_chart_drawer(self, chart_data_list):
+        renderer = ChartBatchRenderer(theme="dark", remove_css_variables=True, max_workers=2, max_pending=2)
+        results = sorted(renderer.iter_svg_strings(chart_data_list), key=lambda result: result.index)
+
+        assert [result.index for result in results] == [0, 1, 2]
+        assert [result.svg for result in results] == _expected_svgs(chart_data_list, remove_css_variables=True)
+
+    def test_save_svgs_writes_files(self, chart_data_list, tmp_path):
+        renderer = ChartBatchRenderer(theme="dark", max_workers=1)
+        results = list(
+            renderer.save_svgs(chart_data_list, tmp_path, filename_factory=lambda index, _: f"chart_{index}")
+        )
+
+        assert all(result.ok and result.svg is None for result in results)
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["chart_0.svg", "chart_1.svg", "chart_2.svg"]
+        assert (tmp_path / "chart_2.svg").read_text(encoding="utf-8") == _expected_svgs(chart_data_list)[2]
+
+    def test_errors_are_reported_per_item(self, chart_data_list):
+        renderer = ChartBatchRenderer(max_workers=1)
+        results = sorted(
+            renderer.iter_svg_strings([chart_data_list[0], None, chart_data_list[1]]),  # type: ignore[list-item]
+            key=lambda result: result.index,
+        )
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1], ChartRenderResult)
+        assert results[1].svg is None
+        assert results[1].error
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_filename_factory_errors_are_reported_per_item(self, chart_data_list, tmp_path, max_workers):
+        def filename_factory(index, _):
+            if index == 1:
+                raise ValueError("no name")
+            return f"chart_{index}"
+
+        renderer = ChartBatchRenderer(max_workers=max_workers)
+        results = sorted(
+            renderer.save_svgs(chart_data_list, tmp_path, filename_factory=filename_factory),
+            key=lambda result: result.index,
+        )
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[1].error == "ValueError: no name"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["chart_0.svg", "chart_2.svg"]
+
+    def test_save_svgs_default_filename(self, chart_data_list, tmp_path):
+        renderer = ChartBatchRenderer(style="modern", max_workers=1)
+        (result,) = renderer.save_svgs(chart_data_list[:1], tmp_path)
+
+        expected = ChartDrawer(chart_data_list[0]).get_default_filename(" - Modern")
+        assert result.path == tmp_path / f"{expected}.svg"
+
+    def test_worker_warm_up_loads_chart_language(self, monkeypatch):
+        loaded = []
+        monkeypatch.setattr(chart_batch_renderer, "_WORKER_SETTINGS", None)
+        monkeypatch.setattr(
+            chart_batch_renderer,
+            "load_language_settings",
+            lambda overrides=None, *, languages=None: loaded.append(tuple(languages)) or {},
+        )
+        renderer = ChartBatchRenderer(chart_language="IT", max_workers=1)
+
+        chart_batch_renderer._init_batch_worker(renderer._settings)
+
+        assert loaded == [("IT", "EN")]
+
+    def test_invalid_options_raise(self):
+        with pytest.raises(KerykeionException):
+            ChartBatchRenderer(theme="neon")  # type: ignore[arg-type]
+        with pytest.raises(KerykeionException):
+            ChartBatchRenderer(style="baroque")  # type: ignore[arg-type]
+        with pytest.raises(KerykeionException):
+            ChartBatchRenderer(max_workers=0)
@@ -246,6 +246,37 @@ class TestChartDrawerBasic:
         template_dict = chart._create_template_dictionary()
         assert template_dict["stringTitle"] == custom_title
 
+    def test_validate_template_matches_default_render(self):
+        from kerykeion.schemas import ChartTemplateModel
+
+        for data in (
+            self.chart_data,
+            ChartDataFactory.create_synastry_chart_data(self.subject, self.subject2),
+        ):
+            for style in ("classic", "modern"):
+                fast = ChartDrawer(data, style=style)
+                strict = ChartDrawer(data, style=style, validate_template=True)
+                assert fast.generate_svg_string() == strict.generate_svg_string()
+                assert fast.generate_wheel_only_svg_string() == strict.generate_wheel_only_svg_string()
+                assert fast.generate_aspect_grid_only_svg_string() == strict.generate_aspect_grid_only_svg_string()
+
+        values = ChartDrawer(self.chart_data)._create_template_dictionary()
+        assert isinstance(values, dict)
+        assert isinstance(values["full_wheel_translate_y"], int)
+        assert ChartTemplateModel(**values).model_dump().items() <= values.items()
+
+    def test_validate_template_rejects_invalid_values(self):
+        data = self.chart_data
+        fast = ChartDrawer(data)
+        fast._vertical_offsets["wheel"] = 50.5
+        with pytest.raises(KerykeionException, match="full_wheel_translate_y"):
+            fast.generate_svg_string()
+
+        strict = ChartDrawer(data, validate_template=True)
+        strict.chart_colors_settings["paper_0"] = None
+        with pytest.raises(ValueError, match="paper_color_0"):
+            strict.generate_svg_string()
+
     def test_chart_with_no_custom_title(self):
         chart = ChartDrawer(self.chart_data)
         assert chart.custom_title is None
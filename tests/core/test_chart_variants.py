@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Chart Variants Tests.
+
+Tests for ChartVariants: summaries and expanded subjects compared with
+subjects created directly by AstrologicalSubjectFactory for several house
+systems and sidereal modes.
+"""
+
+import pytest
+import swisseph as swe
+
+from kerykeion import AstrologicalSubjectFactory, ChartVariants
+from kerykeion.chart_variants import ALL_HOUSES_SYSTEMS, ALL_SIDEREAL_MODES
+from kerykeion.schemas import KerykeionException
+
+
+def _subject(**kwargs):
+    return AstrologicalSubjectFactory.from_iso_utc_time(
+        "Variants",
+        "1990-05-17T13:45:00+00:00",
+        lng=9.19,
+        lat=45.4642,
+        tz_str="Europe/Rome",
+        online=False,
+        suppress_geonames_warning=True,
+        **kwargs,
+    )
+
+
+def _angular_difference(first: float, second: float) -> float:
+    return abs((first - second + 180.0) % 360.0 - 180.0)
+
+
+@pytest.fixture(scope="module")
+def variants():
+    return ChartVariants.from_subject(_subject())
+
+
+class TestChartVariants:
+    def test_all_variants_by_default(self, variants):
+        assert len(variants) == len(ALL_HOUSES_SYSTEMS) * (len(ALL_SIDEREAL_MODES) + 1)
+        assert variants.sidereal_modes[0] is None
+        assert sum(1 for _ in variants) == len(variants)
+
+    @pytest.mark.parametrize(
+        "houses_system, sidereal_mode",
+        [("P", None), ("W", "LAHIRI"), ("K", "FAGAN_BRADLEY"), ("B", "RAMAN"), ("A", "KRISHNAMURTI")],
+    )
+    def test_variant_matches_factory(self, variants, houses_system, sidereal_mode):
+        expected = _subject(
+            zodiac_type="Sidereal" if sidereal_mode else "Tropical",
+            sidereal_mode=sidereal_mode,
+            houses_system_identifier=houses_system,
+        )
+        variant = variants.variant(houses_system, sidereal_mode)
+
+        assert variant.ascendant == pytest.approx(expected.ascendant.abs_pos)
+        assert variant.cusps[3] == pytest.approx(expected.fourth_house.abs_pos)
+        for point_name in ("Sun", "Moon", "Saturn", "True_North_Lunar_Node"):
+            point = getattr(expected, point_name.lower())
+            assert _angular_difference(variant.longitudes[point_name], point.abs_pos) < 1e-6
+            assert variant.houses[point_name] == point.house
+
+    @pytest.mark.parametrize("houses_system, sidereal_mode", [("P", None), ("K", "LAHIRI"), ("W", "J2000")])
+    def test_expanded_subject_matches_factory(self, variants, houses_system, sidereal_mode):
+        expected = _subject(
+            zodiac_type="Sidereal" if sidereal_mode else "Tropical",
+            sidereal_mode=sidereal_mode,
+            houses_system_identifier=houses_system,
+        )
+        expanded = variants.to_subject(houses_system, sidereal_mode)
+
+        assert expanded.zodiac_type == expected.zodiac_type
+        assert expanded.houses_system_identifier == houses_system
+        assert expanded.ascendant.abs_pos == pytest.approx(expected.ascendant.abs_pos)
+        for point_name in expected.active_points:
+            expected_point = getattr(expected, point_name.lower())
+            expanded_point = getattr(expanded, point_name.lower())
+            assert _angular_difference(expanded_point.abs_pos, expected_point.abs_pos) < 1e-6
+            assert expanded_point.sign == expected_point.sign
+            assert expanded_point.house == expected_point.house
+            assert expanded_point.retrograde == expected_point.retrograde
+
+    @pytest.mark.parametrize("houses_system, sidereal_mode", [("P", None), ("W", "J2000")])
+    def test_expanded_subject_keeps_outer_position_source(self, variants, houses_system, sidereal_mode):
+        class RecordingSource:
+            def __init__(self):
+                self.requests = []
+
+            def lookup(self, julian_day, planet_id, iflag):
+                self.requests.append(planet_id)
+                return None
+
+        outer = RecordingSource()
+        with AstrologicalSubjectFactory.precomputed_positions(outer):
+            expanded = variants.to_subject(houses_system, sidereal_mode)
+
+        # The shifted positions answer for the Sun; epoch-ecliptic modes are computed in full
+        assert (swe.SUN in outer.requests) == (sidereal_mode is not None)
+        assert expanded.sun.abs_pos == variants.to_subject(houses_system, sidereal_mode).sun.abs_pos
+
+    def test_ayanamsa(self, variants):
+        lahiri = variants.variant("P", "LAHIRI")
+        assert lahiri.ayanamsa == variants.ayanamsa("LAHIRI")
+        assert 23 < lahiri.ayanamsa < 24
+        assert variants.variant("P").ayanamsa == 0.0
+
+    def test_undefined_house_system(self):
+        # The factory clamps polar latitudes, so move an existing subject beyond the polar circle
+        arctic = ChartVariants.from_subject(_subject().model_copy(update={"lat": 85.0}), ["P", "W"], ["LAHIRI"])
+
+        assert arctic.variant("P", "LAHIRI").cusps is None
+        assert arctic.variant("W", "LAHIRI").houses
+        with pytest.raises(KerykeionException):
+            arctic.to_subject("P")
+
+    def test_invalid_arguments(self, variants):
+        with pytest.raises(KerykeionException):
+            ChartVariants.from_subject(_subject(zodiac_type="Sidereal", sidereal_mode="LAHIRI"))
+        with pytest.raises(KerykeionException):
+            ChartVariants.from_subject(_subject(), ["E"])
+        with pytest.raises(KerykeionException):
+            ChartVariants.from_subject(_subject(), ["P"], ["USER"])
+        with pytest.raises(KerykeionException):
+            ChartVariants.from_subject(_subject(), ["P"], ["LAHIRI"]).variant("K", "LAHIRI")
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Compatibility Search Tests.
+
+Tests for CompatibilitySearch: score parity with RelationshipScoreFactory,
+top-k ranking, precomputed vectors and full breakdowns for the winners.
+"""
+
+import pytest
+
+from kerykeion import AstrologicalSubjectFactory
+from kerykeion.compatibility_search import CompatibilitySearch, CompatibilityVector
+from kerykeion.relationship_score_factory import RelationshipScoreFactory
+from kerykeion.schemas import KerykeionException
+
+
+@pytest.fixture(scope="module")
+def candidate_pool(john_lennon, yoko_ono, paul_mccartney, johnny_depp):
+    generated = [
+        AstrologicalSubjectFactory.from_birth_data(
+            f"Candidate {index}",
+            1930 + index * 3,
+            (index % 12) + 1,
+            (index * 7) % 28 + 1,
+            (index * 5) % 24,
+            (index * 11) % 60,
+            lng=-120 + index * 9.5,
+            lat=-40 + index * 3.5,
+            tz_str="Etc/UTC",
+            online=False,
+            suppress_geonames_warning=True,
+        )
+        for index in range(24)
+    ]
+    no_ascendant = AstrologicalSubjectFactory.from_birth_data(
+        "No Ascendant",
+        1975,
+        3,
+        21,
+        6,
+        0,
+        lng=12.5,
+        lat=41.9,
+        tz_str="Europe/Rome",
+        online=False,
+        suppress_geonames_warning=True,
+        active_points=["Sun", "Moon", "Venus", "Mars"],
+    )
+    return [yoko_ono, paul_mccartney, johnny_depp, no_ascendant, *generated]
+
+
+class TestCompatibilitySearch:
+    @pytest.mark.parametrize("use_only_major_aspects", [True, False])
+    def test_scores_match_relationship_score_factory(self, john_lennon, candidate_pool, use_only_major_aspects):
+        search = CompatibilitySearch(candidate_pool, use_only_major_aspects=use_only_major_aspects)
+        expected = [
+            RelationshipScoreFactory(
+                john_lennon, candidate, use_only_major_aspects=use_only_major_aspects
+            ).get_relationship_score()
+            for candidate in candidate_pool
+        ]
+
+        assert len(search) == len(candidate_pool)
+        assert search.score_all(john_lennon) == [score.score_value for score in expected]
+
+    def test_top_k_ranking_and_breakdown(self, john_lennon, candidate_pool):
+        search = CompatibilitySearch(candidate_pool)
+        scores = search.score_all(john_lennon)
+        matches = search.top_k(john_lennon, k=3, with_breakdown=True)
+
+        assert [match.score_value for match in matches] == sorted(scores, reverse=True)[:3]
+        for match in matches:
+            assert match.key == candidate_pool[match.index].name
+            assert match.relationship_score is not None
+            assert match.relationship_score.score_value == match.score_value
+            assert match.relationship_score.score_description == match.score_description
+            assert match.relationship_score.is_destiny_sign == match.is_destiny_sign
+
+    def test_precomputed_vectors_with_loader(self, john_lennon, candidate_pool):
+        vectors = [CompatibilityVector.from_subject(subject) for subject in candidate_pool]
+        by_name = {subject.name: subject for subject in candidate_pool}
+        search = CompatibilitySearch(vectors)
+
+        assert search.score_all(CompatibilityVector.from_subject(john_lennon)) == CompatibilitySearch(
+            candidate_pool
+        ).score_all(john_lennon)
+
+        with pytest.raises(KerykeionException):
+            search.top_k(john_lennon, k=1, with_breakdown=True)
+
+        match = search.top_k(john_lennon, k=1, with_breakdown=True, subject_loader=by_name.__getitem__)[0]
+        assert match.relationship_score is not None
+        assert match.relationship_score.score_value == match.score_value
+
+    def test_vector_omits_inactive_points(self, candidate_pool):
+        vector = CompatibilityVector.from_subject(candidate_pool[3])
+        assert vector.ascendant is None
+        assert vector.sun is not None
+
+    def test_invalid_arguments(self, john_lennon, candidate_pool):
+        with pytest.raises(KerykeionException):
+            CompatibilitySearch([object()])  # type: ignore[list-item]
+        with pytest.raises(KerykeionException):
+            CompatibilitySearch(candidate_pool).top_k(john_lennon, k=0)
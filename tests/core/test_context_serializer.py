@@ -9,6 +9,8 @@ import pytest
 from kerykeion import AstrologicalSubjectFactory
 from kerykeion.context_serializer import (
     to_context,
+    iter_context,
+    write_context,
     kerykeion_point_to_context,
     lunar_phase_to_context,
     aspect_to_context,
@@ -1423,3 +1425,43 @@ class TestHouseComparisonContext:
         solar_return = factory.next_return_from_date(2024, 9, 1, return_type="Solar")
         result = astrological_subject_to_context(solar_return)
         assert '<return_info type="Solar"' in result
+
+
+class TestStreamingContext:
+    """Tests for iter_context and write_context."""
+
+    @pytest.fixture(scope="class")
+    def synastry_data(self, john_lennon, yoko_ono):
+        return ChartDataFactory.create_synastry_chart_data(john_lennon, yoko_ono)
+
+    @pytest.fixture(scope="class")
+    def transits_range(self, john_lennon):
+        from kerykeion.schemas.kr_models import TransitsTimeRangeModel, TransitMomentModel
+
+        moments = [TransitMomentModel(date=f"2024-01-{day:02d}T12:00:00", aspects=[]) for day in range(1, 11)]
+        return TransitsTimeRangeModel(subject=john_lennon, transits=moments, dates=[moment.date for moment in moments])
+
+    def test_chunks_join_to_to_context(self, john_lennon, synastry_data, transits_range):
+        for model in (john_lennon, john_lennon.sun, synastry_data, transits_range):
+            assert "".join(iter_context(model, lines_per_chunk=3)) == to_context(model)
+
+    def test_chunking_transits_range(self, transits_range):
+        chunks = list(iter_context(transits_range, lines_per_chunk=4))
+        # Opening tag + 10 moments + closing tag = 12 lines
+        assert len(chunks) == 3
+        assert chunks[0].startswith("<transit_analysis ")
+        assert all(chunk.startswith("\n") for chunk in chunks[1:])
+
+    def test_write_context_to_stream(self, synastry_data):
+        import io
+
+        stream = io.StringIO()
+        written = write_context(synastry_data, stream)
+        assert stream.getvalue() == to_context(synastry_data)
+        assert written == len(stream.getvalue())
+
+    def test_invalid_arguments(self, john_lennon):
+        with pytest.raises(ValueError):
+            list(iter_context(john_lennon, lines_per_chunk=0))
+        with pytest.raises(TypeError):
+            list(iter_context("not a model"))  # type: ignore[arg-type]
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Eclipse Catalog Tests.
+
+Tests for kerykeion.moon_phase_details.eclipse_catalog: catalog lookups against
+the live Swiss Ephemeris searches, the fallback outside the catalog range, and
+building, writing and reading catalog files.
+"""
+
+import random
+
+import pytest
+import swisseph as swe
+
+from kerykeion.moon_phase_details.eclipse_catalog import EclipseCatalog, load_eclipse_catalog
+from kerykeion.moon_phase_details.utils import (
+    compute_next_lunar_eclipse_jd,
+    compute_next_solar_eclipse_jd,
+    describe_lunar_eclipse_type,
+    describe_solar_eclipse_type,
+    search_next_lunar_eclipse_jd,
+    search_next_solar_eclipse_jd,
+)
+from kerykeion.schemas import KerykeionException
+
+LIVE_SEARCH = {"solar": search_next_solar_eclipse_jd, "lunar": search_next_lunar_eclipse_jd}
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    bundled = load_eclipse_catalog()
+    assert bundled is not None
+    return bundled
+
+
+class TestBundledCatalog:
+    def test_covers_1800_to_2400(self, catalog):
+        assert catalog.start_jd == swe.julday(1800, 1, 1, 0.0)
+        assert catalog.end_jd == swe.julday(2400, 1, 1, 0.0)
+        for kind in ("solar", "lunar"):
+            entries = catalog.entries(kind)
+            assert 1400 < len(entries) < 1500
+            assert all(earlier.julian_day < later.julian_day for earlier, later in zip(entries, entries[1:]))
+            assert entries[-1].julian_day > catalog.end_jd
+
+    def test_lookup_matches_live_search(self, catalog):
+        rng = random.Random(20250101)
+        for _ in range(40):
+            julian_day = rng.uniform(catalog.start_jd, catalog.end_jd)
+            for kind, search in LIVE_SEARCH.items():
+                entry = catalog.next_eclipse(kind, julian_day)
+                assert (entry.retflag, entry.julian_day) == search(julian_day)
+
+    def test_known_eclipses(self, catalog):
+        # 2024-04-08 total solar eclipse and 2025-03-14 total lunar eclipse.
+        solar = catalog.next_eclipse("solar", swe.julday(2024, 3, 1, 0.0))
+        lunar = catalog.next_eclipse("lunar", swe.julday(2025, 3, 1, 0.0))
+        assert swe.revjul(solar.julian_day)[:3] == (2024, 4, 8)
+        assert describe_solar_eclipse_type(solar.retflag) == "Total Solar Eclipse"
+        assert solar.magnitude > 1.0
+        assert swe.revjul(lunar.julian_day)[:3] == (2025, 3, 14)
+        assert describe_lunar_eclipse_type(lunar.retflag) == "Total Lunar Eclipse"
+        assert 1.0 < lunar.magnitude < 1.3
+
+    def test_next_eclipse_is_strictly_after(self, catalog):
+        entry = catalog.next_eclipse("solar", swe.julday(2024, 3, 1, 0.0))
+        assert catalog.next_eclipse("solar", entry.julian_day).julian_day > entry.julian_day
+        assert catalog.next_eclipse("lunar", catalog.start_jd - 1) is None
+        assert catalog.next_eclipse("lunar", catalog.end_jd + 1) is None
+
+
+class TestComputeNextEclipse:
+    def test_uses_catalog_inside_range(self, catalog):
+        julian_day = swe.julday(2030, 5, 1, 0.0)
+        entry = catalog.next_eclipse("solar", julian_day)
+        assert compute_next_solar_eclipse_jd(julian_day) == (entry.retflag, entry.julian_day)
+
+    def test_falls_back_to_live_search_outside_range(self):
+        julian_day = swe.julday(1700, 5, 1, 0.0)
+        assert compute_next_solar_eclipse_jd(julian_day) == search_next_solar_eclipse_jd(julian_day)
+        assert compute_next_lunar_eclipse_jd(julian_day) == search_next_lunar_eclipse_jd(julian_day)
+
+
+class TestBuildReadWrite:
+    def test_round_trip(self, catalog, tmp_path):
+        start, end = swe.julday(2024, 1, 1, 0.0), swe.julday(2027, 1, 1, 0.0)
+        built = EclipseCatalog.build(start, end)
+        path = tmp_path / "eclipses.csv"
+        built.write(path)
+        read = EclipseCatalog.read(path)
+        assert (read.start_jd, read.end_jd) == (start, end)
+        for kind in ("solar", "lunar"):
+            assert len(read.entries(kind)) == len(built.entries(kind))
+            # Magnitudes are written with four decimals.
+            for read_entry, built_entry in zip(read.entries(kind), built.entries(kind)):
+                assert read_entry[:2] == built_entry[:2]
+                assert read_entry.magnitude == pytest.approx(built_entry.magnitude, abs=5e-5)
+            assert read.entries(kind)[0] == catalog.next_eclipse(kind, start)
+
+    def test_invalid_inputs(self, tmp_path):
+        with pytest.raises(KerykeionException, match="before its start"):
+            EclipseCatalog.build(2460000.5, 2450000.5)
+        path = tmp_path / "broken.csv"
+        path.write_text("# header only\n")
+        with pytest.raises(KerykeionException, match="range line is missing"):
+            EclipseCatalog.read(path)
+        path.write_text("2450000.5,2460000.5\nX,2455000.5,4,1.0\n")
+        with pytest.raises(KerykeionException, match="Malformed"):
+            EclipseCatalog.read(path)
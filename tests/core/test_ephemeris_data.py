@@ -6,7 +6,8 @@ Integrates all test cases from:
   - tests/factories/test_ephemeris_factory_parametrized.py
 
 Covers daily/hourly/minutely ephemeris, planetary movement rates,
-model vs dict output, edge cases, and chronological ordering.
+model vs dict output, edge cases, chronological ordering and the lazy
+streaming API.
 """
 
 import logging
@@ -645,3 +646,66 @@ class TestEphemerisConfigurationVariants:
         data = factory.get_ephemeris_data(as_model=True)
         assert data is not None
         assert len(data) == 3
+
+
+# =============================================================================
+# STREAMING
+# =============================================================================
+
+
+class TestStreaming:
+    """Lazy factories and the iter_ephemeris_data / iter_subjects API."""
+
+    def _factory(self, **kwargs):
+        return EphemerisDataFactory(
+            start_datetime=datetime(2024, 1, 1),
+            end_datetime=datetime(2024, 1, 2),
+            step_type="hours",
+            step=3,
+            lat=DEFAULT_LAT,
+            lng=DEFAULT_LNG,
+            tz_str=DEFAULT_TZ,
+            **kwargs,
+        )
+
+    def test_iterators_match_list_api(self):
+        factory = self._factory()
+        assert list(factory.iter_ephemeris_data()) == factory.get_ephemeris_data()
+        assert list(factory.iter_ephemeris_data(as_model=True)) == factory.get_ephemeris_data(as_model=True)
+        assert [subject.model_dump() for subject in factory.iter_subjects()] == [
+            subject.model_dump() for subject in factory.get_ephemeris_data_as_astrological_subjects()
+        ]
+
+    def test_lazy_factory_matches_eager_factory(self):
+        lazy = self._factory(lazy=True)
+        assert lazy._dates_list is None
+        assert len(lazy) == 9
+        assert list(lazy.iter_ephemeris_data()) == self._factory().get_ephemeris_data()
+        assert lazy._dates_list is None
+        assert lazy.dates_list == self._factory().dates_list
+
+    def test_chunks(self):
+        factory = self._factory(lazy=True)
+        chunks = list(factory.iter_ephemeris_data(chunk_size=4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+        assert [record for chunk in chunks for record in chunk] == list(factory.iter_ephemeris_data())
+        subject_chunks = list(factory.iter_subjects(chunk_size=5))
+        assert [len(chunk) for chunk in subject_chunks] == [5, 4]
+        with pytest.raises(ValueError, match="chunk_size"):
+            factory.iter_subjects(chunk_size=0)
+
+    def test_lazy_mode_ignores_caps(self, caplog):
+        with pytest.raises(ValueError, match="Too many minutes"):
+            EphemerisDataFactory(datetime(1900, 1, 1), datetime(2100, 1, 1), step_type="minutes")
+        with caplog.at_level(logging.WARNING):
+            factory = EphemerisDataFactory(datetime(1900, 1, 1), datetime(2100, 1, 1), step_type="minutes", lazy=True)
+        assert "Large number of dates" not in caplog.text
+        assert len(factory) == 73049 * 1440 + 1
+        first = next(factory.iter_ephemeris_data())
+        assert first["date"] == "1900-01-01T00:00:00"
+        dates = factory.iter_dates()
+        assert [next(dates) for _ in range(2)][-1] == datetime(1900, 1, 1, 0, 1)
+
+    def test_lazy_mode_still_rejects_empty_ranges(self):
+        with pytest.raises(ValueError, match="No dates found"):
+            EphemerisDataFactory(datetime(2024, 1, 2), datetime(2024, 1, 1), lazy=True)
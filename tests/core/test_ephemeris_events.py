@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Ephemeris Events Tests.
+
+Tests for EphemerisEventFinder: ingress and station times checked against
+Swiss Ephemeris, time ordering of the merged stream, retrograde shadow
+periods and sidereal ingresses.
+"""
+
+from datetime import datetime
+
+import pytest
+import swisseph as swe
+
+from kerykeion import EphemerisEventFinder
+from kerykeion.schemas import KerykeionException
+
+START = datetime(2024, 1, 1)
+END = datetime(2025, 1, 1)
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+def _position(julian_day, planet_id, flags=FLAGS):
+    return swe.calc_ut(julian_day, planet_id, flags)[0]
+
+
+@pytest.fixture(scope="module")
+def events():
+    return list(EphemerisEventFinder().iter_events(START, END))
+
+
+class TestEvents:
+    def test_stream_is_in_time_order(self, events):
+        julian_days = [event.julian_day for event in events]
+        assert julian_days == sorted(julian_days)
+        assert {event.point for event in events} >= {"Sun", "Moon", "Mercury", "Saturn"}
+        assert START.isoformat() <= events[0].date[:19] and events[-1].date[:19] <= END.isoformat()
+
+    def test_ingresses_cross_sign_boundaries(self, events):
+        ingresses = [event for event in events if event.event_type == "Ingress"]
+        # The Sun enters every sign once a year, the Moon about 13 times each
+        assert sum(event.point == "Sun" for event in ingresses) == 12
+        assert sum(event.point == "Moon" for event in ingresses) > 150
+
+        planet_ids = {"Sun": swe.SUN, "Moon": swe.MOON, "Mercury": swe.MERCURY, "Mars": swe.MARS}
+        for event in ingresses:
+            if event.point not in planet_ids:
+                continue
+            before = _position(event.julian_day - 1e-3, planet_ids[event.point])[0]
+            after = _position(event.julian_day + 1e-3, planet_ids[event.point])[0]
+            assert int(before // 30) != int(after // 30)
+            assert event.longitude % 30 == 0
+            assert event.sign != event.previous_sign
+
+    def test_stations_have_zero_speed(self, events):
+        stations = [event for event in events if event.event_type.startswith("Station")]
+        assert not any(event.point in ("Sun", "Moon") for event in stations)
+        for event in stations:
+            if event.point != "Mercury":
+                continue
+            before = _position(event.julian_day - 0.01, swe.MERCURY)[3]
+            after = _position(event.julian_day + 0.01, swe.MERCURY)[3]
+            assert (before > 0 > after) if event.event_type == "Station Retrograde" else (before < 0 < after)
+
+        mercury_retrograde = [
+            event.date[:10]
+            for event in stations
+            if event.point == "Mercury" and event.event_type == "Station Retrograde"
+        ]
+        assert mercury_retrograde == ["2024-04-01", "2024-08-05", "2024-11-26"]
+
+    def test_event_type_filter(self):
+        finder = EphemerisEventFinder(["Mars", "Jupiter"])
+        stations = list(finder.iter_events(START, END, event_types=["Station Retrograde", "Station Direct"]))
+
+        assert stations
+        assert all(event.event_type.startswith("Station") for event in stations)
+
+    def test_sidereal_ingresses(self):
+        finder = EphemerisEventFinder(["Sun"], zodiac_type="Sidereal", sidereal_mode="LAHIRI")
+        aries = next(event for event in finder.iter_events(START, END) if event.sign == "Ari")
+
+        # The sidereal Sun enters Aries around the 13th of April
+        assert aries.date.startswith("2024-04-13")
+
+    def test_invalid_arguments(self):
+        with pytest.raises(KerykeionException):
+            EphemerisEventFinder(["Ascendant"])
+        with pytest.raises(KerykeionException):
+            EphemerisEventFinder(perspective_type="Topocentric")
+        with pytest.raises(KerykeionException):
+            list(EphemerisEventFinder().iter_events(END, START))
+
+
+class TestRetrogradePeriods:
+    def test_mercury_shadows(self):
+        periods = list(EphemerisEventFinder().retrograde_periods("Mercury", datetime(2024, 3, 1), datetime(2024, 6, 1)))
+
+        assert len(periods) == 1
+        period = periods[0]
+        assert period.station_retrograde.date.startswith("2024-04-01")
+        assert period.station_direct.date.startswith("2024-04-25")
+        assert period.shadow_start.julian_day < period.station_retrograde.julian_day
+        assert period.shadow_end.julian_day > period.station_direct.julian_day
+
+        # The shadows open and close at the longitudes of the stations
+        shadow_start = _position(period.shadow_start.julian_day, swe.MERCURY)[0]
+        shadow_end = _position(period.shadow_end.julian_day, swe.MERCURY)[0]
+        assert shadow_start == pytest.approx(period.station_direct.longitude, abs=1e-4)
+        assert shadow_end == pytest.approx(period.station_retrograde.longitude, abs=1e-4)
+
+    def test_shadow_events_match_periods(self):
+        finder = EphemerisEventFinder(["Mercury"])
+        shadow_events = [
+            event
+            for event in finder.iter_events(START, END, event_types=["Shadow Start", "Shadow End"])
+            if event.date.startswith("2024-05")
+        ]
+        period = next(finder.retrograde_periods("Mercury", datetime(2024, 4, 1), datetime(2024, 4, 2)))
+
+        assert len(shadow_events) == 1
+        assert shadow_events[0].event_type == "Shadow End"
+        assert shadow_events[0].julian_day == pytest.approx(period.shadow_end.julian_day, abs=1e-5)
+
+    def test_bodies_without_retrograde_motion(self):
+        with pytest.raises(KerykeionException):
+            next(EphemerisEventFinder().retrograde_periods("Sun", START, END))
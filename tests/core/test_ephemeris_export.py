@@ -0,0 +1,141 @@
+"""
+Tests for the ephemeris and transit export layer (kerykeion.ephemeris_export).
+
+Covers flat row schemas, lazy factory sources, CSV / JSONL writers and
+columnar batching.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+from pytest import approx
+
+from kerykeion.ephemeris_data_factory import EphemerisDataFactory
+from kerykeion.ephemeris_export import (
+    TRANSIT_COLUMNS,
+    ephemeris_rows,
+    iter_column_batches,
+    transit_rows,
+    write_csv,
+    write_jsonl,
+)
+from kerykeion.schemas import KerykeionException
+from kerykeion.transits_time_range_factory import TransitsTimeRangeFactory
+
+
+@pytest.fixture(scope="module")
+def ephemeris_factory():
+    return EphemerisDataFactory(
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 5),
+        lat=41.9028,
+        lng=12.4964,
+        tz_str="Europe/Rome",
+    )
+
+
+@pytest.fixture(scope="module")
+def transits_factory(ephemeris_factory, john_lennon):
+    return TransitsTimeRangeFactory(john_lennon, ephemeris_factory.get_ephemeris_data_as_astrological_subjects())
+
+
+class TestEphemerisRows:
+    def test_factory_rows_match_ephemeris_data(self, ephemeris_factory):
+        rows = list(ephemeris_rows(ephemeris_factory))
+        data = ephemeris_factory.get_ephemeris_data()
+
+        assert len(rows) == len(data) == 5
+        assert rows[0]["date"] == "2023-12-31T23:00:00+00:00"
+        assert rows[0]["sun_abs_pos"] == approx(data[0]["planets"][0]["abs_pos"])
+        assert rows[0]["sun_speed"] == approx(data[0]["planets"][0]["speed"])
+        assert rows[0]["sun_house"] == data[0]["planets"][0]["house"]
+        assert rows[0]["first_house_abs_pos"] == approx(data[0]["houses"][0]["abs_pos"])
+
+    def test_all_sources_share_schema(self, ephemeris_factory):
+        from_factory = list(ephemeris_rows(ephemeris_factory))
+        from_dicts = list(ephemeris_rows(ephemeris_factory.get_ephemeris_data(), tz_str="Europe/Rome"))
+        from_models = list(ephemeris_rows(ephemeris_factory.get_ephemeris_data(as_model=True), tz_str="Europe/Rome"))
+        from_subjects = list(ephemeris_rows(ephemeris_factory.get_ephemeris_data_as_astrological_subjects()))
+
+        assert from_factory == from_dicts == from_models
+        assert list(from_subjects[0]) == list(from_factory[0])
+        assert from_subjects[0]["moon_abs_pos"] == approx(from_factory[0]["moon_abs_pos"])
+
+    def test_dates_are_utc_for_every_source(self, ephemeris_factory):
+        expected = [
+            "2023-12-31T23:00:00+00:00",
+            "2024-01-01T23:00:00+00:00",
+            "2024-01-02T23:00:00+00:00",
+            "2024-01-03T23:00:00+00:00",
+            "2024-01-04T23:00:00+00:00",
+        ]
+        sources = [
+            ephemeris_factory,
+            ephemeris_factory.get_ephemeris_data(),
+            ephemeris_factory.get_ephemeris_data(as_model=True),
+            ephemeris_factory.get_ephemeris_data_as_astrological_subjects(),
+        ]
+
+        for source in sources:
+            rows = ephemeris_rows(source, tz_str="Europe/Rome")
+            assert [row["date"] for row in rows] == expected
+
+    def test_record_dates_default_to_utc(self, ephemeris_factory):
+        rows = list(ephemeris_rows(ephemeris_factory.get_ephemeris_data()))
+
+        assert rows[0]["date"] == "2024-01-01T00:00:00+00:00"
+
+    def test_unsupported_record_raises(self):
+        with pytest.raises(KerykeionException):
+            list(ephemeris_rows([42]))  # type: ignore[list-item]
+
+
+class TestTransitRows:
+    def test_one_row_per_aspect(self, transits_factory):
+        model = transits_factory.get_transit_moments()
+        rows = list(transit_rows(model))
+
+        assert len(rows) == sum(len(moment.aspects) for moment in model.transits)
+        assert all(tuple(row) == TRANSIT_COLUMNS for row in rows)
+        assert list(transit_rows(transits_factory)) == rows
+        assert list(transit_rows(model.transits)) == rows
+
+
+class TestWriters:
+    def test_csv_round_trip(self, ephemeris_factory):
+        rows = list(ephemeris_rows(ephemeris_factory))
+        stream = io.StringIO(newline="")
+
+        assert write_csv(iter(rows), stream) == len(rows)
+
+        read_back = list(csv.DictReader(io.StringIO(stream.getvalue(), newline="")))
+        assert list(read_back[0]) == list(rows[0])
+        assert float(read_back[2]["mars_abs_pos"]) == rows[2]["mars_abs_pos"]
+
+    def test_csv_to_path(self, transits_factory, tmp_path):
+        path = tmp_path / "transits.csv"
+        count = write_csv(transit_rows(transits_factory), path)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == ",".join(TRANSIT_COLUMNS)
+        assert len(lines) == count + 1
+
+    def test_jsonl(self, ephemeris_factory):
+        stream = io.StringIO()
+        count = write_jsonl(ephemeris_rows(ephemeris_factory), stream)
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == count == 5
+        assert json.loads(lines[0])["date"] == "2023-12-31T23:00:00+00:00"
+
+    def test_column_batches(self, ephemeris_factory):
+        rows = list(ephemeris_rows(ephemeris_factory))
+        batches = list(iter_column_batches(rows, batch_size=2))
+
+        assert [len(batch["date"]) for batch in batches] == [2, 2, 1]
+        assert batches[1]["sun_abs_pos"] == [rows[2]["sun_abs_pos"], rows[3]["sun_abs_pos"]]
+        with pytest.raises(ValueError):
+            list(iter_column_batches(rows, batch_size=0))
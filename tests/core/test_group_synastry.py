@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Group Synastry Tests.
+
+Tests for GroupSynastryMatrix: parity of every ordered pair with
+AspectsFactory.dual_chart_aspects, shared active points, custom aspects, the
+count matrix and input validation.
+"""
+
+import pytest
+
+from kerykeion import AspectsFactory, AstrologicalSubjectFactory, GroupSynastryMatrix
+from kerykeion.schemas import KerykeionException
+from kerykeion.settings.config_constants import ALL_ACTIVE_POINTS
+
+
+def _member(index, **kwargs):
+    return AstrologicalSubjectFactory.from_birth_data(
+        f"Member {index}",
+        1950 + index * 7,
+        (index * 5) % 12 + 1,
+        (index * 11) % 28 + 1,
+        (index * 7) % 24,
+        (index * 13) % 60,
+        lng=-70 + index * 23.5,
+        lat=-30 + index * 11.0,
+        tz_str="Etc/UTC",
+        online=False,
+        suppress_geonames_warning=True,
+        **kwargs,
+    )
+
+
+@pytest.fixture(scope="module")
+def group():
+    return [_member(index) for index in range(6)]
+
+
+@pytest.fixture(scope="module")
+def matrix(group):
+    return GroupSynastryMatrix(group)
+
+
+def _reference(matrix, first, second):
+    return AspectsFactory.dual_chart_aspects(
+        matrix.subjects[first],
+        matrix.subjects[second],
+        active_points=matrix.active_points,
+        active_aspects=matrix.active_aspects,
+    )
+
+
+class TestParityWithAspectsFactory:
+    def test_every_ordered_pair(self, matrix):
+        models = list(matrix.iter_dual_chart_aspects(ordered=True))
+        assert len(models) == 6 * 5
+        for first, second, model in models:
+            assert model.model_dump() == _reference(matrix, first, second).model_dump()
+
+    def test_compact_aspects_follow_factory_order(self, matrix):
+        reference = _reference(matrix, 4, 1)
+        compact = matrix.aspects(4, 1)
+        assert [(a.p1_name, a.p2_name, a.aspect) for a in compact] == [
+            (a.p1_name, a.p2_name, a.aspect) for a in reference.aspects
+        ]
+        assert [a.aspect_movement for a in compact] == [a.aspect_movement for a in reference.aspects]
+
+    def test_custom_points_and_aspects(self, group):
+        active_aspects = [{"name": "conjunction", "orb": 3}, {"name": "opposition", "orb": 3}]
+        matrix = GroupSynastryMatrix(group, active_points=["Sun", "Moon", "Venus"], active_aspects=active_aspects)
+        assert matrix.points == ("Sun", "Moon", "Venus")
+        for first, second, model in matrix.iter_dual_chart_aspects():
+            assert model.model_dump() == _reference(matrix, first, second).model_dump()
+            assert {aspect.aspect for aspect in model.aspects} <= {"conjunction", "opposition"}
+
+    def test_points_shared_by_the_whole_group(self, group):
+        extended = _member(9, active_points=ALL_ACTIVE_POINTS)
+        limited = _member(10, active_points=["Sun", "Moon", "Mars", "Ascendant"])
+        matrix = GroupSynastryMatrix([extended, group[0], limited])
+        assert matrix.active_points == ["Ascendant", "Mars", "Moon", "Sun"]
+        for first, second, model in matrix.iter_dual_chart_aspects(ordered=True):
+            assert model.model_dump() == _reference(matrix, first, second).model_dump()
+
+
+class TestMatrix:
+    def test_pairs_and_counts(self, matrix):
+        pairs = list(matrix.pairs())
+        assert len(pairs) == 15 and all(first < second for first, second in pairs)
+        counts = matrix.aspect_counts()
+        for first, second in pairs:
+            assert counts[first][second] == counts[second][first] == len(matrix.aspects(first, second))
+            assert len(matrix.aspects(second, first)) == counts[first][second]
+        assert all(counts[index][index] == 0 for index in range(len(matrix)))
+
+    def test_keys(self, group):
+        assert GroupSynastryMatrix(group).keys == [subject.name for subject in group]
+        assert GroupSynastryMatrix(group[:2], keys=["a", "b"]).keys == ["a", "b"]
+
+    def test_invalid_inputs(self, group, matrix):
+        with pytest.raises(KerykeionException, match="at least two"):
+            GroupSynastryMatrix(group[:1])
+        with pytest.raises(KerykeionException, match="keys"):
+            GroupSynastryMatrix(group[:2], keys=["only one"])
+        with pytest.raises(KerykeionException, match="two different"):
+            matrix.aspects(2, 2)
+        with pytest.raises(KerykeionException, match="between 0 and 5"):
+            matrix.aspects(0, 6)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentation Tests.
+
+Tests for the opt-in stage timing and Swiss Ephemeris call counting of
+kerykeion.instrumentation: recorded stages, call attribution, nesting,
+emission through logging and callbacks, and the disabled fast path.
+"""
+
+import logging
+import threading
+from unittest.mock import patch
+
+import swisseph
+
+from kerykeion import AstrologicalSubjectFactory, ChartDataFactory, ChartDrawer
+from kerykeion.instrumentation import _NULL_STAGE, Profiler, stage, swe
+
+
+def _subject():
+    return AstrologicalSubjectFactory.from_birth_data(
+        "Profiled",
+        1990,
+        6,
+        15,
+        12,
+        0,
+        lng=12.5,
+        lat=41.9,
+        tz_str="Europe/Rome",
+        online=False,
+        suppress_geonames_warning=True,
+    )
+
+
+class TestProfiler:
+    def test_subject_and_chart_stages(self):
+        with Profiler() as profiler:
+            subject = _subject()
+            ChartDrawer(ChartDataFactory.create_natal_chart_data(subject)).generate_svg_string()
+
+        stages = profiler.report.stages
+        for name in ("subject.time_conversion", "subject.houses", "subject.planets", "subject.validation"):
+            assert stages[name].calls == 1
+        for name in ("chart.layout", "chart.template", "chart.circles", "chart.aspects", "chart.substitution"):
+            assert stages[name].calls == 1
+        assert "chart.minify" not in stages
+
+        # Every standard planet costs one calc_ut call
+        assert stages["subject.planets"].swe_calls >= 10
+        assert stages["subject.houses"].swe_calls >= 1
+        assert profiler.report.swe_calls["calc_ut"] >= stages["subject.planets"].swe_calls
+        assert stages["chart.template"].total_seconds >= stages["chart.circles"].total_seconds
+        assert profiler.report.total_seconds >= stages["chart.template"].total_seconds
+
+    def test_functions_imported_by_name_are_counted(self):
+        with Profiler() as profiler:
+            ChartDataFactory.create_natal_chart_data(_subject())
+
+        # Aspect orbs are measured with swe.difdeg2n in aspects_utils
+        assert profiler.report.swe_calls["difdeg2n"] > 0
+
+    def test_swisseph_module_is_not_patched(self):
+        calc_ut = swisseph.calc_ut
+        with Profiler():
+            assert swisseph.calc_ut is calc_ut
+            assert swe.calc_ut is not calc_ut
+        assert swe.calc_ut is calc_ut
+        assert swe.FLG_SIDEREAL == swisseph.FLG_SIDEREAL
+
+    def test_mock_patch_applies_while_profiling(self):
+        with Profiler() as profiler, patch("swisseph.julday", return_value=42.0) as julday:
+            assert swe.julday(2000, 1, 1, 12.0) == 42.0
+
+        julday.assert_called_once()
+        assert profiler.report.swe_calls == {"julday": 1}
+
+    def test_nested_profilers_both_record(self):
+        with Profiler() as outer:
+            with stage("outer.only"):
+                swe.julday(2000, 1, 1, 12.0)
+            with Profiler() as inner:
+                with stage("shared"):
+                    swe.julday(2000, 1, 1, 12.0)
+
+        assert set(inner.report.stages) == {"shared"}
+        assert set(outer.report.stages) == {"outer.only", "shared"}
+        assert inner.report.swe_calls == {"julday": 1}
+        assert outer.report.swe_calls == {"julday": 2}
+        assert outer.report.stages["shared"].swe_calls == 1
+
+    def test_other_threads_are_not_recorded(self):
+        with Profiler() as profiler:
+            thread = threading.Thread(target=lambda: swe.julday(2000, 1, 1, 12.0))
+            thread.start()
+            thread.join()
+
+        assert profiler.report.total_swe_calls == 0
+
+    def test_report_emission(self, caplog):
+        reports = []
+        with caplog.at_level(logging.INFO, logger="kerykeion.instrumentation"):
+            with Profiler(log_level=logging.INFO, callback=reports.append, count_swe_calls=False) as profiler:
+                with stage("custom"):
+                    swe.julday(2000, 1, 1, 12.0)
+
+        assert reports == [profiler.report]
+        assert profiler.report.swe_calls == {}
+        assert "custom" in caplog.text
+        data = profiler.report.to_dict()
+        assert data["stages"]["custom"]["calls"] == 1
+        assert "custom" in profiler.report.format()
+
+
+class TestDisabled:
+    def test_stage_is_shared_no_op(self):
+        assert stage("subject.houses") is _NULL_STAGE
+        with stage("anything"):
+            pass
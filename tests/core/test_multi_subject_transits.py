@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Multi-Subject Transits Tests.
+
+Tests for MultiSubjectTransitEngine: parity with TransitsTimeRangeFactory,
+lazy ephemeris sources, precomputed positions and zodiac wrap-around.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from kerykeion import AstrologicalSubjectFactory
+from kerykeion.ephemeris_data_factory import EphemerisDataFactory
+from kerykeion.multi_subject_transits import MultiSubjectTransitEngine
+from kerykeion.schemas import KerykeionException
+from kerykeion.transits_time_range_factory import TransitsTimeRangeFactory
+
+
+@pytest.fixture(scope="module")
+def ephemeris_factory():
+    return EphemerisDataFactory(datetime(2024, 1, 1), datetime(2024, 1, 6))
+
+
+@pytest.fixture(scope="module")
+def natal_subjects(john_lennon, yoko_ono, paul_mccartney, johnny_depp):
+    limited = AstrologicalSubjectFactory.from_birth_data(
+        "Limited Points",
+        1985,
+        7,
+        4,
+        9,
+        30,
+        lng=-0.1278,
+        lat=51.5074,
+        tz_str="Europe/London",
+        online=False,
+        suppress_geonames_warning=True,
+        active_points=["Sun", "Moon", "Mars", "Ascendant"],
+    )
+    return [john_lennon, yoko_ono, paul_mccartney, johnny_depp, limited]
+
+
+def _event_key(subject_key, date, transit_point, natal_point, aspect, orbit, movement):
+    return (subject_key, date, transit_point, natal_point, aspect, round(orbit, 9), movement)
+
+
+class TestMultiSubjectTransitEngine:
+    def test_matches_transits_time_range_factory(self, natal_subjects, ephemeris_factory):
+        ephemeris = ephemeris_factory.get_ephemeris_data_as_astrological_subjects()
+        engine = MultiSubjectTransitEngine(natal_subjects)
+
+        events = sorted(
+            _event_key(e.subject_key, e.date, e.transit_point, e.natal_point, e.aspect, e.orbit, e.aspect_movement)
+            for e in engine.iter_events(ephemeris)
+        )
+        expected = sorted(
+            _event_key(subject.name, moment.date, a.p1_name, a.p2_name, a.aspect, a.orbit, a.aspect_movement)
+            for subject in natal_subjects
+            for moment in TransitsTimeRangeFactory(subject, ephemeris).get_transit_moments().transits
+            for a in moment.aspects
+        )
+
+        assert len(engine) == len(natal_subjects)
+        assert events == expected
+
+    def test_lazy_factory_source_and_time_order(self, natal_subjects, ephemeris_factory):
+        engine = MultiSubjectTransitEngine(natal_subjects)
+        events = list(engine.iter_events(ephemeris_factory))
+        ephemeris = ephemeris_factory.get_ephemeris_data_as_astrological_subjects()
+
+        assert events == list(engine.iter_events(ephemeris))
+        dates = [event.date for event in events]
+        assert dates == sorted(dates)
+
+    def test_precomputed_positions_and_wrap_around(self, ephemeris_factory):
+        transit_subject = next(ephemeris_factory._iter_subjects())
+        sun = transit_subject.sun.abs_pos
+        engine = MultiSubjectTransitEngine(active_points=["Sun"], active_aspects=[{"name": "conjunction", "orb": 2}])
+        engine.add_positions("across_zero", {"Sun": (sun + 359.5) % 360})
+        engine.add_positions("far", {"Sun": (sun + 45) % 360})
+        engine.add_positions("exact", {"Sun": sun})
+
+        events = list(engine.events_at(transit_subject))
+
+        assert sorted(event.subject_key for event in events) == ["across_zero", "exact"]
+        assert all(event.aspect == "conjunction" for event in events)
+
+    def test_subjects_added_after_query_are_indexed(self, john_lennon, yoko_ono, ephemeris_factory):
+        transit_subject = next(ephemeris_factory._iter_subjects())
+        engine = MultiSubjectTransitEngine({"john": john_lennon})
+        first = {event.subject_key for event in engine.events_at(transit_subject)}
+        engine.add_subject(yoko_ono, key="yoko")
+        second = {event.subject_key for event in engine.events_at(transit_subject)}
+
+        assert first == {"john"}
+        assert second == {"john", "yoko"}
+
+    def test_invalid_longitude_raises(self):
+        with pytest.raises(KerykeionException):
+            MultiSubjectTransitEngine().add_positions("bad", {"Sun": 360.0})
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Position Cache Tests.
+
+Tests for ChebyshevPositionCache: accuracy against Swiss Ephemeris, binary
+file round-trip, fallback outside the cached configuration and
+EphemerisDataFactory integration.
+"""
+
+from datetime import datetime
+
+import pytest
+import swisseph as swe
+
+from kerykeion import AstrologicalSubjectFactory, EphemerisDataFactory
+from kerykeion.position_cache import ChebyshevPositionCache
+from kerykeion.schemas import KerykeionException
+
+START_JD = 2460310.5  # 2024-01-01 00:00 UT
+
+
+@pytest.fixture(scope="module")
+def position_cache():
+    return ChebyshevPositionCache.build(START_JD - 2, START_JD + 40)
+
+
+def _angular_difference(first: float, second: float) -> float:
+    return abs((first - second + 180.0) % 360.0 - 180.0)
+
+
+class TestChebyshevPositionCache:
+    @pytest.mark.parametrize("body, planet_id", [("Sun", swe.SUN), ("Moon", swe.MOON), ("Mercury", swe.MERCURY)])
+    def test_matches_swiss_ephemeris(self, position_cache, body, planet_id):
+        for step in range(60):
+            julian_day = START_JD + step * 0.613
+            longitude, speed, declination = position_cache.position(body, julian_day)
+            ecliptic = swe.calc_ut(julian_day, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+            equatorial = swe.calc_ut(julian_day, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_EQUATORIAL)[0]
+
+            assert _angular_difference(longitude, ecliptic[0]) < 1e-5
+            assert speed == pytest.approx(ecliptic[3], abs=1e-4)
+            assert declination == pytest.approx(equatorial[1], abs=1e-5)
+
+    def test_reports_measured_errors(self, position_cache):
+        assert "True_North_Lunar_Node" in position_cache.bodies
+        for body, (longitude_error, speed_error, _) in position_cache.max_errors.items():
+            scale = 100 if body == "True_North_Lunar_Node" else 1
+            assert longitude_error <= position_cache.tolerance * scale
+            assert speed_error <= position_cache.speed_tolerance * scale
+
+    def test_binary_round_trip(self, position_cache, tmp_path):
+        path = tmp_path / "positions.krcheb"
+        position_cache.save(path)
+        loaded = ChebyshevPositionCache.load(path)
+
+        assert loaded.bodies == position_cache.bodies
+        assert loaded.max_errors == position_cache.max_errors
+        assert loaded.position("Moon", START_JD + 3.3) == position_cache.position("Moon", START_JD + 3.3)
+
+        (tmp_path / "broken.krcheb").write_bytes(path.read_bytes()[:100])
+        with pytest.raises(KerykeionException):
+            ChebyshevPositionCache.load(tmp_path / "broken.krcheb")
+
+    def test_lookup_falls_back_outside_configuration(self, position_cache):
+        iflag = swe.FLG_SWIEPH | swe.FLG_SPEED
+        assert position_cache.lookup(START_JD, swe.SUN, iflag) is not None
+        assert position_cache.lookup(START_JD + 100, swe.SUN, iflag) is None
+        assert position_cache.lookup(START_JD, swe.SUN, iflag | swe.FLG_SIDEREAL) is None
+        assert position_cache.lookup(START_JD, swe.OSCU_APOG, iflag) is None
+        with pytest.raises(KerykeionException):
+            position_cache.position("Sun", START_JD + 100)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(KerykeionException):
+            ChebyshevPositionCache.build(START_JD, START_JD - 1)
+        with pytest.raises(KerykeionException):
+            ChebyshevPositionCache.build(START_JD, START_JD + 1, perspective_type="Topocentric")
+        with pytest.raises(KerykeionException):
+            ChebyshevPositionCache.build(START_JD, START_JD + 1, ["True_Lilith"])
+
+
+class TestPositionCacheIntegration:
+    def test_subject_factory_uses_active_cache(self, position_cache):
+        def create():
+            return AstrologicalSubjectFactory.from_birth_data(
+                "Cached",
+                2024,
+                1,
+                12,
+                15,
+                30,
+                lng=12.5,
+                lat=41.9,
+                tz_str="Europe/Rome",
+                online=False,
+                suppress_geonames_warning=True,
+                active_points=["Sun", "Moon", "Mercury", "True_North_Lunar_Node", "True_Lilith"],
+            )
+
+        reference = create()
+        with position_cache.activate():
+            cached = create()
+
+        for point in ("sun", "moon", "mercury", "true_north_lunar_node"):
+            assert _angular_difference(getattr(cached, point).abs_pos, getattr(reference, point).abs_pos) < 1e-4
+            assert getattr(cached, point).sign == getattr(reference, point).sign
+        assert cached.true_lilith.abs_pos == reference.true_lilith.abs_pos
+
+    def test_precomputed_positions_nest(self, position_cache):
+        class FixedSun:
+            def lookup(self, julian_day, planet_id, iflag):
+                return (123.0, 1.0, 0.0) if planet_id == swe.SUN else None
+
+        def create():
+            return AstrologicalSubjectFactory.from_birth_data(
+                "Nested",
+                2024,
+                1,
+                12,
+                15,
+                30,
+                lng=12.5,
+                lat=41.9,
+                tz_str="Europe/Rome",
+                online=False,
+                suppress_geonames_warning=True,
+                active_points=["Sun", "Moon"],
+            )
+
+        reference = create()
+        with position_cache.activate():
+            with AstrologicalSubjectFactory.precomputed_positions(FixedSun()):
+                inner = create()
+            outer = create()
+
+        assert inner.sun.abs_pos == 123.0
+        assert inner.moon.abs_pos == outer.moon.abs_pos
+        assert _angular_difference(outer.moon.abs_pos, reference.moon.abs_pos) < 1e-4
+        assert _angular_difference(outer.sun.abs_pos, reference.sun.abs_pos) < 1e-4
+        assert create().sun.abs_pos == reference.sun.abs_pos
+
+    def test_ephemeris_data_factory_parity(self, position_cache):
+        arguments = dict(step_type="hours", step=6, lat=41.9, lng=12.5, tz_str="Europe/Rome")
+        reference = EphemerisDataFactory(datetime(2024, 1, 1), datetime(2024, 1, 20), **arguments)
+        cached = EphemerisDataFactory(
+            datetime(2024, 1, 1), datetime(2024, 1, 20), position_cache=position_cache, **arguments
+        )
+
+        for expected, actual in zip(
+            reference.get_ephemeris_data_as_astrological_subjects(),
+            cached.get_ephemeris_data_as_astrological_subjects(),
+        ):
+            for point_name in expected.active_points:
+                expected_point = getattr(expected, point_name.lower())
+                actual_point = getattr(actual, point_name.lower())
+                assert _angular_difference(actual_point.abs_pos, expected_point.abs_pos) < 1e-4
+                assert actual_point.retrograde == expected_point.retrograde
+
+    def test_sidereal_factory_ignores_cache(self, position_cache):
+        arguments = dict(zodiac_type="Sidereal", sidereal_mode="LAHIRI")
+        reference = EphemerisDataFactory(datetime(2024, 1, 1), datetime(2024, 1, 3), **arguments)
+        cached = EphemerisDataFactory(
+            datetime(2024, 1, 1), datetime(2024, 1, 3), position_cache=position_cache, **arguments
+        )
+
+        assert reference.get_ephemeris_data() == cached.get_ephemeris_data()
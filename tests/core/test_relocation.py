@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Relocation Tests.
+
+Tests for RelocationEngine: parity with charts recomputed by
+AstrologicalSubjectFactory, grid columns, polar fallbacks and
+Astro*Carto*Graphy lines.
+"""
+
+import math
+
+import pytest
+
+from kerykeion import AstrologicalSubjectFactory, RelocationEngine
+from kerykeion.schemas import KerykeionException
+
+HOUSE_NAMES = [
+    "First_House",
+    "Second_House",
+    "Third_House",
+    "Fourth_House",
+    "Fifth_House",
+    "Sixth_House",
+    "Seventh_House",
+    "Eighth_House",
+    "Ninth_House",
+    "Tenth_House",
+    "Eleventh_House",
+    "Twelfth_House",
+]
+
+
+def _subject(lat, lng, **kwargs):
+    return AstrologicalSubjectFactory.from_birth_data(
+        "Relocated",
+        1990,
+        5,
+        17,
+        13,
+        45,
+        lng=lng,
+        lat=lat,
+        tz_str="Etc/UTC",
+        online=False,
+        suppress_geonames_warning=True,
+        **kwargs,
+    )
+
+
+@pytest.fixture(scope="module")
+def natal():
+    return _subject(45.4642, 9.19)
+
+
+class TestRelocate:
+    @pytest.mark.parametrize("lat, lng", [(40.7128, -74.006), (-33.8688, 151.2093), (64.1466, -21.9426)])
+    def test_matches_recomputed_subject(self, natal, lat, lng):
+        relocated = RelocationEngine(natal).relocate(lat, lng)
+        expected = _subject(lat, lng)
+
+        assert relocated.ascendant == pytest.approx(expected.ascendant.abs_pos)
+        assert relocated.medium_coeli == pytest.approx(expected.medium_coeli.abs_pos)
+        assert relocated.cusps[6] == pytest.approx(expected.seventh_house.abs_pos)
+        for point_name, house in relocated.houses.items():
+            assert HOUSE_NAMES[house - 1] == getattr(expected, point_name.lower()).house
+        assert "Ascendant" not in relocated.houses
+        assert "Sun" in relocated.houses
+
+    def test_sidereal_subject(self):
+        options = dict(zodiac_type="Sidereal", sidereal_mode="LAHIRI", houses_system_identifier="W")
+        relocated = RelocationEngine(_subject(45.4642, 9.19, **options)).relocate(35.6762, 139.6503)
+        expected = _subject(35.6762, 139.6503, **options)
+
+        assert relocated.ascendant == pytest.approx(expected.ascendant.abs_pos)
+        assert relocated.cusps[0] == pytest.approx(expected.first_house.abs_pos)
+
+    def test_consumer_calculations_between_results(self):
+        options = dict(zodiac_type="Sidereal", sidereal_mode="LAHIRI")
+        engine = RelocationEngine(_subject(45.4642, 9.19, **options))
+        cities = [(40.7128, -74.006), (51.5072, -0.1276), (35.6762, 139.6503)]
+        expected = [chart.ascendant for chart in engine.iter_locations(cities)]
+
+        interleaved = []
+        for chart in engine.iter_locations(cities):
+            interleaved.append(chart.ascendant)
+            _subject(-33.8688, 151.2093)
+        assert interleaved == expected
+        assert interleaved[1] == pytest.approx(_subject(51.5072, -0.1276, **options).ascendant.abs_pos)
+
+    def test_polar_latitude_is_clamped_like_the_factory(self, natal):
+        relocated = RelocationEngine(natal).relocate(69.6, 18.9)
+        expected = _subject(69.6, 18.9)
+
+        assert relocated.lat == expected.lat == 66.0
+        assert relocated.ascendant == pytest.approx(expected.ascendant.abs_pos)
+        assert relocated.cusps[6] == pytest.approx(expected.seventh_house.abs_pos)
+        assert [chart.lat for chart in RelocationEngine(natal).iter_locations([(-80.0, 0.0), (10.0, 0.0)])] == [
+            -66.0,
+            10.0,
+        ]
+
+    def test_undefined_house_system_raises_without_adjustment(self, natal):
+        with pytest.raises(KerykeionException, match="undefined at latitude 69.6"):
+            RelocationEngine(natal).relocate(69.6, 18.9, adjust_polar_latitude=False)
+        with pytest.raises(KerykeionException):
+            list(RelocationEngine(natal).iter_locations([(80.0, 10.0)], adjust_polar_latitude=False))
+
+    def test_invalid_points(self, natal):
+        with pytest.raises(KerykeionException):
+            RelocationEngine(natal, points=["Ascendant"])
+        with pytest.raises(KerykeionException):
+            RelocationEngine(natal, points=["Eris"])
+
+
+class TestRelocationGrid:
+    def test_grid_columns_match_single_locations(self, natal):
+        engine = RelocationEngine(natal, points=["Sun", "Moon", "Saturn"])
+        grid = engine.grid([-20.0, 30.0, 75.0], [-120.0, 0.0, 100.0])
+
+        assert len(grid) == 9
+        assert grid.points == ("Sun", "Moon", "Saturn")
+        assert list(grid.lat[:4]) == [-20.0, -20.0, -20.0, 30.0]
+        assert len(grid.cusps) == 12 * 9
+
+        single = engine.relocate(30.0, 100.0)
+        assert grid.ascendant[5] == single.ascendant
+        assert tuple(grid.cusps[60:72]) == single.cusps
+        assert grid.houses["Moon"][5] == single.houses["Moon"]
+
+        # Placidus is undefined beyond the polar circle
+        assert math.isnan(grid.ascendant[6])
+        assert grid.houses["Sun"][6] == 0
+
+    def test_locations_grid_with_whole_signs(self, natal):
+        engine = RelocationEngine(natal, houses_system_identifier="W")
+        grid = engine.locations_grid([(78.2, 15.6), (51.5, -0.1)])
+
+        assert not math.isnan(grid.ascendant[0])
+        assert grid.cusps[0] % 30 == 0
+
+
+class TestAstroCartoGraphy:
+    def test_lines_match_relocated_angles(self, natal):
+        engine = RelocationEngine(natal)
+        lines = {(line.point, line.angle): line for line in engine.astrocartography_lines(["Sun", "Moon"])}
+
+        assert len(lines) == 8
+        sun_mc = lines[("Sun", "MC")]
+        # The Sun has no ecliptic latitude, so on its MC line it is on the relocated Midheaven
+        assert engine.relocate(10.0, sun_mc.lng[0]).medium_coeli == pytest.approx(natal.sun.abs_pos, abs=1e-3)
+        assert lines[("Sun", "IC")].lng[0] == pytest.approx((sun_mc.lng[0] % 360) - 180)
+
+        sun_asc = lines[("Sun", "ASC")]
+        index = list(sun_asc.lat).index(40.0)
+        assert engine.relocate(40.0, sun_asc.lng[index]).ascendant == pytest.approx(natal.sun.abs_pos, abs=1e-3)
+
+    def test_circumpolar_latitudes_are_nan(self, natal):
+        lines = RelocationEngine(natal).astrocartography_lines(["Sun"], latitudes=[0.0, 80.0])
+        rising = next(line for line in lines if line.angle == "ASC")
+
+        assert not math.isnan(rising.lng[0])
+        assert math.isnan(rising.lng[1])
+
+    def test_unsupported_body(self, natal):
+        with pytest.raises(KerykeionException):
+            RelocationEngine(natal).astrocartography_lines(["Pars_Fortunae"])
@@ -6,10 +6,13 @@ Integrates all cases from tests/settings/test_settings.py plus
 settings-related edge cases from tests/edge_cases/test_edge_cases.py.
 """
 
+import subprocess
+import sys
 from copy import deepcopy
 
 import pytest
 
+from kerykeion.settings.translation_strings import BUNDLED_LANGUAGES, LANGUAGE_SETTINGS, LazyLanguageSettings
 from kerykeion.settings.kerykeion_settings import load_settings_mapping, _deep_merge
 from kerykeion.settings.translations import load_language_settings, get_translations
 
@@ -83,6 +86,18 @@ class TestLoadLanguageSettings:
         languages = load_language_settings({"language_settings": {"PT": {"info": "Informações"}}})
         assert languages["PT"]["info"] == "Informações"
 
+    def test_selected_languages_only(self):
+        languages = load_language_settings({"IT": {"info": "Dati"}, "FR": {"info": "X"}}, languages=("IT", "EN"))
+        assert list(languages) == ["IT", "EN"]
+        assert languages["IT"]["info"] == "Dati"
+        assert languages["EN"] == LANGUAGE_SETTINGS["EN"]
+        assert languages["EN"] is not LANGUAGE_SETTINGS["EN"]
+
+    def test_selected_unknown_language_comes_from_overrides(self):
+        languages = load_language_settings({"XX": {"info": "Custom"}}, languages=("XX", "EN"))
+        assert languages["XX"] == {"info": "Custom"}
+        assert load_language_settings(languages=("XX",)) == {}
+
 
 # =============================================================================
 # TestGetTranslations
@@ -199,3 +214,52 @@ class TestDeepMerge:
         merged = _deep_merge(base, overrides)
         assert merged["l1"]["l2"]["l3"]["val"] == "replaced"
         assert merged["l1"]["l2"]["l3"]["keep"] is True
+
+
+# =============================================================================
+# TestLazyLanguageSettings
+# =============================================================================
+
+
+class TestLazyLanguageSettings:
+    """Tests for the per-language translation modules loaded on first use."""
+
+    def test_behaves_like_the_bundled_dictionary(self):
+        assert list(LANGUAGE_SETTINGS) == list(BUNDLED_LANGUAGES)
+        assert len(LANGUAGE_SETTINGS) == len(BUNDLED_LANGUAGES)
+        assert "EN" in LANGUAGE_SETTINGS and "XX" not in LANGUAGE_SETTINGS
+        assert LANGUAGE_SETTINGS.get("XX") is None
+        for code in BUNDLED_LANGUAGES:
+            assert LANGUAGE_SETTINGS[code]["weekdays"]["Monday"]
+
+    def test_deepcopy_returns_plain_dict(self):
+        copied = deepcopy(LANGUAGE_SETTINGS)
+        assert type(copied) is dict
+        assert copied == dict(LANGUAGE_SETTINGS.items())
+        assert copied["EN"] is not LANGUAGE_SETTINGS["EN"]
+
+    def test_assignment_and_deletion(self):
+        languages = LazyLanguageSettings()
+        languages["XX"] = {"info": "Custom"}
+        del languages["FR"]
+        assert list(languages) == [code for code in BUNDLED_LANGUAGES if code != "FR"] + ["XX"]
+        assert languages.loaded_languages() == ("XX",)
+        with pytest.raises(KeyError):
+            languages["FR"]
+        languages["FR"] = {"info": "Infos"}
+        assert languages["FR"] == {"info": "Infos"}
+
+    def test_languages_are_loaded_on_first_use(self):
+        code = (
+            "import sys\n"
+            "from kerykeion import AstrologicalSubjectFactory, ChartDataFactory, ChartDrawer\n"
+            "from kerykeion.settings import get_translations\n"
+            "subject = AstrologicalSubjectFactory.from_birth_data('A', 1990, 6, 15, 12, 0, lng=12.5, lat=41.9,"
+            " tz_str='Europe/Rome', online=False, suppress_geonames_warning=True)\n"
+            "ChartDrawer(ChartDataFactory.create_natal_chart_data(subject), chart_language='IT').generate_svg_string()\n"
+            "get_translations('info', 'Info', language='DE')\n"
+            "prefix = 'kerykeion.settings.translation_strings.'\n"
+            "print(sorted(name[len(prefix):] for name in sys.modules if name.startswith(prefix)))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip().splitlines()[-1] == "['de', 'en', 'it']"
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Sky Cache Tests.
+
+Tests for SkyCache: parity of cached subjects with uncached ones across
+locations, zodiacs and perspectives, cache keys, LRU eviction, the topocentric
+and position cache bypasses, and calculation failures kept in snapshots.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import swisseph as swe
+
+from kerykeion import AstrologicalSubjectFactory
+from kerykeion.schemas import KerykeionException
+from kerykeion.settings.config_constants import ALL_ACTIVE_POINTS
+from kerykeion.sky_cache import SkyCache
+
+CITIES = [
+    ("Rome", 12.4964, 41.9028),
+    ("New York", -74.006, 40.7128),
+    ("Tokyo", 139.6917, 35.6895),
+    ("Sydney", 151.2093, -33.8688),
+    ("Reykjavik", -21.9426, 64.1466),
+]
+
+
+def _subject(city, lng, lat, iso_time="2025-03-20T09:01:00Z", **kwargs):
+    return AstrologicalSubjectFactory.from_iso_utc_time(
+        city, iso_time, lng=lng, lat=lat, tz_str="Etc/UTC", online=False, **kwargs
+    )
+
+
+def _dumps(**kwargs):
+    return [_subject(*city, **kwargs).model_dump() for city in CITIES]
+
+
+class TestParity:
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {"active_points": ALL_ACTIVE_POINTS},
+            {"zodiac_type": "Sidereal", "sidereal_mode": "LAHIRI"},
+            {"perspective_type": "Heliocentric"},
+            {"perspective_type": "True Geocentric", "houses_system_identifier": "W"},
+        ],
+    )
+    def test_cached_subjects_match_uncached(self, settings):
+        expected = _dumps(**settings)
+        cache = SkyCache()
+        with cache.activate():
+            assert _dumps(**settings) == expected
+        assert (cache.misses, cache.hits, len(cache)) == (1, len(CITIES) - 1, 1)
+
+    def test_houses_differ_between_cities(self):
+        with SkyCache().activate():
+            subjects = [_subject(*city) for city in CITIES]
+        assert len({subject.sun.abs_pos for subject in subjects}) == 1
+        assert len({subject.ascendant.abs_pos for subject in subjects}) == len(CITIES)
+
+    def test_inactive_outside_the_block(self):
+        cache = SkyCache()
+        with cache.activate():
+            _subject(*CITIES[0])
+        _subject(*CITIES[1])
+        assert (cache.misses, cache.hits) == (1, 0)
+
+
+class TestKeys:
+    def test_settings_are_part_of_the_key(self):
+        cache = SkyCache()
+        with cache.activate():
+            tropical = _subject(*CITIES[0])
+            lahiri = _subject(*CITIES[0], zodiac_type="Sidereal", sidereal_mode="LAHIRI")
+            fagan = _subject(*CITIES[0], zodiac_type="Sidereal", sidereal_mode="FAGAN_BRADLEY")
+            user = _subject(
+                *CITIES[0],
+                zodiac_type="Sidereal",
+                sidereal_mode="USER",
+                custom_ayanamsa_t0=2451545.0,
+                custom_ayanamsa_ayan_t0=23.0,
+            )
+            later = _subject(*CITIES[0], iso_time="2025-03-20T09:02:00Z")
+            points = _subject(*CITIES[0], active_points=["Sun", "Moon", "Ascendant"])
+        assert (cache.misses, cache.hits) == (6, 0)
+        assert len({tropical.sun.abs_pos, lahiri.sun.abs_pos, fagan.sun.abs_pos, user.sun.abs_pos}) == 4
+        assert later.moon.abs_pos != tropical.moon.abs_pos
+        assert points.sun.abs_pos == tropical.sun.abs_pos
+        assert points.mercury is None
+
+    def test_topocentric_is_not_cached(self):
+        cache = SkyCache()
+        with cache.activate():
+            first, second = (_subject(*city, perspective_type="Topocentric") for city in CITIES[:2])
+        assert (cache.misses, cache.hits, len(cache)) == (0, 0, 0)
+        assert first.moon.abs_pos != second.moon.abs_pos
+
+
+class TestEviction:
+    def test_least_recently_used_snapshot_is_evicted(self):
+        cache = SkyCache(maxsize=2)
+        times = ["2025-01-01T00:00:00Z", "2025-01-02T00:00:00Z", "2025-01-03T00:00:00Z"]
+        with cache.activate():
+            _subject(*CITIES[0], iso_time=times[0])
+            _subject(*CITIES[0], iso_time=times[1])
+            _subject(*CITIES[1], iso_time=times[0])  # hit, times[1] is now the oldest
+            _subject(*CITIES[0], iso_time=times[2])  # evicts times[1]
+            assert (cache.misses, cache.hits, len(cache)) == (3, 1, 2)
+            _subject(*CITIES[2], iso_time=times[0])
+            _subject(*CITIES[2], iso_time=times[1])
+        assert (cache.misses, cache.hits) == (4, 2)
+
+    def test_clear_and_invalid_size(self):
+        cache = SkyCache()
+        with cache.activate():
+            _subject(*CITIES[0])
+        cache.clear()
+        assert (cache.misses, cache.hits, len(cache)) == (0, 0, 0)
+        with pytest.raises(KerykeionException, match="at least 1"):
+            SkyCache(maxsize=0)
+
+
+class TestFailures:
+    def test_failed_points_are_removed_for_every_subject(self, caplog):
+        original_calc = swe.calc_ut
+
+        def mock_calc_ut(julian_day, planet_id, flags):
+            if planet_id == swe.MERCURY:
+                raise Exception("Mock ephemeris error")
+            return original_calc(julian_day, planet_id, flags)
+
+        cache = SkyCache()
+        with patch("swisseph.calc_ut", side_effect=mock_calc_ut), cache.activate():
+            subjects = [_subject(*city) for city in CITIES[:3]]
+        assert cache.hits == 2
+        for subject in subjects:
+            assert subject.mercury is None
+            assert "Mercury" not in subject.active_points
+            assert subject.venus is not None
+        assert caplog.text.count("Error calculating Mercury: Mock ephemeris error") == 3
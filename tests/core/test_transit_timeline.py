@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Transit Timeline Tests.
+
+Tests for the delta-encoded transit output: lossless round trips against
+TransitsTimeRangeFactory.get_transit_moments, the compact default encoding,
+span invariants, exact moments, the start/exact/end event stream and
+single-moment views.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from kerykeion import AstrologicalSubjectFactory, EphemerisDataFactory
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_models import TransitMomentModel, TransitTimelineModel
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS
+from kerykeion.transit_timeline import (
+    build_transit_timeline,
+    expand_transit_timeline,
+    iter_timeline_events,
+    iter_transit_moments,
+    transit_moment_at,
+)
+from kerykeion.transits_time_range_factory import TransitsTimeRangeFactory
+
+AXES = ("Ascendant", "Medium_Coeli", "Descendant", "Imum_Coeli")
+
+
+@pytest.fixture(scope="module")
+def natal():
+    return AstrologicalSubjectFactory.from_birth_data(
+        "Natal",
+        1980,
+        5,
+        17,
+        10,
+        30,
+        lng=12.4964,
+        lat=41.9028,
+        tz_str="Europe/Rome",
+        online=False,
+        suppress_geonames_warning=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def daily(natal):
+    moments = EphemerisDataFactory(
+        datetime(2024, 1, 1), datetime(2024, 7, 1)
+    ).get_ephemeris_data_as_astrological_subjects()
+    return TransitsTimeRangeFactory(natal, moments)
+
+
+@pytest.fixture(scope="module")
+def hourly(natal):
+    moments = EphemerisDataFactory(
+        datetime(2024, 3, 1), datetime(2024, 3, 3), step_type="hours"
+    ).get_ephemeris_data_as_astrological_subjects()
+    return TransitsTimeRangeFactory(natal, moments)
+
+
+class TestRoundTrip:
+    @pytest.mark.parametrize("factory_name", ["daily", "hourly"])
+    def test_expand_matches_transit_moments(self, request, factory_name):
+        factory = request.getfixturevalue(factory_name)
+        full = factory.get_transit_moments()
+        timeline = factory.get_transit_timeline(lossless=True)
+        assert isinstance(timeline, TransitTimelineModel)
+        assert timeline.subject == factory.natal_chart
+        assert expand_transit_timeline(timeline).model_dump() == full.model_dump()
+        assert build_transit_timeline(full, lossless=True).model_dump() == timeline.model_dump()
+
+    def test_single_moments(self, hourly):
+        full = hourly.get_transit_moments()
+        timeline = hourly.get_transit_timeline(lossless=True)
+        for index in (0, 1, 17, len(full.transits) - 1, -1):
+            assert transit_moment_at(timeline, index).model_dump() == full.transits[index].model_dump()
+        with pytest.raises(KerykeionException, match="out of range"):
+            transit_moment_at(timeline, len(full.transits))
+
+    def test_survives_serialization(self, daily):
+        timeline = daily.get_transit_timeline(lossless=True)
+        restored = TransitTimelineModel.model_validate_json(timeline.model_dump_json())
+        assert expand_transit_timeline(restored).model_dump() == daily.get_transit_moments().model_dump()
+
+    def test_changed_natal_position_starts_a_new_span(self, daily):
+        moments = list(daily.get_transit_moments().transits[:40])
+        aspect = moments[0].aspects[0]
+        shifted = [
+            TransitMomentModel(
+                date=moment.date,
+                aspects=[
+                    item.model_copy(update={"p2_abs_pos": item.p2_abs_pos + 1e-6})
+                    if index >= 20 and (item.p1_name, item.p2_name) == (aspect.p1_name, aspect.p2_name)
+                    else item
+                    for item in moment.aspects
+                ],
+            )
+            for index, moment in enumerate(moments)
+        ]
+        timeline = build_transit_timeline(shifted, lossless=True)
+        assert [moment.model_dump() for moment in iter_transit_moments(timeline)] == [
+            moment.model_dump() for moment in shifted
+        ]
+
+    def test_default_keeps_only_events_and_orbs(self, daily):
+        timeline = daily.get_transit_timeline()
+        lossless = daily.get_transit_timeline(lossless=True)
+        assert timeline.dates == lossless.dates
+        assert timeline.spans == [
+            span.model_copy(update={"p1_abs_positions": None, "p1_speeds": None}) for span in lossless.spans
+        ]
+        assert [event[:4] for event in iter_timeline_events(timeline)] == [
+            event[:4] for event in iter_timeline_events(lossless)
+        ]
+        for rebuild in (expand_transit_timeline, lambda timeline: transit_moment_at(timeline, 0)):
+            with pytest.raises(KerykeionException, match="lossless=True"):
+                rebuild(timeline)
+
+
+class TestSpans:
+    def test_invariants(self, daily):
+        timeline = daily.get_transit_timeline(lossless=True)
+        assert [span.start_index for span in timeline.spans] == sorted(span.start_index for span in timeline.spans)
+        for span in timeline.spans:
+            length = span.end_index - span.start_index + 1
+            assert (
+                len(span.orbits) == len(span.p1_abs_positions) == len(span.p1_speeds) == len(span.movements) == length
+            )
+            assert all(span.start_index <= index <= span.end_index for index in span.exact_indices)
+
+    def test_exact_moments_are_closest_samples(self, daily):
+        timeline = daily.get_transit_timeline()
+        exact_spans = [span for span in timeline.spans if span.exact_indices]
+        assert exact_spans
+        for span in exact_spans:
+            for index in span.exact_indices:
+                offset = index - span.start_index
+                neighbours = [span.orbits[i] for i in (offset - 1, offset + 1) if 0 <= i < len(span.orbits)]
+                assert all(span.orbits[offset] <= orbit for orbit in neighbours)
+
+    def test_range_edges_are_not_exact_moments(self, hourly):
+        timeline = hourly.get_transit_timeline()
+        last = len(timeline.dates) - 1
+        for span in timeline.spans:
+            if span.start_index == 0 and span.end_index == 0 or span.start_index == last and span.end_index == last:
+                assert span.exact_indices == []
+
+    def test_slow_planet_perfects_inside_its_span(self, daily):
+        timeline = daily.get_transit_timeline()
+        spans = [
+            span
+            for span in timeline.spans
+            if span.p1_name in ("Jupiter", "Saturn")
+            and 0 < span.start_index
+            and span.end_index < len(timeline.dates) - 1
+        ]
+        assert spans
+        for span in spans:
+            closest = min(range(len(span.orbits)), key=span.orbits.__getitem__)
+            assert span.start_index + closest in span.exact_indices
+
+    def test_smaller_than_full_output(self, natal, daily):
+        points = [point for point in DEFAULT_ACTIVE_POINTS if point not in AXES]
+        factory = TransitsTimeRangeFactory(natal, daily.ephemeris_data_points, active_points=points)
+        full_size = len(factory.get_transit_moments().model_dump_json(exclude={"subject"}))
+        timeline_size = len(factory.get_transit_timeline().model_dump_json(exclude={"subject"}))
+        assert timeline_size < full_size / 3
+
+
+class TestEvents:
+    def test_events_in_time_order(self, hourly):
+        timeline = hourly.get_transit_timeline()
+        events = list(iter_timeline_events(timeline))
+        assert [event.index for event in events] == sorted(event.index for event in events)
+        assert sum(event.kind == "start" for event in events) == len(timeline.spans)
+        assert sum(event.kind == "end" for event in events) == len(timeline.spans)
+        assert sum(event.kind == "exact" for event in events) == sum(len(span.exact_indices) for span in timeline.spans)
+        for event in events:
+            assert event.date == timeline.dates[event.index]
+            assert event.orbit == event.span.orbits[event.index - event.span.start_index]
+
+    def test_start_events_match_new_aspects(self, hourly):
+        full = hourly.get_transit_moments()
+        timeline = hourly.get_transit_timeline()
+        starts = {
+            (event.index, event.span.p1_name, event.span.p2_name)
+            for event in iter_timeline_events(timeline)
+            if event.kind == "start"
+        }
+        previous: set = set()
+        expected = set()
+        for index, moment in enumerate(full.transits):
+            current = {(aspect.p1_name, aspect.p2_name, aspect.aspect) for aspect in moment.aspects}
+            expected.update((index, p1, p2) for p1, p2, _ in current - previous)
+            previous = current
+        assert starts == expected
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Transit Timeline Renderer Tests.
+
+Tests for TransitTimelineRenderer: frame layers matching the classic Transit
+wheel drawn by ChartDrawer, the static natal layer, the SMIL animation and
+construction from a TransitsTimeRangeFactory.
+"""
+
+import re
+from datetime import datetime
+
+import pytest
+
+from kerykeion import AstrologicalSubjectFactory, ChartDataFactory, ChartDrawer, TransitsTimeRangeFactory
+from kerykeion.charts.draw_planets import draw_planets, draw_secondary_planets
+from kerykeion.charts.transit_timeline_renderer import TransitTimelineRenderer
+from kerykeion.ephemeris_data_factory import EphemerisDataFactory
+from kerykeion.schemas import KerykeionException
+
+ROME = dict(lng=12.4964, lat=41.9028, tz_str="Europe/Rome")
+
+
+@pytest.fixture(scope="module")
+def natal():
+    return AstrologicalSubjectFactory.from_birth_data(
+        "Timeline", 1990, 6, 15, 14, 30, online=False, suppress_geonames_warning=True, **ROME
+    )
+
+
+@pytest.fixture(scope="module")
+def transit_subjects():
+    factory = EphemerisDataFactory(datetime(2024, 1, 1), datetime(2024, 1, 5), step_type="days", step=1, **ROME)
+    return factory.get_ephemeris_data_as_astrological_subjects()
+
+
+def _transit_drawer(natal, transit_subject):
+    return ChartDrawer(ChartDataFactory.create_transit_chart_data(natal, transit_subject))
+
+
+class TestFrames:
+    def test_secondary_planets_split_draw_planets(self, natal, transit_subjects):
+        drawer = _transit_drawer(natal, transit_subjects[0])
+        common = dict(
+            available_kerykeion_celestial_points=drawer.available_kerykeion_celestial_points,
+            available_planets_setting=drawer.available_planets_setting,
+            radius=drawer.main_radius,
+            main_subject_first_house_degree_ut=natal.first_house.abs_pos,
+            main_subject_seventh_house_degree_ut=natal.seventh_house.abs_pos,
+            chart_type="Transit",
+        )
+        both = draw_planets(
+            second_subject_available_kerykeion_celestial_points=drawer.second_subject_celestial_points,
+            third_circle_radius=drawer.third_circle_radius,
+            second_circle_radius=drawer.second_circle_radius,
+            **common,
+        )
+        inner = draw_planets(
+            second_subject_available_kerykeion_celestial_points=[],
+            third_circle_radius=drawer.third_circle_radius,
+            second_circle_radius=drawer.second_circle_radius,
+            **common,
+        )
+        outer = draw_secondary_planets(
+            second_subject_available_kerykeion_celestial_points=drawer.second_subject_celestial_points, **common
+        )
+
+        assert outer and outer in both
+        assert both.replace(outer, "", 1) == inner
+
+    def test_frames_match_transit_chart_layers(self, natal, transit_subjects):
+        renderer = TransitTimelineRenderer(natal, transit_subjects)
+        frames = list(renderer.iter_frames())
+
+        assert [frame.index for frame in frames] == list(range(len(transit_subjects)))
+        for frame, transit_subject in zip(frames, transit_subjects):
+            drawer = _transit_drawer(natal, transit_subject)
+            assert frame.date == transit_subject.iso_formatted_local_datetime
+            assert drawer.aspects_list
+            assert drawer._draw_all_aspects_lines(drawer.main_radius, drawer.main_radius - 160) in frame.svg
+            assert (
+                draw_secondary_planets(
+                    radius=drawer.main_radius,
+                    available_kerykeion_celestial_points=drawer.available_kerykeion_celestial_points,
+                    available_planets_setting=drawer.available_planets_setting,
+                    second_subject_available_kerykeion_celestial_points=drawer.second_subject_celestial_points,
+                    main_subject_first_house_degree_ut=natal.first_house.abs_pos,
+                    main_subject_seventh_house_degree_ut=natal.seventh_house.abs_pos,
+                    chart_type="Transit",
+                )
+                in frame.svg
+            )
+
+    def test_from_transits_factory(self, natal, transit_subjects):
+        factory = TransitsTimeRangeFactory(natal, transit_subjects, active_points=["Sun", "Moon", "Mars"])
+        renderer = TransitTimelineRenderer.from_transits_factory(factory)
+        assert sorted(renderer.active_points) == ["Mars", "Moon", "Sun"]
+
+        frame = next(renderer.iter_frames())
+        assert 'xlink:href="#Moon"' in frame.svg
+        assert 'xlink:href="#Jupiter"' not in frame.svg
+
+
+class TestSvgOutput:
+    def test_static_layer_has_no_transit_planets(self, natal, transit_subjects):
+        renderer = TransitTimelineRenderer(natal, transit_subjects, theme="dark")
+        svg = renderer.generate_static_svg_string()
+
+        assert "<g kr:node='Transit_Frames'></g>" in svg
+        assert "transit-planet-name" not in svg
+        assert "Timeline - Transits for 2024-01-01 / 2024-01-05" in svg
+
+    def test_animated_svg(self, natal, transit_subjects):
+        renderer = TransitTimelineRenderer(natal, transit_subjects)
+        svg = renderer.generate_animated_svg_string(frame_duration=0.5)
+
+        # Like every ChartDrawer SVG, the document uses single-quoted attributes
+        assert svg.count("kr:node='Transit_Frame'") == len(transit_subjects)
+        animations = re.findall(r"<animate attributeName='visibility'[^>]*>", svg)
+        assert len(animations) == 5
+        assert all("dur='2.5s'" in animation and "indefinite" in animation for animation in animations)
+        assert "values='visible;hidden' keyTimes='0;0.2'" in animations[0]
+        assert "values='hidden;visible;hidden' keyTimes='0;0.4;0.6'" in animations[2]
+        assert "values='hidden;visible' keyTimes='0;0.8'" in animations[4]
+
+        once = renderer.generate_animated_svg_string(loop=False)
+        assert "repeatCount='1' fill='freeze'" in once
+
+        minified = renderer.generate_animated_svg_string(minify=True, remove_css_variables=True)
+        assert "<animate" in minified and "var(--" not in minified
+
+    def test_single_frame_is_not_animated(self, natal, transit_subjects):
+        svg = TransitTimelineRenderer(natal, transit_subjects[:1]).generate_animated_svg_string()
+        assert "<animate" not in svg
+        assert "kr:node='Transit_Frame'" in svg
+
+    def test_invalid_arguments(self, natal, transit_subjects):
+        with pytest.raises(KerykeionException):
+            TransitTimelineRenderer(natal, [])
+        with pytest.raises(KerykeionException):
+            TransitTimelineRenderer(natal, transit_subjects, drawer_options={"style": "modern"})
+        with pytest.raises(KerykeionException):
+            TransitTimelineRenderer(natal, transit_subjects).generate_animated_svg_string(frame_duration=0)
@@ -468,6 +468,34 @@ class TestInlineCssVariables:
         result = inline_css_variables_in_svg(svg)
         assert "<style>" not in result
 
+    def test_nested_variables_are_resolved(self):
+        svg = """
+        <style>:root { --base: #123456; --alias: var(--base); --alias-2: var(--alias); }</style>
+        <rect fill="var(--alias-2)" stroke="var(--missing, var(--alias))" />
+        """
+        result = inline_css_variables_in_svg(svg)
+        assert 'fill="#123456"' in result
+        assert 'stroke="#123456"' in result
+        assert "var(" not in result
+
+    def test_cyclic_variables_terminate(self):
+        svg = """
+        <style>:root { --a: var(--b); --b: var(--a, red); }</style>
+        <rect fill="var(--a)" stroke="var(--b)" />
+        """
+        result = inline_css_variables_in_svg(svg)
+        assert "var(" not in result
+
+    def test_resolved_map_is_cached_per_style(self):
+        from kerykeion.utilities import _resolve_css_variable_map
+
+        svg = '<style>:root { --cache-test: blue; }</style><rect fill="var(--cache-test)" />'
+        _resolve_css_variable_map.cache_clear()
+        first = inline_css_variables_in_svg(svg)
+        second = inline_css_variables_in_svg(svg)
+        assert first == second == '<rect fill="blue" />'
+        assert _resolve_css_variable_map.cache_info().hits == 1
+
 
 # =============================================================================
 # TestDistributePercentages
@@ -609,6 +637,45 @@ class TestChartsUtilsInternalFunctions:
 
         assert offsetToTz(timedelta(hours=2)) == 2.0
 
+    def test_static_wheel_layers_are_shared_across_rotations(self):
+        from kerykeion.charts.charts_utils import (
+            _degree_ticks,
+            _zodiac_slices_geometry,
+            draw_degree_ring,
+            draw_zodiac_slices,
+        )
+
+        _degree_ticks.cache_clear()
+        first = draw_degree_ring(240, 0, 123.456, "#000")
+        second = draw_degree_ring(240, 0, 311.789, "#000")
+        assert _degree_ticks.cache_info().hits == 1
+        assert first.startswith('<g id="degreeRing" transform="rotate(123.456 240 240)">')
+        assert first.split(">", 1)[1] == second.split(">", 1)[1]
+        assert draw_degree_ring(240, 0, 123.456, "#fff") != first
+
+        styles = [f"fill:#{i:02d}0000;" for i in range(12)]
+        signs = ["Ari", "Tau", "Gem", "Can", "Leo", "Vir", "Lib", "Sco", "Sag", "Cap", "Aqu", "Pis"]
+        _zodiac_slices_geometry.cache_clear()
+        slices = draw_zodiac_slices(0, "Natal", 10.0, 240, styles, signs)
+        draw_zodiac_slices(0, "Natal", 200.0, 240, styles, signs)
+        assert _zodiac_slices_geometry.cache_info().hits == 1
+        assert slices.startswith('<g transform="rotate(10.0 240 240)">')
+        assert slices.count('<g transform="rotate(-10.0 ') == 12
+
+    def test_modern_static_rings_are_memoized(self):
+        from kerykeion.charts.draw_modern import (
+            _draw_ruler_ring,
+            _draw_zodiac_background_ring,
+            _zodiac_background_geometry,
+        )
+
+        assert _draw_ruler_ring() is _draw_ruler_ring()
+        _draw_zodiac_background_ring(42.0)
+        _draw_zodiac_background_ring(43.0)
+        assert _zodiac_background_geometry.cache_info().misses <= 1
+        assert _zodiac_background_geometry.cache_info().hits >= 1
+        assert _draw_zodiac_background_ring(42.0) != _draw_zodiac_background_ring(43.0)
+
     def test_get_decoded_celestial_point_unknown_raises(self):
         from kerykeion.charts.charts_utils import get_decoded_kerykeion_celestial_point_name
         from kerykeion.schemas.settings_models import KerykeionLanguageCelestialPointModel
@@ -770,3 +837,94 @@ class TestInlineCssEdgeCases:
         svg = '<rect fill="var(--unknown-color)" />'
         result = inline_css_variables_in_svg(svg)
         assert 'fill=""' in result or "var" not in result
+
+
+@pytest.fixture(scope="module")
+def aspect_grid_drawers():
+    from kerykeion import AstrologicalSubjectFactory, ChartDataFactory
+    from kerykeion.charts.chart_drawer import ChartDrawer
+    from kerykeion.settings.config_constants import ALL_ACTIVE_POINTS
+
+    def subject(name, year):
+        return AstrologicalSubjectFactory.from_birth_data(
+            name,
+            year,
+            6,
+            15,
+            14,
+            30,
+            lng=12.4964,
+            lat=41.9028,
+            tz_str="Europe/Rome",
+            online=False,
+            suppress_geonames_warning=True,
+            active_points=ALL_ACTIVE_POINTS,
+        )
+
+    first, second = subject("First", 1990), subject("Second", 1988)
+    natal = ChartDrawer(ChartDataFactory.create_natal_chart_data(first, active_points=ALL_ACTIVE_POINTS))
+    synastry = ChartDrawer(ChartDataFactory.create_synastry_chart_data(first, second, active_points=ALL_ACTIVE_POINTS))
+    return natal, synastry
+
+
+class TestAspectGridAssembly:
+    """Tests for the aspect pair index and the SVG fragment buffer used by the grids."""
+
+    def test_index_keys(self):
+        from kerykeion.charts.charts_utils import build_aspect_pair_index
+
+        aspects = [{"p1": 3, "p2": 1, "n": 0}, {"p1": 1, "p2": 3, "n": 1}, {"p1": 2, "p2": 2, "n": 2}]
+
+        directional = build_aspect_pair_index(aspects)
+        assert [a["n"] for a in directional[(3, 1)]] == [0]
+        assert [a["n"] for a in directional[(1, 3)]] == [1]
+
+        symmetric = build_aspect_pair_index(aspects, symmetric=True)
+        assert set(symmetric) == {(1, 3), (2, 2)}
+        assert [a["n"] for a in symmetric[(1, 3)]] == [0, 1]
+
+    def test_fragment_buffer(self):
+        from kerykeion.charts.charts_utils import SvgFragmentBuffer
+
+        buffer = SvgFragmentBuffer()
+        assert buffer.getvalue() == ""
+        buffer.append("<g>")
+        buffer.append("</g>")
+        assert buffer.getvalue() == "<g></g>"
+
+    def test_grids_match_with_and_without_index(self, aspect_grid_drawers):
+        from kerykeion.charts.charts_utils import draw_aspect_grid, draw_transit_aspect_grid
+
+        natal, synastry = aspect_grid_drawers
+        assert natal.aspects_list and synastry.aspects_list
+
+        expected = draw_aspect_grid("#000", natal.available_planets_setting, natal.aspects_list)
+        indexed = draw_aspect_grid(
+            "#000",
+            natal.available_planets_setting,
+            natal.aspects_list,
+            aspect_index=natal._aspect_pair_index(symmetric=True),
+        )
+        assert indexed == expected and "<use" in expected
+
+        expected = draw_transit_aspect_grid("#000", synastry.available_planets_setting, synastry.aspects_list)
+        indexed = draw_transit_aspect_grid(
+            "#000",
+            synastry.available_planets_setting,
+            synastry.aspects_list,
+            aspect_index=synastry._aspect_pair_index(symmetric=False),
+        )
+        assert indexed == expected and "<use" in expected
+
+    def test_drawer_index_is_cached_per_aspect_list(self, aspect_grid_drawers):
+        natal, _ = aspect_grid_drawers
+        index = natal._aspect_pair_index(symmetric=True)
+        assert natal._aspect_pair_index(symmetric=True) is index
+        assert natal._aspect_pair_index(symmetric=False) is not index
+
+        original = natal.aspects_list
+        try:
+            natal.aspects_list = list(original[:1])
+            assert sum(len(aspects) for aspects in natal._aspect_pair_index(symmetric=True).values()) == 1
+        finally:
+            natal.aspects_list = original
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Wire Format Tests.
+
+Tests for kerykeion.wire_format: lossless round trips of every supported
+subject and chart data model, payload size against JSON, and the rejection of
+foreign, outdated, corrupted or unexpected payloads.
+"""
+
+import struct
+
+import pytest
+
+from kerykeion import (
+    AstrologicalSubjectFactory,
+    ChartDataFactory,
+    CompositeSubjectFactory,
+    PlanetaryReturnFactory,
+)
+from kerykeion.schemas import KerykeionException
+from kerykeion.schemas.kr_models import AstrologicalSubjectModel, DualChartDataModel
+from kerykeion.settings.config_constants import ALL_ACTIVE_POINTS
+from kerykeion.wire_format import WIRE_FORMAT_VERSION, from_wire, to_wire
+
+ROME = dict(lng=12.4964, lat=41.9028, tz_str="Europe/Rome")
+LONDON = dict(lng=-0.1276, lat=51.5072, tz_str="Europe/London")
+
+
+def _subject(name="First", year=1990, location=ROME, **kwargs):
+    return AstrologicalSubjectFactory.from_birth_data(
+        name, year, 6, 15, 14, 30, online=False, suppress_geonames_warning=True, **location, **kwargs
+    )
+
+
+@pytest.fixture(scope="module")
+def first():
+    return _subject()
+
+
+@pytest.fixture(scope="module")
+def second():
+    return _subject("Second", 1988, LONDON)
+
+
+def _assert_round_trip(model):
+    payload = to_wire(model)
+    decoded = from_wire(payload)
+    assert type(decoded) is type(model)
+    assert decoded == model
+    assert decoded.model_dump_json() == model.model_dump_json()
+    return payload
+
+
+class TestRoundTrip:
+    def test_subjects(self, first):
+        _assert_round_trip(first)
+        _assert_round_trip(_subject(active_points=ALL_ACTIVE_POINTS))
+        sidereal = _subject(zodiac_type="Sidereal", sidereal_mode="LAHIRI", houses_system_identifier="W")
+        assert sidereal.ayanamsa_value is not None
+        _assert_round_trip(sidereal)
+
+    def test_composite_and_return_subjects(self, first, second):
+        composite = CompositeSubjectFactory(first, second).get_midpoint_composite_subject_model()
+        _assert_round_trip(composite)
+        solar_return = PlanetaryReturnFactory(first, online=False, **ROME).next_return_from_date(
+            2024, 1, 1, return_type="Solar"
+        )
+        _assert_round_trip(solar_return)
+        _assert_round_trip(ChartDataFactory.create_composite_chart_data(composite))
+        _assert_round_trip(ChartDataFactory.create_return_chart_data(first, solar_return))
+
+    def test_chart_data(self, first, second):
+        _assert_round_trip(ChartDataFactory.create_natal_chart_data(first))
+        _assert_round_trip(ChartDataFactory.create_transit_chart_data(first, second))
+        synastry = ChartDataFactory.create_synastry_chart_data(first, second)
+        assert synastry.relationship_score is not None and synastry.house_comparison is not None
+        _assert_round_trip(synastry)
+
+    def test_decoded_models_are_independent(self, first):
+        payload = to_wire(first)
+        one, two = from_wire(payload), from_wire(payload)
+        one.sun.abs_pos = 0.0
+        assert two.sun == first.sun
+
+    def test_payload_is_smaller_than_json(self, first, second):
+        for model in (first, ChartDataFactory.create_synastry_chart_data(first, second)):
+            assert len(to_wire(model)) * 4 < len(model.model_dump_json())
+
+    def test_expected_type(self, first):
+        payload = to_wire(first)
+        assert from_wire(payload, AstrologicalSubjectModel) == first
+        with pytest.raises(KerykeionException, match="Expected a DualChartDataModel"):
+            from_wire(payload, DualChartDataModel)
+
+
+class TestRejectedPayloads:
+    def test_unsupported_model(self, first):
+        with pytest.raises(KerykeionException, match="does not support"):
+            to_wire(first.sun)
+
+    def test_header_checks(self, first):
+        payload = bytearray(to_wire(first))
+        assert payload[:4] == b"KRW" + bytes([WIRE_FORMAT_VERSION])
+
+        with pytest.raises(KerykeionException, match="too short"):
+            from_wire(payload[:4])
+        with pytest.raises(KerykeionException, match="Not a Kerykeion"):
+            from_wire(b"JSON" + payload[4:])
+
+        newer = bytearray(payload)
+        newer[3] = WIRE_FORMAT_VERSION + 1
+        with pytest.raises(KerykeionException, match="version"):
+            from_wire(bytes(newer))
+
+        other_schema = bytearray(payload)
+        struct.pack_into("<I", other_schema, 5, struct.unpack_from("<I", payload, 5)[0] ^ 1)
+        with pytest.raises(KerykeionException, match="different AstrologicalSubjectModel schema"):
+            from_wire(bytes(other_schema))
+
+    def test_truncated_and_trailing_bytes(self, first):
+        payload = to_wire(first)
+        with pytest.raises(KerykeionException, match="truncated"):
+            from_wire(payload[:-10])
+        with pytest.raises(KerykeionException, match="trailing"):
+            from_wire(payload + b"\x00")